@@ -97,10 +97,13 @@ class StorageConfig:
             yaml has no WAL, no FTS5, and no concurrent-write protection, so it
             is opt-in for local single-user use only.
         db_path: Path to SQLite database file.
+        sqlite_profile: SQLite PRAGMA profile (default, throughput); YAML key
+            ``storage.sqlite.profile``.
     """
 
     backend: str = "sqlite"
     db_path: str = "data/decisions.db"
+    sqlite_profile: str = "default"
 
 
 @dataclass(slots=True)
@@ -204,6 +207,7 @@ class Config:
             storage=StorageConfig(
                 backend=os.getenv("CSTP_STORAGE", "sqlite"),
                 db_path=os.getenv("CSTP_DB_PATH", "data/decisions.db"),
+                sqlite_profile=os.getenv("CSTP_DB_PROFILE", "default"),
             ),
         )
 
@@ -259,6 +263,9 @@ class Config:
             config.storage = StorageConfig(
                 backend=st.get("backend", config.storage.backend),
                 db_path=st.get("db_path", config.storage.db_path),
+                sqlite_profile=(st.get("sqlite") or {}).get(
+                    "profile", config.storage.sqlite_profile
+                ),
             )
 
         # Tracker config
@@ -14,7 +14,9 @@ from typing import Any
 
 import yaml
 
+from .bm25_index import index_decision_keywords
 from .decision_service import DECISIONS_PATH
+from .storage.yaml_cache import iter_decision_files
 
 logger = logging.getLogger(__name__)
 
@@ -104,14 +106,8 @@ async def find_pending_decisions(
     if not base.exists():
         return results
 
-    for yaml_file in base.rglob("*-decision-*.yaml"):
+    for _, yaml_file, data in iter_decision_files(base):
         try:
-            with open(yaml_file, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-
-            if not data:
-                continue
-
             # Must be pending
             if data.get("status") != "pending":
                 continue
@@ -232,7 +228,7 @@ async def update_decision_outcome(
         from .storage.factory import get_decision_store
 
         store = get_decision_store()
-        if await store.get(decision_id) is None:
+        if decision_id not in await store.existing_ids([decision_id]):
             # Not yet migrated. Insert the full record — already carrying the
             # outcome — rather than deferring to the next startup migration.
             # Returning True without it would be the worst of both: the YAML is no
@@ -250,6 +246,7 @@ async def update_decision_outcome(
                 )
                 _rollback(path, original_bytes)
                 return False
+            index_decision_keywords(decision_id, data)
             return True
 
         updated = await store.update_outcome(
@@ -267,6 +264,7 @@ async def update_decision_outcome(
             )
             _rollback(path, original_bytes)
             return False
+        index_decision_keywords(decision_id, data)
         return True
 
     except Exception as e:
@@ -1,20 +1,41 @@
 """BM25 keyword search index for decisions (F017).
 
 Provides exact keyword matching to complement semantic search.
+
+``KeywordIndex`` is the serving index: one shared inverted index with
+per-term postings and document-length stats, updated in place as decisions
+are recorded, updated, and reviewed, and snapshotted to disk so a restart
+does not re-tokenize the corpus. ``BM25Index`` is the original rank_bm25
+wrapper, kept as the scoring reference.
 """
 from __future__ import annotations
 
+import asyncio
+import heapq
+import json
+import logging
+import math
+import os
 import re
-import time
+from collections import Counter
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 from rank_bm25 import BM25Okapi
 
-# Cache for BM25 index to avoid rebuilding on every request
-_index_cache: dict[str, tuple[BM25Index, float, int]] = {}
-_CACHE_TTL_SECONDS = 300  # 5 minute TTL
-_CACHE_KEY = "default"
+logger = logging.getLogger(__name__)
+
+# Snapshot location; set BM25_INDEX_PATH="" to keep the index memory-only.
+_DEFAULT_INDEX_PATH = "data/bm25_index.json"
+_SNAPSHOT_FORMAT = 1
+
+# Rebuilds page through the store with only the fields the index reads.
+_REBUILD_PAGE_SIZE = 1000
+_INDEXED_FIELDS = ("summary", "decision", "context", "category", "tags", "reasons", "project")
+
+_keyword_index: KeywordIndex | None = None
+_keyword_index_lock = asyncio.Lock()
 
 
 @dataclass
@@ -224,51 +245,390 @@ def merge_results(
     return ranked[:top_k]
 
 
-def get_cached_index(
-    decisions: list[dict[str, Any]],
-    cache_key: str = _CACHE_KEY,
-) -> BM25Index:
-    """Get or create cached BM25 index.
+class KeywordIndex:
+    """Incrementally maintained BM25 inverted index over decisions.
 
-    Caches the index for _CACHE_TTL_SECONDS to avoid rebuilding on every request.
-    Invalidates cache if decision count changes.
+    Scores match ``BM25Okapi`` (same k1, b, epsilon and IDF floor) computed
+    over the whole corpus. Category and project filters are posting sets
+    intersected with the term postings, so every filter combination shares
+    this one index.
 
-    Args:
-        decisions: List of decision dicts.
-        cache_key: Cache key (use different keys for filtered queries).
-
-    Returns:
-        Cached or newly built BM25Index.
+    Attributes:
+        dirty: True when the index changed since it was last saved.
+        version: DecisionStore change counter this index reflects, or None
+            if the store does not track one.
+        fingerprint: ``DecisionStore.fingerprint()`` when the index was last
+            saved in step with the store, or None; checked at load because
+            ``version`` may restart from zero with the process.
     """
-    global _index_cache
-
-    now = time.time()
-    doc_count = len(decisions)
 
-    # Check cache
-    if cache_key in _index_cache:
-        cached_index, cached_time, cached_count = _index_cache[cache_key]
+    def __init__(self, k1: float = 1.5, b: float = 0.75, epsilon: float = 0.25) -> None:
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        self._doc_tf: dict[str, dict[str, int]] = {}
+        self._doc_len: dict[str, int] = {}
+        self._total_len = 0
+        self._postings: dict[str, set[str]] = {}
+        self._doc_filters: dict[str, tuple[str | None, str | None]] = {}
+        self._by_category: dict[str, set[str]] = {}
+        self._by_project: dict[str, set[str]] = {}
+        # Mean IDF over the vocabulary, for the negative-IDF floor; recomputed
+        # lazily on the first search after a change.
+        self._avg_idf: float | None = None
+        self.dirty = False
+        self.version: int | None = None
+        self.fingerprint: str | None = None
 
-        # Valid if within TTL and count matches
-        if (now - cached_time) < _CACHE_TTL_SECONDS and cached_count == doc_count:
-            return cached_index
+    @classmethod
+    def from_decisions(cls, decisions: list[dict[str, Any]]) -> KeywordIndex:
+        """Build an index over ``decisions`` (dicts with at least an ``id``)."""
+        index = cls()
+        for d in decisions:
+            if doc_id := d.get("id"):
+                index.upsert(str(doc_id), d)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._doc_tf)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._doc_tf
+
+    def upsert(self, doc_id: str, decision: dict[str, Any]) -> None:
+        """Index (or re-index) one decision."""
+        tf = dict(Counter(tokenize(build_searchable_text(decision))))
+        category = decision.get("category")
+        project = decision.get("project")
+        self._add(doc_id, tf, str(category) if category else None, str(project) if project else None)
+
+    def remove(self, doc_id: str) -> None:
+        """Drop a decision from the index; unknown IDs are ignored."""
+        tf = self._doc_tf.pop(doc_id, None)
+        if tf is None:
+            return
+        for term in tf:
+            _discard(self._postings, term, doc_id)
+        self._total_len -= self._doc_len.pop(doc_id)
+        category, project = self._doc_filters.pop(doc_id)
+        if category:
+            _discard(self._by_category, category, doc_id)
+        if project:
+            _discard(self._by_project, project, doc_id)
+        self._avg_idf = None
+        self.dirty = True
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        category: str | None = None,
+        project: str | None = None,
+    ) -> list[tuple[str, float]]:
+        """Return the top-k (doc_id, score) pairs with a positive score.
 
-    # Build new index
-    new_index = BM25Index.from_decisions(decisions)
-    _index_cache[cache_key] = (new_index, now, doc_count)
+        Args:
+            query: Search query string.
+            top_k: Maximum results to return.
+            category: Only score decisions in this category.
+            project: Only score decisions in this project.
 
-    return new_index
+        Returns:
+            List of (doc_id, score) tuples, highest scores first.
+        """
+        tokens = tokenize(query)
+        if not tokens or not self._doc_tf:
+            return []
 
+        allowed: set[str] | None = None
+        for value, postings in ((category, self._by_category), (project, self._by_project)):
+            if value:
+                rows = postings.get(value, set())
+                allowed = rows if allowed is None else allowed & rows
+        if allowed is not None and not allowed:
+            return []
 
-def invalidate_cache(cache_key: str | None = None) -> None:
-    """Invalidate BM25 index cache.
+        n_docs = len(self._doc_tf)
+        avgdl = self._total_len / n_docs
+        floor = self.epsilon * self._average_idf()
+        scores: dict[str, float] = {}
+        for term in tokens:
+            docs = self._postings.get(term)
+            if not docs:
+                continue
+            idf = _idf(n_docs, len(docs))
+            if idf < 0:
+                idf = floor
+            candidates = docs if allowed is None else docs & allowed
+            for doc_id in candidates:
+                freq = self._doc_tf[doc_id][term]
+                norm = self.k1 * (1 - self.b + self.b * self._doc_len[doc_id] / avgdl)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * freq * (self.k1 + 1) / (freq + norm)
+
+        ranked = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        return [(doc_id, score) for doc_id, score in ranked if score > 0]
+
+    def save(self, path: Path) -> None:
+        """Write a JSON snapshot atomically (temp file + rename)."""
+        payload = {
+            "format": _SNAPSHOT_FORMAT,
+            "version": self.version,
+            "fingerprint": self.fingerprint,
+            "params": [self.k1, self.b, self.epsilon],
+            "docs": {
+                doc_id: [*self._doc_filters[doc_id], tf]
+                for doc_id, tf in self._doc_tf.items()
+            },
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+        self.dirty = False
 
-    Args:
-        cache_key: Specific key to invalidate, or None for all.
+    @classmethod
+    def load(cls, path: Path) -> KeywordIndex | None:
+        """Read a snapshot written by ``save``; None if missing or unreadable."""
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable BM25 snapshot %s", path, exc_info=True)
+            return None
+        if payload.get("format") != _SNAPSHOT_FORMAT:
+            return None
+
+        k1, b, epsilon = payload["params"]
+        index = cls(k1=k1, b=b, epsilon=epsilon)
+        for doc_id, (category, project, tf) in payload["docs"].items():
+            index._add(doc_id, tf, category, project)
+        index.version = payload.get("version")
+        index.fingerprint = payload.get("fingerprint")
+        index.dirty = False
+        return index
+
+    def _add(
+        self,
+        doc_id: str,
+        tf: dict[str, int],
+        category: str | None,
+        project: str | None,
+    ) -> None:
+        self.remove(doc_id)
+        self._doc_tf[doc_id] = tf
+        length = sum(tf.values())
+        self._doc_len[doc_id] = length
+        self._total_len += length
+        for term in tf:
+            self._postings.setdefault(term, set()).add(doc_id)
+        self._doc_filters[doc_id] = (category, project)
+        if category:
+            self._by_category.setdefault(category, set()).add(doc_id)
+        if project:
+            self._by_project.setdefault(project, set()).add(doc_id)
+        self._avg_idf = None
+        self.dirty = True
+
+    def _average_idf(self) -> float:
+        if self._avg_idf is None:
+            n_docs = len(self._doc_tf)
+            total = sum(_idf(n_docs, len(docs)) for docs in self._postings.values())
+            self._avg_idf = total / len(self._postings) if self._postings else 0.0
+        return self._avg_idf
+
+
+def _idf(n_docs: int, doc_freq: int) -> float:
+    """BM25Okapi IDF: log((N - n + 0.5) / (n + 0.5))."""
+    return math.log(n_docs - doc_freq + 0.5) - math.log(doc_freq + 0.5)
+
+
+def _discard(postings: dict[str, set[str]], key: str, doc_id: str) -> None:
+    docs = postings.get(key)
+    if docs is None:
+        return
+    docs.discard(doc_id)
+    if not docs:
+        del postings[key]
+
+
+def keyword_index_path() -> Path | None:
+    """Snapshot path from BM25_INDEX_PATH, or None when persistence is off."""
+    raw = os.getenv("BM25_INDEX_PATH", _DEFAULT_INDEX_PATH)
+    return Path(raw) if raw else None
+
+
+async def get_keyword_index() -> KeywordIndex:
+    """Get the shared keyword index, loading or rebuilding it when stale.
+
+    Freshness is one cheap ``DecisionStore.version()`` lookup per call: the
+    decision-service hooks advance ``index.version`` in step with their own
+    writes, so a mismatch means something else changed the store and the
+    index is rebuilt from it. A saved snapshot is reused at startup when
+    its fingerprint and document count match the store.
     """
-    global _index_cache
+    global _keyword_index
+
+    from .storage.factory import get_decision_store
+
+    store = get_decision_store()
+    current = await _store_version(store)
+    index = _keyword_index
+    if index is not None and (current is None or index.version == current):
+        return index
+
+    async with _keyword_index_lock:
+        index = _keyword_index
+        if index is not None and (current is None or index.version == current):
+            return index
+
+        if index is None:
+            path = keyword_index_path()
+            index = await asyncio.to_thread(KeywordIndex.load, path) if path else None
+            if index is not None and not await _snapshot_matches(index, store):
+                index = None
+            if index is not None:
+                # The snapshot matches the stored decisions; track this
+                # process's counter from here on.
+                index.version = current
+        else:
+            logger.info(
+                "Decision store changed outside the keyword-index hooks "
+                "(version %s -> %s); rebuilding", index.version, current,
+            )
+            index = None
+
+        if index is None:
+            index = KeywordIndex.from_decisions(await _load_corpus(store))
+            # Read before loading, so a write that races the load forces
+            # another rebuild instead of being silently missed.
+            index.version = current
+
+        _keyword_index = index
+        await save_keyword_index()
+        return index
+
+
+async def _load_corpus(store: Any) -> list[dict[str, Any]]:
+    """Every decision, paged through ``store.list`` by cursor."""
+    from .storage import ListQuery
+
+    decisions: list[dict[str, Any]] = []
+    cursor: str | None = None
+    try:
+        while True:
+            result = await store.list(ListQuery(
+                limit=_REBUILD_PAGE_SIZE,
+                fields=list(_INDEXED_FIELDS),
+                cursor=cursor,
+                include_total=False,
+            ))
+            decisions.extend(result.decisions)
+            cursor = result.next_cursor
+            if cursor is None or not result.decisions:
+                return decisions
+    except Exception:
+        logger.debug("Store list() failed, building keyword index from YAML", exc_info=True)
+
+    from .query_service import load_all_decisions
+
+    return await load_all_decisions()
+
+
+async def _store_version(store: Any) -> int | None:
+    try:
+        version: int | None = await store.version()
+    except Exception:
+        logger.debug("Store version() failed; keyword index trusts its hooks", exc_info=True)
+        return None
+    return version
+
+
+async def _store_fingerprint(store: Any) -> str | None:
+    try:
+        fingerprint: str | None = await store.fingerprint()
+    except Exception:
+        logger.debug("Store fingerprint() failed", exc_info=True)
+        return None
+    return fingerprint
+
+
+async def _snapshot_matches(index: KeywordIndex, store: Any) -> bool:
+    current = await _store_fingerprint(store)
+    if current is not None and index.fingerprint != current:
+        logger.info("BM25 snapshot is at store fingerprint %s, store is at %s", index.fingerprint, current)
+        return False
+    try:
+        expected = await store.count()
+    except Exception:
+        logger.debug("Store count() failed, rebuilding BM25 index", exc_info=True)
+        return False
+    if len(index) != expected:
+        logger.info(
+            "BM25 snapshot covers %d decisions, store has %d; rebuilding",
+            len(index), expected,
+        )
+        return False
+    return True
+
+
+def set_keyword_index(index: KeywordIndex | None) -> None:
+    """Replace the shared keyword index (None forces a reload on next use)."""
+    global _keyword_index
+    _keyword_index = index
+
+
+async def save_keyword_index() -> bool:
+    """Snapshot the shared keyword index if it has unsaved changes.
+
+    The snapshot carries the store fingerprint only while the index is in
+    step with the store (same version); otherwise the next load rebuilds.
 
-    if cache_key is None:
-        _index_cache.clear()
-    elif cache_key in _index_cache:
-        del _index_cache[cache_key]
+    Returns:
+        True if a snapshot was written.
+    """
+    from .storage.factory import get_decision_store
+
+    index = _keyword_index
+    path = keyword_index_path()
+    if index is None or path is None or not index.dirty:
+        return False
+    store = get_decision_store()
+    # Fingerprint first: a write landing after it moves the version too.
+    fingerprint = await _store_fingerprint(store)
+    in_step = index.version is not None and index.version == await _store_version(store)
+    index.fingerprint = fingerprint if in_step else None
+    try:
+        await asyncio.to_thread(index.save, path)
+    except OSError:
+        logger.warning("Failed to save BM25 snapshot to %s", path, exc_info=True)
+        return False
+    return True
+
+
+def index_decision_keywords(doc_id: str, decision: dict[str, Any]) -> None:
+    """Apply a decision just written to the DecisionStore to the keyword index.
+
+    Call once per successful store write (save, update_fields, or
+    update_outcome): each of those advances the store version by one, and
+    the index advances its own version to match.
+
+    A no-op until the index has been loaded: the first keyword query builds
+    it from the store, which already contains this decision.
+    """
+    index = _keyword_index
+    if index is None:
+        return
+    index.upsert(doc_id, decision)
+    if index.version is not None:
+        index.version += 1
+
+
+def remove_decision_keywords(doc_id: str) -> None:
+    """Remove a decision just deleted from the DecisionStore."""
+    index = _keyword_index
+    if index is None:
+        return
+    index.remove(doc_id)
+    if index.version is not None:
+        index.version += 1
@@ -9,9 +9,8 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from .decision_service import DECISIONS_PATH
+from .storage.yaml_cache import iter_decision_files
 
 logger = logging.getLogger(__name__)
 
@@ -200,6 +199,13 @@ class GetCalibrationResponse:
         return result
 
 
+# Everything calibration and drift read from a decision; the store skips the
+# text, reasons, and bridge columns they never look at.
+_CALIBRATION_FIELDS = [
+    "confidence", "outcome", "status", "category", "stakes", "created_at", "date",
+]
+
+
 async def _scan_decisions(
     decisions_path: str | None = None,
     agent: str | None = None,
@@ -214,7 +220,7 @@ async def _scan_decisions(
     """Load decisions with optional filters, preferring DecisionStore over YAML.
 
     Tries DecisionStore.list() first for efficient querying (SQLite indexed).
-    Falls back to YAML rglob if the store is unavailable or raises.
+    Falls back to the cached YAML files if the store is unavailable or raises.
 
     Args:
         decisions_path: Override for decisions directory (YAML fallback only).
@@ -249,6 +255,7 @@ async def _scan_decisions(
             date_to=until,
             sort="created_at",
             order="desc",
+            fields=_CALIBRATION_FIELDS,
         )
         result = await store.list(query)
         decisions = result.decisions
@@ -261,21 +268,15 @@ async def _scan_decisions(
     except Exception:
         logger.debug("DecisionStore unavailable, falling back to YAML scan", exc_info=True)
 
-    # --- Slow path: YAML rglob fallback ---
+    # --- Slow path: YAML fallback (parsed-document cache) ---
     base = Path(decisions_path or DECISIONS_PATH)
     decisions = []
 
     if not base.exists():
         return decisions
 
-    for yaml_file in base.rglob("*-decision-*.yaml"):
+    for _, _, data in iter_decision_files(base):
         try:
-            with open(yaml_file, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-
-            if not data:
-                continue
-
             # Review status filter
             if reviewed_only:
                 if data.get("status") != "reviewed":
@@ -1,6 +1,7 @@
 """Decision recording service for CSTP.
 
-Creates decision YAML files and indexes them to ChromaDB.
+Creates decision YAML files and indexes them to ChromaDB. Blocking file I/O
+runs on the shared YAML I/O pool (see ``yaml_io``), not on the event loop.
 """
 
 import json
@@ -14,9 +15,17 @@ from typing import Any
 
 import yaml
 
+from .bm25_index import index_decision_keywords
+from .embeddings.cache import get_embedding_cache
 from .embeddings.factory import get_embedding_provider
+from .index_pipeline import get_index_pipeline
+from .storage import DecisionStore
 from .storage.factory import get_decision_store
+from .storage.path_index import get_path_index
+from .storage.yaml_cache import get_yaml_cache
 from .vectordb.factory import get_vector_store
+from .yaml_mirror import get_yaml_mirror
+from .yaml_io import dump_yaml, run_io, write_yaml_atomic
 
 # Environment configuration
 DECISIONS_PATH = os.getenv("DECISIONS_PATH", "decisions")
@@ -581,7 +590,7 @@ class RecordDecisionResponse:
     success: bool
     id: str
     path: str
-    indexed: bool
+    indexed: bool | str  # "queued" when RECORD_INDEXING=queued
     timestamp: str
     error: str | None = None
     quality: dict[str, Any] | None = None  # F027 P3: Quality score
@@ -801,6 +810,12 @@ def build_decision_yaml(request: RecordDecisionRequest, decision_id: str) -> dic
     return decision_data
 
 
+def decision_file_path(base: Path, decision_id: str, when: datetime) -> Path:
+    """Return ``base/YYYY/MM/YYYY-MM-DD-decision-<id>.yaml`` for ``when``."""
+    filename = f"{when.strftime('%Y-%m-%d')}-decision-{decision_id}.yaml"
+    return base / str(when.year) / f"{when.month:02d}" / filename
+
+
 def write_decision_file(
     decision_data: dict[str, Any],
     decision_id: str,
@@ -808,22 +823,24 @@ def write_decision_file(
 ) -> str:
     """Write decision to YAML file. Returns file path."""
     base = Path(base_path or DECISIONS_PATH)
-    now = datetime.now(UTC)
+    file_path = decision_file_path(base, decision_id, datetime.now(UTC))
 
     # Create directory structure: decisions/YYYY/MM/
-    year_month_dir = base / str(now.year) / f"{now.month:02d}"
-    year_month_dir.mkdir(parents=True, exist_ok=True)
-
-    # File name: YYYY-MM-DD-decision-<id>.yaml
-    filename = f"{now.strftime('%Y-%m-%d')}-decision-{decision_id}.yaml"
-    file_path = year_month_dir / filename
+    file_path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(file_path, "w", encoding="utf-8") as f:
-        yaml.dump(decision_data, f, default_flow_style=False, sort_keys=False)
+        dump_yaml(decision_data, f)
 
+    get_path_index(base).record(decision_id, file_path)
     return str(file_path)
 
 
+def _write_yaml(file_path: Path, data: dict[str, Any]) -> None:
+    """Overwrite a decision file in place."""
+    with open(file_path, "w", encoding="utf-8") as f:
+        dump_yaml(data, f)
+
+
 @dataclass
 class GetDecisionRequest:
     """Request to get a single decision by ID."""
@@ -864,7 +881,7 @@ class GetDecisionResponse:
 async def get_decision(request: GetDecisionRequest) -> GetDecisionResponse:
     """Get a single decision by ID, returning full contents.
 
-    Tries DecisionStore first, falls back to YAML rglob if not found.
+    Tries DecisionStore first, falls back to the YAML file if not found.
 
     Args:
         request: Contains the decision ID to look up.
@@ -881,25 +898,26 @@ async def get_decision(request: GetDecisionRequest) -> GetDecisionResponse:
     except Exception as e:
         logger.debug("DecisionStore get failed, falling back to YAML: %s", e)
 
+    return await run_io(_get_decision_from_yaml, request.decision_id)
+
+
+def _get_decision_from_yaml(decision_id: str) -> GetDecisionResponse:
+    """Blocking YAML fallback for get_decision; runs on the I/O pool."""
     base = Path(DECISIONS_PATH)
     if not base.exists():
         return GetDecisionResponse(found=False, error="Decisions directory not found")
 
-    # Search for matching file (glob handles both exact and prefix matches)
-    pattern = f"*-decision-{request.decision_id}*.yaml"
-    matches = list(base.rglob(pattern))
+    # Exact ID, else the first ID it is a prefix of
+    yaml_file = get_path_index(base).get_prefix(decision_id)
 
-    if not matches:
+    if yaml_file is None:
         return GetDecisionResponse(
             found=False,
-            error=f"Decision not found: {request.decision_id}",
+            error=f"Decision not found: {decision_id}",
         )
 
-    # Read the first match
-    yaml_file = matches[0]
     try:
-        with open(yaml_file, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = get_yaml_cache().load(yaml_file)
 
         if not data:
             return GetDecisionResponse(
@@ -931,15 +949,35 @@ async def get_decision(request: GetDecisionRequest) -> GetDecisionResponse:
 
 
 async def generate_embedding(text: str) -> list[float] | None:
-    """Generate embedding using the configured EmbeddingProvider."""
+    """Generate embedding using the configured EmbeddingProvider.
+
+    Goes through the shared embedding cache, so unchanged text is never
+    re-embedded by record, review, or reindex.
+    """
     try:
         provider = get_embedding_provider()
-        return await provider.embed(text)
+        return await get_embedding_cache().embed(provider, text)
     except Exception as e:
         logger.warning("Failed to generate embedding: %s", e)
         return None
 
 
+async def generate_embeddings(texts: list[str]) -> list[list[float] | None]:
+    """Embed many texts with one cached batch call.
+
+    If the batch fails, each text is retried on its own so one bad input
+    only loses its own embedding.
+    """
+    if not texts:
+        return []
+    try:
+        provider = get_embedding_provider()
+        return list(await get_embedding_cache().embed_batch(provider, texts))
+    except Exception as e:
+        logger.warning("Batch embedding failed, retrying one by one: %s", e)
+    return [await generate_embedding(text) for text in texts]
+
+
 def build_embedding_text(request: RecordDecisionRequest) -> str:
     """Build text for embedding generation."""
     parts = [f"Decision: {request.decision}"]
@@ -1020,7 +1058,11 @@ async def record_decision(
 ) -> RecordDecisionResponse:
     """Record a new decision.
 
-    Creates YAML file and indexes to ChromaDB.
+    Creates YAML file and indexes to ChromaDB. With the write-behind YAML
+    mirror active, only the store write is synchronous and the YAML file
+    is queued (see ``yaml_mirror``). With queued indexing active, the
+    vector index entry is queued the same way and the response reports
+    ``indexed="queued"`` (see ``index_pipeline``).
 
     Args:
         request: The decision to record.
@@ -1031,43 +1073,69 @@ async def record_decision(
     """
     now = datetime.now(UTC)
     decision_id = generate_decision_id()
+    base = Path(decisions_path or DECISIONS_PATH)
 
     # Build and write YAML
     decision_data = build_decision_yaml(request, decision_id)
 
-    try:
-        file_path = write_decision_file(decision_data, decision_id, decisions_path)
-    except Exception as e:
-        return RecordDecisionResponse(
-            success=False,
-            id=decision_id,
-            path="",
-            indexed=False,
-            timestamp=now.isoformat(),
-            error=f"Failed to write decision file: {e}",
-        )
+    # Outbox entries committed in the same store transaction as the decision
+    outbox: list[tuple[str, dict[str, Any] | None]] = []
+    mirror = get_yaml_mirror()
+    write_behind = mirror.active
+    if write_behind:
+        # Write-behind: the store write is the only synchronous one; the YAML
+        # file is queued in the same transaction and written by the mirror.
+        file_path = str(decision_file_path(base, decision_id, now))
+        outbox.append(mirror.entry(decision_id, decision_data, Path(file_path), base))
+    else:
+        try:
+            file_path = await run_io(write_decision_file, decision_data, decision_id, decisions_path)
+        except Exception as e:
+            return RecordDecisionResponse(
+                success=False,
+                id=decision_id,
+                path="",
+                indexed=False,
+                timestamp=now.isoformat(),
+                error=f"Failed to write decision file: {e}",
+            )
+
+    embedding_text = build_embedding_text(request)
+    metadata = build_index_metadata(request, file_path, now)
+    pipeline = get_index_pipeline()
+    queue_index = pipeline.active
+    if queue_index:
+        outbox.append(pipeline.entry(decision_id, embedding_text, metadata))
 
     # F050: write to the DecisionStore. This is authoritative, not best-effort:
     # listDecisions, getStats, and calibration all read from the store, so a
     # swallowed failure here would acknowledge a decision that no query can ever
     # return. The YAML file is left in place — it is the only remaining copy and
     # a later migration can still pick it up — but the call reports failure.
+    store = get_decision_store()
     store_error = await _persist_store_mutation(
         decision_id,
         "decision",
-        get_decision_store().save(decision_id, decision_data),
+        _save_with_outbox(store, decision_id, decision_data, outbox)
+        if outbox
+        else store.save(decision_id, decision_data),
     )
     if store_error:
-        # Discard the file we just created. A retry mints a fresh decision_id, so
-        # keeping this one would leave an orphan that a later migration imports as
-        # a second, phantom copy of the same decision. Nothing is lost: the record
-        # was never acknowledged, and the caller still holds the payload.
-        try:
-            Path(file_path).unlink(missing_ok=True)
-            note = "The partial YAML file was removed; the call is safe to retry."
-        except Exception as e:
-            logger.error("Could not remove orphaned decision file %s: %s", file_path, e)
-            note = f"An orphaned YAML file remains at {file_path} ({e})."
+        if write_behind:
+            note = "Nothing was written; the call is safe to retry."
+        else:
+            # Discard the file we just created. A retry mints a fresh decision_id,
+            # so keeping this one would leave an orphan that a later migration
+            # imports as a second, phantom copy of the same decision. Nothing is
+            # lost: the record was never acknowledged, and the caller still holds
+            # the payload.
+            try:
+                await run_io(Path(file_path).unlink, missing_ok=True)
+                get_path_index(base).forget(decision_id)
+                note = "The partial YAML file was removed; the call is safe to retry."
+            except Exception as e:
+                logger.error("Could not remove orphaned decision file %s: %s", file_path, e)
+                note = f"An orphaned YAML file remains at {file_path} ({e})."
         return RecordDecisionResponse(
             success=False,
             id=decision_id,
@@ -1076,10 +1144,53 @@ async def record_decision(
             timestamp=now.isoformat(),
             error=f"{store_error} {note}",
         )
+    if write_behind:
+        mirror.queued()
 
-    # Index to ChromaDB
-    embedding_text = build_embedding_text(request)
-    metadata = {
+    index_decision_keywords(decision_id, decision_data)
+
+    # Index to ChromaDB, or leave it to the index workers
+    indexed: bool | str
+    if queue_index:
+        pipeline.queued()
+        indexed = "queued"
+    else:
+        indexed = await index_to_chromadb(decision_id, embedding_text, metadata)
+
+    # F027 P3: Score recording quality
+    quality = score_decision_quality(request)
+
+    return RecordDecisionResponse(
+        success=True,
+        id=decision_id,
+        path=file_path,
+        indexed=indexed,
+        timestamp=now.isoformat(),
+        quality=quality,
+    )
+
+
+async def _save_with_outbox(
+    store: DecisionStore,
+    decision_id: str,
+    data: dict[str, Any],
+    outbox: list[tuple[str, dict[str, Any] | None]],
+) -> bool:
+    """Save a decision with its outbox entries; a store without an outbox is an error."""
+    saved = await store.save_with_outbox(decision_id, data, outbox)
+    if saved is None:
+        msg = f"{type(store).__name__} has no outbox"
+        raise RuntimeError(msg)
+    return saved
+
+
+def build_index_metadata(
+    request: RecordDecisionRequest,
+    file_path: str,
+    now: datetime,
+) -> dict[str, Any]:
+    """Build vector-store metadata for a newly recorded decision."""
+    metadata: dict[str, Any] = {
         "path": file_path,
         "title": request.decision[:500],
         "category": request.category,
@@ -1131,19 +1242,7 @@ async def record_decision(
         if bridge_obj:
             metadata["bridge_json"] = json.dumps(bridge_obj)[:1000]
 
-    indexed = await index_to_chromadb(decision_id, embedding_text, metadata)
-
-    # F027 P3: Score recording quality
-    quality = score_decision_quality(request)
-
-    return RecordDecisionResponse(
-        success=True,
-        id=decision_id,
-        path=file_path,
-        indexed=indexed,
-        timestamp=now.isoformat(),
-        quality=quality,
-    )
+    return metadata
 
 
 # =============================================================================
@@ -1223,7 +1322,7 @@ async def find_decision(
 ) -> tuple[Path, dict[str, Any]] | None:
     """Find a decision by ID.
 
-    Searches decisions directory for matching ID.
+    Looks the ID up in the decisions directory's path index.
 
     Args:
         decision_id: The decision ID to find (must be alphanumeric).
@@ -1239,18 +1338,24 @@ async def find_decision(
     if not decision_id or not decision_id.replace("-", "").replace("_", "").isalnum():
         raise ValueError(f"Invalid decision ID format: {decision_id}")
     base = Path(decisions_path or DECISIONS_PATH)
+    # Write-behind mode: make sure a queued file for this decision exists first
+    await get_yaml_mirror().flush(decision_id)
+    return await run_io(_find_decision_file, base, decision_id)
+
 
+def _find_decision_file(base: Path, decision_id: str) -> tuple[Path, dict[str, Any]] | None:
+    """Blocking lookup and parse for find_decision; runs on the I/O pool."""
     if not base.exists():
         return None
 
-    # Search pattern: decisions/YYYY/MM/*-decision-{id}.yaml
-    for yaml_file in base.rglob(f"*-decision-{decision_id}.yaml"):
-        try:
-            with open(yaml_file, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-            return (yaml_file, data)
-        except Exception as e:
-            logger.warning("Failed to read decision file %s: %s", yaml_file, e)
+    yaml_file = get_path_index(base).get(decision_id)
+    if yaml_file is None:
+        return None
+    try:
+        data = get_yaml_cache().load(yaml_file)
+        return (yaml_file, data)
+    except Exception as e:
+        logger.warning("Failed to read decision file %s: %s", yaml_file, e)
 
     return None
 
@@ -1270,6 +1375,25 @@ async def reindex_decision(
     Returns:
         True if indexing succeeded.
     """
+    embedding_text, metadata = build_reindex_document(data, file_path)
+    # A still-queued record entry would land later with the old text
+    await get_index_pipeline().settle(decision_id)
+    return await index_to_chromadb(decision_id, embedding_text, metadata)
+
+
+def build_reindex_document(
+    data: dict[str, Any],
+    file_path: str,
+) -> tuple[str, dict[str, Any]]:
+    """Build the embedding text and vector metadata for a stored decision.
+
+    Args:
+        data: Decision data as stored.
+        file_path: Path to the decision file.
+
+    Returns:
+        Tuple of (embedding_text, metadata).
+    """
     # Build embedding text from decision data
     parts = [f"Decision: {data.get('summary', data.get('decision', ''))}"]
 
@@ -1373,7 +1497,7 @@ async def reindex_decision(
         if bridge_obj:
             metadata["bridge_json"] = json.dumps(bridge_obj)[:1000]
 
-    return await index_to_chromadb(decision_id, embedding_text, metadata)
+    return embedding_text, metadata
 
 
 async def update_decision(
@@ -1418,8 +1542,7 @@ async def update_decision(
 
     # Write back
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        await run_io(_write_yaml, file_path, data)
     except Exception as e:
         return {"success": False, "error": f"Failed to write: {e}"}
 
@@ -1441,6 +1564,8 @@ async def update_decision(
             ),
         }
 
+    index_decision_keywords(str(data.get("id") or decision_id), data)
+
     # Re-index
     indexed = await reindex_decision(decision_id, data, str(file_path))
 
@@ -1497,13 +1622,12 @@ async def append_thought(
     # rereads the already-appended YAML and adds the same thought again at the
     # next step number, duplicating it in the trace once the store recovers.
     try:
-        original_bytes = file_path.read_bytes()
+        original_bytes = await run_io(file_path.read_bytes)
     except Exception as e:
         return {"success": False, "error": f"Failed to read for rollback: {e}"}
 
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        await run_io(_write_yaml, file_path, data)
     except Exception as e:
         return {"success": False, "error": f"Failed to write: {e}"}
 
@@ -1514,13 +1638,16 @@ async def append_thought(
         get_decision_store().update_fields(decision_id, deliberation=delib),
     )
     if store_error:
-        rollback_note = _restore_yaml(file_path, original_bytes)
+        rollback_note = await run_io(_restore_yaml, file_path, original_bytes)
         return {
             "success": False,
             "decision_id": decision_id,
             "error": f"{store_error} {rollback_note}",
         }
 
+    # Text is unchanged, but the hook keeps the index's store version in step.
+    index_decision_keywords(str(data.get("id") or decision_id), data)
+
     return {
         "success": True,
         "decision_id": decision_id,
@@ -1580,20 +1707,7 @@ async def review_decision(
 
     # Write updated YAML atomically (write to temp, then replace)
     try:
-        import tempfile
-        temp_fd, temp_path = tempfile.mkstemp(
-            suffix=".yaml",
-            dir=path.parent,
-        )
-        try:
-            with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
-            os.replace(temp_path, path)
-        except Exception:
-            # Clean up temp file on failure
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-            raise
+        await run_io(write_yaml_atomic, path, data)
     except Exception as e:
         return ReviewDecisionResponse(
             success=False,
@@ -1650,6 +1764,8 @@ async def review_decision(
             ),
         )
 
+    index_decision_keywords(str(data.get("id") or request.id), data)
+
     # Re-index with outcome metadata
     reindexed = await reindex_decision(request.id, data, str(path))
 
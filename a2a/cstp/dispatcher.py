@@ -3,6 +3,7 @@
 Routes incoming JSON-RPC requests to appropriate method handlers.
 """
 
+import asyncio
 import logging
 from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
@@ -20,7 +21,7 @@ from .attribution_service import (
     AttributeOutcomesRequest,
     attribute_outcomes,
 )
-from .bm25_index import get_cached_index, merge_results
+from .bm25_index import get_keyword_index, merge_results
 from .calibration_service import (
     GetCalibrationRequest,
     get_calibration,
@@ -46,6 +47,7 @@ from .models import (
     CheckGuardrailsRequest,
     CheckGuardrailsResponse,
     DecisionSummary,
+    ExplainQueryResponse,
     GetCircuitStateRequest,
     GetCircuitStateResponse,
     GetStatsRequest,
@@ -53,6 +55,8 @@ from .models import (
     GuardrailViolation,
     ListDecisionsRequest,
     ListDecisionsResponse,
+    IndexStatusResponse,
+    MirrorStatusResponse,
     PreActionRequest,
     QueryDecisionsRequest,
     QueryDecisionsResponse,
@@ -72,6 +76,7 @@ from .provenance_service import (
 from .query_service import query_decisions, load_all_decisions
 from .reindex_service import reindex_decisions
 from .session_context_service import get_session_context
+from .storage import ListQuery
 
 logger = logging.getLogger("cstp.dispatcher")
 
@@ -89,6 +94,24 @@ def _extract_bridge(d: dict[str, Any]) -> dict[str, str] | None:
     return result or None
 
 
+# Decision fields a DecisionSummary is built from; reasons and actual_result
+# are only read when the request asks for them.
+_SUMMARY_FIELDS = (
+    "summary", "decision", "category", "confidence", "stakes", "status",
+    "outcome", "created_at", "tags", "pattern", "lessons", "bridge",
+)
+
+
+def _summary_fields(request: QueryDecisionsRequest) -> tuple[str, ...]:
+    """Projection for hydrating search hits into DecisionSummary rows."""
+    fields: tuple[str, ...] = _SUMMARY_FIELDS
+    if request.include_reasons:
+        fields += ("reasons",)
+    if request.include_detail:
+        fields += ("actual_result",)
+    return fields
+
+
 # Type alias for method handlers
 MethodHandler = Callable[[dict[str, Any], str], Awaitable[dict[str, Any]]]
 
@@ -244,6 +267,31 @@ def _annotate_compaction_levels(result: QueryDecisionsResponse) -> None:
     result.total = len(annotated)
 
 
+async def _keyword_hits(
+    request: QueryDecisionsRequest,
+    top_k: int,
+) -> list[tuple[str, float]]:
+    """BM25 hits for a query: store-native FTS first, else the shared index."""
+    from .storage.factory import get_decision_store
+
+    hits = await get_decision_store().keyword_search(
+        request.query,
+        {"category": request.filters.category, "project": request.filters.project},
+        top_k,
+    )
+    if hits is not None:
+        return hits
+
+    # One shared incremental index; filters are posting-set intersections
+    keyword_index = await get_keyword_index()
+    return keyword_index.search(
+        request.query,
+        top_k,
+        category=request.filters.category,
+        project=request.filters.project,
+    )
+
+
 async def _handle_query_decisions(params: dict[str, Any], agent_id: str) -> dict[str, Any]:
     """Handle cstp.queryDecisions method.
 
@@ -335,18 +383,16 @@ async def _handle_query_decisions(params: dict[str, Any], agent_id: str) -> dict
         return result.to_dict()
 
     if request.retrieval_mode == "keyword":
-        # Keyword-only search via BM25
-        all_decisions = await load_all_decisions(
-            category=request.filters.category,
-            project=request.filters.project,
-        )
-        # Use cached index for performance
-        cache_key = f"kw:{request.filters.category}:{request.filters.project}"
-        bm25_index = get_cached_index(all_decisions, cache_key)
-        keyword_results = bm25_index.search(request.query, request.limit)
+        # Keyword-only search via BM25, ranked in the store when it can
+        keyword_results = await _keyword_hits(request, request.limit)
+
+        # Hydrate only the hits, in one batched store call
+        from .storage.factory import get_decision_store
 
-        # Build decision map for quick lookup
-        decision_map = {d["id"]: d for d in all_decisions}
+        decision_map = await get_decision_store().get_many(
+            [doc_id for doc_id, _ in keyword_results],
+            fields=_summary_fields(request),
+        )
 
         decisions = []
         for doc_id, score in keyword_results:
@@ -396,6 +442,7 @@ async def _handle_query_decisions(params: dict[str, Any], agent_id: str) -> dict
             pr=request.filters.pr,
             has_outcome=request.filters.has_outcome,
             tags=request.filters.tags,
+            search_mode=request.search_mode,
         )
 
         if response.error:
@@ -408,14 +455,7 @@ async def _handle_query_decisions(params: dict[str, Any], agent_id: str) -> dict
         ]
 
         # Get keyword results
-        all_decisions = await load_all_decisions(
-            category=request.filters.category,
-            project=request.filters.project,
-        )
-        # Use cached index for performance
-        cache_key = f"hybrid:{request.filters.category}:{request.filters.project}"
-        bm25_index = get_cached_index(all_decisions, cache_key)
-        keyword_results = bm25_index.search(request.query, request.limit * 2)
+        keyword_results = await _keyword_hits(request, request.limit * 2)
 
         # Merge results
         merged = merge_results(
@@ -425,12 +465,15 @@ async def _handle_query_decisions(params: dict[str, Any], agent_id: str) -> dict
             top_k=request.limit,
         )
 
-        # Build response from merged results
-        decision_map = {d["id"][:8]: d for d in all_decisions}
-        decision_map.update({d["id"]: d for d in all_decisions})
-
-        # Also map from semantic results
+        # Build response from merged results; semantic hits carry their
+        # metadata, so only keyword-only hits need hydrating from the store
         semantic_map = {r.id: r for r in response.results}
+        from .storage.factory import get_decision_store
+
+        decision_map = await get_decision_store().get_many(
+            [doc_id for doc_id, _ in merged if doc_id not in semantic_map],
+            fields=_summary_fields(request),
+        )
 
         decisions = []
         for doc_id, score_dict in merged:
@@ -500,6 +543,7 @@ async def _handle_query_decisions(params: dict[str, Any], agent_id: str) -> dict
             pr=request.filters.pr,
             has_outcome=request.filters.has_outcome,
             tags=request.filters.tags,
+            search_mode=request.search_mode,
         )
 
         if response.error:
@@ -925,6 +969,27 @@ async def _handle_get_wisdom(
     return response.to_dict()
 
 
+def _list_query(request: ListDecisionsRequest) -> ListQuery:
+    """Map a listDecisions request onto the store's ListQuery."""
+    return ListQuery(
+        limit=request.limit,
+        offset=request.offset,
+        category=request.category,
+        stakes=request.stakes,
+        status=request.status,
+        agent=request.agent,
+        tags=request.tags,
+        project=request.project,
+        date_from=request.date_from,
+        date_to=request.date_to,
+        search=request.search,
+        sort=request.sort,
+        order=request.order,
+        cursor=request.cursor,
+        include_total=request.include_total,
+    )
+
+
 async def _handle_list_decisions(params: dict[str, Any], agent_id: str) -> dict[str, Any]:
     """Handle cstp.listDecisions method (F050).
 
@@ -935,38 +1000,86 @@ async def _handle_list_decisions(params: dict[str, Any], agent_id: str) -> dict[
         agent_id: Authenticated agent ID.
 
     Returns:
-        Paginated list of decisions with total count.
+        Paginated list of decisions with total count (None when
+        ``includeTotal`` is false) and a ``nextCursor`` for the next page.
     """
-    from .storage import ListQuery
     from .storage.factory import get_decision_store
 
     request = ListDecisionsRequest.from_params(params)
     store = get_decision_store()
-    query = ListQuery(
-        limit=request.limit,
-        offset=request.offset,
-        category=request.category,
-        stakes=request.stakes,
-        status=request.status,
-        agent=request.agent,
-        tags=request.tags,
-        project=request.project,
-        date_from=request.date_from,
-        date_to=request.date_to,
-        search=request.search,
-        sort=request.sort,
-        order=request.order,
-    )
-    result = await store.list(query)
+    result = await store.list(_list_query(request))
     response = ListDecisionsResponse(
         decisions=result.decisions,
         total=result.total,
         limit=result.limit,
         offset=result.offset,
+        next_cursor=result.next_cursor,
     )
     return response.to_dict()
 
 
+async def _handle_explain_query(params: dict[str, Any], agent_id: str) -> dict[str, Any]:
+    """Handle cstp.explainQuery method.
+
+    Debug aid: shows how the store would run a cstp.listDecisions query
+    (SQLite: EXPLAIN QUERY PLAN of its count and page statements), so
+    regressions to full table scans are visible.
+
+    Args:
+        params: The same params cstp.listDecisions accepts.
+        agent_id: Authenticated agent ID.
+
+    Returns:
+        Plan steps per statement and whether any step scans a whole table.
+    """
+    from .storage.factory import get_decision_store
+
+    request = ListDecisionsRequest.from_params(params or {})
+    store = get_decision_store()
+    plans = await store.explain(_list_query(request))
+    return ExplainQueryResponse(plans=plans).to_dict()
+
+
+async def _handle_mirror_status(params: dict[str, Any], agent_id: str) -> dict[str, Any]:
+    """Handle cstp.mirrorStatus method.
+
+    Reports the write-behind YAML mirror: how many decision files are still
+    queued, how old the oldest one is, and recent write failures.
+
+    Args:
+        params: Unused.
+        agent_id: Authenticated agent ID.
+
+    Returns:
+        Mirror mode, backlog size, lag gauge, and worker counters.
+    """
+    from .yaml_mirror import get_yaml_mirror
+
+    status = await get_yaml_mirror().status()
+    return MirrorStatusResponse(**status).to_dict()
+
+
+async def _handle_index_status(params: dict[str, Any], agent_id: str) -> dict[str, Any]:
+    """Handle cstp.indexStatus method.
+
+    Reports the queued vector-indexing backlog and, given ``id``, whether
+    that decision is unknown, still queued, being retried, or has no index
+    work pending.
+
+    Args:
+        params: JSON-RPC params (optional ``id``).
+        agent_id: Authenticated agent ID.
+
+    Returns:
+        Indexing mode, backlog size, lag gauge, worker counters, and the
+        decision's state if requested.
+    """
+    from .index_pipeline import get_index_pipeline
+
+    status = await get_index_pipeline().status(params.get("id") or None)
+    return IndexStatusResponse(**status).to_dict()
+
+
 async def _handle_get_stats(params: dict[str, Any], agent_id: str) -> dict[str, Any]:
     """Handle cstp.getStats method (F050).
 
@@ -1175,6 +1288,9 @@ def register_methods(dispatcher: CstpDispatcher) -> None:
     # F050: Structured Storage Layer
     dispatcher.register("cstp.listDecisions", _handle_list_decisions)
     dispatcher.register("cstp.getStats", _handle_get_stats)
+    dispatcher.register("cstp.explainQuery", _handle_explain_query)
+    dispatcher.register("cstp.mirrorStatus", _handle_mirror_status)
+    dispatcher.register("cstp.indexStatus", _handle_index_status)
 
     # F030: Circuit Breaker
     dispatcher.register("cstp.listBreakers", _handle_list_breakers)
@@ -1418,15 +1534,19 @@ async def _handle_record_decision(params: dict[str, Any], agent_id: str) -> dict
         from .deliberation_tracker import get_tracker
         get_tracker().backfill_consumed(tracker_key, response.id)
 
-    # F045 follow-up: Auto-link decision in graph
-    auto_linked = 0
-    if response.success and response.id:
-        from .graph_service import safe_auto_link
+    if not response.success:
+        raise RuntimeError(response.error or "Failed to record decision")
 
-        related_dicts = (
-            [r.to_dict() for r in request.related_to] if request.related_to else []
-        )
-        auto_linked = await safe_auto_link(
+    # F045 follow-up: Auto-link decision in graph, concurrently with
+    # F026 guardrails against the record context (supports deliberation checks)
+    from .graph_service import safe_auto_link
+    from .guardrails_service import evaluate_record_guardrails
+
+    related_dicts = (
+        [r.to_dict() for r in request.related_to] if request.related_to else []
+    )
+    auto_linked, record_warnings = await asyncio.gather(
+        safe_auto_link(
             response_id=response.id,
             category=request.category,
             stakes=request.stakes,
@@ -1435,10 +1555,9 @@ async def _handle_record_decision(params: dict[str, Any], agent_id: str) -> dict
             pattern=request.pattern,
             related_to=related_dicts,
             summary=str(request.decision)[:120],
-        )
-
-    if not response.success:
-        raise RuntimeError(response.error or "Failed to record decision")
+        ),
+        evaluate_record_guardrails(request),
+    )
 
     # Add auto-deliberation info to response only if auto-capture happened
     result = response.to_dict()
@@ -1448,9 +1567,6 @@ async def _handle_record_decision(params: dict[str, Any], agent_id: str) -> dict
         result["deliberation_auto"] = True
         result["deliberation_inputs_count"] = len(request.deliberation.inputs)
 
-    # F026: Run guardrails against record context (supports deliberation checks)
-    from .guardrails_service import evaluate_record_guardrails
-    record_warnings = await evaluate_record_guardrails(request)
     if record_warnings:
         result["guardrail_warnings"] = record_warnings
 
@@ -45,6 +45,9 @@ class EmbeddingProvider(ABC):
         """
         return [await self.embed(t) for t in texts]
 
+    async def close(self) -> None:  # noqa: B027
+        """Release HTTP clients or other resources. Override if held."""
+
     @property
     @abstractmethod
     def dimensions(self) -> int:
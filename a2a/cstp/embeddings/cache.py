@@ -0,0 +1,237 @@
+"""Content-addressed embedding cache.
+
+Embeddings are keyed by ``(model_name, dimensions, sha256(text))``, so the
+same text embedded by ``record_decision``, ``reindex_decision``, a full
+reindex, or a repeated query is only sent to the provider once. Lookups go
+through an in-memory LRU tier first and an optional SQLite tier second;
+the SQLite tier survives restarts, so reindexing after a metadata-only
+change costs no API calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from . import EmbeddingProvider
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[str, int, str]
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    dimensions INTEGER NOT NULL,
+    text_sha256 TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (model, dimensions, text_sha256)
+) WITHOUT ROWID;
+"""
+
+
+def cache_key(provider: EmbeddingProvider, text: str) -> CacheKey:
+    """Return the cache key for embedding ``text`` with ``provider``."""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return (provider.model_name, provider.dimensions, digest)
+
+
+class EmbeddingCache:
+    """Two-tier (LRU memory + optional SQLite) embedding cache.
+
+    Vectors are stored as float64 so cached values round-trip exactly.
+
+    Attributes:
+        hits: Lookups answered from either tier.
+        misses: Lookups that had to call the provider.
+        disk_hits: The subset of ``hits`` served by the SQLite tier.
+    """
+
+    def __init__(self, max_entries: int = 10_000, db_path: str | None = None) -> None:
+        self._max_entries = max(0, max_entries)
+        self._memory: OrderedDict[CacheKey, list[float]] = OrderedDict()
+        self._db_path = Path(db_path) if db_path else None
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    # ------------------------------------------------------------------
+    # Embedding entry points
+    # ------------------------------------------------------------------
+
+    async def embed(self, provider: EmbeddingProvider, text: str) -> list[float]:
+        """Return the embedding for ``text``, calling the provider on a miss."""
+        key = cache_key(provider, text)
+        vector = await self._lookup(key)
+        if vector is not None:
+            return vector
+        vector = await provider.embed(text)
+        await self._store({key: vector})
+        return vector
+
+    async def embed_batch(self, provider: EmbeddingProvider, texts: list[str]) -> list[list[float]]:
+        """Embed ``texts``, sending only the uncached ones to ``embed_batch``."""
+        keys = [cache_key(provider, t) for t in texts]
+        found: dict[CacheKey, list[float]] = {}
+        for key in dict.fromkeys(keys):
+            vector = self._memory_get(key)
+            if vector is not None:
+                found[key] = vector
+        missing = [k for k in dict.fromkeys(keys) if k not in found]
+        if missing and self._db_path is not None:
+            from_disk = await asyncio.to_thread(self._disk_get_many, missing)
+            for key, vector in from_disk.items():
+                self._memory_put(key, vector)
+            found.update(from_disk)
+            self.disk_hits += len(from_disk)
+
+        todo = {k: t for k, t in zip(keys, texts, strict=True) if k not in found}
+        self.hits += len(keys) - sum(1 for k in keys if k in todo)
+        self.misses += sum(1 for k in keys if k in todo)
+        if todo:
+            vectors = await provider.embed_batch(list(todo.values()))
+            fresh = dict(zip(todo, vectors, strict=True))
+            await self._store(fresh)
+            found.update(fresh)
+        return [found[k] for k in keys]
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and tier sizes."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "persistent": self._db_path is not None,
+        }
+
+    def close(self) -> None:
+        """Close the SQLite tier connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Tiers
+    # ------------------------------------------------------------------
+
+    async def _lookup(self, key: CacheKey) -> list[float] | None:
+        vector = self._memory_get(key)
+        if vector is None and self._db_path is not None:
+            vector = (await asyncio.to_thread(self._disk_get_many, [key])).get(key)
+            if vector is not None:
+                self._memory_put(key, vector)
+                self.disk_hits += 1
+        if vector is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return vector
+
+    async def _store(self, entries: dict[CacheKey, list[float]]) -> None:
+        for key, vector in entries.items():
+            self._memory_put(key, vector)
+        if self._db_path is not None:
+            await asyncio.to_thread(self._disk_put_many, entries)
+
+    def _memory_get(self, key: CacheKey) -> list[float] | None:
+        vector = self._memory.get(key)
+        if vector is not None:
+            self._memory.move_to_end(key)
+        return vector
+
+    def _memory_put(self, key: CacheKey, vector: list[float]) -> None:
+        if self._max_entries == 0:
+            return
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            assert self._db_path is not None  # noqa: S101
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA_SQL)
+        return self._conn
+
+    def _disk_get_many(self, keys: list[CacheKey]) -> dict[CacheKey, list[float]]:
+        found: dict[CacheKey, list[float]] = {}
+        try:
+            with self._lock:
+                conn = self._connect()
+                for key in keys:
+                    row = conn.execute(
+                        "SELECT vector FROM embeddings "
+                        "WHERE model = ? AND dimensions = ? AND text_sha256 = ?",
+                        key,
+                    ).fetchone()
+                    if row is not None:
+                        found[key] = array("d", row[0]).tolist()
+        except sqlite3.Error:
+            logger.warning("Embedding cache read failed", exc_info=True)
+        return found
+
+    def _disk_put_many(self, entries: dict[CacheKey, list[float]]) -> None:
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO embeddings "
+                        "(model, dimensions, text_sha256, vector) VALUES (?, ?, ?, ?)",
+                        [(*key, array("d", vector).tobytes()) for key, vector in entries.items()],
+                    )
+        except sqlite3.Error:
+            logger.warning("Embedding cache write failed", exc_info=True)
+
+
+_cache: EmbeddingCache | None = None
+
+
+def create_embedding_cache() -> EmbeddingCache:
+    """Create an EmbeddingCache from the environment.
+
+    ``EMBEDDING_CACHE_SIZE`` bounds the memory tier (default 10000 vectors);
+    ``EMBEDDING_CACHE_PATH`` is the SQLite tier (default
+    ``data/embedding_cache.db``; empty keeps the cache memory-only).
+    """
+    size = int(os.getenv("EMBEDDING_CACHE_SIZE", "10000"))
+    path = os.getenv("EMBEDDING_CACHE_PATH", "data/embedding_cache.db")
+    return EmbeddingCache(max_entries=size, db_path=path or None)
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get or create the singleton EmbeddingCache."""
+    global _cache
+    if _cache is None:
+        _cache = create_embedding_cache()
+    return _cache
+
+
+def set_embedding_cache(cache: EmbeddingCache | None) -> None:
+    """Set the EmbeddingCache instance (for testing)."""
+    global _cache
+    if _cache is not None and _cache is not cache:
+        _cache.close()
+    _cache = cache
+
+
+def embedding_cache_stats() -> dict[str, Any] | None:
+    """Counters of the active cache, or None if none was created yet."""
+    return _cache.stats() if _cache is not None else None
@@ -15,6 +15,7 @@ def create_embedding_provider() -> EmbeddingProvider:
 
     Supported values:
         - "gemini" (default): Google Gemini embedding API.
+        - "local": offline feature-hashing embeddings (no network).
     """
     provider_name = os.getenv("EMBEDDING_PROVIDER", "gemini")
     match provider_name:
@@ -22,6 +23,10 @@ def create_embedding_provider() -> EmbeddingProvider:
             from .gemini import GeminiEmbeddings
 
             return GeminiEmbeddings()
+        case "local":
+            from .local import HashingEmbeddings
+
+            return HashingEmbeddings()
         case _:
             msg = f"Unknown embedding provider: {provider_name}"
             raise ValueError(msg)
@@ -39,3 +44,11 @@ def set_embedding_provider(provider: EmbeddingProvider | None) -> None:
     """Set the EmbeddingProvider instance (for testing)."""
     global _provider
     _provider = provider
+
+
+async def close_embedding_provider() -> None:
+    """Close and drop the singleton EmbeddingProvider, if one was created."""
+    global _provider
+    if _provider is not None:
+        provider, _provider = _provider, None
+        await provider.close()
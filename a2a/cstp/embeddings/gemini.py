@@ -4,9 +4,12 @@ Extracts and unifies the embedding generation logic previously
 duplicated in query_service.py and decision_service.py.
 """
 
+import asyncio
 import logging
 import os
+import random
 from pathlib import Path
+from typing import Any
 
 from . import EmbeddingProvider
 
@@ -20,6 +23,16 @@ _SECRETS_PATHS = os.getenv(
 
 _cached_api_key: str = ""
 
+_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
+
+# batchEmbedContents accepts at most 100 requests per call.
+_MAX_BATCH = 100
+
+# Statuses worth retrying: rate limiting and transient overload.
+_RETRY_STATUSES = frozenset({429, 500, 503})
+_BACKOFF_BASE_S = 0.5
+_BACKOFF_MAX_S = 30.0
+
 
 def _get_secrets_paths() -> list[Path]:
     """Get list of paths to search for secrets."""
@@ -56,38 +69,80 @@ class GeminiEmbeddings(EmbeddingProvider):
     """Gemini embedding provider using the Google AI API.
 
     Uses the x-goog-api-key header (not URL query param) for security.
+
+    One pooled ``httpx.AsyncClient`` is kept per provider and reused for
+    every request. Concurrent ``embed()`` calls that arrive within
+    ``batch_window_ms`` of each other are coalesced into a single
+    ``batchEmbedContents`` request, and at most ``max_concurrency`` requests
+    are in flight at once. 429/5xx responses are retried with exponential
+    backoff, honouring ``Retry-After`` when the API sends it.
     """
 
     def __init__(
         self,
         api_key: str | None = None,
         model: str = "gemini-embedding-001",
+        *,
+        batch_window_ms: float | None = None,
+        max_concurrency: int | None = None,
+        max_retries: int = 5,
     ) -> None:
         self._api_key = api_key or _load_gemini_key()
         self._model = model
-        self._url = (
-            f"https://generativelanguage.googleapis.com/v1beta/"
-            f"models/{model}:embedContent"
-        )
+        self._url = f"{_API_BASE}/models/{model}:embedContent"
+        self._batch_url = f"{_API_BASE}/models/{model}:batchEmbedContents"
+        if batch_window_ms is None:
+            batch_window_ms = float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "5"))
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv("EMBEDDING_MAX_CONCURRENCY", "4"))
+        self._batch_window = max(0.0, batch_window_ms) / 1000.0
+        self._max_concurrency = max(1, max_concurrency)
+        self._max_retries = max(0, max_retries)
+
+        self._client: Any = None  # httpx.AsyncClient, created on first use
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._pending: list[tuple[str, asyncio.Future[list[float]]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task[None]] = set()
 
     async def embed(self, text: str) -> list[float]:
-        """Generate embedding using Gemini API."""
-        import httpx
+        """Generate embedding using Gemini API.
 
+        Joins the current micro-batch; the request is sent when the batch
+        window closes or the batch reaches the API limit.
+        """
         if len(text) > self.max_length:
             text = text[: self.max_length]
 
-        headers = {
-            "Content-Type": "application/json",
-            "x-goog-api-key": self._api_key,
-        }
-        data = {"content": {"parts": [{"text": text}]}}
+        await self._bind_loop()
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[float]] = loop.create_future()
+        self._pending.append((text, future))
+        if len(self._pending) >= _MAX_BATCH:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._batch_window, self._flush)
+        return await future
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed ``texts`` with concurrent ``batchEmbedContents`` calls."""
+        texts = [t[: self.max_length] for t in texts]
+        chunks = [texts[i : i + _MAX_BATCH] for i in range(0, len(texts), _MAX_BATCH)]
+        results = await asyncio.gather(*(self._embed_many(chunk) for chunk in chunks))
+        return [vector for chunk in results for vector in chunk]
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(self._url, json=data, headers=headers)
-            if response.status_code != 200:
-                raise RuntimeError(f"Embedding API error: {response.json()}")
-            return response.json()["embedding"]["values"]
+    async def close(self) -> None:
+        """Flush pending requests and close the pooled HTTP client."""
+        if self._pending:
+            self._flush()
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._semaphore = None
+        self._loop = None
 
     @property
     def dimensions(self) -> int:
@@ -96,3 +151,155 @@ class GeminiEmbeddings(EmbeddingProvider):
     @property
     def model_name(self) -> str:
         return self._model
+
+    # ------------------------------------------------------------------
+    # Micro-batching
+    # ------------------------------------------------------------------
+
+    def _flush(self) -> None:
+        """Send everything queued so far as one batch request."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: list[tuple[str, asyncio.Future[list[float]]]]) -> None:
+        try:
+            vectors = await self._embed_many([text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), vector in zip(batch, vectors, strict=True):
+            if not future.done():
+                future.set_result(vector)
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    async def _embed_many(self, texts: list[str]) -> list[list[float]]:
+        """Embed up to ``_MAX_BATCH`` texts in one API call."""
+        if len(texts) == 1:
+            body = await self._post(self._url, {"content": {"parts": [{"text": texts[0]}]}})
+            return [body["embedding"]["values"]]
+
+        model = f"models/{self._model}"
+        body = await self._post(
+            self._batch_url,
+            {
+                "requests": [
+                    {"model": model, "content": {"parts": [{"text": text}]}}
+                    for text in texts
+                ]
+            },
+        )
+        embeddings = body.get("embeddings", [])
+        if len(embeddings) != len(texts):
+            raise RuntimeError(
+                f"Embedding API returned {len(embeddings)} vectors for {len(texts)} texts"
+            )
+        return [e["values"] for e in embeddings]
+
+    async def _post(self, url: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """POST with the shared client, bounded concurrency, and retries."""
+        await self._bind_loop()
+        client = self._client
+        assert self._semaphore is not None  # noqa: S101
+        headers = {
+            "Content-Type": "application/json",
+            "x-goog-api-key": self._api_key,
+        }
+
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                response = await client.post(url, json=payload, headers=headers)
+            if response.status_code == 200:
+                data: dict[str, Any] = response.json()
+                return data
+            if response.status_code not in _RETRY_STATUSES or attempt >= self._max_retries:
+                raise RuntimeError(f"Embedding API error: {_error_body(response)}")
+
+            # Back off outside the semaphore so other requests can proceed.
+            retry_after = _retry_after_seconds(response)
+            delay = retry_after if retry_after is not None else _backoff_delay(attempt)
+            logger.warning(
+                "Embedding API throttled or unavailable; retry %d/%d in %.2fs",
+                attempt + 1,
+                self._max_retries,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _bind_loop(self) -> None:
+        """Tie the pool and micro-batch state to the running event loop.
+
+        Pooled connections, the semaphore, and queued futures belong to the
+        loop that created them, so a provider reused under a new loop (e.g.
+        ``asyncio.run`` per CLI call) drops that state and starts a fresh
+        pool instead of touching dead sockets or waiting on a dead timer.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._loop is loop:
+            return
+        stale_client = self._client if self._loop is not loop else None
+        if self._loop is not None and self._loop is not loop:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            if self._pending:
+                logger.warning(
+                    "Dropping %d embedding requests queued on a previous event loop",
+                    len(self._pending),
+                )
+            self._pending = []
+            self._batch_tasks.clear()
+
+        import httpx
+
+        self._loop = loop
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        self._client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=self._max_concurrency,
+                max_keepalive_connections=self._max_concurrency,
+            ),
+        )
+        if stale_client is not None:
+            try:
+                await stale_client.aclose()
+            except Exception as e:
+                logger.debug("Failed to close embedding client from a previous event loop: %s", e)
+            else:
+                logger.debug("Closed embedding client from a previous event loop")
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, min(_BACKOFF_MAX_S, _BACKOFF_BASE_S * 2**attempt))  # noqa: S311
+
+
+def _retry_after_seconds(response: Any) -> float | None:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return min(_BACKOFF_MAX_S, max(0.0, float(value)))
+    except ValueError:
+        return None
+
+
+def _error_body(response: Any) -> Any:
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
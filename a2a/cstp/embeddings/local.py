@@ -0,0 +1,102 @@
+"""Offline, deterministic embedding provider (feature hashing + NumPy).
+
+Tokenizes text into word unigrams, word bigrams, and character trigrams,
+hashes each feature into one of ``dimensions`` signed buckets, weights by
+sublinear term frequency, and L2-normalizes. No network, no model files,
+and the same text always yields the same vector in every process, which
+makes it suitable for air-gapped deployments and for benchmarking the
+rest of the pipeline without API latency or quota.
+
+Selected with ``EMBEDDING_PROVIDER=local``.
+"""
+
+import hashlib
+import math
+import os
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from . import EmbeddingProvider
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Relative weight of each feature family in the final vector.
+_UNIGRAM_WEIGHT = 1.0
+_BIGRAM_WEIGHT = 0.5
+_TRIGRAM_WEIGHT = 0.25
+
+
+@lru_cache(maxsize=1 << 16)
+def _bucket(feature: str, dimensions: int) -> tuple[int, float]:
+    """Map a feature to a (bucket, sign) pair with a process-stable hash."""
+    digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+    return digest % dimensions, 1.0 if (digest >> 63) & 1 else -1.0
+
+
+def _features(text: str) -> dict[str, float]:
+    """Weighted feature counts for one text."""
+    words = _TOKEN_RE.findall(text.lower())
+    counts: dict[str, float] = {}
+    for word in words:
+        key = "w:" + word
+        counts[key] = counts.get(key, 0.0) + _UNIGRAM_WEIGHT
+        padded = f"<{word}>"
+        for i in range(len(padded) - 2):
+            key = "c:" + padded[i : i + 3]
+            counts[key] = counts.get(key, 0.0) + _TRIGRAM_WEIGHT
+    for first, second in zip(words, words[1:], strict=False):
+        key = f"b:{first} {second}"
+        counts[key] = counts.get(key, 0.0) + _BIGRAM_WEIGHT
+    return counts
+
+
+class HashingEmbeddings(EmbeddingProvider):
+    """Feature-hashing embedding provider, computed locally with NumPy."""
+
+    def __init__(self, dimensions: int | None = None) -> None:
+        if dimensions is None:
+            dimensions = int(os.getenv("LOCAL_EMBEDDING_DIM", "768"))
+        if dimensions <= 0:
+            raise ValueError(f"Embedding dimensions must be positive, got {dimensions}")
+        self._dimensions = dimensions
+
+    async def embed(self, text: str) -> list[float]:
+        """Embed a single text."""
+        vector: list[float] = self._embed_matrix([text])[0].tolist()
+        return vector
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed all ``texts`` into one matrix in a single vectorized pass."""
+        if not texts:
+            return []
+        vectors: list[list[float]] = self._embed_matrix(texts).tolist()
+        return vectors
+
+    def _embed_matrix(self, texts: list[str]) -> np.ndarray:
+        rows: list[int] = []
+        cols: list[int] = []
+        values: list[float] = []
+        for row, text in enumerate(texts):
+            for feature, count in _features(text[: self.max_length]).items():
+                bucket, sign = _bucket(feature, self._dimensions)
+                rows.append(row)
+                cols.append(bucket)
+                # Sublinear tf: repeated terms help, but with diminishing returns.
+                values.append(sign * (1.0 + math.log(count) if count >= 1.0 else count))
+
+        matrix = np.zeros((len(texts), self._dimensions), dtype=np.float32)
+        np.add.at(matrix, (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)), values)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        normalized: np.ndarray = matrix / norms
+        return normalized
+
+    @property
+    def dimensions(self) -> int:
+        return self._dimensions
+
+    @property
+    def model_name(self) -> str:
+        return f"local-hashing-{self._dimensions}"
@@ -16,6 +16,12 @@ logger = logging.getLogger(__name__)
 
 _MIN_EDGE_WEIGHT = 0.01  # Floor for auto-link edge weights (prevents zero-weight edges)
 
+# Decision fields that become graph nodes and relates_to edges at startup.
+_GRAPH_NODE_FIELDS = [
+    "decision", "summary", "category", "stakes", "confidence", "outcome",
+    "created_at", "tags", "pattern", "related_to",
+]
+
 
 # ---------------------------------------------------------------------------
 # Response dataclasses
@@ -354,7 +360,7 @@ async def initialize_graph_from_decisions(
     if decisions is None:
         from .query_service import load_all_decisions
 
-        decisions = await load_all_decisions()
+        decisions = await load_all_decisions(fields=_GRAPH_NODE_FIELDS)
 
     edges_loaded = 0
 
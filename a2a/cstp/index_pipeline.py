@@ -0,0 +1,292 @@
+"""Queued vector indexing of recorded decisions.
+
+With ``RECORD_INDEXING=queued``, ``record_decision`` saves the decision and
+a ``vector_index`` outbox entry (embedding text plus metadata) in one store
+transaction and answers ``indexed: "queued"`` without waiting for the
+embedding API. A small pool of workers claims entries in batches, embeds
+them with one ``generate_embeddings`` call and writes them with
+``upsert_many``. The outbox is durable, so decisions queued before a crash
+or restart are indexed once the workers start again; a failed batch is
+retried with exponential backoff. ``cstp.indexStatus`` reports the backlog
+and whether a single decision still has index work queued.
+
+``reindex_decision`` calls ``settle(decision_id)`` first: the inline
+reindex supersedes any queued entry, and an in-flight batch must not land
+after it with older text.
+
+Backends without an outbox (see ``DecisionStore.save_with_outbox``) keep
+indexing inline; the pipeline then stays inactive.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+from datetime import UTC, datetime
+from typing import Any
+
+from .storage import DecisionStore, OutboxEntry
+from .storage.factory import get_decision_store
+from .vectordb import VectorDocument
+from .vectordb.factory import get_vector_store
+
+logger = logging.getLogger(__name__)
+
+INDEX_TOPIC = "vector_index"
+
+INDEXING_MODES: frozenset[str] = frozenset({"inline", "queued"})
+
+
+class IndexPipeline:
+    """Worker pool draining the ``vector_index`` outbox.
+
+    Attributes:
+        indexed: Decisions indexed since start.
+        failures: Failed index attempts since start (each is retried).
+    """
+
+    def __init__(
+        self,
+        mode: str | None = None,
+        workers: int | None = None,
+        batch_size: int = 32,
+        poll_s: float = 1.0,
+        lease_s: float = 120.0,
+        max_backoff_s: float = 300.0,
+    ) -> None:
+        self.mode = mode or os.getenv("RECORD_INDEXING", "inline")
+        if self.mode not in INDEXING_MODES:
+            msg = f"Unknown RECORD_INDEXING mode: {self.mode} (expected one of {sorted(INDEXING_MODES)})"
+            raise ValueError(msg)
+        self._workers = max(1, workers or int(os.getenv("INDEX_WORKERS", "2")))
+        self._batch_size = batch_size
+        self._poll_s = poll_s
+        self._lease_s = lease_s
+        self._max_backoff_s = max_backoff_s
+        self._store: DecisionStore | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._wake = asyncio.Event()
+        # Decision IDs whose batch is being embedded/upserted right now
+        self._inflight: set[str] = set()
+        self._settled = asyncio.Condition()
+        self.indexed = 0
+        self.failures = 0
+        self.last_indexed_at: str | None = None
+
+    @property
+    def active(self) -> bool:
+        """True while records go through the outbox (between start and stop)."""
+        return self._store is not None
+
+    async def start(self, store: DecisionStore) -> bool:
+        """Start the workers over ``store`` if queued indexing is configured.
+
+        Returns:
+            True if the pipeline is now active.
+        """
+        if self.mode != "queued" or self._tasks:
+            return self.active
+        if await store.outbox_status(INDEX_TOPIC) is None:
+            logger.warning(
+                "RECORD_INDEXING=queued needs a store with an outbox; "
+                "%s has none, indexing inline",
+                type(store).__name__,
+            )
+            return False
+        self._store = store
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(self._run()) for _ in range(self._workers)]
+        logger.info("Queued indexing started with %d workers", self._workers)
+        return True
+
+    async def stop(self) -> None:
+        """Stop the workers; whatever is still queued is indexed after restart."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._store = None
+
+    def entry(
+        self,
+        decision_id: str,
+        text: str,
+        metadata: dict[str, Any],
+    ) -> tuple[str, dict[str, Any]]:
+        """Outbox entry to save alongside the decision (see ``queued``)."""
+        return INDEX_TOPIC, {"decision_id": decision_id, "text": text, "metadata": metadata}
+
+    def queued(self) -> None:
+        """Wake a worker after an entry was committed."""
+        self._wake.set()
+
+    async def settle(self, decision_id: str) -> None:
+        """Drop ``decision_id``'s queued entries and wait out any in-flight batch."""
+        if self._store is None:
+            return
+        entries = await self._store.claim_outbox(INDEX_TOPIC, decision_id=decision_id)
+        if entries:
+            await self._store.complete_outbox([entry.id for entry in entries])
+        async with self._settled:
+            await self._settled.wait_for(lambda: decision_id not in self._inflight)
+
+    async def drain(self) -> int:
+        """Index every due entry; returns how many decisions were indexed.
+
+        Stops early at a batch that failed outright, so it waits for its
+        backoff instead of spinning here.
+        """
+        if self._store is None:
+            return 0
+        indexed = 0
+        while True:
+            entries = await self._store.claim_outbox(
+                INDEX_TOPIC, limit=self._batch_size, lease_s=self._lease_s,
+            )
+            batch_indexed = await self._process(entries) if entries else 0
+            indexed += batch_indexed
+            if batch_indexed == 0:
+                return indexed
+
+    async def status(self, decision_id: str | None = None) -> dict[str, Any]:
+        """Backlog, lag, and worker counters; plus one decision's state if given."""
+        queue: dict[str, Any] | None = None
+        if self._store is not None:
+            queue = await self._store.outbox_status(INDEX_TOPIC)
+        queue = queue or {}
+        oldest = queue.get("oldest_created_at")
+        lag = 0.0
+        if oldest:
+            lag = max(0.0, (datetime.now(UTC) - datetime.fromisoformat(oldest)).total_seconds())
+        result: dict[str, Any] = {
+            "mode": self.mode,
+            "active": self.active,
+            "workers": len(self._tasks),
+            "pending": queue.get("pending", 0),
+            "retrying": queue.get("retrying", 0),
+            "oldest_pending_at": oldest,
+            "lag_seconds": round(lag, 3),
+            "max_attempts": queue.get("max_attempts", 0),
+            "last_error": queue.get("last_error"),
+            "indexed": self.indexed,
+            "failures": self.failures,
+            "last_indexed_at": self.last_indexed_at,
+        }
+        if decision_id is not None:
+            result["decision"] = await self._decision_status(decision_id)
+        return result
+
+    async def _decision_status(self, decision_id: str) -> dict[str, Any]:
+        """Where ``decision_id`` stands: not_found, queued, retrying, or not_queued.
+
+        ``not_queued`` means no index work is pending. The vector store has
+        no lookup by ID, so it does not say whether the document is there:
+        the decision may have been indexed, or recorded inline with a failed
+        index (``indexed=False``).
+        """
+        store = self._store or get_decision_store()
+        if not await store.existing_ids([decision_id]):
+            return {"id": decision_id, "state": "not_found"}
+        mine: dict[str, Any] | None = None
+        if self._store is not None:
+            mine = await self._store.outbox_status(INDEX_TOPIC, decision_id=decision_id)
+        if not mine or not mine.get("pending"):
+            return {"id": decision_id, "state": "not_queued"}
+        return {
+            "id": decision_id,
+            "state": "retrying" if mine.get("retrying") else "queued",
+            "queued_at": mine.get("oldest_created_at"),
+            "attempts": mine.get("max_attempts", 0),
+            "last_error": mine.get("last_error"),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if await self.drain() == 0:
+                    self._wake.clear()
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(self._wake.wait(), self._poll_s)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Index worker iteration failed")
+                await asyncio.sleep(self._poll_s)
+
+    async def _process(self, entries: list[OutboxEntry]) -> int:
+        """Embed and upsert one claimed batch; reschedule what failed."""
+        assert self._store is not None  # noqa: S101
+        from .decision_service import generate_embeddings
+
+        ids = {entry.decision_id for entry in entries}
+        self._inflight |= ids
+        try:
+            payloads = [entry.payload or {} for entry in entries]
+            embeddings = await generate_embeddings([p.get("text", "") for p in payloads])
+            documents: list[VectorDocument] = []
+            done: list[OutboxEntry] = []
+            failed: list[OutboxEntry] = []
+            for entry, payload, embedding in zip(entries, payloads, embeddings, strict=True):
+                if embedding is None:
+                    failed.append(entry)
+                    continue
+                documents.append(
+                    VectorDocument(entry.decision_id, payload["text"], embedding, payload.get("metadata") or {})
+                )
+                done.append(entry)
+
+            error = "no embedding"
+            if documents:
+                try:
+                    if not await self._upsert(documents):
+                        error = "vector store rejected the batch"
+                        failed, done = failed + done, []
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                    failed, done = failed + done, []
+
+            for entry in failed:
+                self.failures += 1
+                delay = min(self._max_backoff_s, 2.0 ** entry.attempts)
+                logger.warning(
+                    "Indexing %s failed (attempt %d, retry in %.0fs): %s",
+                    entry.decision_id, entry.attempts, delay, error,
+                )
+                await self._store.retry_outbox(entry.id, error, delay)
+            await self._store.complete_outbox([entry.id for entry in done])
+            if done:
+                self.indexed += len(done)
+                self.last_indexed_at = datetime.now(UTC).isoformat()
+            return len(done)
+        finally:
+            self._inflight -= ids
+            async with self._settled:
+                self._settled.notify_all()
+
+    @staticmethod
+    async def _upsert(documents: list[VectorDocument]) -> bool:
+        store = get_vector_store()
+        if not await store.get_collection_id():
+            await store.initialize()
+        return await store.upsert_many(documents)
+
+
+_pipeline: IndexPipeline | None = None
+
+
+def get_index_pipeline() -> IndexPipeline:
+    """Get or create the singleton IndexPipeline (``RECORD_INDEXING`` picks the mode)."""
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = IndexPipeline()
+    return _pipeline
+
+
+def set_index_pipeline(pipeline: IndexPipeline | None) -> None:
+    """Set the IndexPipeline instance (for testing)."""
+    global _pipeline
+    _pipeline = pipeline
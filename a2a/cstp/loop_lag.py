@@ -0,0 +1,108 @@
+"""Event-loop lag monitor.
+
+A task sleeps for a fixed interval and measures how late it wakes up. Any
+lateness is time the loop spent running something synchronous, so a rising
+``max_ms`` / ``p99_ms`` means some handler is blocking every other request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """Samples scheduling delay of the running event loop.
+
+    Attributes:
+        samples: Total samples taken.
+        max_lag: Worst lag seen since start, in seconds.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.25,
+        window: int = 240,
+        warn_threshold: float = 0.5,
+    ) -> None:
+        self._interval = interval
+        self._warn_threshold = warn_threshold
+        self._recent: deque[float] = deque(maxlen=window)
+        self._task: asyncio.Task[None] | None = None
+        self.samples = 0
+        self.max_lag = 0.0
+
+    def start(self) -> None:
+        """Start sampling on the running loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def record(self, lag: float) -> None:
+        """Record one lag sample, in seconds."""
+        lag = max(0.0, lag)
+        self._recent.append(lag)
+        self.samples += 1
+        if lag > self.max_lag:
+            self.max_lag = lag
+        if lag >= self._warn_threshold:
+            logger.warning("Event loop blocked for %.0f ms", lag * 1000)
+
+    def stats(self) -> dict[str, Any]:
+        """Lag over the recent window and since start, in milliseconds."""
+        recent = sorted(self._recent)
+        if recent:
+            p99 = recent[min(len(recent) - 1, int(len(recent) * 0.99))]
+            mean = sum(recent) / len(recent)
+            last = self._recent[-1]
+        else:
+            p99 = mean = last = 0.0
+        return {
+            "samples": self.samples,
+            "last_ms": round(last * 1000, 2),
+            "mean_ms": round(mean * 1000, 2),
+            "p99_ms": round(p99 * 1000, 2),
+            "max_ms": round(self.max_lag * 1000, 2),
+            "interval_ms": round(self._interval * 1000, 2),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self._interval)
+            self.record(time.perf_counter() - started - self._interval)
+
+
+_monitor: LoopLagMonitor | None = None
+
+
+def get_loop_lag_monitor() -> LoopLagMonitor:
+    """Get or create the singleton LoopLagMonitor."""
+    global _monitor
+    if _monitor is None:
+        _monitor = LoopLagMonitor()
+    return _monitor
+
+
+def set_loop_lag_monitor(monitor: LoopLagMonitor | None) -> None:
+    """Set the LoopLagMonitor instance (for testing)."""
+    global _monitor
+    _monitor = monitor
+
+
+def loop_lag_stats() -> dict[str, Any] | None:
+    """Counters of the active monitor, or None if none was created yet."""
+    return _monitor.stats() if _monitor is not None else None
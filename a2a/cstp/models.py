@@ -64,6 +64,8 @@ class QueryDecisionsRequest:
     compacted: bool = False  # When true, annotate results with compaction level
     # F163 P3: Include actual_result in results
     include_detail: bool = False
+    # Vector search: exact | approximate | None (store default)
+    search_mode: str | None = None
 
     @property
     def effective_query(self) -> str:
@@ -105,6 +107,10 @@ class QueryDecisionsRequest:
         if bridge_side and bridge_side not in ("structure", "function"):
             bridge_side = None
 
+        search_mode = params.get("searchMode", params.get("search_mode"))
+        if search_mode not in ("exact", "approximate"):
+            search_mode = None
+
         return cls(
             query=query,
             filters=QueryFilters.from_dict(params.get("filters")),
@@ -117,6 +123,7 @@ class QueryDecisionsRequest:
             include_detail=bool(
                 params.get("includeDetail", params.get("include_detail", False))
             ),
+            search_mode=search_mode,
         )
 
 
@@ -1405,6 +1412,8 @@ class ListDecisionsRequest:
     search: str | None = None
     sort: str = "created_at"
     order: str = "desc"
+    cursor: str | None = None
+    include_total: bool = True
 
     @classmethod
     def from_params(cls, params: dict[str, Any]) -> "ListDecisionsRequest":
@@ -1442,6 +1451,10 @@ class ListDecisionsRequest:
             search=params.get("search"),
             sort=sort,
             order=order,
+            cursor=params.get("cursor") or None,
+            include_total=bool(
+                params.get("includeTotal", params.get("include_total", True))
+            ),
         )
 
 
@@ -1450,9 +1463,10 @@ class ListDecisionsResponse:
     """Response from cstp.listDecisions (F050)."""
 
     decisions: list[dict[str, Any]]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    next_cursor: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dict with camelCase keys."""
@@ -1461,9 +1475,105 @@ class ListDecisionsResponse:
             "total": self.total,
             "limit": self.limit,
             "offset": self.offset,
+            "nextCursor": self.next_cursor,
         }
 
 
+@dataclass(slots=True)
+class ExplainQueryResponse:
+    """Response from cstp.explainQuery: the store's plan for a listDecisions query."""
+
+    plans: dict[str, list[dict[str, Any]]] | None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dict with camelCase keys."""
+        steps = [step for plan in (self.plans or {}).values() for step in plan]
+        return {
+            "supported": self.plans is not None,
+            "plans": self.plans or {},
+            "fullScan": any(step.get("fullScan") for step in steps),
+        }
+
+
+@dataclass(slots=True)
+class MirrorStatusResponse:
+    """Response from cstp.mirrorStatus: write-behind YAML mirror backlog."""
+
+    mode: str
+    active: bool
+    pending: int = 0
+    retrying: int = 0
+    oldest_pending_at: str | None = None
+    lag_seconds: float = 0.0
+    max_attempts: int = 0
+    last_error: str | None = None
+    written: int = 0
+    failures: int = 0
+    last_written_at: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dict with camelCase keys."""
+        return {
+            "mode": self.mode,
+            "active": self.active,
+            "pending": self.pending,
+            "retrying": self.retrying,
+            "oldestPendingAt": self.oldest_pending_at,
+            "lagSeconds": self.lag_seconds,
+            "maxAttempts": self.max_attempts,
+            "lastError": self.last_error,
+            "written": self.written,
+            "failures": self.failures,
+            "lastWrittenAt": self.last_written_at,
+        }
+
+
+@dataclass(slots=True)
+class IndexStatusResponse:
+    """Response from cstp.indexStatus: queued vector-indexing backlog."""
+
+    mode: str
+    active: bool
+    workers: int = 0
+    pending: int = 0
+    retrying: int = 0
+    oldest_pending_at: str | None = None
+    lag_seconds: float = 0.0
+    max_attempts: int = 0
+    last_error: str | None = None
+    indexed: int = 0
+    failures: int = 0
+    last_indexed_at: str | None = None
+    decision: dict[str, Any] | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dict with camelCase keys."""
+        result: dict[str, Any] = {
+            "mode": self.mode,
+            "active": self.active,
+            "workers": self.workers,
+            "pending": self.pending,
+            "retrying": self.retrying,
+            "oldestPendingAt": self.oldest_pending_at,
+            "lagSeconds": self.lag_seconds,
+            "maxAttempts": self.max_attempts,
+            "lastError": self.last_error,
+            "indexed": self.indexed,
+            "failures": self.failures,
+            "lastIndexedAt": self.last_indexed_at,
+        }
+        if self.decision is not None:
+            d = self.decision
+            result["decision"] = {
+                "id": d["id"],
+                "state": d["state"],
+                "queuedAt": d.get("queued_at"),
+                "attempts": d.get("attempts", 0),
+                "lastError": d.get("last_error"),
+            }
+        return result
+
+
 @dataclass(slots=True)
 class GetStatsRequest:
     """Request for cstp.getStats (F050)."""
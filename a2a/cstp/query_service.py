@@ -12,9 +12,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from .embeddings.cache import get_embedding_cache
 from .embeddings.factory import get_embedding_provider
+from .storage.yaml_cache import iter_decision_files
 from .vectordb.factory import get_vector_store
 
 logger = logging.getLogger(__name__)
@@ -73,6 +73,7 @@ async def query_decisions(
     has_outcome: bool | None = None,
     # F027: Tag filter
     tags: list[str] | None = None,
+    search_mode: str | None = None,
 ) -> QueryResponse:
     """Query similar decisions using vector similarity search.
 
@@ -89,6 +90,9 @@ async def query_decisions(
         pr: Filter by PR number.
         has_outcome: Filter to only reviewed decisions (True) or pending (False).
         tags: Filter by tag values.
+        search_mode: "exact" forces an exhaustive vector scan, "approximate"
+            uses the store's ANN index if it has one; None keeps the store
+            default.
 
     Returns:
         QueryResponse with results or error.
@@ -108,9 +112,9 @@ async def query_decisions(
             error="Collection not found. Index decisions first.",
         )
 
-    # Generate embedding
+    # Generate embedding (repeated queries are served from the cache)
     try:
-        embedding = await provider.embed(query)
+        embedding = await get_embedding_cache().embed(provider, query)
     except Exception as e:
         return QueryResponse(
             results=[],
@@ -154,10 +158,14 @@ async def query_decisions(
         where["status"] = "pending"
 
     # Query via VectorStore
+    query_kwargs: dict[str, Any] = {}
+    if search_mode is not None:
+        query_kwargs["exact"] = search_mode == "exact"
     vector_results = await store.query(
         embedding=embedding,
         n_results=n_results,
         where=where if where else None,
+        **query_kwargs,
     )
 
     # Parse VectorResult into QueryResult
@@ -225,16 +233,19 @@ async def load_all_decisions(
     decisions_path: str | None = None,
     category: str | None = None,
     project: str | None = None,
+    fields: list[str] | None = None,
 ) -> list[dict[str, Any]]:
-    """Load all decisions, preferring DecisionStore over YAML rglob.
+    """Load all decisions, preferring DecisionStore over YAML files.
 
     Tries DecisionStore.list() first for efficient querying.
-    Falls back to YAML rglob if store is unavailable or raises.
+    Falls back to the cached YAML files if store is unavailable or raises.
 
     Args:
         decisions_path: Override for decisions directory.
         category: Optional category filter.
         project: Optional project filter.
+        fields: Optional projection passed to the store (see
+            ``ListQuery.fields``); the YAML fallback returns full records.
 
     Returns:
         List of decision dictionaries with id and content.
@@ -252,6 +263,7 @@ async def load_all_decisions(
             project=project,
             sort="created_at",
             order="desc",
+            fields=fields,
         )
         result = await store.list(query)
         return result.decisions
@@ -264,21 +276,9 @@ async def load_all_decisions(
     if not base.exists():
         return decisions
 
-    for yaml_file in base.rglob("*-decision-*.yaml"):
+    for decision_id, _, data in iter_decision_files(base):
         try:
-            with open(yaml_file, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-
-            if not data:
-                continue
-
-            # Extract ID from filename
-            filename = yaml_file.stem
-            parts = filename.rsplit("-decision-", 1)
-            if len(parts) == 2:
-                data["id"] = parts[1]
-            else:
-                data["id"] = filename
+            data["id"] = decision_id
 
             # Apply filters
             if category and data.get("category") != category:
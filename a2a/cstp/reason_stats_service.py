@@ -15,9 +15,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from .decision_service import DECISIONS_PATH
+from .storage.yaml_cache import iter_decision_files
 
 
 # Valid reason types from the schema
@@ -218,14 +217,8 @@ async def load_decisions_with_reasons(
     if not base.exists():
         return decisions
 
-    for yaml_file in base.rglob("*-decision-*.yaml"):
+    for _, _, data in iter_decision_files(base):
         try:
-            with open(yaml_file, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-
-            if not data:
-                continue
-
             # Must have reasons
             reasons = data.get("reasons", [])
             if not reasons:
@@ -8,12 +8,17 @@ import time
 from dataclasses import dataclass
 from typing import Any
 
-from .decision_service import reindex_decision
+from .bm25_index import KeywordIndex, save_keyword_index, set_keyword_index
+from .decision_service import build_reindex_document, generate_embeddings
 from .query_service import load_all_decisions
+from .vectordb import VectorDocument, VectorStore
 from .vectordb.factory import get_vector_store
 
 logger = logging.getLogger(__name__)
 
+# Decisions embedded and upserted per batch.
+_REINDEX_BATCH_SIZE = 256
+
 
 @dataclass
 class ReindexResult:
@@ -41,7 +46,7 @@ async def reindex_decisions() -> ReindexResult:
 
     This will:
     1. Reset the vector store collection
-    2. Load all decisions from YAML files
+    2. Load all decisions from YAML files (and rebuild the BM25 index)
     3. Generate embeddings for each
     4. Upsert to the store
 
@@ -64,6 +69,10 @@ async def reindex_decisions() -> ReindexResult:
 
     # Step 2: Load all decisions
     decisions = await load_all_decisions()
+
+    # Rebuild the keyword index from the same snapshot while we have it
+    set_keyword_index(KeywordIndex.from_decisions(decisions))
+    await save_keyword_index()
     if not decisions:
         return ReindexResult(
             success=True,
@@ -73,33 +82,61 @@ async def reindex_decisions() -> ReindexResult:
             message="No decisions found to index",
         )
 
-    # Step 3 & 4: Generate embeddings and upsert
+    # Step 3 & 4: Generate embeddings and upsert, one batch at a time, so
+    # the whole corpus costs a handful of embedding and store round trips.
     indexed = 0
     errors = 0
 
+    for start in range(0, len(decisions), _REINDEX_BATCH_SIZE):
+        batch_indexed, batch_errors = await _reindex_batch(
+            store, decisions[start : start + _REINDEX_BATCH_SIZE]
+        )
+        indexed += batch_indexed
+        errors += batch_errors
+
+    duration_ms = int((time.time() - start_time) * 1000)
+
+    return ReindexResult(
+        success=True,
+        decisions_indexed=indexed,
+        errors=errors,
+        duration_ms=duration_ms,
+        message=f"Indexed {indexed} decisions with {errors} errors in {duration_ms}ms",
+    )
+
+
+async def _reindex_batch(store: VectorStore, decisions: list[dict[str, Any]]) -> tuple[int, int]:
+    """Embed and upsert one batch of decisions.
+
+    Returns:
+        Tuple of (indexed, errors).
+    """
+    errors = 0
+    pending: list[tuple[str, str, dict[str, Any]]] = []
     for decision in decisions:
         doc_id = decision.get("id", "")
         if not doc_id:
             errors += 1
             continue
-
-        file_path = decision.get("_file", "")
-
         try:
-            if await reindex_decision(doc_id, decision, file_path):
-                indexed += 1
-            else:
-                errors += 1
+            text, metadata = build_reindex_document(decision, decision.get("_file", ""))
         except Exception as e:
             logger.error("Failed to reindex decision %s: %s", doc_id, e)
             errors += 1
+            continue
+        pending.append((doc_id, text, metadata))
 
-    duration_ms = int((time.time() - start_time) * 1000)
+    embeddings = await generate_embeddings([text for _, text, _ in pending])
+    documents = []
+    for (doc_id, text, metadata), embedding in zip(pending, embeddings, strict=True):
+        if embedding is None:
+            logger.error("Failed to reindex decision %s: no embedding", doc_id)
+            errors += 1
+            continue
+        documents.append(VectorDocument(doc_id, text, embedding, metadata))
 
-    return ReindexResult(
-        success=True,
-        decisions_indexed=indexed,
-        errors=errors,
-        duration_ms=duration_ms,
-        message=f"Indexed {indexed} decisions with {errors} errors in {duration_ms}ms",
-    )
+    if not documents:
+        return 0, errors
+    if not await store.upsert_many(documents):
+        return 0, errors + len(documents)
+    return len(documents), errors
@@ -25,6 +25,13 @@ from .query_service import load_all_decisions, query_decisions
 
 logger = logging.getLogger("cstp.session_context")
 
+# Fields read by the profile, calibration, ready-queue, pattern, and wisdom
+# sections; context, reasons, and bridge are never loaded.
+_SESSION_FIELDS = [
+    "decision", "summary", "category", "stakes", "status", "confidence",
+    "outcome", "pattern", "created_at", "date", "review_by", "preserve",
+]
+
 
 async def get_session_context(
     request: SessionContextRequest,
@@ -43,7 +50,7 @@ async def get_session_context(
     include = set(request.include)
 
     # Load all decisions once (shared data source for profile, ready, patterns)
-    all_decisions = await load_all_decisions()
+    all_decisions = await load_all_decisions(fields=_SESSION_FIELDS)
 
     # --- Agent Profile (always included) ---
     agent_profile = _build_agent_profile(all_decisions)
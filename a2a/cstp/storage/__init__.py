@@ -6,7 +6,12 @@ storage backends must implement.
 
 from __future__ import annotations
 
+import base64
+import binascii
+import builtins
+import json
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -29,6 +34,14 @@ class ListQuery:
     search: str | None = None
     sort: str = "created_at"
     order: str = "desc"
+    # Projection: when set, each decision holds only ``id`` and these fields,
+    # and backends may skip reading the rest (e.g. child tables).
+    fields: list[str] | None = None
+    # Keyset pagination: a ListResult.next_cursor from the same sort/order.
+    # Replaces offset, so every page costs the same however deep it is.
+    cursor: str | None = None
+    # False skips the COUNT(*) behind ListResult.total (total is then None).
+    include_total: bool = True
 
 
 @dataclass(slots=True)
@@ -36,9 +49,11 @@ class ListResult:
     """Paginated result from a list query."""
 
     decisions: list[dict[str, Any]]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    # Token for the page after this one, or None on the last page.
+    next_cursor: str | None = None
 
 
 @dataclass(slots=True)
@@ -64,6 +79,59 @@ class StatsResult:
     recent_activity: dict[str, int] = field(default_factory=dict)
 
 
+@dataclass(slots=True)
+class OutboxEntry:
+    """A side effect of a decision write, queued in the store's outbox.
+
+    Written in the same transaction as the decision, so the side effect
+    (e.g. mirroring the decision to YAML) survives a crash right after the
+    write is acknowledged.
+    """
+
+    id: int
+    topic: str
+    decision_id: str
+    payload: dict[str, Any] | None
+    attempts: int = 0
+    created_at: str = ""
+    last_error: str | None = None
+
+
+def encode_cursor(query: ListQuery, sort_value: Any, decision_id: str) -> str:
+    """Opaque continuation token for the row after (sort_value, decision_id)."""
+    raw = json.dumps([query.sort, query.order.lower(), sort_value, decision_id])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(query: ListQuery) -> tuple[Any, str]:
+    """Return the (sort_value, decision_id) position encoded in ``query.cursor``.
+
+    Raises:
+        ValueError: If the token is malformed or was issued for a different
+            sort column or order.
+    """
+    token = query.cursor or ""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        sort, order, sort_value, decision_id = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if sort != query.sort or order != query.order.lower() or not isinstance(decision_id, str):
+        raise ValueError("Cursor does not match the requested sort order")
+    return sort_value, decision_id
+
+
+def project_fields(
+    data: dict[str, Any], fields: Collection[str] | None
+) -> dict[str, Any]:
+    """Return ``data`` limited to ``id`` and ``fields`` (all of it if None)."""
+    if fields is None:
+        return data
+    projected = {k: data[k] for k in fields if k in data}
+    projected["id"] = data.get("id")
+    return projected
+
+
 class DecisionStore(ABC):
     """Abstract structured storage for decisions.
 
@@ -107,6 +175,65 @@ class DecisionStore(ABC):
         """
         ...
 
+    async def get_many(
+        self,
+        decision_ids: list[str],
+        fields: Collection[str] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Get several decisions by ID in one call.
+
+        The default issues one ``get`` per ID; backends override it with a
+        batched lookup so hydrating a page of search hits is one round trip.
+
+        Args:
+            decision_ids: Decision identifiers; unknown IDs are skipped.
+            fields: Optional projection. When given, each result holds
+                ``id`` plus whichever of these fields the decision has, and
+                backends may skip reading the rest (e.g. child tables).
+
+        Returns:
+            Mapping of decision ID to decision data.
+        """
+        found: dict[str, dict[str, Any]] = {}
+        for decision_id in decision_ids:
+            data = await self.get(decision_id)
+            if data is not None:
+                found[decision_id] = project_fields(data, fields)
+        return found
+
+    async def existing_ids(self, decision_ids: list[str]) -> set[str]:
+        """Return the subset of ``decision_ids`` present in the store.
+
+        The default goes through ``get_many`` with an ``id``-only projection;
+        backends override it with a lookup that never reads decision rows.
+
+        Args:
+            decision_ids: Decision identifiers to check.
+
+        Returns:
+            The IDs that exist.
+        """
+        return set(await self.get_many(decision_ids, fields=("id",)))
+
+    async def save_many(self, items: list[tuple[str, dict[str, Any]]]) -> int:
+        """Insert or update several decisions in one call.
+
+        The default issues one ``save`` per item; backends override it to
+        write the whole batch in a single transaction. A failing item does
+        not prevent the others from being saved.
+
+        Args:
+            items: (decision_id, data) pairs, as accepted by ``save``.
+
+        Returns:
+            Number of decisions saved.
+        """
+        saved = 0
+        for decision_id, data in items:
+            if await self.save(decision_id, data):
+                saved += 1
+        return saved
+
     @abstractmethod
     async def delete(self, decision_id: str) -> bool:
         """Delete a decision by ID.
@@ -199,5 +326,146 @@ class DecisionStore(ABC):
         """
         ...
 
+    async def keyword_search(
+        self,
+        query: str,
+        filters: dict[str, Any] | None = None,
+        top_k: int = 10,
+    ) -> builtins.list[tuple[str, float]] | None:
+        """Rank decisions by keyword relevance inside the backend.
+
+        Backends with a native full-text engine override this so keyword
+        retrieval never copies the corpus into Python.
+
+        Args:
+            query: Free-text query; any word may match.
+            filters: Equality filters (e.g. ``category``, ``project``).
+            top_k: Maximum number of hits.
+
+        Returns:
+            (decision_id, score) pairs, best first (higher is better), or
+            None if the backend has no keyword engine and callers should use
+            the in-process BM25 index instead.
+        """
+        return None
+
+    async def version(self) -> int | None:
+        """Return a change counter that moves on every write.
+
+        Lets derived indexes (e.g. the BM25 keyword index) check freshness
+        without reading the corpus. Two equal values mean no decision was
+        saved, updated, or deleted in between.
+
+        Returns:
+            The current counter, or None if the backend does not track one.
+        """
+        return None
+
+    async def fingerprint(self) -> str | None:
+        """Return a token for the stored decisions that survives restarts.
+
+        ``version()`` may be a per-instance counter; equal fingerprints
+        taken by different processes mean the same stored decisions, so a
+        snapshot saved by one process can be validated by the next.
+
+        Returns:
+            The token, or None if the backend cannot provide one.
+        """
+        return None
+
+    async def explain(self, query: ListQuery) -> dict[str, builtins.list[dict[str, Any]]] | None:
+        """Describe how the backend would execute ``list(query)``.
+
+        Args:
+            query: The list query to analyse.
+
+        Returns:
+            Query-plan steps keyed by statement (e.g. ``count``, ``page``),
+            each step a dict with ``detail`` and ``fullScan``; or None if
+            the backend has no query planner.
+        """
+        return None
+
+    # ------------------------------------------------------------------
+    # Outbox: durable queue of side effects, committed with the decision.
+    # Backends without one return None from save_with_outbox/outbox_status
+    # and callers keep doing the side effect synchronously.
+    # ------------------------------------------------------------------
+
+    async def save_with_outbox(
+        self,
+        decision_id: str,
+        data: dict[str, Any],
+        outbox: builtins.list[tuple[str, dict[str, Any] | None]],
+    ) -> bool | None:
+        """Save a decision and queue outbox entries in one transaction.
+
+        Args:
+            decision_id: As for ``save``.
+            data: As for ``save``.
+            outbox: (topic, payload) pairs to queue for ``decision_id``.
+                Payloads must be JSON-serializable.
+
+        Returns:
+            True if both landed, False if neither did, or None if the
+            backend has no outbox (nothing was written).
+        """
+        return None
+
+    async def claim_outbox(
+        self,
+        topic: str,
+        limit: int = 32,
+        lease_s: float = 60.0,
+        decision_id: str | None = None,
+    ) -> builtins.list[OutboxEntry]:
+        """Lease up to ``limit`` due entries of ``topic``, oldest first.
+
+        Claimed entries are hidden from other claims for ``lease_s`` seconds
+        and their ``attempts`` is incremented; an entry neither completed
+        nor retried by then becomes due again.
+
+        Args:
+            topic: Outbox topic.
+            limit: Maximum entries to claim.
+            lease_s: Lease length in seconds.
+            decision_id: Claim only this decision's entries, due or not
+                (used to flush one decision ahead of the queue).
+
+        Returns:
+            The claimed entries; empty if none or no outbox.
+        """
+        return []
+
+    async def complete_outbox(self, entry_ids: builtins.list[int]) -> None:  # noqa: B027
+        """Remove entries whose side effect is done."""
+
+    async def retry_outbox(self, entry_id: int, error: str, delay_s: float) -> None:  # noqa: B027
+        """Record a failed attempt and make the entry due again after ``delay_s``."""
+
+    async def outbox_status(
+        self, topic: str, decision_id: str | None = None
+    ) -> dict[str, Any] | None:
+        """Summarize the queued entries of ``topic``.
+
+        Args:
+            topic: Outbox topic.
+            decision_id: Limit the summary to one decision.
+
+        Returns:
+            ``pending`` (count), ``retrying`` (entries with failed attempts),
+            ``oldest_created_at``, ``max_attempts`` and ``last_error``; or
+            None if the backend has no outbox.
+        """
+        return None
+
+    def metrics(self) -> dict[str, Any]:
+        """Backend runtime counters (connection pools, queues) for /health.
+
+        Returns:
+            Counters keyed by component; empty if the backend has none.
+        """
+        return {}
+
     async def close(self) -> None:  # noqa: B027
         """Clean up connections. Override if the backend holds resources."""
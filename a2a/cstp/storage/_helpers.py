@@ -10,7 +10,15 @@ from collections import Counter
 from datetime import UTC, datetime
 from typing import Any
 
-from . import ListQuery, StatsQuery, StatsResult
+from . import (
+    ListQuery,
+    ListResult,
+    StatsQuery,
+    StatsResult,
+    decode_cursor,
+    encode_cursor,
+    project_fields,
+)
 
 
 def get_date_key(data: dict[str, Any]) -> str:
@@ -78,23 +86,66 @@ def apply_filters(
     return result
 
 
+def _sort_key(d: dict[str, Any], sort_field: str) -> str:
+    val = d.get(sort_field)
+    if val is None:
+        # For date fields, use the date/created_at fallback
+        if sort_field in ("created_at", "date"):
+            val = d.get("created_at") or d.get("date") or ""
+        else:
+            return ""
+    return str(val)
+
+
 def sort_decisions(
     decisions: list[dict[str, Any]], sort_field: str, order: str
 ) -> list[dict[str, Any]]:
-    """Sort decisions by the given field and order."""
+    """Sort decisions by the given field and order, ties broken by ID."""
     reverse = order.lower() == "desc"
+    return sorted(
+        decisions,
+        key=lambda d: (_sort_key(d, sort_field), str(d.get("id") or "")),
+        reverse=reverse,
+    )
+
+
+def paginate(decisions: list[dict[str, Any]], query: ListQuery) -> ListResult:
+    """Sort filtered decisions and cut the page ``query`` asks for.
 
-    def sort_key(d: dict[str, Any]) -> str:
-        val = d.get(sort_field)
-        if val is None:
-            # For date fields, use the date/created_at fallback
-            if sort_field in ("created_at", "date"):
-                val = d.get("created_at") or d.get("date") or ""
-            else:
-                return ""
-        return str(val)
-
-    return sorted(decisions, key=sort_key, reverse=reverse)
+    Honours ``query.cursor`` (keyset position, replaces offset),
+    ``query.include_total`` and ``query.fields``.
+    """
+    reverse = query.order.lower() == "desc"
+    keyed = sorted(
+        (((_sort_key(d, query.sort), str(d.get("id") or "")), d) for d in decisions),
+        key=lambda item: item[0],
+        reverse=reverse,
+    )
+
+    offset = query.offset
+    if query.cursor:
+        sort_value, last_id = decode_cursor(query)
+        position = (str(sort_value), last_id)
+        keyed = [
+            item
+            for item in keyed
+            if (item[0] < position if reverse else item[0] > position)
+        ]
+        offset = 0
+
+    end = offset + query.limit
+    page = keyed[offset:end]
+    next_cursor = None
+    if page and len(keyed) > end:
+        next_cursor = encode_cursor(query, *page[-1][0])
+
+    return ListResult(
+        decisions=[project_fields(d, query.fields) for _, d in page],
+        total=len(decisions) if query.include_total else None,
+        limit=query.limit,
+        offset=offset,
+        next_cursor=next_cursor,
+    )
 
 
 def apply_stats_filters(
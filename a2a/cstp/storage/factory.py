@@ -48,21 +48,32 @@ def create_decision_store(storage_config: Any | None = None) -> DecisionStore:
 
     Supported values:
         - "sqlite" (default): SQLite with WAL mode and FTS5.
+        - "partitioned": SQLite files per month or project next to the db
+          path (see ``CSTP_PARTITION_BY``), read-only archives attachable.
         - "yaml": YAML filesystem store (legacy, single-user/dev only).
         - "memory": In-memory store for testing.
 
+    Both SQLite backends take their PRAGMA profile from CSTP_DB_PROFILE, then
+    ``storage.sqlite.profile`` in the YAML config.
+
     The default is sqlite because the vector, graph, and BM25 subsystems all
     assume a queryable, crash-safe decision store underneath them. YAML offers
     no WAL, no FTS5, and no concurrent-write protection, so it warns loudly.
     """
     backend, db_path = resolve_backend(storage_config)
+    profile = os.getenv("CSTP_DB_PROFILE") or getattr(storage_config, "sqlite_profile", None)
     # if/elif rather than match: static analysers do not treat `case _` as proving
     # exhaustiveness, so a match here reads as a function that can fall through and
     # implicitly return None.
     if backend == "sqlite":
         from .sqlite import SQLiteDecisionStore
 
-        return SQLiteDecisionStore(db_path)
+        return SQLiteDecisionStore(db_path, profile=profile)
+
+    if backend == "partitioned":
+        from .partitioned import PartitionedDecisionStore
+
+        return PartitionedDecisionStore(db_path, profile=profile)
 
     if backend == "yaml":
         from .yaml_fs import YAMLFileSystemStore
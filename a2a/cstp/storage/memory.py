@@ -6,12 +6,25 @@ All data is lost when the process exits.
 
 from __future__ import annotations
 
+import builtins
+import copy
+import itertools
 import logging
+import time
+from collections.abc import Collection
 from datetime import UTC, datetime
 from typing import Any
 
-from . import DecisionStore, ListQuery, ListResult, StatsQuery, StatsResult
-from ._helpers import apply_filters, apply_stats_filters, compute_stats, matches_filters, sort_decisions
+from . import (
+    DecisionStore,
+    ListQuery,
+    ListResult,
+    OutboxEntry,
+    StatsQuery,
+    StatsResult,
+    project_fields,
+)
+from ._helpers import apply_filters, apply_stats_filters, compute_stats, matches_filters, paginate
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +38,10 @@ class MemoryDecisionStore(DecisionStore):
 
     def __init__(self) -> None:
         self._data: dict[str, dict[str, Any]] = {}
+        self._version = 0
+        # Outbox entries keyed by id, each with its epoch-seconds due time.
+        self._outbox: dict[int, tuple[OutboxEntry, float]] = {}
+        self._outbox_ids = itertools.count(1)
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -33,6 +50,7 @@ class MemoryDecisionStore(DecisionStore):
     async def initialize(self) -> None:
         """Initialize the in-memory data structures."""
         self._data.clear()
+        self._version += 1
 
     async def close(self) -> None:
         """No-op for in-memory storage."""
@@ -50,16 +68,34 @@ class MemoryDecisionStore(DecisionStore):
         data["updated_at"] = now
         data["id"] = decision_id
         self._data[decision_id] = data
+        self._version += 1
         return True
 
     async def get(self, decision_id: str) -> dict[str, Any] | None:
         """Retrieve a decision from memory."""
         return self._data.get(decision_id)
 
+    async def get_many(
+        self,
+        decision_ids: list[str],
+        fields: Collection[str] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Retrieve several decisions from memory."""
+        return {
+            i: project_fields(self._data[i], fields)
+            for i in decision_ids
+            if i in self._data
+        }
+
+    async def existing_ids(self, decision_ids: list[str]) -> set[str]:
+        """Return the IDs held in memory."""
+        return {i for i in decision_ids if i in self._data}
+
     async def delete(self, decision_id: str) -> bool:
         """Remove a decision from memory."""
         if decision_id in self._data:
             del self._data[decision_id]
+            self._version += 1
             return True
         return False
 
@@ -74,20 +110,8 @@ class MemoryDecisionStore(DecisionStore):
         # Apply filters
         filtered = apply_filters(all_decisions, query)
 
-        total = len(filtered)
-
-        # Sort
-        filtered = sort_decisions(filtered, query.sort, query.order)
-
-        # Paginate
-        page = filtered[query.offset : query.offset + query.limit]
-
-        return ListResult(
-            decisions=page,
-            total=total,
-            limit=query.limit,
-            offset=query.offset,
-        )
+        # Sort and paginate
+        return paginate(filtered, query)
 
     async def stats(self, query: StatsQuery) -> StatsResult:
         """Compute statistics over in-memory decisions."""
@@ -121,6 +145,7 @@ class MemoryDecisionStore(DecisionStore):
         if notes is not None:
             data["review_notes"] = notes
         data["updated_at"] = datetime.now(UTC).isoformat()
+        self._version += 1
         return True
 
     async def update_fields(self, decision_id: str, **fields: Any) -> bool:
@@ -132,6 +157,7 @@ class MemoryDecisionStore(DecisionStore):
         for key, value in fields.items():
             data[key] = value
         data["updated_at"] = datetime.now(UTC).isoformat()
+        self._version += 1
         return True
 
     async def count(self, **filters: Any) -> int:
@@ -144,3 +170,93 @@ class MemoryDecisionStore(DecisionStore):
             if matches_filters(d, filters):
                 count += 1
         return count
+
+    async def version(self) -> int:
+        """Return the in-process write counter."""
+        return self._version
+
+    async def fingerprint(self) -> str:
+        """Return the write counter; the data does not outlive the process either."""
+        return str(self._version)
+
+    # ------------------------------------------------------------------
+    # Outbox (in memory: lost on exit like everything else here)
+    # ------------------------------------------------------------------
+
+    async def save_with_outbox(
+        self,
+        decision_id: str,
+        data: dict[str, Any],
+        outbox: builtins.list[tuple[str, dict[str, Any] | None]],
+    ) -> bool:
+        """Store a decision and queue its outbox entries."""
+        await self.save(decision_id, data)
+        now = time.time()
+        for topic, payload in outbox:
+            entry = OutboxEntry(
+                id=next(self._outbox_ids),
+                topic=topic,
+                decision_id=decision_id,
+                payload=copy.deepcopy(payload),
+                created_at=datetime.now(UTC).isoformat(),
+            )
+            self._outbox[entry.id] = (entry, now)
+        return True
+
+    async def claim_outbox(
+        self,
+        topic: str,
+        limit: int = 32,
+        lease_s: float = 60.0,
+        decision_id: str | None = None,
+    ) -> builtins.list[OutboxEntry]:
+        """Lease due outbox entries (all of one decision's, if given)."""
+        now = time.time()
+        if decision_id is None:
+            due = sorted(
+                (item for item in self._outbox.values()
+                 if item[0].topic == topic and item[1] <= now),
+                key=lambda item: (item[1], item[0].id),
+            )
+        else:
+            due = sorted(
+                (item for item in self._outbox.values()
+                 if item[0].topic == topic and item[0].decision_id == decision_id),
+                key=lambda item: item[0].id,
+            )
+        claimed = []
+        for entry, _ in due[:limit]:
+            entry.attempts += 1
+            self._outbox[entry.id] = (entry, now + lease_s)
+            claimed.append(copy.deepcopy(entry))
+        return claimed
+
+    async def complete_outbox(self, entry_ids: builtins.list[int]) -> None:
+        """Drop finished outbox entries."""
+        for entry_id in entry_ids:
+            self._outbox.pop(entry_id, None)
+
+    async def retry_outbox(self, entry_id: int, error: str, delay_s: float) -> None:
+        """Reschedule a failed outbox entry."""
+        item = self._outbox.get(entry_id)
+        if item is not None:
+            item[0].last_error = error
+            self._outbox[entry_id] = (item[0], time.time() + delay_s)
+
+    async def outbox_status(
+        self, topic: str, decision_id: str | None = None
+    ) -> dict[str, Any]:
+        """Count and age of the queued entries of ``topic``."""
+        entries = sorted(
+            (entry for entry, _ in self._outbox.values()
+             if entry.topic == topic and decision_id in (None, entry.decision_id)),
+            key=lambda entry: entry.id,
+        )
+        errors = [entry.last_error for entry in entries if entry.last_error]
+        return {
+            "pending": len(entries),
+            "retrying": len(errors),
+            "oldest_created_at": entries[0].created_at if entries else None,
+            "max_attempts": max((entry.attempts for entry in entries), default=0),
+            "last_error": errors[-1] if errors else None,
+        }
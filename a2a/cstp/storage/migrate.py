@@ -1,7 +1,7 @@
 """Auto-migration from YAML files to SQLite.
 
-On server startup, if CSTP_STORAGE=sqlite and the database is empty,
-automatically imports all existing YAML decision files into SQLite.
+On server startup, if CSTP_STORAGE=sqlite and any YAML decision is missing
+from the database, imports the YAML decision files into SQLite.
 
 Can also be run as a CLI command:
     python -m a2a.cstp.storage.migrate [--decisions-dir DIR] [--db-path PATH] [--force]
@@ -9,7 +9,10 @@ Can also be run as a CLI command:
 
 import asyncio
 import logging
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Any
 
@@ -21,6 +24,13 @@ logger = logging.getLogger(__name__)
 
 DECISIONS_PATH = os.getenv("DECISIONS_PATH", "decisions")
 
+# Decisions written per save_many() call (one transaction each).
+_IMPORT_BATCH = 1000
+
+# Parse in a process pool only with at least this many files per worker.
+_PARALLEL_PARSE_MIN = 500
+_PARSE_WORKERS = int(os.getenv("CSTP_MIGRATE_WORKERS", str(os.cpu_count() or 1)))
+
 
 def _parse_yaml_decision(yaml_file: Path) -> tuple[str, dict[str, Any]] | None:
     """Parse a YAML decision file and extract decision ID.
@@ -56,15 +66,77 @@ def _parse_yaml_decision(yaml_file: Path) -> tuple[str, dict[str, Any]] | None:
         return None
 
 
+async def _parse_yaml_files(
+    yaml_files: list[Path],
+) -> list[tuple[str, dict[str, Any]] | None]:
+    """Parse YAML decision files, in a process pool when there are many.
+
+    YAML parsing is CPU-bound pure Python, so threads would serialize on the
+    GIL. Small sets (and hosts with one CPU) are parsed in one worker thread,
+    since starting processes costs more than it saves. If the pool cannot be
+    started (restricted sandboxes), parsing falls back to the thread.
+
+    Args:
+        yaml_files: Files to parse.
+
+    Returns:
+        One entry per file, in order: (decision_id, data) or None.
+    """
+    workers = min(_PARSE_WORKERS, len(yaml_files) // _PARALLEL_PARSE_MIN)
+    if workers > 1:
+        chunksize = max(1, len(yaml_files) // (workers * 4))
+
+        def parse_in_pool() -> list[tuple[str, dict[str, Any]] | None]:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                return list(pool.map(_parse_yaml_decision, yaml_files, chunksize=chunksize))
+
+        try:
+            return await asyncio.to_thread(parse_in_pool)
+        except (OSError, BrokenProcessPool):
+            logger.warning("YAML parse pool unavailable, parsing in-process", exc_info=True)
+
+    return await asyncio.to_thread(lambda: [_parse_yaml_decision(f) for f in yaml_files])
+
+
+async def _save_records(
+    store: DecisionStore,
+    records: list[tuple[str, dict[str, Any]]],
+    total_files: int,
+) -> int:
+    """Save parsed decisions via save_many() in ``_IMPORT_BATCH``-sized batches.
+
+    Returns:
+        Number of decisions imported.
+    """
+    imported = 0
+    for start in range(0, len(records), _IMPORT_BATCH):
+        batch = records[start : start + _IMPORT_BATCH]
+        try:
+            imported += await store.save_many(batch)
+        except Exception:
+            logger.warning("Failed to import a batch of %d decisions", len(batch), exc_info=True)
+
+    logger.info(
+        "YAML migration complete: %d imported, %d errors, %d total files",
+        imported,
+        total_files - imported,
+        total_files,
+    )
+    return imported
+
+
 async def migrate_yaml_to_store(
     store: DecisionStore,
     decisions_dir: str | None = None,
 ) -> int:
     """Import all YAML decision files into a DecisionStore.
 
-    Scans the decisions directory for YAML files and inserts each
-    into the store via save(). Uses upsert semantics so it's safe
-    to re-run (idempotent).
+    Scans the decisions directory for YAML files and inserts them via
+    save_many() in batches. Uses upsert semantics so it's safe to re-run
+    (idempotent).
 
     Args:
         store: Initialized DecisionStore to import into.
@@ -84,32 +156,8 @@ async def migrate_yaml_to_store(
         logger.info("No YAML decision files found in %s", base)
         return 0
 
-    imported = 0
-    errors = 0
-
-    for yaml_file in yaml_files:
-        result = _parse_yaml_decision(yaml_file)
-        if result is None:
-            errors += 1
-            continue
-
-        decision_id, data = result
-
-        try:
-            await store.save(decision_id, data)
-            imported += 1
-        except Exception:
-            logger.warning("Failed to import %s", yaml_file, exc_info=True)
-            errors += 1
-
-    logger.info(
-        "YAML migration complete: %d imported, %d errors, %d total files",
-        imported,
-        errors,
-        len(yaml_files),
-    )
-
-    return imported
+    parsed = await _parse_yaml_files(yaml_files)
+    return await _save_records(store, [r for r in parsed if r is not None], len(yaml_files))
 
 
 async def auto_migrate_if_incomplete(
@@ -121,10 +169,9 @@ async def auto_migrate_if_incomplete(
     Called during server startup.
 
     Resumability matters here. The original gate was "only run when the store is
-    empty", but `migrate_yaml_to_store` commits one record at a time with no
-    surrounding transaction. A crash after the first save left a non-empty store,
-    so the next startup skipped migration permanently and the remaining YAML
-    decisions became invisible to every read path.
+    empty", but an import interrupted part-way leaves a non-empty store, so the
+    next startup skipped migration permanently and the remaining YAML decisions
+    became invisible to every read path.
 
     The check is per-ID rather than a count comparison. Aggregate counts are not
     sound: a store holding decisions recorded *after* an interrupted import can
@@ -149,8 +196,8 @@ async def auto_migrate_if_incomplete(
         return 0
 
     # IDs come from the filename (YYYY-MM-DD-decision-XXXXXXXX.yaml), so the common
-    # case — everything already imported — costs one directory walk and one lookup
-    # per file, with no YAML parsing at all.
+    # case — everything already imported — costs one directory walk and one
+    # ID-only existence query per chunk of files, with no YAML parsing at all.
     by_id: dict[str, Path] = {}
     for f in yaml_files:
         stem = f.stem
@@ -158,24 +205,19 @@ async def auto_migrate_if_incomplete(
             by_id[stem.rsplit("-decision-", 1)[1]] = f
 
     try:
-        absent = [
-            decision_id
-            for decision_id in sorted(by_id)
-            if await store.get(decision_id) is None
-        ]
+        present = await store.existing_ids(list(by_id))
     except Exception:
         logger.warning("Could not inspect store contents, skipping auto-migration", exc_info=True)
         return 0
 
+    absent = [decision_id for decision_id in sorted(by_id) if decision_id not in present]
+
     # A file that cannot be parsed can never be imported, so counting it as
     # missing would make the gate permanently unsatisfiable and re-run the whole
     # migration on every restart. Parsing happens only for absent IDs, so a fully
     # migrated store still parses nothing.
-    missing = [
-        decision_id
-        for decision_id in absent
-        if _parse_yaml_decision(by_id[decision_id]) is not None
-    ]
+    parsed = await _parse_yaml_files([by_id[decision_id] for decision_id in absent])
+    missing = [result for result in parsed if result is not None]
     unparseable = len(absent) - len(missing)
     if unparseable:
         logger.warning(
@@ -196,7 +238,12 @@ async def auto_migrate_if_incomplete(
         len(missing),
         len(by_id),
     )
-    return await migrate_yaml_to_store(store, decisions_dir)
+    # Re-sync every file, not only the missing ones, as a full migration
+    # would; the absent files are already parsed, so parse just the rest.
+    absent_files = {by_id[decision_id] for decision_id in absent}
+    rest = await _parse_yaml_files([f for f in yaml_files if f not in absent_files])
+    records = missing + [r for r in rest if r is not None]
+    return await _save_records(store, records, len(yaml_files))
 
 
 # Back-compat alias: the gate is no longer "is the store empty", but callers
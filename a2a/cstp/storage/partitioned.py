@@ -0,0 +1,482 @@
+"""Partitioned SQLite storage backend for decisions.
+
+Routes each decision to one of several SQLite files, one per calendar month
+of ``created_at`` or one per project, each a full SQLiteDecisionStore with
+its own writer thread and reader pool. Reads fan out to the partitions
+concurrently (each on its own reader threads) and merge: sorted list pages
+by k-way merge on (sort value, id), stats and counts by summing. Vacuum,
+FTS merges, and backups then work on one bounded file at a time, and a
+write only ever locks its own partition.
+
+Archived partitions are opened read-only: they answer reads, never receive
+writes, and a write routed to an archived partition raises ValueError.
+Attaching the old single-file ``decisions.db`` as an archive keeps its
+decisions readable after switching to this backend.
+
+Configuration via environment variables:
+    - CSTP_DB_PATH: Partition files live next to it, named
+      ``<stem>-<partition>.db`` (default: data/decisions.db)
+    - CSTP_PARTITION_BY: ``month`` (default) or ``project``
+    - CSTP_DB_ARCHIVES: Comma-separated database files to attach read-only
+    - CSTP_DB_READERS / CSTP_DB_GROUP_COMMIT_*: Applied to every partition
+"""
+
+from __future__ import annotations
+
+import asyncio
+import builtins
+import dataclasses
+import heapq
+import logging
+import os
+import re
+from collections import Counter
+from collections.abc import Collection
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from . import (
+    DecisionStore,
+    ListQuery,
+    ListResult,
+    StatsQuery,
+    StatsResult,
+    decode_cursor,
+    encode_cursor,
+)
+from .sqlite import _FIELD_ALIASES, _NULLABLE_SORTS, _SORTABLE_COLUMNS, SQLiteDecisionStore
+
+logger = logging.getLogger(__name__)
+
+PARTITION_SCHEMES: frozenset[str] = frozenset({"month", "project"})
+
+_MONTH_RE = re.compile(r"^\d{4}-\d{2}$")
+_UNSAFE_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+class PartitionedDecisionStore(DecisionStore):
+    """Decision storage spread over per-month or per-project SQLite files.
+
+    Partitions are discovered from the files next to ``db_path`` at
+    ``initialize()`` and created on first write. Routing only decides where
+    a row lives: every read filters on the row's own columns, so a lookup
+    by ID simply asks every partition.
+    """
+
+    def __init__(
+        self,
+        db_path: str | None = None,
+        partition_by: str | None = None,
+        archives: list[str] | None = None,
+        **store_options: Any,
+    ) -> None:
+        base = Path(db_path or os.getenv("CSTP_DB_PATH") or "data/decisions.db")
+        self._dir = base.parent
+        self._stem = base.stem
+        self._partition_by = partition_by or os.getenv("CSTP_PARTITION_BY", "month")
+        if self._partition_by not in PARTITION_SCHEMES:
+            msg = f"Unknown partition scheme: {self._partition_by}"
+            raise ValueError(msg)
+        if archives is None:
+            env_archives = os.getenv("CSTP_DB_ARCHIVES", "")
+            archives = [p.strip() for p in env_archives.split(",") if p.strip()]
+        self._archive_paths = [Path(p) for p in archives]
+        self._store_options = store_options
+        self._live: dict[str, SQLiteDecisionStore] = {}
+        self._archived: dict[str, SQLiteDecisionStore] = {}
+        self._create_lock = asyncio.Lock()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def initialize(self) -> None:
+        """Open archived partitions read-only and every live partition file."""
+        archived_files = {p.resolve() for p in self._archive_paths}
+        for path in self._archive_paths:
+            self._archived[self._name_for_file(path)] = SQLiteDecisionStore(
+                str(path), read_only=True, **self._store_options,
+            )
+        for path in sorted(self._dir.glob(f"{self._stem}-*.db")):
+            if path.resolve() in archived_files:
+                continue
+            name = self._name_for_file(path)
+            if name not in self._archived:
+                self._live[name] = SQLiteDecisionStore(str(path), **self._store_options)
+        await asyncio.gather(*(p.initialize() for p in self._all()))
+        logger.info(
+            "PartitionedDecisionStore initialized in %s by %s: %d live, %d archived",
+            self._dir, self._partition_by, len(self._live), len(self._archived),
+        )
+
+    async def close(self) -> None:
+        """Close every partition."""
+        await asyncio.gather(*(p.close() for p in self._all()))
+        self._live.clear()
+        self._archived.clear()
+
+    def _name_for_file(self, path: Path) -> str:
+        prefix = f"{self._stem}-"
+        return path.stem[len(prefix):] if path.stem.startswith(prefix) else path.stem
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def partition_for(self, data: dict[str, Any]) -> str:
+        """Name of the partition a decision with ``data`` is stored in."""
+        if self._partition_by == "month":
+            created = data.get("created_at") or data.get("date") or datetime.now(UTC)
+            month = str(created)[:7]
+            return month if _MONTH_RE.match(month) else "undated"
+        project = data.get("project")
+        if isinstance(project, dict):
+            project = project.get("name")
+        if not project:
+            return "unassigned"
+        return _UNSAFE_NAME_RE.sub("_", str(project)).strip("._") or "unassigned"
+
+    def _all(self) -> list[SQLiteDecisionStore]:
+        """Live partitions first, so their rows win over archived copies."""
+        return [*self._live.values(), *self._archived.values()]
+
+    def _candidates(
+        self,
+        project: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+    ) -> dict[str, SQLiteDecisionStore]:
+        """Partitions, by name, that can hold rows matching these filters."""
+        selected: dict[str, SQLiteDecisionStore] = {}
+        wanted_project = self.partition_for({"project": project}) if project else None
+        for name, store in [*self._live.items(), *self._archived.items()]:
+            if self._partition_by == "project" and wanted_project is not None:
+                if name != wanted_project and name in self._live:
+                    continue
+            if self._partition_by == "month" and _MONTH_RE.match(name):
+                if date_from and name < date_from[:7]:
+                    continue
+                if date_to and name > date_to[:7]:
+                    continue
+            selected[name] = store
+        return selected
+
+    async def _writable(self, name: str) -> SQLiteDecisionStore:
+        """The live partition ``name``, created on first use."""
+        if name in self._archived:
+            msg = f"Partition {name} is archived (read-only)"
+            raise ValueError(msg)
+        store = self._live.get(name)
+        if store is not None:
+            return store
+        async with self._create_lock:
+            store = self._live.get(name)
+            if store is None:
+                path = self._dir / f"{self._stem}-{name}.db"
+                store = SQLiteDecisionStore(str(path), **self._store_options)
+                await store.initialize()
+                self._live[name] = store
+                logger.info("Created decision partition %s", path)
+        return store
+
+    async def _owners(self, decision_ids: list[str]) -> dict[str, list[str]]:
+        """Map each live partition name to the given IDs it holds."""
+        names = list(self._live)
+        found = await asyncio.gather(
+            *(self._live[n].existing_ids(decision_ids) for n in names)
+        )
+        return {n: sorted(ids) for n, ids in zip(names, found, strict=True) if ids}
+
+    # ------------------------------------------------------------------
+    # CRUD
+    # ------------------------------------------------------------------
+
+    async def save(self, decision_id: str, data: dict[str, Any]) -> bool:
+        """Save into the routed partition, removing copies left elsewhere."""
+        return await self.save_many([(decision_id, data)]) == 1
+
+    async def save_many(self, items: list[tuple[str, dict[str, Any]]]) -> int:
+        """Save a batch, one transaction per partition, partitions in parallel."""
+        if not items:
+            return 0
+        routed: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+        for decision_id, data in items:
+            routed.setdefault(self.partition_for(data), []).append((decision_id, data))
+        owners = await self._owners([decision_id for decision_id, _ in items])
+        targets = {name: await self._writable(name) for name in routed}
+        saved = await asyncio.gather(
+            *(targets[name].save_many(batch) for name, batch in routed.items())
+        )
+
+        # A decision whose created_at or project moved it to another
+        # partition: drop the old copy once the new one is committed.
+        destination = {
+            decision_id: name
+            for name, batch in routed.items()
+            for decision_id, _ in batch
+        }
+        moved = [
+            (name, decision_id)
+            for name, ids in owners.items()
+            for decision_id in ids
+            if destination[decision_id] != name
+        ]
+        if moved:
+            landed = await self._owners([decision_id for _, decision_id in moved])
+            await asyncio.gather(*(
+                self._live[name].delete(decision_id)
+                for name, decision_id in moved
+                if decision_id in landed.get(destination[decision_id], ())
+            ))
+        return sum(saved)
+
+    async def get(self, decision_id: str) -> dict[str, Any] | None:
+        """Look the decision up in every partition."""
+        for found in await asyncio.gather(*(p.get(decision_id) for p in self._all())):
+            if found is not None:
+                return found
+        return None
+
+    async def get_many(
+        self,
+        decision_ids: list[str],
+        fields: Collection[str] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Batched lookup in every partition concurrently."""
+        merged: dict[str, dict[str, Any]] = {}
+        results = await asyncio.gather(
+            *(p.get_many(decision_ids, fields) for p in self._all())
+        )
+        for found in reversed(results):
+            merged.update(found)
+        return merged
+
+    async def existing_ids(self, decision_ids: list[str]) -> set[str]:
+        """IDs present in any partition."""
+        results = await asyncio.gather(*(p.existing_ids(decision_ids) for p in self._all()))
+        return set().union(*results)
+
+    async def delete(self, decision_id: str) -> bool:
+        """Delete from every live partition holding the decision."""
+        results = await asyncio.gather(*(p.delete(decision_id) for p in self._live.values()))
+        return any(results)
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+
+    async def list(self, query: ListQuery) -> ListResult:
+        """Fan the query out and k-way merge the sorted partition pages."""
+        sort_col = query.sort if query.sort in _SORTABLE_COLUMNS else "created_at"
+        descending = query.order.lower() != "asc"
+        start = 0 if query.cursor else query.offset
+        end = start + query.limit
+
+        # The sort column is fetched for merging even when not projected.
+        fields = query.fields
+        strip_sort = False
+        if fields is not None:
+            projected = {_FIELD_ALIASES.get(f, f) for f in fields}
+            strip_sort = sort_col not in projected
+            fields = [*fields, sort_col] if strip_sort else fields
+        partition_query = dataclasses.replace(query, offset=0, limit=end, fields=fields)
+        partitions = self._candidates(query.project, query.date_from, query.date_to)
+
+        def merge_key(d: dict[str, Any]) -> tuple[Any, str]:
+            value = d.get(sort_col)
+            if value is None and sort_col in _NULLABLE_SORTS:
+                value = ""
+            return value, d["id"]
+
+        total: int | None = None
+        if (
+            not query.include_total
+            and sort_col == "created_at"
+            and self._partition_by == "month"
+            and all(_MONTH_RE.match(name) for name in partitions)
+        ):
+            # Month partitions are ranges of created_at: read them in sort
+            # order and stop once the page (plus one row) is full.
+            merged: builtins.list[dict[str, Any]] = []
+            for name in sorted(partitions, reverse=descending):
+                if query.cursor and self._before_cursor(name, query, descending):
+                    continue
+                result = await partitions[name].list(
+                    dataclasses.replace(partition_query, limit=end + 1 - len(merged))
+                )
+                merged += result.decisions
+                if len(merged) > end:
+                    break
+            more = len(merged) > end
+        else:
+            # Each partition returns its first start + limit rows in the same
+            # (sort value, id) order; the page is a slice of their merge.
+            results = await asyncio.gather(
+                *(p.list(partition_query) for p in partitions.values())
+            )
+            merged = list(heapq.merge(
+                *(r.decisions for r in results), key=merge_key, reverse=descending,
+            ))
+            more = len(merged) > end or any(r.next_cursor for r in results)
+            if query.include_total:
+                total = sum(r.total or 0 for r in results)
+
+        page = merged[start:end]
+        next_cursor = encode_cursor(query, *merge_key(page[-1])) if more and page else None
+        if strip_sort:
+            # created_at also brings the derived "date" field with it
+            extra = (sort_col, "date") if sort_col == "created_at" else (sort_col,)
+            for d in page:
+                for key in extra:
+                    d.pop(key, None)
+
+        return ListResult(
+            decisions=page,
+            total=total,
+            limit=query.limit,
+            offset=start,
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def _before_cursor(month: str, query: ListQuery, descending: bool) -> bool:
+        """True if every row of ``month`` sorts before the cursor position."""
+        sort_value, _ = decode_cursor(query)
+        cursor_month = str(sort_value)[:7]
+        return month > cursor_month if descending else month < cursor_month
+
+    async def stats(self, query: StatsQuery) -> StatsResult:
+        """Sum every partition's statistics."""
+        partitions = self._candidates(query.project, query.date_from, query.date_to)
+        results = await asyncio.gather(
+            *(p.stats(query, tag_limit=None) for p in partitions.values())
+        )
+        merged = StatsResult()
+        by_category: Counter[str] = Counter()
+        by_stakes: Counter[str] = Counter()
+        by_status: Counter[str] = Counter()
+        by_agent: Counter[str] = Counter()
+        by_day: Counter[str] = Counter()
+        tags: Counter[str] = Counter()
+        recent: Counter[str] = Counter()
+        for r in results:
+            merged.total += r.total
+            by_category.update(r.by_category)
+            by_stakes.update(r.by_stakes)
+            by_status.update(r.by_status)
+            by_agent.update(r.by_agent)
+            by_day.update({d["date"]: d["count"] for d in r.by_day})
+            tags.update({t["tag"]: t["count"] for t in r.top_tags})
+            recent.update(r.recent_activity)
+        merged.by_category = dict(by_category)
+        merged.by_stakes = dict(by_stakes)
+        merged.by_status = dict(by_status)
+        merged.by_agent = dict(by_agent)
+        # Exact: a day among the 30 most recent overall is among the 30 most
+        # recent of every partition that has it.
+        merged.by_day = [
+            {"date": day, "count": by_day[day]}
+            for day in sorted(by_day, reverse=True)[:30]
+        ]
+        merged.top_tags = [
+            {"tag": tag, "count": count}
+            for tag, count in sorted(tags.items(), key=lambda t: (-t[1], t[0]))[:20]
+        ]
+        merged.recent_activity = {
+            label: recent[label] for label in ("last24h", "last7d", "last30d")
+        }
+        return merged
+
+    async def update_outcome(
+        self,
+        decision_id: str,
+        outcome: str,
+        result: str | None = None,
+        lessons: str | None = None,
+        notes: str | None = None,
+    ) -> bool:
+        """Record the outcome in the live partition holding the decision."""
+        owners = await self._owners([decision_id])
+        results = await asyncio.gather(*(
+            self._live[name].update_outcome(decision_id, outcome, result, lessons, notes)
+            for name in owners
+        ))
+        return any(results)
+
+    async def update_fields(self, decision_id: str, **fields: Any) -> bool:
+        """Update in place, or move the decision if its partition changes."""
+        owners = await self._owners([decision_id])
+        if not owners:
+            return False
+        if self._partition_by == "project" and "project" in fields:
+            name = next(iter(owners))
+            current = await self._live[name].get(decision_id)
+            if current is not None:
+                updated = {**current, **fields}
+                if self.partition_for(updated) != name:
+                    return await self.save(decision_id, updated)
+        results = await asyncio.gather(*(
+            self._live[name].update_fields(decision_id, **fields) for name in owners
+        ))
+        return any(results)
+
+    async def count(self, **filters: Any) -> int:
+        """Sum the partition counts."""
+        partitions = self._candidates(filters.get("project"))
+        counts = await asyncio.gather(*(p.count(**filters) for p in partitions.values()))
+        return sum(counts)
+
+    async def keyword_search(
+        self,
+        query: str,
+        filters: dict[str, Any] | None = None,
+        top_k: int = 10,
+    ) -> builtins.list[tuple[str, float]] | None:
+        """Merge each partition's FTS5 hits by score.
+
+        bm25() statistics are per partition, so scores are comparable only
+        approximately across partitions.
+        """
+        project = (filters or {}).get("project")
+        partitions = self._candidates(project)
+        results = await asyncio.gather(
+            *(p.keyword_search(query, filters, top_k) for p in partitions.values())
+        )
+        hits = [hit for r in results if r for hit in r]
+        return heapq.nlargest(top_k, hits, key=lambda hit: hit[1])
+
+    async def version(self) -> int:
+        """Sum of the partition change counters; moves on every write."""
+        versions = await asyncio.gather(*(p.version() for p in self._all()))
+        return sum(versions)
+
+    async def fingerprint(self) -> str:
+        """Partition fingerprints, in partition order."""
+        fingerprints = await asyncio.gather(*(p.fingerprint() for p in self._all()))
+        return ",".join(fingerprints)
+
+    async def explain(self, query: ListQuery) -> dict[str, builtins.list[dict[str, Any]]]:
+        """Per-partition plans, keyed ``<partition>/<statement>``."""
+        partitions = self._candidates(query.project, query.date_from, query.date_to)
+        plans = await asyncio.gather(*(p.explain(query) for p in partitions.values()))
+        return {
+            f"{name}/{statement}": steps
+            for name, plan in zip(partitions, plans, strict=True)
+            for statement, steps in plan.items()
+        }
+
+    async def maintain(self) -> dict[str, dict[str, int]]:
+        """Optimize and checkpoint every live partition; results by name."""
+        names = list(self._live)
+        results = await asyncio.gather(*(self._live[n].maintain() for n in names))
+        return dict(zip(names, results, strict=True))
+
+    def metrics(self) -> dict[str, Any]:
+        """Writer and reader counters per partition."""
+        return {
+            "partitions": {
+                **{name: p.metrics() for name, p in self._live.items()},
+                **{f"{name} (archived)": p.metrics() for name, p in self._archived.items()},
+            },
+        }
@@ -0,0 +1,391 @@
+"""Decision ID → YAML file path index.
+
+Decision files live at ``decisions/YYYY/MM/YYYY-MM-DD-decision-{id}.yaml``,
+so finding one by ID used to mean an ``rglob`` over the whole tree. The
+index keeps ``id → path`` in memory, persisted to a sidecar SQLite file so
+a restart does not rescan 100k files.
+
+Freshness comes from directory mtimes: creating, renaming, or deleting a
+file bumps its directory's mtime. Writers in this process update the index
+directly (``record`` / ``forget``); on a miss, or a hit whose file has
+gone, the index stats every directory it knows and re-lists only those
+whose mtime moved, which also picks up files written by other processes.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS decision_paths (
+    id TEXT PRIMARY KEY,
+    path TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS scanned_dirs (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+_MARKER = "-decision-"
+
+# A directory modified this recently may change again within the same mtime
+# tick (coarse on some filesystems), so its mtime is not trusted: it is
+# recorded as 0 and re-listed on the next refresh.
+_RACY_NS = 2_000_000_000
+
+_DEFAULT_SIDECAR = ".decision-index.db"
+
+
+def decision_id_from_name(name: str) -> str | None:
+    """Return the ID in ``YYYY-MM-DD-decision-{id}.yaml``, or None."""
+    if not name.endswith(".yaml") or _MARKER not in name:
+        return None
+    return name[: -len(".yaml")].rsplit(_MARKER, 1)[1]
+
+
+class DecisionPathIndex:
+    """Persistent ``decision id → file path`` map for one decisions tree.
+
+    Paths are stored relative to ``base``. Thread-safe.
+
+    Attributes:
+        hits: Lookups answered from the map without a refresh.
+        refreshes: Refreshes triggered by misses or vanished files.
+        dirs_scanned: Directories re-listed by refreshes and full scans.
+    """
+
+    def __init__(self, base: Path, db_path: Path | None = None) -> None:
+        self._base = base
+        self._db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._paths: dict[str, str] = {}
+        self._by_dir: dict[str, set[str]] = {}
+        self._dirs: dict[str, int] = {}
+        self.hits = 0
+        self.refreshes = 0
+        self.dirs_scanned = 0
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get(self, decision_id: str) -> Path | None:
+        """Return the file for ``decision_id``, or None if there is none."""
+        with self._lock:
+            self._ensure_loaded()
+            path = self._existing(decision_id)
+            if path is not None:
+                self.hits += 1
+                return path
+            self._refresh()
+            return self._existing(decision_id)
+
+    def get_prefix(self, prefix: str) -> Path | None:
+        """Return a file whose ID is or starts with ``prefix``.
+
+        An exact match wins; otherwise the lowest matching ID.
+        """
+        exact = self.get(prefix)
+        if exact is not None:
+            return exact
+        with self._lock:
+            for decision_id in sorted(k for k in self._paths if k.startswith(prefix)):
+                path = self._existing(decision_id)
+                if path is not None:
+                    return path
+        return None
+
+    def items(self) -> list[tuple[str, Path]]:
+        """Return ``(id, path)`` for every indexed file, refreshed, in path order.
+
+        Only directories whose mtime moved since their last listing are
+        re-listed, so repeated full-tree reads cost one ``stat`` per directory.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            self._refresh()
+            ordered = sorted(self._paths.items(), key=lambda item: item[1])
+        return [(decision_id, self._base / rel) for decision_id, rel in ordered]
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._paths)
+
+    # ------------------------------------------------------------------
+    # Maintenance by writers
+    # ------------------------------------------------------------------
+
+    def record(self, decision_id: str, path: str | Path) -> None:
+        """Note that ``decision_id`` was just written to ``path``."""
+        try:
+            rel = Path(path).resolve().relative_to(self._base.resolve()).as_posix()
+        except ValueError:
+            logger.debug("Not indexing %s: outside %s", path, self._base)
+            return
+        with self._lock:
+            self._ensure_loaded()
+            self._set(decision_id, rel)
+            self._persist(upserts=[(decision_id, rel)])
+
+    def forget(self, decision_id: str) -> None:
+        """Note that the file for ``decision_id`` was deleted."""
+        with self._lock:
+            self._ensure_loaded()
+            if self._drop(decision_id):
+                self._persist(deletes=[decision_id])
+
+    def refresh(self) -> None:
+        """Re-list every directory whose mtime moved since it was scanned."""
+        with self._lock:
+            self._ensure_loaded()
+            self._refresh()
+
+    def stats(self) -> dict[str, Any]:
+        """Entry and lookup counters."""
+        with self._lock:
+            return {
+                "entries": len(self._paths),
+                "dirs": len(self._dirs),
+                "hits": self.hits,
+                "refreshes": self.refreshes,
+                "dirs_scanned": self.dirs_scanned,
+                "persistent": self._db_path is not None,
+            }
+
+    def close(self) -> None:
+        """Close the sidecar connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Internals (callers hold the lock)
+    # ------------------------------------------------------------------
+
+    def _existing(self, decision_id: str) -> Path | None:
+        rel = self._paths.get(decision_id)
+        if rel is None:
+            return None
+        path = self._base / rel
+        return path if path.is_file() else None
+
+    def _set(self, decision_id: str, rel: str) -> None:
+        self._drop(decision_id)
+        self._paths[decision_id] = rel
+        self._by_dir.setdefault(_parent(rel), set()).add(decision_id)
+
+    def _drop(self, decision_id: str) -> bool:
+        rel = self._paths.pop(decision_id, None)
+        if rel is None:
+            return False
+        self._by_dir.get(_parent(rel), set()).discard(decision_id)
+        return True
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        conn = self._connect()
+        if conn is not None:
+            try:
+                for decision_id, rel in conn.execute("SELECT id, path FROM decision_paths"):
+                    self._set(decision_id, rel)
+                self._dirs = dict(conn.execute("SELECT path, mtime_ns FROM scanned_dirs"))
+            except sqlite3.Error:
+                logger.warning("Decision path index %s unreadable; rescanning", self._db_path,
+                               exc_info=True)
+                self._paths.clear()
+                self._by_dir.clear()
+                self._dirs.clear()
+        if self._dirs:
+            self._refresh()
+        else:
+            self._full_scan()
+
+    def _full_scan(self) -> None:
+        started = time.perf_counter()
+        self._paths.clear()
+        self._by_dir.clear()
+        self._dirs.clear()
+        upserts: list[tuple[str, str]] = []
+        dirs: list[tuple[str, int]] = []
+        if self._base.is_dir():
+            self._scan_dir("", upserts, [], dirs)
+        self._persist(upserts=upserts, dirs=dirs, replace=True)
+        logger.info(
+            "Indexed %d decision files in %d directories under %s in %.2fs",
+            len(self._paths), len(self._dirs), self._base, time.perf_counter() - started,
+        )
+
+    def _refresh(self) -> None:
+        self.refreshes += 1
+        if not self._dirs:
+            if self._base.is_dir():
+                self._full_scan()
+            return
+        upserts: list[tuple[str, str]] = []
+        deletes: list[str] = []
+        dirs: list[tuple[str, int]] = []
+        gone: list[str] = []
+        for rel_dir, mtime_ns in list(self._dirs.items()):
+            try:
+                current = (self._base / rel_dir).stat().st_mtime_ns
+            except FileNotFoundError:
+                gone.append(rel_dir)
+                continue
+            if current != mtime_ns or mtime_ns == 0:
+                self._scan_dir(rel_dir, upserts, deletes, dirs)
+        for rel_dir in gone:
+            self._dirs.pop(rel_dir, None)
+            for decision_id in list(self._by_dir.pop(rel_dir, ())):
+                if self._paths.pop(decision_id, None) is not None:
+                    deletes.append(decision_id)
+        if upserts or deletes or dirs or gone:
+            self._persist(upserts=upserts, deletes=deletes, dirs=dirs, dropped_dirs=gone)
+
+    def _scan_dir(
+        self,
+        rel_dir: str,
+        upserts: list[tuple[str, str]],
+        deletes: list[str],
+        dirs: list[tuple[str, int]],
+    ) -> None:
+        """List one directory; recurse into subdirectories not seen before."""
+        directory = self._base / rel_dir
+        try:
+            # stat before listing, so a file added mid-listing bumps the
+            # mtime past what is recorded and is caught next time.
+            mtime_ns = directory.stat().st_mtime_ns
+            entries = list(os.scandir(directory))
+        except OSError:
+            return
+        self.dirs_scanned += 1
+        if time.time_ns() - mtime_ns < _RACY_NS:
+            mtime_ns = 0
+        self._dirs[rel_dir] = mtime_ns
+        dirs.append((rel_dir, mtime_ns))
+
+        present: set[str] = set()
+        new_dirs: list[str] = []
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if rel not in self._dirs and not entry.name.startswith("."):
+                    new_dirs.append(rel)
+                continue
+            decision_id = decision_id_from_name(entry.name)
+            if decision_id is None:
+                continue
+            present.add(decision_id)
+            if self._paths.get(decision_id) != rel:
+                self._set(decision_id, rel)
+                upserts.append((decision_id, rel))
+        for decision_id in list(self._by_dir.get(rel_dir, ())):
+            if decision_id not in present:
+                self._drop(decision_id)
+                deletes.append(decision_id)
+        for rel in new_dirs:
+            self._scan_dir(rel, upserts, deletes, dirs)
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._db_path is None:
+            return None
+        if self._conn is None:
+            try:
+                self._db_path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.executescript(_SCHEMA_SQL)
+            except (OSError, sqlite3.Error):
+                logger.warning("Decision path index %s unavailable; keeping it in memory",
+                               self._db_path, exc_info=True)
+                self._db_path = None
+                self._conn = None
+        return self._conn
+
+    def _persist(
+        self,
+        upserts: list[tuple[str, str]] | None = None,
+        deletes: list[str] | None = None,
+        dirs: list[tuple[str, int]] | None = None,
+        dropped_dirs: list[str] | None = None,
+        replace: bool = False,
+    ) -> None:
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            with conn:
+                if replace:
+                    conn.execute("DELETE FROM decision_paths")
+                    conn.execute("DELETE FROM scanned_dirs")
+                if deletes:
+                    conn.executemany(
+                        "DELETE FROM decision_paths WHERE id = ?",
+                        [(decision_id,) for decision_id in deletes],
+                    )
+                if upserts:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO decision_paths (id, path) VALUES (?, ?)",
+                        upserts,
+                    )
+                if dropped_dirs:
+                    conn.executemany(
+                        "DELETE FROM scanned_dirs WHERE path = ?",
+                        [(d,) for d in dropped_dirs],
+                    )
+                if dirs:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO scanned_dirs (path, mtime_ns) VALUES (?, ?)",
+                        dirs,
+                    )
+        except sqlite3.Error:
+            logger.warning("Decision path index write failed", exc_info=True)
+
+
+def _parent(rel: str) -> str:
+    return rel.rpartition("/")[0]
+
+
+_indexes: dict[Path, DecisionPathIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_path_index(base: str | Path) -> DecisionPathIndex:
+    """Get or create the index for the decisions tree at ``base``.
+
+    ``DECISION_INDEX_PATH`` names the sidecar file (default:
+    ``<base>/.decision-index.db``; empty keeps the index memory-only).
+    """
+    key = Path(base).resolve()
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            raw = os.getenv("DECISION_INDEX_PATH")
+            if raw is None:
+                db_path: Path | None = key / _DEFAULT_SIDECAR
+            else:
+                db_path = Path(raw) if raw else None
+            index = _indexes[key] = DecisionPathIndex(key, db_path)
+        return index
+
+
+def reset_path_indexes() -> None:
+    """Close and drop every index (for testing)."""
+    with _indexes_lock:
+        for index in _indexes.values():
+            index.close()
+        _indexes.clear()
@@ -1,26 +1,45 @@
 """SQLite storage backend for decisions.
 
-Uses WAL mode for concurrent reads, FTS5 for keyword search,
-and normalized tables for tags, reasons, bridge, and deliberation.
+Uses WAL mode with a pool of reader connections and one writer thread,
+FTS5 for keyword search, and normalized tables for tags, reasons, bridge,
+and deliberation.
 """
 
 from __future__ import annotations
 
 import asyncio
+import builtins
+import functools
 import json
 import logging
 import os
 import re
 import sqlite3
-from collections import defaultdict
-from datetime import UTC, datetime
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Collection, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any
-
-from . import DecisionStore, ListQuery, ListResult, StatsQuery, StatsResult
+from typing import Any, TypeVar
+
+from . import (
+    DecisionStore,
+    ListQuery,
+    ListResult,
+    OutboxEntry,
+    StatsQuery,
+    StatsResult,
+    decode_cursor,
+    encode_cursor,
+)
+from .sqlite_pool import ReaderPool, WriterExecutor
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 SCHEMA_SQL = """\
 -- Core decisions table
 CREATE TABLE IF NOT EXISTS decisions (
@@ -79,50 +98,396 @@ CREATE TABLE IF NOT EXISTS decision_deliberation (
     total_duration_ms INTEGER
 );
 
--- Indexes for common query patterns
-CREATE INDEX IF NOT EXISTS idx_decisions_created_at ON decisions(created_at);
-CREATE INDEX IF NOT EXISTS idx_decisions_category ON decisions(category);
-CREATE INDEX IF NOT EXISTS idx_decisions_status ON decisions(status);
+-- Indexes for common query patterns (composite ones: see _INDEX_SCHEMA_SQL)
 CREATE INDEX IF NOT EXISTS idx_decisions_stakes ON decisions(stakes);
 CREATE INDEX IF NOT EXISTS idx_decisions_recorded_by ON decisions(recorded_by);
-CREATE INDEX IF NOT EXISTS idx_decisions_project ON decisions(project);
-CREATE INDEX IF NOT EXISTS idx_decision_tags_tag ON decision_tags(tag);
+CREATE INDEX IF NOT EXISTS idx_decision_reasons_decision_id ON decision_reasons(decision_id);
+
+-- Change counter: bumped by every write to decisions (every mutation path
+-- touches the row), so derived indexes can check freshness in one lookup.
+CREATE TABLE IF NOT EXISTS store_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO store_meta (key, value) VALUES ('version', 0);
+
+CREATE TRIGGER IF NOT EXISTS decisions_version_ai AFTER INSERT ON decisions BEGIN
+    UPDATE store_meta SET value = value + 1 WHERE key = 'version';
+END;
+
+CREATE TRIGGER IF NOT EXISTS decisions_version_ad AFTER DELETE ON decisions BEGIN
+    UPDATE store_meta SET value = value + 1 WHERE key = 'version';
+END;
+
+CREATE TRIGGER IF NOT EXISTS decisions_version_au AFTER UPDATE ON decisions BEGIN
+    UPDATE store_meta SET value = value + 1 WHERE key = 'version';
+END;
+"""
 
--- FTS5 virtual table for keyword search
-CREATE VIRTUAL TABLE IF NOT EXISTS decisions_fts USING fts5(
+# FTS5 index over the decision text plus tags, reasons, and bridge. It keeps
+# its own copy of the text (no external content table) because tags, reasons,
+# and bridge live in child tables; triggers on those tables refresh the
+# matching FTS row. Row ids are shared with decisions.rowid.
+_FTS_TAGS = "(SELECT group_concat(tag, ' ') FROM decision_tags WHERE decision_id = {id})"
+_FTS_REASONS = "(SELECT group_concat(text, ' ') FROM decision_reasons WHERE decision_id = {id})"
+_FTS_REASONS_TYPED = (
+    "(SELECT group_concat(text || ' ' || type, ' ') FROM decision_reasons WHERE decision_id = {id})"
+)
+_FTS_BRIDGE = (
+    "(SELECT trim(coalesce(structure, '') || ' ' || coalesce(function, '')) "
+    "FROM decision_bridge WHERE decision_id = {id})"
+)
+_FTS_ROWID = "(SELECT rowid FROM decisions WHERE id = {id})"
+
+
+def _fts_child_triggers(table: str, column: str, expr: str) -> str:
+    """Triggers that refresh one FTS column when a child table changes."""
+    return "".join(
+        f"""
+DROP TRIGGER IF EXISTS {table}_fts_a{op[0].lower()};
+CREATE TRIGGER {table}_fts_a{op[0].lower()} AFTER {op} ON {table} BEGIN
+    UPDATE decisions_fts SET {column} = {expr.format(id=f"{ref}.decision_id")}
+    WHERE rowid = {_FTS_ROWID.format(id=f"{ref}.decision_id")};
+END;
+"""
+        for op, ref in (("INSERT", "new"), ("DELETE", "old"))
+    )
+
+
+def _fts_schema_sql(direct: tuple[str, ...], reasons: str) -> str:
+    """(Re)build decisions_fts over ``direct`` decisions columns plus child text.
+
+    Drops any previous FTS table and triggers, then backfills from the
+    current rows, so each schema version can be applied as one migration.
+    """
+    columns = ", ".join(direct)
+    new_values = ", ".join(f"new.{c}" for c in direct)
+    row_values = ", ".join(f"d.{c}" for c in direct)
+    assignments = ", ".join(f"{c} = new.{c}" for c in direct)
+    return f"""
+DROP TRIGGER IF EXISTS decisions_ai;
+DROP TRIGGER IF EXISTS decisions_ad;
+DROP TRIGGER IF EXISTS decisions_au;
+DROP TABLE IF EXISTS decisions_fts;
+
+CREATE VIRTUAL TABLE decisions_fts USING fts5(
     id UNINDEXED,
-    decision,
-    context,
-    pattern,
-    content=decisions,
-    content_rowid=rowid
+    {columns},
+    tags,
+    reasons,
+    bridge
 );
 
--- Triggers to keep FTS5 in sync with decisions table
-CREATE TRIGGER IF NOT EXISTS decisions_ai AFTER INSERT ON decisions BEGIN
-    INSERT INTO decisions_fts(rowid, id, decision, context, pattern)
-    VALUES (new.rowid, new.id, new.decision, new.context, new.pattern);
+CREATE TRIGGER decisions_ai AFTER INSERT ON decisions BEGIN
+    INSERT INTO decisions_fts(rowid, id, {columns}, tags, reasons, bridge)
+    VALUES (
+        new.rowid, new.id, {new_values},
+        {_FTS_TAGS.format(id="new.id")},
+        {reasons.format(id="new.id")},
+        {_FTS_BRIDGE.format(id="new.id")}
+    );
 END;
 
-CREATE TRIGGER IF NOT EXISTS decisions_ad AFTER DELETE ON decisions BEGIN
-    INSERT INTO decisions_fts(decisions_fts, rowid, id, decision, context, pattern)
-    VALUES ('delete', old.rowid, old.id, old.decision, old.context, old.pattern);
+CREATE TRIGGER decisions_ad AFTER DELETE ON decisions BEGIN
+    DELETE FROM decisions_fts WHERE rowid = old.rowid;
 END;
 
-CREATE TRIGGER IF NOT EXISTS decisions_au AFTER UPDATE ON decisions BEGIN
-    INSERT INTO decisions_fts(decisions_fts, rowid, id, decision, context, pattern)
-    VALUES ('delete', old.rowid, old.id, old.decision, old.context, old.pattern);
-    INSERT INTO decisions_fts(rowid, id, decision, context, pattern)
-    VALUES (new.rowid, new.id, new.decision, new.context, new.pattern);
+-- Only text columns: status/outcome/updated_at writes leave the FTS row alone.
+CREATE TRIGGER decisions_au AFTER UPDATE OF {columns} ON decisions BEGIN
+    UPDATE decisions_fts
+    SET {assignments}
+    WHERE rowid = new.rowid;
 END;
+{_fts_child_triggers("decision_tags", "tags", _FTS_TAGS)}
+{_fts_child_triggers("decision_reasons", "reasons", reasons)}
+{_fts_child_triggers("decision_bridge", "bridge", _FTS_BRIDGE)}
+INSERT INTO decisions_fts(rowid, id, {columns}, tags, reasons, bridge)
+SELECT
+    d.rowid, d.id, {row_values},
+    {_FTS_TAGS.format(id="d.id")},
+    {reasons.format(id="d.id")},
+    {_FTS_BRIDGE.format(id="d.id")}
+FROM decisions d;
+"""
+
+
+_FTS_SCHEMA_SQL = _fts_schema_sql(("decision", "context", "pattern"), _FTS_REASONS)
+
+# Version 5 also indexes category and reason types, matching the terms
+# build_searchable_text gives the in-process keyword index.
+_FTS_CATEGORY_SCHEMA_SQL = _fts_schema_sql(
+    ("decision", "context", "pattern", "category"), _FTS_REASONS_TYPED,
+)
+
+# Rollups behind stats(): decision counts per (day, category, stakes,
+# status, agent, project) and tag counts per (day, project, tag), kept
+# current by triggers so getStats reads O(days x dimensions) rows instead of
+# scanning decisions. day is the created_at prefix (YYYY-MM-DD); NULL agent
+# and project are stored as ''.
+_ROLLUP_KEY = (
+    "substr({r}.created_at, 1, 10), {r}.category, {r}.stakes, {r}.status, "
+    "coalesce({r}.recorded_by, ''), coalesce({r}.project, '')"
+)
+_ROLLUP_MATCH = (
+    "day = substr({r}.created_at, 1, 10) AND category = {r}.category "
+    "AND stakes = {r}.stakes AND status = {r}.status "
+    "AND agent = coalesce({r}.recorded_by, '') AND project = coalesce({r}.project, '')"
+)
+_TAG_ROLLUP_MATCH = "day = substr({r}.created_at, 1, 10) AND project = coalesce({r}.project, '')"
+
+
+def _rollup_add(r: str) -> str:
+    return f"""
+    INSERT INTO decision_rollup (day, category, stakes, status, agent, project, count)
+    VALUES ({_ROLLUP_KEY.format(r=r)}, 1)
+    ON CONFLICT DO UPDATE SET count = count + 1;"""
+
+
+def _rollup_remove(r: str) -> str:
+    return f"""
+    UPDATE decision_rollup SET count = count - 1 WHERE {_ROLLUP_MATCH.format(r=r)};
+    DELETE FROM decision_rollup WHERE {_ROLLUP_MATCH.format(r=r)} AND count <= 0;"""
+
+
+def _tag_rollup_add(r: str) -> str:
+    return f"""
+    INSERT INTO tag_rollup (day, project, tag, count)
+    SELECT substr({r}.created_at, 1, 10), coalesce({r}.project, ''), tag, 1
+    FROM decision_tags WHERE decision_id = {r}.id
+    ON CONFLICT DO UPDATE SET count = count + 1;"""
+
+
+def _tag_rollup_remove(r: str) -> str:
+    return f"""
+    UPDATE tag_rollup SET count = count - 1
+    WHERE {_TAG_ROLLUP_MATCH.format(r=r)}
+    AND tag IN (SELECT tag FROM decision_tags WHERE decision_id = {r}.id);
+    DELETE FROM tag_rollup WHERE {_TAG_ROLLUP_MATCH.format(r=r)} AND count <= 0;"""
+
+
+_ROLLUP_SCHEMA_SQL = f"""
+DROP TRIGGER IF EXISTS decisions_rollup_ai;
+DROP TRIGGER IF EXISTS decisions_rollup_ad;
+DROP TRIGGER IF EXISTS decisions_rollup_au;
+DROP TRIGGER IF EXISTS decisions_tag_rollup_bd;
+DROP TRIGGER IF EXISTS decisions_tag_rollup_au;
+DROP TRIGGER IF EXISTS decision_tags_rollup_ai;
+DROP TRIGGER IF EXISTS decision_tags_rollup_ad;
+DROP TABLE IF EXISTS decision_rollup;
+DROP TABLE IF EXISTS tag_rollup;
+
+CREATE TABLE decision_rollup (
+    day TEXT NOT NULL,
+    category TEXT NOT NULL,
+    stakes TEXT NOT NULL,
+    status TEXT NOT NULL,
+    agent TEXT NOT NULL,
+    project TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (day, category, stakes, status, agent, project)
+) WITHOUT ROWID;
+
+CREATE TABLE tag_rollup (
+    day TEXT NOT NULL,
+    project TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (day, project, tag)
+) WITHOUT ROWID;
+
+CREATE TRIGGER decisions_rollup_ai AFTER INSERT ON decisions BEGIN{_rollup_add("new")}
+END;
+
+CREATE TRIGGER decisions_rollup_ad AFTER DELETE ON decisions BEGIN{_rollup_remove("old")}
+END;
+
+CREATE TRIGGER decisions_rollup_au AFTER UPDATE OF created_at, category, stakes, status,
+    recorded_by, project ON decisions
+WHEN old.created_at IS NOT new.created_at OR old.category IS NOT new.category
+    OR old.stakes IS NOT new.stakes OR old.status IS NOT new.status
+    OR old.recorded_by IS NOT new.recorded_by OR old.project IS NOT new.project
+BEGIN{_rollup_remove("old")}{_rollup_add("new")}
+END;
+
+-- Tag rows are counted under their decision's day and project. Deleting a
+-- decision takes its tags out first: the ON DELETE CASCADE that follows runs
+-- after the parent row is gone, so decision_tags_rollup_ad finds no match.
+CREATE TRIGGER decisions_tag_rollup_bd BEFORE DELETE ON decisions BEGIN{_tag_rollup_remove("old")}
+END;
+
+CREATE TRIGGER decisions_tag_rollup_au AFTER UPDATE OF created_at, project ON decisions
+WHEN substr(old.created_at, 1, 10) IS NOT substr(new.created_at, 1, 10)
+    OR old.project IS NOT new.project
+BEGIN{_tag_rollup_remove("old")}{_tag_rollup_add("new")}
+END;
+
+CREATE TRIGGER decision_tags_rollup_ai AFTER INSERT ON decision_tags BEGIN
+    INSERT INTO tag_rollup (day, project, tag, count)
+    SELECT substr(created_at, 1, 10), coalesce(project, ''), new.tag, 1
+    FROM decisions WHERE id = new.decision_id
+    ON CONFLICT DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER decision_tags_rollup_ad AFTER DELETE ON decision_tags BEGIN
+    UPDATE tag_rollup SET count = count - 1
+    WHERE (day, project, tag) = (
+        SELECT substr(created_at, 1, 10), coalesce(project, ''), old.tag
+        FROM decisions WHERE id = old.decision_id
+    );
+    DELETE FROM tag_rollup WHERE tag = old.tag AND count <= 0;
+END;
+
+INSERT INTO decision_rollup (day, category, stakes, status, agent, project, count)
+SELECT {_ROLLUP_KEY.format(r="d")}, COUNT(*)
+FROM decisions d GROUP BY 1, 2, 3, 4, 5, 6;
+
+INSERT INTO tag_rollup (day, project, tag, count)
+SELECT substr(d.created_at, 1, 10), coalesce(d.project, ''), t.tag, COUNT(*)
+FROM decision_tags t JOIN decisions d ON d.id = t.decision_id
+GROUP BY 1, 2, 3;
+"""
+
+# Composite indexes for the hot filter + sort shapes. Each replaces the
+# single-column index on its leading column, so writes maintain no more
+# indexes than before. Trailing id lets list() walk (created_at, id) keyset
+# order straight off the index; (tag, decision_id) covers the tags filter.
+#   - list()/keyset pages and date ranges:   created_at, id
+#   - category listings (load_all_decisions): category, created_at, id
+#   - calibration (status='reviewed' + category + date range):
+#                                             status, category, created_at
+#   - project queues (project + status='pending'):
+#                                             project, status, created_at
+_INDEX_SCHEMA_SQL = """
+DROP INDEX IF EXISTS idx_decisions_created_at;
+DROP INDEX IF EXISTS idx_decisions_category;
+DROP INDEX IF EXISTS idx_decisions_status;
+DROP INDEX IF EXISTS idx_decisions_project;
+DROP INDEX IF EXISTS idx_decision_tags_tag;
+
+CREATE INDEX IF NOT EXISTS idx_decisions_created_id ON decisions(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_decisions_category_created
+    ON decisions(category, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_decisions_status_category_created
+    ON decisions(status, category, created_at);
+CREATE INDEX IF NOT EXISTS idx_decisions_project_status_created
+    ON decisions(project, status, created_at);
+CREATE INDEX IF NOT EXISTS idx_decision_tags_tag_decision ON decision_tags(tag, decision_id);
+
+ANALYZE;
+"""
+
+# Outbox of side effects committed with a decision (see DecisionStore.
+# save_with_outbox). available_at is epoch seconds: a claim pushes it past
+# the lease, a failed attempt past the retry delay.
+_OUTBOX_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    topic TEXT NOT NULL,
+    decision_id TEXT NOT NULL,
+    payload TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    created_at TEXT NOT NULL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_topic_due ON outbox(topic, available_at, id);
+CREATE INDEX IF NOT EXISTS idx_outbox_decision ON outbox(decision_id, topic);
 """
 
+# Schema migrations layered on SCHEMA_SQL, applied in order and recorded in
+# PRAGMA user_version so each runs once per database file.
+_MIGRATIONS: tuple[tuple[int, str], ...] = (
+    (1, _FTS_SCHEMA_SQL),
+    (2, _ROLLUP_SCHEMA_SQL),
+    (3, _INDEX_SCHEMA_SQL),
+    (4, _OUTBOX_SCHEMA_SQL),
+    (5, _FTS_CATEGORY_SCHEMA_SQL),
+)
+
+# bm25() column weights, in decisions_fts column order (id is unindexed):
+# decision, context, pattern, category, tags, reasons, bridge.
+_FTS_WEIGHTS = "0.0, 8.0, 3.0, 4.0, 3.0, 5.0, 2.0, 2.0"
+
+# list(search=...) keeps its original scope: decision text, context, pattern.
+_LIST_SEARCH_COLUMNS = "{decision context pattern}"
+
+# Appended to a YYYY-MM-DD day to bound every created_at on that day.
+_DAY_END = "\uffff"
+
+# stats() dimensions: rollup table, its grouping column, and the table and
+# expression that count the same key from raw rows on edge days.
+_TAGGED = "decision_tags t JOIN decisions d ON d.id = t.decision_id"
+_STATS_DIMENSIONS: dict[str, tuple[str, str, str, str]] = {
+    "total": ("decision_rollup", "''", "decisions", "''"),
+    "category": ("decision_rollup", "category", "decisions", "category"),
+    "stakes": ("decision_rollup", "stakes", "decisions", "stakes"),
+    "status": ("decision_rollup", "status", "decisions", "status"),
+    "agent": ("decision_rollup", "agent", "decisions", "coalesce(recorded_by, '')"),
+    "day": ("decision_rollup", "day", "decisions", "substr(created_at, 1, 10)"),
+    "tag": ("tag_rollup", "tag", _TAGGED, "t.tag"),
+}
+
+# ID lists bind as one JSON array parameter, so an IN (...) over any number of
+# IDs has one fixed statement text (one prepared statement in the cache) and
+# never runs into SQLITE_MAX_VARIABLE_NUMBER.
+_IN_IDS = "(SELECT value FROM json_each(?))"
+
+
+@dataclass(frozen=True, slots=True)
+class SQLiteProfile:
+    """Connection tuning applied to every connection a store opens.
+
+    ``None`` leaves SQLite's own default. ``maintenance_interval_s > 0``
+    runs ``PRAGMA optimize`` and ``wal_checkpoint(TRUNCATE)`` on the writer
+    thread on that schedule.
+    """
+
+    synchronous: str | None = None
+    mmap_size: int | None = None
+    cache_size: int | None = None
+    temp_store: str | None = None
+    cached_statements: int = 128
+    maintenance_interval_s: float = 0.0
+
+    def pragmas(self) -> list[str]:
+        """PRAGMA statements that apply this profile to a connection."""
+        statements = []
+        if self.synchronous is not None:
+            statements.append(f"PRAGMA synchronous={self.synchronous}")
+        if self.mmap_size is not None:
+            statements.append(f"PRAGMA mmap_size={self.mmap_size}")
+        if self.cache_size is not None:
+            statements.append(f"PRAGMA cache_size={self.cache_size}")
+        if self.temp_store is not None:
+            statements.append(f"PRAGMA temp_store={self.temp_store}")
+        return statements
+
+
+SQLITE_PROFILES: dict[str, SQLiteProfile] = {
+    # SQLite's defaults: synchronous=FULL, no mmap, ~2 MB page cache.
+    "default": SQLiteProfile(),
+    # synchronous=NORMAL under WAL skips the fsync per commit; a power loss
+    # can lose the last commits but never corrupts the file. cache_size is
+    # in KiB when negative (32 MiB per connection).
+    "throughput": SQLiteProfile(
+        synchronous="NORMAL",
+        mmap_size=256 * 1024 * 1024,
+        cache_size=-32768,
+        temp_store="MEMORY",
+        cached_statements=512,
+        maintenance_interval_s=300.0,
+    ),
+}
+
 # Columns allowed in ORDER BY to prevent SQL injection
 _SORTABLE_COLUMNS: frozenset[str] = frozenset({
     "id", "decision", "confidence", "category", "stakes",
     "status", "created_at", "updated_at", "recorded_by", "project",
 })
 
+# Sortable columns that may hold NULL
+_NULLABLE_SORTS: frozenset[str] = frozenset({"updated_at", "recorded_by", "project"})
+
 # Fields that can be updated via update_fields()
 _UPDATABLE_FIELDS: frozenset[str] = frozenset({
     "decision", "confidence", "category", "stakes", "status",
@@ -131,12 +496,168 @@ _UPDATABLE_FIELDS: frozenset[str] = frozenset({
     "outcome_notes", "reviewed_at",
 })
 
+# Every decisions column, and the API names _normalize_row renames them to.
+_DECISION_COLUMNS: frozenset[str] = frozenset({
+    "id", "decision", "confidence", "category", "stakes", "status",
+    "context", "recorded_by", "project", "feature", "pr", "pattern",
+    "outcome", "outcome_result", "outcome_lessons", "outcome_notes",
+    "reviewed_at", "created_at", "updated_at",
+})
+_FIELD_ALIASES: dict[str, str] = {
+    "actual_result": "outcome_result",
+    "lessons": "outcome_lessons",
+    "review_notes": "outcome_notes",
+    "date": "created_at",
+}
+
+# Fields held in child tables, hydrated by _attach_children. list() skips
+# deliberation traces unless a projection asks for them.
+_CHILD_FIELDS: tuple[str, ...] = ("tags", "reasons", "bridge", "deliberation")
+_LIST_CHILDREN: tuple[str, ...] = ("tags", "reasons", "bridge")
+
 # Fields allowed as count()/list() filters
 _FILTER_COLUMNS: frozenset[str] = frozenset({
     "category", "stakes", "status", "recorded_by", "project", "feature",
 })
 
 
+def _projection(
+    fields: Collection[str] | None,
+    default_children: Collection[str],
+) -> tuple[str, tuple[str, ...]]:
+    """Map a field projection to a ``d.``-qualified SELECT list and child tables.
+
+    ``None`` selects every column plus ``default_children``. Otherwise only
+    the requested columns (always including ``id``) and child tables are
+    read; names that are neither are ignored.
+    """
+    if fields is None:
+        return "d.*", tuple(default_children)
+    columns = {"id"}
+    for name in fields:
+        column = _FIELD_ALIASES.get(name, name)
+        if column in _DECISION_COLUMNS:
+            columns.add(column)
+    select = ", ".join(f"d.{c}" for c in sorted(columns))
+    return select, tuple(c for c in _CHILD_FIELDS if c in fields)
+
+
+@dataclass(slots=True)
+class _ListStatements:
+    """The SQL behind one list() call, shared by list() and explain()."""
+
+    count_sql: str | None
+    params: list[Any]
+    page_sql: str
+    page_params: list[Any]
+    offset: int
+    children: tuple[str, ...]
+
+
+def _list_statements(query: ListQuery) -> _ListStatements:
+    """Build the count and page statements for ``query``.
+
+    Raises:
+        ValueError: If ``query.cursor`` is invalid for this sort order.
+    """
+    conditions: list[str] = []
+    params: list[Any] = []
+
+    if query.category:
+        conditions.append("d.category = ?")
+        params.append(query.category)
+    if query.stakes:
+        conditions.append("d.stakes = ?")
+        params.append(query.stakes)
+    if query.status:
+        conditions.append("d.status = ?")
+        params.append(query.status)
+    if query.agent:
+        conditions.append("d.recorded_by = ?")
+        params.append(query.agent)
+    if query.project:
+        conditions.append("d.project = ?")
+        params.append(query.project)
+    if query.feature:
+        conditions.append("d.feature = ?")
+        params.append(query.feature)
+    if query.date_from:
+        conditions.append("d.created_at >= ?")
+        params.append(query.date_from)
+    if query.date_to:
+        date_to_val = query.date_to
+        if "T" not in date_to_val:
+            date_to_val += "T23:59:59"
+        conditions.append("d.created_at <= ?")
+        params.append(date_to_val)
+    if query.tags:
+        conditions.append(
+            f"d.id IN (SELECT decision_id FROM decision_tags WHERE tag IN {_IN_IDS})"
+        )
+        params.append(json.dumps(query.tags))
+    if query.search:
+        sanitized = _sanitize_fts_query(query.search)
+        conditions.append(
+            "d.rowid IN (SELECT rowid FROM decisions_fts "
+            "WHERE decisions_fts MATCH ?)"
+        )
+        params.append(f"{_LIST_SEARCH_COLUMNS} : ({sanitized})")
+
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+
+    # Validate sort column. Nullable columns sort as '' so the keyset
+    # comparison below never meets a NULL; d.id breaks ties.
+    sort_col = query.sort if query.sort in _SORTABLE_COLUMNS else "created_at"
+    sort_expr = (
+        f"ifnull(d.{sort_col}, '')" if sort_col in _NULLABLE_SORTS else f"d.{sort_col}"
+    )
+    order = "ASC" if query.order.upper() == "ASC" else "DESC"
+
+    count_sql: str | None = None
+    if query.include_total:
+        count_sql = f"SELECT COUNT(*) FROM decisions d WHERE {where_clause}"  # noqa: S608
+
+    # Keyset pagination: seek past the cursor row instead of OFFSET, so
+    # deep pages cost the same as the first. The leading <= / >= term
+    # keeps the sort-column index usable as a range scan.
+    page_conditions = where_clause
+    page_params = list(params)
+    offset = query.offset
+    if query.cursor:
+        sort_value, last_id = decode_cursor(query)
+        op = "<" if order == "DESC" else ">"
+        page_conditions += (
+            f" AND {sort_expr} {op}= ? AND ({sort_expr} {op} ? OR d.id {op} ?)"
+        )
+        page_params += [sort_value, sort_value, last_id]
+        offset = 0
+
+    columns, children = _projection(query.fields, _LIST_CHILDREN)
+    page_sql = (
+        f"SELECT {columns}, {sort_expr} AS _sort_key "  # noqa: S608
+        f"FROM decisions d WHERE {page_conditions} "
+        f"ORDER BY {sort_expr} {order}, d.id {order} "
+        f"LIMIT ? OFFSET ?"
+    )
+    return _ListStatements(
+        count_sql=count_sql,
+        params=params,
+        page_sql=page_sql,
+        page_params=[*page_params, query.limit + 1, offset],
+        offset=offset,
+        children=children,
+    )
+
+
+def _is_full_scan(detail: str) -> bool:
+    """True for an EXPLAIN QUERY PLAN step that walks a whole table."""
+    return (
+        detail.startswith("SCAN ")
+        and " USING " not in detail
+        and "VIRTUAL TABLE" not in detail
+    )
+
+
 def _now() -> str:
     """Return current UTC timestamp as ISO-8601 string."""
     return datetime.now(UTC).isoformat()
@@ -157,16 +678,78 @@ def _sanitize_fts_query(term: str) -> str:
     return " ".join(f'"{w}"' for w in words)
 
 
+def _fts_any_terms(query: str) -> str | None:
+    """Build an FTS5 MATCH expression matching any word of ``query``.
+
+    Words are quoted so FTS5 operators in user input are inert; OR lets
+    bm25() rank partial matches instead of requiring every term.
+    """
+    words = re.findall(r"\w+", query.lower())
+    if not words:
+        return None
+    return " OR ".join(f'"{w}"' for w in dict.fromkeys(words))
+
+
 class SQLiteDecisionStore(DecisionStore):
     """SQLite-backed decision storage with WAL mode and FTS5 search.
 
+    Reads (get/list/stats/count/search) borrow a connection from a bounded
+    pool of query-only connections, so they run in parallel under WAL.
+    Every mutation runs on ``_conn``, the single writer connection, on a
+    dedicated writer thread.
+
+    Opt-in group commit (``group_commit_ms > 0``) batches mutations that
+    arrive within that window, up to ``group_commit_max`` of them, into one
+    transaction: one commit and one fsync for the whole group. Each
+    mutation runs under its own SAVEPOINT, so a failing one rolls back
+    alone, and every caller's await returns only after the group commits.
+
+    ``read_only=True`` opens an existing, fully migrated database file for
+    reads only (no writer thread); every mutation raises ValueError.
+
+    ``profile`` names an entry in ``SQLITE_PROFILES`` (PRAGMA tuning and
+    background maintenance) applied to the writer and every reader.
+
     Configuration via environment variables:
         - CSTP_DB_PATH: Path to SQLite database file (default: data/decisions.db)
+        - CSTP_DB_READERS: Reader connection pool size (default: 4)
+        - CSTP_DB_GROUP_COMMIT_MS: Group-commit window in ms (default: 0, off)
+        - CSTP_DB_GROUP_COMMIT_MAX: Mutations per group commit (default: 64)
+        - CSTP_DB_PROFILE: PRAGMA profile, default or throughput (default: default)
     """
 
-    def __init__(self, db_path: str | None = None) -> None:
+    def __init__(
+        self,
+        db_path: str | None = None,
+        readers: int | None = None,
+        group_commit_ms: float | None = None,
+        group_commit_max: int | None = None,
+        read_only: bool = False,
+        profile: str | None = None,
+    ) -> None:
         self._db_path = Path(db_path or os.getenv("CSTP_DB_PATH", "data/decisions.db"))
+        self._read_only = read_only
+        profile = profile or os.getenv("CSTP_DB_PROFILE", "default")
+        if profile not in SQLITE_PROFILES:
+            msg = f"Unknown SQLite profile: {profile} (expected one of {sorted(SQLITE_PROFILES)})"
+            raise ValueError(msg)
+        self._profile_name = profile
+        self._profile = SQLITE_PROFILES[profile]
+        self._maintenance_task: asyncio.Task[None] | None = None
+        self.maintenance_runs = 0
+        self.last_checkpoint: dict[str, int] = {}
         self._conn: sqlite3.Connection | None = None
+        self._readers = readers or int(os.getenv("CSTP_DB_READERS", "4"))
+        self._reader_pool: ReaderPool | None = None
+        self._writer: WriterExecutor | None = None
+        if group_commit_ms is None:
+            group_commit_ms = float(os.getenv("CSTP_DB_GROUP_COMMIT_MS", "0"))
+        if group_commit_max is None:
+            group_commit_max = int(os.getenv("CSTP_DB_GROUP_COMMIT_MAX", "64"))
+        self._group_commit_ms = group_commit_ms
+        self._group_commit_max = group_commit_max
+        # True while the writer thread runs a group; mutations then use savepoints.
+        self._in_batch = False
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -174,25 +757,216 @@ class SQLiteDecisionStore(DecisionStore):
 
     async def initialize(self) -> None:
         """Initialize database connection, enable WAL, create schema."""
-        await asyncio.to_thread(self._initialize_sync)
+        if self._read_only:
+            self._reader_pool = ReaderPool(self._connect_reader, self._readers)
+            version = await self._read(self._user_version_sync)
+            if version < _MIGRATIONS[-1][0]:
+                await self.close()
+                msg = (
+                    f"{self._db_path} is at schema version {version}; open it "
+                    "read-write once to migrate before attaching it read-only"
+                )
+                raise ValueError(msg)
+            logger.info("SQLiteDecisionStore opened read-only at %s", self._db_path)
+            return
+        self._writer = WriterExecutor(
+            group_window_ms=self._group_commit_ms,
+            group_max_ops=self._group_commit_max,
+            run_batch=self._run_batch_sync,
+        )
+        await self._writer.submit(self._initialize_sync)
+        self._reader_pool = ReaderPool(self._connect_reader, self._readers)
+        if self._profile.maintenance_interval_s > 0:
+            self._maintenance_task = asyncio.get_running_loop().create_task(
+                self._maintenance_loop(self._profile.maintenance_interval_s)
+            )
 
     def _initialize_sync(self) -> None:
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn = sqlite3.connect(
             str(self._db_path),
             check_same_thread=False,
+            cached_statements=self._profile.cached_statements,
         )
         self._conn.row_factory = sqlite3.Row
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.execute("PRAGMA foreign_keys=ON")
+        for pragma in self._profile.pragmas():
+            self._conn.execute(pragma)
         self._conn.executescript(SCHEMA_SQL)
+        self._migrate_sync()
         logger.info("SQLiteDecisionStore initialized at %s", self._db_path)
 
+    def _migrate_sync(self) -> None:
+        """Apply pending ``_MIGRATIONS`` in order, one transaction each."""
+        assert self._conn is not None  # noqa: S101
+        current = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        for version, script in _MIGRATIONS:
+            if version <= current:
+                continue
+            logger.info("Migrating %s to schema version %d", self._db_path, version)
+            self._conn.executescript(
+                f"BEGIN;\n{script}\nPRAGMA user_version = {version};\nCOMMIT;"
+            )
+
+    @staticmethod
+    def _user_version_sync(conn: sqlite3.Connection) -> int:
+        return int(conn.execute("PRAGMA user_version").fetchone()[0])
+
+    def _connect_reader(self) -> sqlite3.Connection:
+        if self._read_only:
+            conn = sqlite3.connect(
+                f"{self._db_path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                cached_statements=self._profile.cached_statements,
+            )
+        else:
+            conn = sqlite3.connect(
+                str(self._db_path),
+                check_same_thread=False,
+                cached_statements=self._profile.cached_statements,
+            )
+            conn.execute("PRAGMA query_only=ON")
+        conn.row_factory = sqlite3.Row
+        for pragma in self._profile.pragmas():
+            conn.execute(pragma)
+        return conn
+
+    async def maintain(self) -> dict[str, int]:
+        """Refresh planner statistics and truncate the WAL.
+
+        Runs ``PRAGMA optimize`` (re-ANALYZEs only tables whose statistics
+        have drifted) and ``PRAGMA wal_checkpoint(TRUNCATE)`` on the writer
+        thread, between mutations. A checkpoint blocked by a long-running
+        reader reports ``busy=1`` and is retried on the next run.
+
+        Returns:
+            The checkpoint result: ``busy``, ``log`` and ``checkpointed``
+            pages.
+        """
+        result = await self._writer_for_mutation().submit(self._maintain_sync)
+        self.maintenance_runs += 1
+        self.last_checkpoint = result
+        return result
+
+    def _maintain_sync(self) -> dict[str, int]:
+        assert self._conn is not None  # noqa: S101
+        self._conn.execute("PRAGMA optimize")
+        busy, log, checkpointed = self._conn.execute(
+            "PRAGMA wal_checkpoint(TRUNCATE)"
+        ).fetchone()
+        return {"busy": busy, "log": log, "checkpointed": checkpointed}
+
+    async def _maintenance_loop(self, interval_s: float) -> None:
+        while True:
+            await asyncio.sleep(interval_s)
+            try:
+                await self.maintain()
+            except Exception:
+                logger.exception("SQLite maintenance of %s failed", self._db_path)
+
     async def close(self) -> None:
-        """Close the database connection."""
-        if self._conn is not None:
-            await asyncio.to_thread(self._conn.close)
-            self._conn = None
+        """Close the reader pool and the writer connection."""
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            self._maintenance_task = None
+        if self._reader_pool is not None:
+            self._reader_pool.close()
+            self._reader_pool = None
+        if self._writer is not None:
+            await self._writer.drain()
+            if self._conn is not None:
+                await self._writer.submit(self._conn.close)
+            self._writer.shutdown()
+            self._writer = None
+        elif self._conn is not None:
+            self._conn.close()
+        self._conn = None
+
+    async def _read(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(conn, *args)`` on a pooled reader in a worker thread."""
+        assert self._reader_pool is not None  # noqa: S101
+        return await asyncio.to_thread(self._read_sync, self._reader_pool, fn, args)
+
+    @staticmethod
+    def _read_sync(pool: ReaderPool, fn: Callable[..., T], args: tuple[Any, ...]) -> T:
+        with pool.connection() as conn:
+            # One read transaction so multi-statement reads see one snapshot.
+            conn.execute("BEGIN")
+            try:
+                return fn(conn, *args)
+            finally:
+                conn.rollback()
+
+    async def _write(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(*args)`` on the writer thread, which owns ``_conn``.
+
+        In group-commit mode the call joins the next group transaction.
+        """
+        return await self._writer_for_mutation().submit_grouped(fn, *args)
+
+    def _writer_for_mutation(self) -> WriterExecutor:
+        if self._read_only:
+            msg = f"{self._db_path} is opened read-only"
+            raise ValueError(msg)
+        assert self._writer is not None  # noqa: S101
+        return self._writer
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Transaction scope for one mutation on the writer connection.
+
+        Outside a group this is ``with conn:`` (commit or roll back). Inside
+        a group it is a SAVEPOINT, released on success and rolled back on
+        error, leaving the commit to ``_run_batch_sync``.
+        """
+        assert self._conn is not None  # noqa: S101
+        if not self._in_batch:
+            with self._conn:
+                yield
+            return
+        self._conn.execute("SAVEPOINT mutation")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK TO mutation")
+            self._conn.execute("RELEASE mutation")
+            raise
+        self._conn.execute("RELEASE mutation")
+
+    def _run_batch_sync(self, calls: list[Callable[[], Any]]) -> list[tuple[bool, Any]]:
+        """Run queued mutations in one transaction (writer thread only)."""
+        assert self._conn is not None  # noqa: S101
+        outcomes: list[tuple[bool, Any]] = []
+        self._conn.execute("BEGIN IMMEDIATE")
+        self._in_batch = True
+        try:
+            for call in calls:
+                try:
+                    outcomes.append((True, call()))
+                except Exception as e:  # delivered to that caller only
+                    outcomes.append((False, e))
+            self._conn.commit()
+        except Exception as e:
+            self._conn.rollback()
+            logger.exception("Group commit of %d mutations failed", len(calls))
+            return [(False, e)] * len(calls)
+        finally:
+            self._in_batch = False
+        return outcomes
+
+    def metrics(self) -> dict[str, Any]:
+        """Writer queue and reader pool counters."""
+        return {
+            "writer": self._writer.stats() if self._writer else {},
+            "readers": self._reader_pool.stats() if self._reader_pool else {},
+            "profile": self._profile_name,
+            "maintenance": {
+                "runs": self.maintenance_runs,
+                "last_checkpoint": self.last_checkpoint,
+            },
+        }
 
     # ------------------------------------------------------------------
     # save
@@ -200,162 +974,329 @@ class SQLiteDecisionStore(DecisionStore):
 
     async def save(self, decision_id: str, data: dict[str, Any]) -> bool:
         """Insert or update a decision with all related records."""
-        return await asyncio.to_thread(self._save_sync, decision_id, data)
+        return await self._write(self._save_sync, decision_id, data)
 
     def _save_sync(self, decision_id: str, data: dict[str, Any]) -> bool:
+        try:
+            with self._transaction():
+                self._save_rows(decision_id, data)
+            return True
+        except Exception:
+            logger.exception("Failed to save decision %s", decision_id)
+            return False
+
+    def _save_rows(self, decision_id: str, data: dict[str, Any]) -> None:
+        """Upsert a decision and replace its child rows (caller owns the transaction)."""
         assert self._conn is not None  # noqa: S101
         now = _now()
         created_at = data.get("created_at") or data.get("date") or now
         updated_at = now
 
-        try:
-            # Handle project field: may be a dict {"name": ..., "pr": ...} or string
-            raw_project = data.get("project")
-            if isinstance(raw_project, dict):
-                project_str = raw_project.get("name", json.dumps(raw_project))
-                pr_val = data.get("pr") or raw_project.get("pr")
-            else:
-                project_str = raw_project
-                pr_val = data.get("pr")
+        # Handle project field: may be a dict {"name": ..., "pr": ...} or string
+        raw_project = data.get("project")
+        if isinstance(raw_project, dict):
+            project_str = raw_project.get("name", json.dumps(raw_project))
+            pr_val = data.get("pr") or raw_project.get("pr")
+        else:
+            project_str = raw_project
+            pr_val = data.get("pr")
+
+        # Upsert the core decision row
+        self._conn.execute(
+            """
+            INSERT INTO decisions (
+                id, decision, confidence, category, stakes, status,
+                context, recorded_by, project, feature, pr, pattern,
+                outcome, outcome_result, outcome_lessons, outcome_notes,
+                reviewed_at, created_at, updated_at
+            ) VALUES (
+                ?, ?, ?, ?, ?, ?,
+                ?, ?, ?, ?, ?, ?,
+                ?, ?, ?, ?,
+                ?, ?, ?
+            )
+            ON CONFLICT(id) DO UPDATE SET
+                decision=excluded.decision,
+                confidence=excluded.confidence,
+                category=excluded.category,
+                stakes=excluded.stakes,
+                status=excluded.status,
+                context=excluded.context,
+                recorded_by=excluded.recorded_by,
+                project=excluded.project,
+                feature=excluded.feature,
+                pr=excluded.pr,
+                pattern=excluded.pattern,
+                outcome=excluded.outcome,
+                outcome_result=excluded.outcome_result,
+                outcome_lessons=excluded.outcome_lessons,
+                outcome_notes=excluded.outcome_notes,
+                reviewed_at=excluded.reviewed_at,
+                updated_at=excluded.updated_at
+            """,
+            (
+                decision_id,
+                data.get("decision", ""),
+                data.get("confidence", 0.0),
+                data.get("category", ""),
+                data.get("stakes", "medium"),
+                data.get("status", "pending"),
+                data.get("context"),
+                data.get("recorded_by") or data.get("agent_id"),
+                project_str,
+                data.get("feature"),
+                pr_val,
+                data.get("pattern"),
+                data.get("outcome"),
+                data.get("outcome_result") or data.get("actual_result"),
+                data.get("outcome_lessons") or data.get("lessons"),
+                data.get("outcome_notes") or data.get("review_notes"),
+                data.get("reviewed_at"),
+                created_at,
+                updated_at,
+            ),
+        )
 
-            with self._conn:
-                # Upsert the core decision row
-                self._conn.execute(
-                    """
-                    INSERT INTO decisions (
-                        id, decision, confidence, category, stakes, status,
-                        context, recorded_by, project, feature, pr, pattern,
-                        outcome, outcome_result, outcome_lessons, outcome_notes,
-                        reviewed_at, created_at, updated_at
-                    ) VALUES (
-                        ?, ?, ?, ?, ?, ?,
-                        ?, ?, ?, ?, ?, ?,
-                        ?, ?, ?, ?,
-                        ?, ?, ?
-                    )
-                    ON CONFLICT(id) DO UPDATE SET
-                        decision=excluded.decision,
-                        confidence=excluded.confidence,
-                        category=excluded.category,
-                        stakes=excluded.stakes,
-                        status=excluded.status,
-                        context=excluded.context,
-                        recorded_by=excluded.recorded_by,
-                        project=excluded.project,
-                        feature=excluded.feature,
-                        pr=excluded.pr,
-                        pattern=excluded.pattern,
-                        outcome=excluded.outcome,
-                        outcome_result=excluded.outcome_result,
-                        outcome_lessons=excluded.outcome_lessons,
-                        outcome_notes=excluded.outcome_notes,
-                        reviewed_at=excluded.reviewed_at,
-                        updated_at=excluded.updated_at
-                    """,
+        # --- Tags ---
+        self._conn.execute(
+            "DELETE FROM decision_tags WHERE decision_id = ?",
+            (decision_id,),
+        )
+        tags = data.get("tags") or []
+        if tags:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO decision_tags (decision_id, tag) "
+                "VALUES (?, ?)",
+                [(decision_id, t) for t in tags],
+            )
+
+        # --- Reasons ---
+        self._conn.execute(
+            "DELETE FROM decision_reasons WHERE decision_id = ?",
+            (decision_id,),
+        )
+        reasons = data.get("reasons") or []
+        if reasons:
+            self._conn.executemany(
+                "INSERT INTO decision_reasons "
+                "(decision_id, type, text, strength) VALUES (?, ?, ?, ?)",
+                [
                     (
                         decision_id,
-                        data.get("decision", ""),
-                        data.get("confidence", 0.0),
-                        data.get("category", ""),
-                        data.get("stakes", "medium"),
-                        data.get("status", "pending"),
-                        data.get("context"),
-                        data.get("recorded_by") or data.get("agent_id"),
-                        project_str,
-                        data.get("feature"),
-                        pr_val,
-                        data.get("pattern"),
-                        data.get("outcome"),
-                        data.get("outcome_result") or data.get("actual_result"),
-                        data.get("outcome_lessons") or data.get("lessons"),
-                        data.get("outcome_notes") or data.get("review_notes"),
-                        data.get("reviewed_at"),
-                        created_at,
-                        updated_at,
-                    ),
-                )
-
-                # --- Tags ---
-                self._conn.execute(
-                    "DELETE FROM decision_tags WHERE decision_id = ?",
-                    (decision_id,),
-                )
-                tags = data.get("tags") or []
-                if tags:
-                    self._conn.executemany(
-                        "INSERT OR IGNORE INTO decision_tags (decision_id, tag) "
-                        "VALUES (?, ?)",
-                        [(decision_id, t) for t in tags],
+                        r.get("type", ""),
+                        r.get("text", ""),
+                        r.get("strength", 0.8),
                     )
+                    for r in reasons
+                ],
+            )
 
-                # --- Reasons ---
-                self._conn.execute(
-                    "DELETE FROM decision_reasons WHERE decision_id = ?",
-                    (decision_id,),
-                )
-                reasons = data.get("reasons") or []
-                for r in reasons:
-                    self._conn.execute(
-                        "INSERT INTO decision_reasons "
-                        "(decision_id, type, text, strength) VALUES (?, ?, ?, ?)",
-                        (
-                            decision_id,
-                            r.get("type", ""),
-                            r.get("text", ""),
-                            r.get("strength", 0.8),
-                        ),
-                    )
+        # --- Bridge ---
+        self._conn.execute(
+            "DELETE FROM decision_bridge WHERE decision_id = ?",
+            (decision_id,),
+        )
+        bridge = data.get("bridge")
+        if bridge and isinstance(bridge, dict):
+            self._conn.execute(
+                "INSERT INTO decision_bridge "
+                "(decision_id, structure, function, tolerance, "
+                "enforcement, prevention) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    decision_id,
+                    bridge.get("structure"),
+                    bridge.get("function"),
+                    json.dumps(bridge["tolerance"])
+                    if bridge.get("tolerance") else None,
+                    json.dumps(bridge["enforcement"])
+                    if bridge.get("enforcement") else None,
+                    json.dumps(bridge["prevention"])
+                    if bridge.get("prevention") else None,
+                ),
+            )
 
-                # --- Bridge ---
-                self._conn.execute(
-                    "DELETE FROM decision_bridge WHERE decision_id = ?",
-                    (decision_id,),
-                )
-                bridge = data.get("bridge")
-                if bridge and isinstance(bridge, dict):
-                    self._conn.execute(
-                        "INSERT INTO decision_bridge "
-                        "(decision_id, structure, function, tolerance, "
-                        "enforcement, prevention) VALUES (?, ?, ?, ?, ?, ?)",
-                        (
-                            decision_id,
-                            bridge.get("structure"),
-                            bridge.get("function"),
-                            json.dumps(bridge["tolerance"])
-                            if bridge.get("tolerance") else None,
-                            json.dumps(bridge["enforcement"])
-                            if bridge.get("enforcement") else None,
-                            json.dumps(bridge["prevention"])
-                            if bridge.get("prevention") else None,
-                        ),
-                    )
+        # --- Deliberation ---
+        self._conn.execute(
+            "DELETE FROM decision_deliberation WHERE decision_id = ?",
+            (decision_id,),
+        )
+        delib = data.get("deliberation")
+        if delib and isinstance(delib, dict):
+            self._conn.execute(
+                "INSERT INTO decision_deliberation "
+                "(decision_id, inputs_json, steps_json, "
+                "total_duration_ms) VALUES (?, ?, ?, ?)",
+                (
+                    decision_id,
+                    json.dumps(delib["inputs"])
+                    if delib.get("inputs") else None,
+                    json.dumps(delib["steps"])
+                    if delib.get("steps") else None,
+                    delib.get("total_duration_ms"),
+                ),
+            )
 
-                # --- Deliberation ---
-                self._conn.execute(
-                    "DELETE FROM decision_deliberation WHERE decision_id = ?",
-                    (decision_id,),
-                )
-                delib = data.get("deliberation")
-                if delib and isinstance(delib, dict):
-                    self._conn.execute(
-                        "INSERT INTO decision_deliberation "
-                        "(decision_id, inputs_json, steps_json, "
-                        "total_duration_ms) VALUES (?, ?, ?, ?)",
+    async def save_many(self, items: list[tuple[str, dict[str, Any]]]) -> int:
+        """Save a batch of decisions in one transaction (one commit, one fsync)."""
+        if not items:
+            return 0
+        return await self._writer_for_mutation().submit(self._save_many_sync, items)
+
+    def _save_many_sync(self, items: list[tuple[str, dict[str, Any]]]) -> int:
+        # Same path as a group commit: each save runs under its own SAVEPOINT,
+        # so one bad record rolls back alone.
+        outcomes = self._run_batch_sync([
+            functools.partial(self._save_sync, decision_id, data)
+            for decision_id, data in items
+        ])
+        return sum(1 for ok, saved in outcomes if ok and saved)
+
+    # ------------------------------------------------------------------
+    # outbox
+    # ------------------------------------------------------------------
+
+    async def save_with_outbox(
+        self,
+        decision_id: str,
+        data: dict[str, Any],
+        outbox: list[tuple[str, dict[str, Any] | None]],
+    ) -> bool:
+        """Save a decision and queue its outbox entries in one transaction."""
+        return await self._write(self._save_with_outbox_sync, decision_id, data, outbox)
+
+    def _save_with_outbox_sync(
+        self,
+        decision_id: str,
+        data: dict[str, Any],
+        outbox: list[tuple[str, dict[str, Any] | None]],
+    ) -> bool:
+        assert self._conn is not None  # noqa: S101
+        try:
+            with self._transaction():
+                self._save_rows(decision_id, data)
+                self._conn.executemany(
+                    "INSERT INTO outbox (topic, decision_id, payload, available_at, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
                         (
+                            topic,
                             decision_id,
-                            json.dumps(delib["inputs"])
-                            if delib.get("inputs") else None,
-                            json.dumps(delib["steps"])
-                            if delib.get("steps") else None,
-                            delib.get("total_duration_ms"),
-                        ),
-                    )
-
+                            json.dumps(payload, default=str) if payload is not None else None,
+                            time.time(),
+                            _now(),
+                        )
+                        for topic, payload in outbox
+                    ],
+                )
             return True
         except Exception:
-            logger.exception("Failed to save decision %s", decision_id)
+            logger.exception("Failed to save decision %s with outbox entries", decision_id)
             return False
 
+    async def claim_outbox(
+        self,
+        topic: str,
+        limit: int = 32,
+        lease_s: float = 60.0,
+        decision_id: str | None = None,
+    ) -> list[OutboxEntry]:
+        """Lease due outbox entries (all of one decision's, if given)."""
+        return await self._write(self._claim_outbox_sync, topic, limit, lease_s, decision_id)
+
+    def _claim_outbox_sync(
+        self,
+        topic: str,
+        limit: int,
+        lease_s: float,
+        decision_id: str | None,
+    ) -> list[OutboxEntry]:
+        assert self._conn is not None  # noqa: S101
+        now = time.time()
+        with self._transaction():
+            if decision_id is None:
+                rows = self._conn.execute(
+                    "SELECT * FROM outbox WHERE topic = ? AND available_at <= ? "
+                    "ORDER BY available_at, id LIMIT ?",
+                    (topic, now, limit),
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT * FROM outbox WHERE decision_id = ? AND topic = ? "
+                    "ORDER BY id LIMIT ?",
+                    (decision_id, topic, limit),
+                ).fetchall()
+            self._conn.execute(
+                "UPDATE outbox SET available_at = ?, attempts = attempts + 1 "
+                f"WHERE id IN {_IN_IDS}",
+                (now + lease_s, json.dumps([r["id"] for r in rows])),
+            )
+        return [
+            OutboxEntry(
+                id=r["id"],
+                topic=r["topic"],
+                decision_id=r["decision_id"],
+                payload=json.loads(r["payload"]) if r["payload"] is not None else None,
+                attempts=r["attempts"] + 1,
+                created_at=r["created_at"],
+                last_error=r["last_error"],
+            )
+            for r in rows
+        ]
+
+    async def complete_outbox(self, entry_ids: list[int]) -> None:
+        """Delete finished outbox entries."""
+        if entry_ids:
+            await self._write(self._complete_outbox_sync, entry_ids)
+
+    def _complete_outbox_sync(self, entry_ids: list[int]) -> None:
+        assert self._conn is not None  # noqa: S101
+        with self._transaction():
+            self._conn.execute(
+                f"DELETE FROM outbox WHERE id IN {_IN_IDS}", (json.dumps(entry_ids),)
+            )
+
+    async def retry_outbox(self, entry_id: int, error: str, delay_s: float) -> None:
+        """Reschedule a failed outbox entry."""
+        await self._write(self._retry_outbox_sync, entry_id, error, delay_s)
+
+    def _retry_outbox_sync(self, entry_id: int, error: str, delay_s: float) -> None:
+        assert self._conn is not None  # noqa: S101
+        with self._transaction():
+            self._conn.execute(
+                "UPDATE outbox SET available_at = ?, last_error = ? WHERE id = ?",
+                (time.time() + delay_s, error[:1000], entry_id),
+            )
+
+    async def outbox_status(
+        self, topic: str, decision_id: str | None = None
+    ) -> dict[str, Any]:
+        """Count and age of the queued entries of ``topic``."""
+        return await self._read(self._outbox_status_sync, topic, decision_id)
+
+    @staticmethod
+    def _outbox_status_sync(
+        conn: sqlite3.Connection, topic: str, decision_id: str | None
+    ) -> dict[str, Any]:
+        where = "topic = ?" + (" AND decision_id = ?" if decision_id else "")
+        params: tuple[Any, ...] = (topic, decision_id) if decision_id else (topic,)
+        pending, retrying, oldest, max_attempts = conn.execute(
+            "SELECT COUNT(*), COUNT(last_error), MIN(created_at), MAX(attempts) "
+            f"FROM outbox WHERE {where}",
+            params,
+        ).fetchone()
+        last_error = conn.execute(
+            f"SELECT last_error FROM outbox WHERE {where} AND last_error IS NOT NULL "
+            "ORDER BY id DESC LIMIT 1",
+            params,
+        ).fetchone()
+        return {
+            "pending": pending,
+            "retrying": retrying,
+            "oldest_created_at": oldest,
+            "max_attempts": max_attempts or 0,
+            "last_error": last_error[0] if last_error else None,
+        }
+
     # ------------------------------------------------------------------
     # helpers
     # ------------------------------------------------------------------
@@ -380,12 +1321,10 @@ class SQLiteDecisionStore(DecisionStore):
 
     async def get(self, decision_id: str) -> dict[str, Any] | None:
         """Get a decision by ID, joining tags, reasons, bridge, deliberation."""
-        return await asyncio.to_thread(self._get_sync, decision_id)
+        return await self._read(self._get_sync, decision_id)
 
-    def _get_sync(self, decision_id: str) -> dict[str, Any] | None:
-        assert self._conn is not None  # noqa: S101
-
-        row = self._conn.execute(
+    def _get_sync(self, conn: sqlite3.Connection, decision_id: str) -> dict[str, Any] | None:
+        row = conn.execute(
             "SELECT * FROM decisions WHERE id = ?", (decision_id,)
         ).fetchone()
         if row is None:
@@ -394,14 +1333,14 @@ class SQLiteDecisionStore(DecisionStore):
         result = self._normalize_row(dict(row))
 
         # Tags
-        tag_rows = self._conn.execute(
+        tag_rows = conn.execute(
             "SELECT tag FROM decision_tags WHERE decision_id = ?",
             (decision_id,),
         ).fetchall()
         result["tags"] = [r["tag"] for r in tag_rows]
 
         # Reasons
-        reason_rows = self._conn.execute(
+        reason_rows = conn.execute(
             "SELECT type, text, strength FROM decision_reasons "
             "WHERE decision_id = ? ORDER BY id",
             (decision_id,),
@@ -409,7 +1348,7 @@ class SQLiteDecisionStore(DecisionStore):
         result["reasons"] = [dict(r) for r in reason_rows]
 
         # Bridge
-        bridge_row = self._conn.execute(
+        bridge_row = conn.execute(
             "SELECT structure, function, tolerance, enforcement, prevention "
             "FROM decision_bridge WHERE decision_id = ?",
             (decision_id,),
@@ -427,7 +1366,7 @@ class SQLiteDecisionStore(DecisionStore):
             }
 
         # Deliberation
-        delib_row = self._conn.execute(
+        delib_row = conn.execute(
             "SELECT inputs_json, steps_json, total_duration_ms "
             "FROM decision_deliberation WHERE decision_id = ?",
             (decision_id,),
@@ -444,128 +1383,84 @@ class SQLiteDecisionStore(DecisionStore):
         return result
 
     # ------------------------------------------------------------------
-    # delete
+    # get_many
     # ------------------------------------------------------------------
 
-    async def delete(self, decision_id: str) -> bool:
-        """Delete a decision and all related records (cascading)."""
-        return await asyncio.to_thread(self._delete_sync, decision_id)
-
-    def _delete_sync(self, decision_id: str) -> bool:
-        assert self._conn is not None  # noqa: S101
-        try:
-            with self._conn:
-                cursor = self._conn.execute(
-                    "DELETE FROM decisions WHERE id = ?", (decision_id,)
-                )
-                return cursor.rowcount > 0
-        except Exception:
-            logger.exception("Failed to delete decision %s", decision_id)
-            return False
-
-    # ------------------------------------------------------------------
-    # list
-    # ------------------------------------------------------------------
-
-    async def list(self, query: ListQuery) -> ListResult:
-        """List decisions with SQL-based filtering, sorting, and pagination."""
-        return await asyncio.to_thread(self._list_sync, query)
-
-    def _list_sync(self, query: ListQuery) -> ListResult:
-        assert self._conn is not None  # noqa: S101
+    async def get_many(
+        self,
+        decision_ids: list[str],
+        fields: Collection[str] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Get several decisions with batched child-table lookups.
 
-        conditions: list[str] = []
-        params: list[Any] = []
+        With ``fields``, only those columns and child tables are read.
+        """
+        return await self._read(self._get_many_sync, decision_ids, fields)
 
-        if query.category:
-            conditions.append("d.category = ?")
-            params.append(query.category)
-        if query.stakes:
-            conditions.append("d.stakes = ?")
-            params.append(query.stakes)
-        if query.status:
-            conditions.append("d.status = ?")
-            params.append(query.status)
-        if query.agent:
-            conditions.append("d.recorded_by = ?")
-            params.append(query.agent)
-        if query.project:
-            conditions.append("d.project = ?")
-            params.append(query.project)
-        if query.feature:
-            conditions.append("d.feature = ?")
-            params.append(query.feature)
-        if query.date_from:
-            conditions.append("d.created_at >= ?")
-            params.append(query.date_from)
-        if query.date_to:
-            date_to_val = query.date_to
-            if "T" not in date_to_val:
-                date_to_val += "T23:59:59"
-            conditions.append("d.created_at <= ?")
-            params.append(date_to_val)
-        if query.tags:
-            placeholders = ",".join("?" for _ in query.tags)
-            conditions.append(
-                f"d.id IN (SELECT decision_id FROM decision_tags "
-                f"WHERE tag IN ({placeholders}))"
-            )
-            params.extend(query.tags)
-        if query.search:
-            sanitized = _sanitize_fts_query(query.search)
-            conditions.append(
-                "d.id IN (SELECT id FROM decisions_fts "
-                "WHERE decisions_fts MATCH ?)"
-            )
-            params.append(sanitized)
-
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+    def _get_many_sync(
+        self,
+        conn: sqlite3.Connection,
+        decision_ids: list[str],
+        fields: Collection[str] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        select, children = _projection(fields, _CHILD_FIELDS)
+        rows = conn.execute(
+            f"SELECT {select} FROM decisions d WHERE d.id IN {_IN_IDS}",  # noqa: S608
+            (json.dumps(list(dict.fromkeys(decision_ids))),),
+        ).fetchall()
+        decisions = [self._normalize_row(dict(row)) for row in rows]
 
-        # Validate sort column
-        sort_col = query.sort if query.sort in _SORTABLE_COLUMNS else "created_at"
-        order = "ASC" if query.order.upper() == "ASC" else "DESC"
+        self._attach_children(conn, decisions, children)
+        return {d["id"]: d for d in decisions}
 
-        # Count total
-        count_sql = f"SELECT COUNT(*) FROM decisions d WHERE {where_clause}"  # noqa: S608
-        total = self._conn.execute(count_sql, params).fetchone()[0]
+    async def existing_ids(self, decision_ids: list[str]) -> set[str]:
+        """Return which IDs exist, reading only the primary-key index."""
+        return await self._read(self._existing_ids_sync, decision_ids)
 
-        # Fetch page
-        select_sql = (
-            f"SELECT d.* FROM decisions d WHERE {where_clause} "  # noqa: S608
-            f"ORDER BY d.{sort_col} {order} "
-            f"LIMIT ? OFFSET ?"
-        )
-        rows = self._conn.execute(
-            select_sql, [*params, query.limit, query.offset]
+    @staticmethod
+    def _existing_ids_sync(conn: sqlite3.Connection, decision_ids: list[str]) -> set[str]:
+        rows = conn.execute(
+            f"SELECT id FROM decisions WHERE id IN {_IN_IDS}",  # noqa: S608
+            (json.dumps(list(dict.fromkeys(decision_ids))),),
         ).fetchall()
+        return {row[0] for row in rows}
 
-        decisions: list[dict[str, Any]] = [
-            self._normalize_row(dict(row)) for row in rows
-        ]
-
-        # Batch-fetch tags for all decisions (avoids N+1 queries)
-        ids = [d["id"] for d in decisions]
-        if ids:
-            placeholders = ",".join("?" for _ in ids)
-            tag_rows = self._conn.execute(
+    def _attach_children(
+        self,
+        conn: sqlite3.Connection,
+        decisions: list[dict[str, Any]],
+        children: Collection[str] = _LIST_CHILDREN,
+    ) -> None:
+        """Batch-fetch the named child tables (tags, reasons, bridge, deliberation).
+
+        One query per child table instead of one per decision.
+        """
+        if not decisions or not children:
+            return
+
+        ids = (json.dumps([d["id"] for d in decisions]),)
+        tags_by_id: dict[str, list[str]] = defaultdict(list)
+        bridge_by_id: dict[str, dict[str, Any]] = {}
+        reasons_by_id: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        delib_by_id: dict[str, dict[str, Any]] = {}
+
+        if "tags" in children:
+            tag_rows = conn.execute(
                 f"SELECT decision_id, tag FROM decision_tags "  # noqa: S608
-                f"WHERE decision_id IN ({placeholders})",
+                f"WHERE decision_id IN {_IN_IDS}",
                 ids,
             ).fetchall()
-            tags_by_id: dict[str, list[str]] = defaultdict(list)
             for r in tag_rows:
                 tags_by_id[r["decision_id"]].append(r["tag"])
-            for d in decisions:
-                d["tags"] = tags_by_id.get(d["id"], [])
 
-            # Batch-fetch bridge (1:1 with decisions)
-            bridge_rows = self._conn.execute(
+        # Bridge (1:1 with decisions)
+        if "bridge" in children:
+            bridge_rows = conn.execute(
                 f"SELECT decision_id, structure, function, "  # noqa: S608
                 f"tolerance, enforcement, prevention "
-                f"FROM decision_bridge WHERE decision_id IN ({placeholders})",
+                f"FROM decision_bridge WHERE decision_id IN {_IN_IDS}",
                 ids,
             ).fetchall()
-            bridge_by_id: dict[str, dict[str, Any]] = {}
             for r in bridge_rows:
                 bridge_by_id[r["decision_id"]] = {
                     "structure": r["structure"],
@@ -577,164 +1472,327 @@ class SQLiteDecisionStore(DecisionStore):
                     "prevention": json.loads(r["prevention"])
                     if r["prevention"] else None,
                 }
-            for d in decisions:
-                bridge = bridge_by_id.get(d["id"])
-                if bridge:
-                    d["bridge"] = bridge
 
-            # Batch-fetch reasons (1:N with decisions)
-            reason_rows = self._conn.execute(
+        # Reasons (1:N with decisions)
+        if "reasons" in children:
+            reason_rows = conn.execute(
                 f"SELECT decision_id, type, text, strength "  # noqa: S608
-                f"FROM decision_reasons WHERE decision_id IN ({placeholders})",
+                f"FROM decision_reasons WHERE decision_id IN {_IN_IDS} "
+                f"ORDER BY id",
                 ids,
             ).fetchall()
-            reasons_by_id: dict[str, list[dict[str, Any]]] = defaultdict(list)
             for r in reason_rows:
                 reasons_by_id[r["decision_id"]].append(
                     {"type": r["type"], "text": r["text"], "strength": r["strength"]}
                 )
-            for d in decisions:
+
+        if "deliberation" in children:
+            delib_rows = conn.execute(
+                f"SELECT decision_id, inputs_json, steps_json, "  # noqa: S608
+                f"total_duration_ms FROM decision_deliberation "
+                f"WHERE decision_id IN {_IN_IDS}",
+                ids,
+            ).fetchall()
+            for r in delib_rows:
+                delib_by_id[r["decision_id"]] = {
+                    "inputs": json.loads(r["inputs_json"])
+                    if r["inputs_json"] else None,
+                    "steps": json.loads(r["steps_json"])
+                    if r["steps_json"] else None,
+                    "total_duration_ms": r["total_duration_ms"],
+                }
+
+        for d in decisions:
+            if "tags" in children:
+                d["tags"] = tags_by_id.get(d["id"], [])
+            if "reasons" in children:
                 d["reasons"] = reasons_by_id.get(d["id"], [])
-        else:
-            for d in decisions:
-                d["tags"] = []
+            bridge = bridge_by_id.get(d["id"])
+            if bridge:
+                d["bridge"] = bridge
+            delib = delib_by_id.get(d["id"])
+            if delib:
+                d["deliberation"] = delib
+
+    # ------------------------------------------------------------------
+    # delete
+    # ------------------------------------------------------------------
+
+    async def delete(self, decision_id: str) -> bool:
+        """Delete a decision and all related records (cascading)."""
+        return await self._write(self._delete_sync, decision_id)
+
+    def _delete_sync(self, decision_id: str) -> bool:
+        assert self._conn is not None  # noqa: S101
+        try:
+            with self._transaction():
+                cursor = self._conn.execute(
+                    "DELETE FROM decisions WHERE id = ?", (decision_id,)
+                )
+                return cursor.rowcount > 0
+        except Exception:
+            logger.exception("Failed to delete decision %s", decision_id)
+            return False
+
+    # ------------------------------------------------------------------
+    # list
+    # ------------------------------------------------------------------
+
+    async def list(self, query: ListQuery) -> ListResult:
+        """List decisions with SQL-based filtering, sorting, and pagination."""
+        return await self._read(self._list_sync, query)
+
+    def _list_sync(self, conn: sqlite3.Connection, query: ListQuery) -> ListResult:
+        statements = _list_statements(query)
+
+        # Count total (optional: it scans every match, whatever the page)
+        total: int | None = None
+        if statements.count_sql is not None:
+            total = conn.execute(statements.count_sql, statements.params).fetchone()[0]
+
+        # Fetch page (plus one row to detect a next page), reading only the
+        # projected columns
+        rows = conn.execute(statements.page_sql, statements.page_params).fetchall()
+
+        next_cursor: str | None = None
+        if len(rows) > query.limit:
+            rows = rows[: query.limit]
+            next_cursor = encode_cursor(query, rows[-1]["_sort_key"], rows[-1]["id"])
+
+        decisions: list[dict[str, Any]] = []
+        for row in rows:
+            d = dict(row)
+            del d["_sort_key"]
+            decisions.append(self._normalize_row(d))
+
+        # Batch-fetch the requested child tables (avoids N+1 queries)
+        self._attach_children(conn, decisions, statements.children)
 
         return ListResult(
             decisions=decisions,
             total=total,
             limit=query.limit,
-            offset=query.offset,
+            offset=statements.offset,
+            next_cursor=next_cursor,
         )
 
     # ------------------------------------------------------------------
-    # stats
+    # explain
     # ------------------------------------------------------------------
 
-    async def stats(self, query: StatsQuery) -> StatsResult:
-        """Compute aggregate statistics using SQL GROUP BY queries."""
-        return await asyncio.to_thread(self._stats_sync, query)
+    async def explain(self, query: ListQuery) -> dict[str, builtins.list[dict[str, Any]]]:
+        """Return SQLite's EXPLAIN QUERY PLAN for the SQL ``list(query)`` runs."""
+        return await self._read(self._explain_sync, query)
 
-    def _stats_sync(self, query: StatsQuery) -> StatsResult:
-        assert self._conn is not None  # noqa: S101
-
-        conditions: list[str] = []
-        params: list[Any] = []
-
-        if query.date_from:
-            conditions.append("created_at >= ?")
-            params.append(query.date_from)
-        if query.date_to:
-            date_to_val = query.date_to
-            if "T" not in date_to_val:
-                date_to_val += "T23:59:59"
-            conditions.append("created_at <= ?")
-            params.append(date_to_val)
-        if query.project:
-            conditions.append("project = ?")
-            params.append(query.project)
-
-        where = " AND ".join(conditions) if conditions else "1=1"
+    @staticmethod
+    def _explain_sync(
+        conn: sqlite3.Connection, query: ListQuery,
+    ) -> dict[str, builtins.list[dict[str, Any]]]:
+        statements = _list_statements(query)
+        plans: dict[str, list[dict[str, Any]]] = {}
+        for name, sql, params in (
+            ("count", statements.count_sql, statements.params),
+            ("page", statements.page_sql, statements.page_params),
+        ):
+            if sql is None:
+                continue
+            plans[name] = [
+                {
+                    "id": row[0],
+                    "parent": row[1],
+                    "detail": row[3],
+                    "fullScan": _is_full_scan(row[3]),
+                }
+                for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            ]
+        return plans
 
-        # Total
-        total = self._conn.execute(
-            f"SELECT COUNT(*) FROM decisions WHERE {where}",  # noqa: S608
-            params,
-        ).fetchone()[0]
+    # ------------------------------------------------------------------
+    # keyword_search
+    # ------------------------------------------------------------------
 
-        # By category
-        by_category: dict[str, int] = {}
-        for row in self._conn.execute(
-            f"SELECT category, COUNT(*) as cnt FROM decisions "  # noqa: S608
-            f"WHERE {where} GROUP BY category",
-            params,
-        ):
-            by_category[row["category"]] = row["cnt"]
+    async def keyword_search(
+        self,
+        query: str,
+        filters: dict[str, Any] | None = None,
+        top_k: int = 10,
+    ) -> builtins.list[tuple[str, float]]:
+        """Rank decisions with FTS5 bm25() over text, category, tags, reasons, and bridge."""
+        return await self._read(self._keyword_search_sync, query, filters, top_k)
+
+    def _keyword_search_sync(
+        self,
+        conn: sqlite3.Connection,
+        query: str,
+        filters: dict[str, Any] | None,
+        top_k: int,
+    ) -> builtins.list[tuple[str, float]]:
+
+        match = _fts_any_terms(query)
+        if match is None or top_k <= 0:
+            return []
+
+        conditions = ["decisions_fts MATCH ?"]
+        params: list[Any] = [match]
+        # Sorted so a filter set always yields the same statement text.
+        for key, value in sorted((filters or {}).items()):
+            if key in _FILTER_COLUMNS and value is not None:
+                conditions.append(f"d.{key} = ?")
+                params.append(value)
 
-        # By stakes
-        by_stakes: dict[str, int] = {}
-        for row in self._conn.execute(
-            f"SELECT stakes, COUNT(*) as cnt FROM decisions "  # noqa: S608
-            f"WHERE {where} GROUP BY stakes",
-            params,
-        ):
-            by_stakes[row["stakes"]] = row["cnt"]
+        # bm25() is lower-is-better; negate so callers get higher-is-better.
+        rows = conn.execute(
+            f"SELECT d.id, bm25(decisions_fts, {_FTS_WEIGHTS}) AS rank "  # noqa: S608
+            f"FROM decisions_fts JOIN decisions d ON d.rowid = decisions_fts.rowid "
+            f"WHERE {' AND '.join(conditions)} "
+            f"ORDER BY rank LIMIT ?",
+            [*params, top_k],
+        ).fetchall()
+        return [(row["id"], -float(row["rank"])) for row in rows]
 
-        # By status
-        by_status: dict[str, int] = {}
-        for row in self._conn.execute(
-            f"SELECT status, COUNT(*) as cnt FROM decisions "  # noqa: S608
-            f"WHERE {where} GROUP BY status",
-            params,
-        ):
-            by_status[row["status"]] = row["cnt"]
+    # ------------------------------------------------------------------
+    # stats
+    # ------------------------------------------------------------------
 
-        # By agent
-        by_agent: dict[str, int] = {}
-        for row in self._conn.execute(
-            f"SELECT recorded_by, COUNT(*) as cnt FROM decisions "  # noqa: S608
-            f"WHERE {where} AND recorded_by IS NOT NULL GROUP BY recorded_by",
-            params,
-        ):
-            by_agent[row["recorded_by"]] = row["cnt"]
-
-        # By day
-        by_day: list[dict[str, Any]] = []
-        for row in self._conn.execute(
-            f"SELECT strftime('%Y-%m-%d', created_at) as date, "  # noqa: S608
-            f"COUNT(*) as count FROM decisions "
-            f"WHERE {where} GROUP BY date ORDER BY date DESC LIMIT 30",
-            params,
-        ):
-            by_day.append({"date": row["date"], "count": row["count"]})
-
-        # Top tags
-        top_tags: list[dict[str, Any]] = []
-        if conditions:
-            tag_sql = (
-                f"SELECT t.tag, COUNT(*) as count "  # noqa: S608
-                f"FROM decision_tags t "
-                f"JOIN decisions d ON t.decision_id = d.id "
-                f"WHERE {where} "
-                f"GROUP BY t.tag ORDER BY count DESC LIMIT 20"
-            )
-        else:
-            tag_sql = (
-                "SELECT tag, COUNT(*) as count FROM decision_tags "
-                "GROUP BY tag ORDER BY count DESC LIMIT 20"
-            )
-        for row in self._conn.execute(tag_sql, params):
-            top_tags.append({"tag": row["tag"], "count": row["count"]})
+    async def stats(self, query: StatsQuery, tag_limit: int | None = 20) -> StatsResult:
+        """Compute aggregate statistics from the rollup tables.
+
+        ``tag_limit`` caps ``top_tags`` (None returns every tag, which lets
+        callers merge exact counts across stores).
+        """
+        return await self._read(self._stats_sync, query, tag_limit)
+
+    def _stats_sync(
+        self, conn: sqlite3.Connection, query: StatsQuery, tag_limit: int | None = 20,
+    ) -> StatsResult:
+        date_from = query.date_from or None
+        date_to = query.date_to or None
+        if date_to and "T" not in date_to:
+            date_to += "T23:59:59"
+
+        def counts(dimension: str, since: str | None = date_from) -> Counter[str]:
+            return self._rollup_counts(conn, dimension, since, date_to, query.project)
+
+        by_agent = counts("agent")
+        by_agent.pop("", None)
+        by_day = [
+            {"date": day, "count": count}
+            for day, count in sorted(counts("day").items(), reverse=True)[:30]
+        ]
+        top_tags = [
+            {"tag": tag, "count": count}
+            for tag, count in sorted(
+                counts("tag").items(), key=lambda t: (-t[1], t[0]),
+            )[:tag_limit]
+        ]
 
-        # Recent activity (respects the same project/date filters)
+        # Recent activity (respects the same project/date filters). Matches
+        # the lexical comparison against SQLite's datetime('now', ...).
+        now = datetime.now(UTC)
         recent_activity: dict[str, int] = {}
-        for label, interval in [
-            ("last24h", "-1 day"),
-            ("last7d", "-7 days"),
-            ("last30d", "-30 days"),
-        ]:
-            activity_conditions = list(conditions)
-            activity_params = list(params)
-            activity_conditions.append("created_at >= datetime('now', ?)")
-            activity_params.append(interval)
-            activity_where = " AND ".join(activity_conditions)
-            row = self._conn.execute(
-                f"SELECT COUNT(*) FROM decisions "  # noqa: S608
-                f"WHERE {activity_where}",
-                activity_params,
-            ).fetchone()
-            recent_activity[label] = row[0]
+        for label, days in [("last24h", 1), ("last7d", 7), ("last30d", 30)]:
+            since = (now - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+            if date_from and date_from > since:
+                since = date_from
+            recent_activity[label] = counts("total", since)[""]
 
         return StatsResult(
-            total=total,
-            by_category=by_category,
-            by_stakes=by_stakes,
-            by_status=by_status,
-            by_agent=by_agent,
+            total=counts("total")[""],
+            by_category=dict(counts("category")),
+            by_stakes=dict(counts("stakes")),
+            by_status=dict(counts("status")),
+            by_agent=dict(by_agent),
             by_day=by_day,
             top_tags=top_tags,
             recent_activity=recent_activity,
         )
 
+    @staticmethod
+    def _rollup_ranges(
+        date_from: str | None, date_to: str | None,
+    ) -> tuple[builtins.list[str], builtins.list[Any], builtins.list[str]]:
+        """Split a created_at range into whole days and partial edge days.
+
+        Returns rollup conditions and params covering the days every
+        created_at of which falls inside the range, plus the edge days
+        (a ``date_from`` with a time part, and the ``date_to`` day) whose
+        decisions must be counted from the decisions table.
+        """
+        conditions: list[str] = []
+        params: list[Any] = []
+        edges: list[str] = []
+        if date_from:
+            first = date_from[:10]
+            if date_from == first:
+                conditions.append("day >= ?")
+            else:
+                conditions.append("day > ?")
+                edges.append(first)
+            params.append(first)
+        if date_to:
+            last = date_to[:10]
+            conditions.append("day < ?")
+            params.append(last)
+            if last not in edges:
+                edges.append(last)
+        return conditions, params, edges
+
+    def _rollup_counts(
+        self,
+        conn: sqlite3.Connection,
+        dimension: str,
+        date_from: str | None,
+        date_to: str | None,
+        project: str | None,
+    ) -> Counter[str]:
+        """Decision (or tag) counts grouped by one ``_STATS_DIMENSIONS`` key.
+
+        Whole days come from the rollup tables; edge days are counted from
+        the decisions table, through the created_at index.
+        """
+        table, rollup_expr, scan_from, scan_expr = _STATS_DIMENSIONS[dimension]
+        conditions, params, edges = self._rollup_ranges(date_from, date_to)
+        if project:
+            conditions.append("project = ?")
+            params.append(project)
+        where = " AND ".join(conditions) or "1=1"
+        result: Counter[str] = Counter()
+        for key, count in conn.execute(
+            f"SELECT {rollup_expr}, SUM(count) FROM {table} "  # noqa: S608
+            f"WHERE {where} GROUP BY 1",
+            params,
+        ):
+            if count:
+                result[key] += count
+        edge_where, edge_params = self._edge_conditions(date_from, date_to, project)
+        for day in edges:
+            for key, count in conn.execute(
+                f"SELECT {scan_expr}, COUNT(*) FROM {scan_from} "  # noqa: S608
+                f"WHERE {edge_where} GROUP BY 1",
+                [*edge_params, day, day + _DAY_END],
+            ):
+                result[key] += count
+        return result
+
+    @staticmethod
+    def _edge_conditions(
+        date_from: str | None, date_to: str | None, project: str | None,
+    ) -> tuple[str, builtins.list[Any]]:
+        """WHERE clause for one edge day; its bounds are the last two params."""
+        conditions: list[str] = []
+        params: list[Any] = []
+        if date_from:
+            conditions.append("created_at >= ?")
+            params.append(date_from)
+        if date_to:
+            conditions.append("created_at <= ?")
+            params.append(date_to)
+        if project:
+            conditions.append("project = ?")
+            params.append(project)
+        conditions.append("created_at >= ? AND created_at < ?")
+        return " AND ".join(conditions), params
+
     # ------------------------------------------------------------------
     # update_outcome
     # ------------------------------------------------------------------
@@ -748,8 +1806,8 @@ class SQLiteDecisionStore(DecisionStore):
         notes: str | None = None,
     ) -> bool:
         """Update outcome fields and set reviewed_at timestamp."""
-        return await asyncio.to_thread(
-            self._update_outcome_sync, decision_id, outcome, result, lessons, notes
+        return await self._write(
+            self._update_outcome_sync, decision_id, outcome, result, lessons, notes,
         )
 
     def _update_outcome_sync(
@@ -763,7 +1821,7 @@ class SQLiteDecisionStore(DecisionStore):
         assert self._conn is not None  # noqa: S101
         now = _now()
         try:
-            with self._conn:
+            with self._transaction():
                 cursor = self._conn.execute(
                     "UPDATE decisions SET "
                     "outcome = ?, outcome_result = ?, outcome_lessons = ?, "
@@ -785,9 +1843,7 @@ class SQLiteDecisionStore(DecisionStore):
 
     async def update_fields(self, decision_id: str, **fields: Any) -> bool:
         """Update specific fields on a decision."""
-        return await asyncio.to_thread(
-            self._update_fields_sync, decision_id, fields
-        )
+        return await self._write(self._update_fields_sync, decision_id, fields)
 
     def _update_fields_sync(
         self, decision_id: str, fields: dict[str, Any]
@@ -802,7 +1858,7 @@ class SQLiteDecisionStore(DecisionStore):
 
         # Filter to allowed columns only
         safe_fields = {
-            k: v for k, v in fields.items() if k in _UPDATABLE_FIELDS
+            k: fields[k] for k in sorted(fields) if k in _UPDATABLE_FIELDS
         }
 
         has_child = (
@@ -813,7 +1869,7 @@ class SQLiteDecisionStore(DecisionStore):
             return False
 
         try:
-            with self._conn:
+            with self._transaction():
                 if safe_fields:
                     safe_fields["updated_at"] = _now()
                     set_clause = ", ".join(f"{k} = ?" for k in safe_fields)
@@ -932,22 +1988,42 @@ class SQLiteDecisionStore(DecisionStore):
 
     async def count(self, **filters: Any) -> int:
         """Count decisions matching optional filters."""
-        return await asyncio.to_thread(self._count_sync, filters)
-
-    def _count_sync(self, filters: dict[str, Any]) -> int:
-        assert self._conn is not None  # noqa: S101
+        return await self._read(self._count_sync, filters)
 
+    def _count_sync(self, conn: sqlite3.Connection, filters: dict[str, Any]) -> int:
         conditions: list[str] = []
         params: list[Any] = []
 
-        for key, value in filters.items():
+        for key, value in sorted(filters.items()):
             if key in _FILTER_COLUMNS and value is not None:
                 conditions.append(f"{key} = ?")
                 params.append(value)
 
         where = " AND ".join(conditions) if conditions else "1=1"
-        row = self._conn.execute(
+        row = conn.execute(
             f"SELECT COUNT(*) FROM decisions WHERE {where}",  # noqa: S608
             params,
         ).fetchone()
         return row[0]
+
+    # ------------------------------------------------------------------
+    # version
+    # ------------------------------------------------------------------
+
+    async def version(self) -> int:
+        """Return the trigger-maintained change counter.
+
+        Persistent across restarts and bumped by writes from any process
+        sharing the database file.
+        """
+        return await self._read(self._version_sync)
+
+    async def fingerprint(self) -> str:
+        """Return the persistent change counter."""
+        return str(await self.version())
+
+    def _version_sync(self, conn: sqlite3.Connection) -> int:
+        row = conn.execute(
+            "SELECT value FROM store_meta WHERE key = 'version'"
+        ).fetchone()
+        return int(row[0]) if row else 0
@@ -0,0 +1,265 @@
+"""Connection plumbing for SQLiteDecisionStore.
+
+WAL mode lets any number of readers run alongside one writer, but only if
+they use separate connections. ``ReaderPool`` hands out a bounded set of
+query-only connections to worker threads; ``WriterExecutor`` funnels every
+mutation through one connection on one dedicated thread, so writes stay
+serialized without blocking reads. In group-commit mode the writer also
+gathers mutations arriving within a short window and commits them in one
+transaction. Both keep counters for ``metrics()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class ReaderPool:
+    """Bounded pool of read-only SQLite connections.
+
+    Connections are opened lazily up to ``size``; once all are in use,
+    callers block until one is returned, and the wait is recorded.
+    """
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection], size: int) -> None:
+        self._connect = connect
+        self._size = max(1, size)
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._open = 0
+        self._in_use = 0
+        self._closed = False
+        self.acquires = 0
+        self.waits = 0
+        self.total_wait_s = 0.0
+        self.max_wait_s = 0.0
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for the duration of the ``with`` block."""
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    def _acquire(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Reader pool is closed")
+            self.acquires += 1
+            self._in_use += 1
+            create = self._idle.empty() and self._open < self._size
+            if create:
+                self._open += 1
+        if create:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._open -= 1
+                    self._in_use -= 1
+                raise
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        started = time.perf_counter()
+        conn = self._idle.get()
+        waited = time.perf_counter() - started
+        with self._lock:
+            self.waits += 1
+            self.total_wait_s += waited
+            self.max_wait_s = max(self.max_wait_s, waited)
+        return conn
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            self._in_use -= 1
+            closed = self._closed
+        if closed:
+            conn.close()
+        else:
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        """Close idle connections; borrowed ones close when returned."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "size": self._size,
+                "open": self._open,
+                "in_use": self._in_use,
+                "acquires": self.acquires,
+                "waits": self.waits,
+                "avg_wait_ms": _ms(self.total_wait_s / self.waits) if self.waits else 0.0,
+                "max_wait_ms": _ms(self.max_wait_s),
+            }
+
+
+# Runs a list of zero-argument calls inside one transaction on the writer
+# thread and returns one (ok, result-or-exception) pair per call.
+BatchRunner = Callable[[list[Callable[[], Any]]], list[tuple[bool, Any]]]
+
+
+class WriterExecutor:
+    """Single dedicated thread that runs every mutation in submission order.
+
+    Records how many writes are queued and how long each waited before
+    the writer thread picked it up.
+
+    With ``group_window_ms > 0`` and a ``run_batch`` callback,
+    ``submit_grouped`` holds mutations for up to ``group_window_ms`` (or
+    until ``group_max_ops`` are queued) and hands them to ``run_batch`` as
+    one transaction. Each caller's await resolves only after that batch
+    has committed.
+    """
+
+    def __init__(
+        self,
+        name: str = "sqlite-writer",
+        *,
+        group_window_ms: float = 0.0,
+        group_max_ops: int = 64,
+        run_batch: BatchRunner | None = None,
+    ) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._depth = 0
+        self.max_depth = 0
+        self.writes = 0
+        self.total_wait_s = 0.0
+        self.max_wait_s = 0.0
+
+        self._group_window = max(0.0, group_window_ms) / 1000.0
+        self._group_max_ops = max(1, group_max_ops)
+        self._run_batch = run_batch
+        self._pending: list[tuple[Callable[[], Any], asyncio.Future[Any]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._batch_futures: set[asyncio.Future[Any]] = set()
+        self.batches = 0
+        self.batched_ops = 0
+        self.max_batch = 0
+
+    @property
+    def group_commit(self) -> bool:
+        return self._group_window > 0 and self._run_batch is not None
+
+    async def submit_grouped(self, fn: Callable[..., T], *args: Any) -> T:
+        """Queue ``fn(*args)`` for the next group commit, or run it now if off."""
+        if not self.group_commit:
+            return await self.submit(fn, *args)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[T] = loop.create_future()
+        self._pending.append((lambda: fn(*args), future))
+        if len(self._pending) >= self._group_max_ops:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._group_window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        assert self._run_batch is not None  # noqa: S101
+        run_batch = self._run_batch
+        done = asyncio.ensure_future(self.submit(run_batch, [call for call, _ in batch]))
+        self._batch_futures.add(done)
+
+        def resolve(task: asyncio.Future[list[tuple[bool, Any]]]) -> None:
+            self._batch_futures.discard(task)
+            if task.cancelled():
+                outcomes: list[tuple[bool, Any]] = [
+                    (False, asyncio.CancelledError())
+                ] * len(batch)
+            elif task.exception() is not None:
+                outcomes = [(False, task.exception())] * len(batch)
+            else:
+                outcomes = task.result()
+            with self._lock:
+                self.batches += 1
+                self.batched_ops += len(batch)
+                self.max_batch = max(self.max_batch, len(batch))
+            for (_, future), (ok, value) in zip(batch, outcomes, strict=True):
+                if future.done():
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+
+        done.add_done_callback(resolve)
+
+    async def drain(self) -> None:
+        """Commit anything still waiting for its group-commit window."""
+        self._flush()
+        while self._batch_futures:
+            await asyncio.gather(*list(self._batch_futures), return_exceptions=True)
+
+    async def submit(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(*args)`` on the writer thread and await its result."""
+        submitted = time.perf_counter()
+        with self._lock:
+            self._depth += 1
+            self.max_depth = max(self.max_depth, self._depth)
+
+        def run() -> T:
+            waited = time.perf_counter() - submitted
+            with self._lock:
+                self._depth -= 1
+                self.writes += 1
+                self.total_wait_s += waited
+                self.max_wait_s = max(self.max_wait_s, waited)
+            return fn(*args)
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, run)
+
+    def shutdown(self) -> None:
+        """Stop the writer thread after already-queued work finishes."""
+        self._executor.shutdown(wait=True)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats: dict[str, Any] = {
+                "queue_depth": self._depth,
+                "max_queue_depth": self.max_depth,
+                "writes": self.writes,
+                "avg_wait_ms": _ms(self.total_wait_s / self.writes) if self.writes else 0.0,
+                "max_wait_ms": _ms(self.max_wait_s),
+            }
+            if self.group_commit:
+                stats["group_commit"] = {
+                    "pending": len(self._pending),
+                    "batches": self.batches,
+                    "avg_batch": (
+                        round(self.batched_ops / self.batches, 2) if self.batches else 0.0
+                    ),
+                    "max_batch": self.max_batch,
+                }
+            return stats
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000.0, 3)
@@ -0,0 +1,155 @@
+"""Parsed-YAML document cache for decision files.
+
+YAML-only deployments answer analytics calls (calibration, reason stats,
+attribution, the query fallback) by reading every decision file, and
+``yaml.safe_load`` dominated those calls. Parsed documents are cached by
+``(path, mtime_ns, size)``, so a file is parsed again only after it changes;
+the set of files comes from the ``DecisionPathIndex``, which re-lists only
+directories whose mtime moved. Parsing uses libyaml's ``CSafeLoader`` when
+PyYAML was built with it.
+
+Callers get a deep copy of the cached document and may mutate it freely.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from .path_index import get_path_index
+
+logger = logging.getLogger(__name__)
+
+SafeLoader: type = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_Entry = tuple[int, int, Any]
+
+
+def parse_yaml(text: str | bytes) -> Any:
+    """Parse one YAML document with the fastest available safe loader."""
+    return yaml.load(text, Loader=SafeLoader)  # noqa: S506 - safe loader
+
+
+class ParsedYAMLCache:
+    """LRU cache of parsed YAML files, validated by mtime and size.
+
+    Attributes:
+        hits: Loads answered without reading the file.
+        misses: Loads that read and parsed the file.
+    """
+
+    def __init__(self, max_entries: int = 20_000) -> None:
+        self._max_entries = max(0, max_entries)
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: str | Path) -> Any:
+        """Return the parsed contents of ``path``.
+
+        Raises:
+            OSError: If the file cannot be read.
+            yaml.YAMLError: If it is not valid YAML.
+        """
+        key = os.fspath(path)
+        st = os.stat(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                if isinstance(entry[2], yaml.YAMLError):
+                    raise entry[2]
+                return copy.deepcopy(entry[2])
+            self.misses += 1
+
+        with open(key, "rb") as f:
+            raw = f.read()
+        try:
+            data = parse_yaml(raw)
+        except yaml.YAMLError as e:
+            # Remember the failure too, so a corrupt file is not reparsed
+            # on every scan until it changes.
+            data = e
+
+        if self._max_entries:
+            with self._lock:
+                self._entries[key] = (st.st_mtime_ns, st.st_size, data)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+        if isinstance(data, yaml.YAMLError):
+            raise data
+        return copy.deepcopy(data)
+
+    def discard(self, path: str | Path) -> None:
+        """Drop ``path`` from the cache."""
+        with self._lock:
+            self._entries.pop(os.fspath(path), None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Entry and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "loader": SafeLoader.__name__,
+            }
+
+
+def iter_decision_files(base: str | Path) -> Iterator[tuple[str, Path, dict[str, Any]]]:
+    """Yield ``(id, path, data)`` for every non-empty decision file under ``base``.
+
+    Unreadable or malformed files are skipped, as the ``rglob`` loops this
+    replaces did.
+    """
+    cache = get_yaml_cache()
+    for decision_id, path in get_path_index(base).items():
+        try:
+            data = cache.load(path)
+        except Exception:
+            logger.debug("Skipping unreadable decision file %s", path, exc_info=True)
+            continue
+        if data:
+            yield decision_id, path, data
+
+
+_cache: ParsedYAMLCache | None = None
+
+
+def get_yaml_cache() -> ParsedYAMLCache:
+    """Get or create the singleton ParsedYAMLCache.
+
+    ``YAML_CACHE_SIZE`` bounds it (default 20000 documents; 0 disables it).
+    """
+    global _cache
+    if _cache is None:
+        _cache = ParsedYAMLCache(max_entries=int(os.getenv("YAML_CACHE_SIZE", "20000")))
+    return _cache
+
+
+def set_yaml_cache(cache: ParsedYAMLCache | None) -> None:
+    """Set the ParsedYAMLCache instance (for testing)."""
+    global _cache
+    _cache = cache
+
+
+def yaml_cache_stats() -> dict[str, Any] | None:
+    """Counters of the active cache, or None if none was created yet."""
+    return _cache.stats() if _cache is not None else None
@@ -9,14 +9,17 @@ from __future__ import annotations
 import logging
 import os
 import tempfile
+from collections.abc import Collection
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from . import DecisionStore, ListQuery, ListResult, StatsQuery, StatsResult
-from ._helpers import apply_filters, apply_stats_filters, compute_stats, matches_filters, sort_decisions
+from . import DecisionStore, ListQuery, ListResult, StatsQuery, StatsResult, project_fields
+from ._helpers import apply_filters, apply_stats_filters, compute_stats, matches_filters, paginate
+from .path_index import DecisionPathIndex, get_path_index
+from .yaml_cache import get_yaml_cache, iter_decision_files
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +32,8 @@ class YAMLFileSystemStore(DecisionStore):
 
     Each decision is stored as an individual YAML file in the decisions
     directory tree: ``decisions/YYYY/MM/YYYY-MM-DD-decision-{id}.yaml``.
+    Lookups by ID go through the shared ``DecisionPathIndex`` for the tree,
+    and files are parsed through the shared ``ParsedYAMLCache``.
 
     Configuration via environment variables:
         - DECISIONS_PATH: Directory for YAML files (default: decisions/)
@@ -36,6 +41,9 @@ class YAMLFileSystemStore(DecisionStore):
 
     def __init__(self, base_path: str | None = None) -> None:
         self._base = Path(base_path or DECISIONS_PATH)
+        # Counts writes made through this instance; edits made to the files
+        # by other processes are not observed.
+        self._version = 0
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -80,6 +88,8 @@ class YAMLFileSystemStore(DecisionStore):
             logger.exception("Failed to write decision %s", decision_id)
             return False
 
+        self._index.record(decision_id, file_path)
+        self._version += 1
         return True
 
     async def get(self, decision_id: str) -> dict[str, Any] | None:
@@ -94,6 +104,21 @@ class YAMLFileSystemStore(DecisionStore):
             data["id"] = decision_id
         return data
 
+    async def get_many(
+        self,
+        decision_ids: list[str],
+        fields: Collection[str] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Read several decisions, parsing only their files."""
+        found: dict[str, dict[str, Any]] = {}
+        for decision_id in dict.fromkeys(decision_ids):
+            result = self._find_file(decision_id)
+            if result is not None:
+                data = result[1]
+                data.setdefault("id", decision_id)
+                found[decision_id] = project_fields(data, fields)
+        return found
+
     async def delete(self, decision_id: str) -> bool:
         """Delete a decision's YAML file."""
         result = self._find_file(decision_id)
@@ -103,6 +128,8 @@ class YAMLFileSystemStore(DecisionStore):
         file_path, _ = result
         try:
             file_path.unlink()
+            self._index.forget(decision_id)
+            self._version += 1
             return True
         except OSError:
             logger.exception("Failed to delete %s", file_path)
@@ -119,20 +146,8 @@ class YAMLFileSystemStore(DecisionStore):
         # Apply filters
         filtered = apply_filters(all_decisions, query)
 
-        total = len(filtered)
-
-        # Sort
-        filtered = sort_decisions(filtered, query.sort, query.order)
-
-        # Paginate
-        page = filtered[query.offset : query.offset + query.limit]
-
-        return ListResult(
-            decisions=page,
-            total=total,
-            limit=query.limit,
-            offset=query.offset,
-        )
+        # Sort and paginate
+        return paginate(filtered, query)
 
     async def stats(self, query: StatsQuery) -> StatsResult:
         """Compute statistics by scanning all YAML files."""
@@ -196,24 +211,43 @@ class YAMLFileSystemStore(DecisionStore):
                 count += 1
         return count
 
+    async def version(self) -> int:
+        """Return the count of writes made through this store instance."""
+        return self._version
+
+    async def fingerprint(self) -> str:
+        """Return the file count and the newest directory mtime in the tree.
+
+        Every write replaces or unlinks a file, which moves its directory's
+        mtime, so this also sees writes made by other processes.
+        """
+        latest = 0
+        for directory, _, _ in os.walk(self._base):
+            try:
+                latest = max(latest, os.stat(directory).st_mtime_ns)
+            except OSError:
+                continue
+        return f"{len(self._index)}:{latest}"
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @property
+    def _index(self) -> DecisionPathIndex:
+        return get_path_index(self._base)
+
     def _find_file(self, decision_id: str) -> tuple[Path, dict[str, Any]] | None:
         """Find a decision YAML file by ID."""
-        if not self._base.exists():
+        yaml_file = self._index.get(decision_id)
+        if yaml_file is None:
             return None
-
-        pattern = f"*-decision-{decision_id}.yaml"
-        for yaml_file in self._base.rglob(pattern):
-            try:
-                with open(yaml_file, encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-                if data:
-                    return (yaml_file, data)
-            except Exception:
-                logger.warning("Failed to read %s", yaml_file)
+        try:
+            data = get_yaml_cache().load(yaml_file)
+            if data:
+                return (yaml_file, data)
+        except Exception:
+            logger.warning("Failed to read %s", yaml_file)
         return None
 
     def _load_all(self) -> list[dict[str, Any]]:
@@ -223,24 +257,9 @@ class YAMLFileSystemStore(DecisionStore):
         if not self._base.exists():
             return decisions
 
-        for yaml_file in self._base.rglob("*-decision-*.yaml"):
-            try:
-                with open(yaml_file, encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-                if not data:
-                    continue
-
-                # Extract ID from filename
-                filename = yaml_file.stem
-                parts = filename.rsplit("-decision-", 1)
-                if len(parts) == 2:
-                    data["id"] = parts[1]
-                else:
-                    data["id"] = filename
-
-                decisions.append(data)
-            except Exception:
-                continue
+        for decision_id, _, data in iter_decision_files(self._base):
+            data["id"] = decision_id
+            decisions.append(data)
 
         return decisions
 
@@ -261,6 +280,7 @@ class YAMLFileSystemStore(DecisionStore):
         except Exception:
             logger.exception("Atomic write failed for %s", file_path)
             return False
+        self._version += 1
         return True
 
 
@@ -2,12 +2,19 @@
 
 import sys
 from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from a2a.cstp import bm25_index
 from a2a.cstp.bm25_index import (
     BM25Index,
+    KeywordIndex,
     build_searchable_text,
+    get_keyword_index,
     merge_results,
     normalize_scores,
     tokenize,
@@ -185,3 +192,189 @@ class TestMergeResults:
         assert "semantic" in scores
         assert "keyword" in scores
         assert "combined" in scores
+
+
+CORPUS = [
+    {"id": "a1", "summary": "Use SQLite for storage", "category": "architecture", "project": "org/x"},
+    {"id": "a2", "summary": "Cache embeddings in SQLite", "category": "architecture", "project": "org/y"},
+    {"id": "a3", "summary": "Adopt ruff for linting", "category": "tooling", "project": "org/x"},
+    {"id": "a4", "summary": "Rotate CSRF tokens per session", "category": "security", "project": "org/x"},
+    {"id": "a5", "summary": "Batch embedding requests", "category": "architecture"},
+]
+
+
+async def _seeded_store() -> Any:
+    from a2a.cstp.storage.factory import get_decision_store
+
+    store = get_decision_store()
+    for d in CORPUS:
+        await store.save(d["id"], dict(d))
+    return store
+
+
+class TestKeywordIndex:
+    """Tests for the incremental KeywordIndex."""
+
+    def test_scores_match_bm25okapi(self) -> None:
+        """Scores equal the rank_bm25 reference on the same corpus."""
+        reference = BM25Index.from_decisions(CORPUS)
+        index = KeywordIndex.from_decisions(CORPUS)
+        for query in ("sqlite", "embedding sqlite cache", "csrf tokens", "ruff"):
+            expected = dict(reference.search(query, top_k=10))
+            actual = dict(index.search(query, top_k=10))
+            assert actual.keys() == expected.keys()
+            for doc_id, score in expected.items():
+                assert actual[doc_id] == pytest.approx(score)
+
+    def test_incremental_equals_rebuild(self) -> None:
+        """Upserts and removals leave the same index a fresh build would."""
+        index = KeywordIndex.from_decisions(CORPUS[:3])
+        index.upsert("a4", CORPUS[3])
+        index.upsert("a5", CORPUS[4])
+        index.upsert("a1", {**CORPUS[0], "summary": "Use Postgres for storage"})
+        index.remove("a3")
+
+        expected_corpus = [
+            {**CORPUS[0], "summary": "Use Postgres for storage"}, CORPUS[1], CORPUS[3], CORPUS[4],
+        ]
+        rebuilt = KeywordIndex.from_decisions(expected_corpus)
+        for query in ("sqlite", "postgres storage", "ruff", "embedding"):
+            assert index.search(query) == pytest.approx(rebuilt.search(query))
+        assert "a3" not in index
+        assert len(index) == 4
+
+    def test_filters_intersect_postings(self) -> None:
+        index = KeywordIndex.from_decisions(CORPUS)
+        assert [d for d, _ in index.search("sqlite", category="architecture", project="org/x")] == ["a1"]
+        assert {d for d, _ in index.search("sqlite embedding", category="architecture")} == {"a1", "a2", "a5"}
+        assert index.search("sqlite", category="tooling") == []
+        assert index.search("sqlite", project="org/none") == []
+
+    def test_snapshot_round_trip(self, tmp_path: Path) -> None:
+        index = KeywordIndex.from_decisions(CORPUS)
+        path = tmp_path / "bm25.json"
+        index.save(path)
+        assert index.dirty is False
+
+        loaded = KeywordIndex.load(path)
+        assert loaded is not None
+        assert loaded.search("sqlite", project="org/x") == index.search("sqlite", project="org/x")
+
+    def test_load_missing_or_corrupt(self, tmp_path: Path) -> None:
+        assert KeywordIndex.load(tmp_path / "missing.json") is None
+        bad = tmp_path / "bad.json"
+        bad.write_text("{not json")
+        assert KeywordIndex.load(bad) is None
+
+
+class TestSharedKeywordIndex:
+    """Lifecycle of the shared index: build, snapshot reuse, hooks."""
+
+    @pytest.mark.asyncio
+    async def test_builds_once_and_reuses_snapshot(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        from a2a.cstp.storage.factory import get_decision_store
+
+        path = tmp_path / "bm25.json"
+        monkeypatch.setenv("BM25_INDEX_PATH", str(path))
+        store = await _seeded_store()
+        with patch.object(store, "list", wraps=store.list) as listed:
+            index = await get_keyword_index()
+            assert await get_keyword_index() is index
+        assert listed.call_count == 1
+        assert path.exists()
+
+        # A restart with a snapshot matching the store skips the rebuild.
+        bm25_index.set_keyword_index(None)
+        with patch.object(get_decision_store(), "list") as listed:
+            reloaded = await get_keyword_index()
+        listed.assert_not_called()
+        assert reloaded.search("ruff") == index.search("ruff")
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_rebuilt(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        path = tmp_path / "bm25.json"
+        monkeypatch.setenv("BM25_INDEX_PATH", str(path))
+        KeywordIndex.from_decisions(CORPUS[:2]).save(path)
+        store = await _seeded_store()
+        with patch.object(store, "list", wraps=store.list) as listed:
+            index = await get_keyword_index()
+        listed.assert_called_once()
+        assert len(index) == len(CORPUS)
+
+    @pytest.mark.asyncio
+    async def test_snapshot_reused_after_writes_and_restart(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from a2a.cstp.storage.factory import set_decision_store
+        from a2a.cstp.storage.yaml_fs import YAMLFileSystemStore
+
+        monkeypatch.setenv("BM25_INDEX_PATH", str(tmp_path / "bm25.json"))
+        store = YAMLFileSystemStore(str(tmp_path / "decisions"))
+        set_decision_store(store)
+        index = await get_keyword_index()
+        for d in CORPUS[:3]:
+            await store.save(d["id"], dict(d))
+            bm25_index.index_decision_keywords(d["id"], d)
+        assert await bm25_index.save_keyword_index()
+
+        # A new process: a fresh store whose write counter starts at zero.
+        restarted = YAMLFileSystemStore(str(tmp_path / "decisions"))
+        set_decision_store(restarted)
+        bm25_index.set_keyword_index(None)
+        with patch.object(restarted, "list") as listed:
+            reloaded = await get_keyword_index()
+        listed.assert_not_called()
+        assert len(reloaded) == 3
+        assert reloaded.search("ruff") == index.search("ruff")
+
+        # A write the hooks never saw changes the fingerprint: rebuild.
+        await YAMLFileSystemStore(str(tmp_path / "decisions")).save("a1", {**CORPUS[0], "summary": "Use Postgres"})
+        bm25_index.set_keyword_index(None)
+        rebuilt = await get_keyword_index()
+        assert [d for d, _ in rebuilt.search("postgres")] == ["a1"]
+
+    @pytest.mark.asyncio
+    async def test_rebuild_pages_through_store(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(bm25_index, "_REBUILD_PAGE_SIZE", 2)
+        store = await _seeded_store()
+        with patch.object(store, "list", wraps=store.list) as listed:
+            index = await get_keyword_index()
+        assert listed.call_count == 3
+        assert len(index) == len(CORPUS)
+        assert [d for d, _ in index.search("csrf")] == ["a4"]
+
+    @pytest.mark.asyncio
+    async def test_record_decision_updates_loaded_index(self, tmp_path: Path) -> None:
+        from a2a.cstp.decision_service import RecordDecisionRequest, record_decision
+
+        from a2a.cstp.storage.factory import get_decision_store
+
+        loaded = KeywordIndex.from_decisions(CORPUS)
+        loaded.version = await get_decision_store().version()
+        bm25_index.set_keyword_index(loaded)
+        request = RecordDecisionRequest.from_dict(
+            {"decision": "Adopt zstandard compression", "confidence": 0.8, "category": "tooling"}
+        )
+        response = await record_decision(request, decisions_path=str(tmp_path))
+
+        assert response.success
+        # The hook kept the index in step with the store: no rebuild.
+        index = await get_keyword_index()
+        assert index is loaded
+        assert [d for d, _ in index.search("zstandard")] == [response.id]
+
+    @pytest.mark.asyncio
+    async def test_external_write_triggers_rebuild(self) -> None:
+        from a2a.cstp.storage.factory import get_decision_store
+
+        store = get_decision_store()
+        for d in CORPUS:
+            await store.save(d["id"], dict(d))
+        index = await get_keyword_index()
+        assert await get_keyword_index() is index
+
+        # A write that bypasses the decision-service hooks moves the version.
+        await store.save("a6", {"summary": "Shard the zstandard dictionary", "category": "tooling"})
+        rebuilt = await get_keyword_index()
+        assert rebuilt is not index
+        assert "a6" in rebuilt
@@ -19,10 +19,20 @@ class VectorResult:
     distance: float = 0.0
 
 
+@dataclass(slots=True)
+class VectorDocument:
+    """Document with its embedding, for bulk upserts."""
+
+    id: str
+    document: str
+    embedding: list[float]
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
 class VectorStore(ABC):
     """Abstract vector store for decision storage and retrieval.
 
-    All vector database backends (ChromaDB, Weaviate, pgvector, in-memory)
+    All vector database backends (ChromaDB, Weaviate, pgvector, NumPy, in-memory)
     implement this interface. Services interact only through these methods.
     """
 
@@ -56,12 +66,31 @@ class VectorStore(ABC):
         """
         ...
 
+    async def upsert_many(self, documents: list[VectorDocument]) -> bool:
+        """Insert or update several documents.
+
+        The default issues one ``upsert`` per document; remote backends
+        override it to send a whole batch per request.
+
+        Args:
+            documents: Documents to write.
+
+        Returns:
+            True if every document was written.
+        """
+        ok = True
+        for doc in documents:
+            ok = await self.upsert(doc.id, doc.document, doc.embedding, doc.metadata) and ok
+        return ok
+
     @abstractmethod
     async def query(
         self,
         embedding: list[float],
         n_results: int = 10,
         where: dict[str, Any] | None = None,
+        *,
+        exact: bool | None = None,
     ) -> list[VectorResult]:
         """Find similar documents by embedding vector.
 
@@ -70,6 +99,9 @@ class VectorStore(ABC):
             n_results: Maximum number of results to return.
             where: Optional metadata filter (ChromaDB-style operators:
                    exact match, $gte, $lte, $in, $contains, $or, $and).
+            exact: True forces an exhaustive scan, False requests the
+                   backend's approximate index, None uses the backend
+                   default. Backends without an ANN index ignore it.
 
         Returns:
             List of VectorResult sorted by ascending distance.
@@ -88,6 +120,19 @@ class VectorStore(ABC):
         """
         ...
 
+    async def delete_many(self, ids: list[str]) -> bool:
+        """Delete many documents, split into backend-sized batches.
+
+        The default is a single ``delete`` call.
+
+        Args:
+            ids: Document IDs to remove.
+
+        Returns:
+            True if every batch succeeded.
+        """
+        return await self.delete(ids)
+
     @abstractmethod
     async def count(self) -> int:
         """Return total number of documents in the collection."""
@@ -4,18 +4,26 @@ Extracts and unifies ChromaDB HTTP API v2 logic previously scattered
 across query_service.py, decision_service.py, and reindex_service.py.
 """
 
+import asyncio
 import json
 import logging
 import os
 from typing import Any
 
-from . import VectorResult, VectorStore
+from . import VectorDocument, VectorResult, VectorStore
 
 logger = logging.getLogger(__name__)
 
+# Documents per upsert/delete request in the bulk operations.
+_BATCH_SIZE = int(os.getenv("CHROMA_BATCH_SIZE", "256"))
+
 
 class ChromaDBStore(VectorStore):
-    """ChromaDB backend via HTTP API v2."""
+    """ChromaDB backend via HTTP API v2.
+
+    Requests share one keep-alive ``httpx.AsyncClient`` owned by the store
+    and released in ``close()``.
+    """
 
     def __init__(
         self,
@@ -31,6 +39,8 @@ class ChromaDBStore(VectorStore):
         self._tenant = tenant or os.getenv("CHROMA_TENANT", "default_tenant")
         self._database = database or os.getenv("CHROMA_DATABASE", "default_database")
         self._collection_id: str | None = None
+        self._client: Any = None  # httpx.AsyncClient, created on first request
+        self._client_loop: asyncio.AbstractEventLoop | None = None
 
     @property
     def _base(self) -> str:
@@ -47,39 +57,85 @@ class ChromaDBStore(VectorStore):
         headers: dict[str, Any] | None = None,
     ) -> tuple[int, Any]:
         """Make an async HTTP request, falling back to sync urllib."""
+        await self._discard_stale_client()
         try:
-            import httpx
-
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                if method == "GET":
-                    response = await client.get(url, headers=headers)
-                elif method == "DELETE":
-                    response = await client.delete(url, headers=headers)
-                else:
-                    response = await client.request(
-                        method, url, json=data, headers=headers
-                    )
-                return response.status_code, response.json() if response.text else {}
+            client = self._get_client()
         except ImportError:
-            import urllib.request
-
-            req_headers = {"Content-Type": "application/json"}
-            if headers:
-                req_headers.update(headers)
-            body = json.dumps(data).encode() if data else None
-            req = urllib.request.Request(
-                url, data=body, headers=req_headers, method=method
-            )
+            return self._request_urllib(method, url, data, headers)
 
-            try:
-                with urllib.request.urlopen(req, timeout=30) as resp:
-                    content = resp.read().decode()
-                    return resp.status, json.loads(content) if content else {}
-            except urllib.error.HTTPError as e:
-                content = e.read().decode() if e.fp else ""
-                return e.code, {"error": content}
-            except Exception as e:
-                return 0, {"error": str(e)}
+        if method == "GET":
+            response = await client.get(url, headers=headers)
+        elif method == "DELETE":
+            response = await client.delete(url, headers=headers)
+        else:
+            response = await client.request(method, url, json=data, headers=headers)
+        return response.status_code, response.json() if response.text else {}
+
+    @staticmethod
+    def _request_urllib(
+        method: str,
+        url: str,
+        data: dict[str, Any] | None,
+        headers: dict[str, Any] | None,
+    ) -> tuple[int, Any]:
+        """Blocking fallback used when httpx is not installed."""
+        import urllib.request
+
+        req_headers = {"Content-Type": "application/json"}
+        if headers:
+            req_headers.update(headers)
+        body = json.dumps(data).encode() if data else None
+        req = urllib.request.Request(
+            url, data=body, headers=req_headers, method=method
+        )
+
+        try:
+            with urllib.request.urlopen(req, timeout=30) as resp:
+                content = resp.read().decode()
+                return resp.status, json.loads(content) if content else {}
+        except urllib.error.HTTPError as e:
+            content = e.read().decode() if e.fp else ""
+            return e.code, {"error": content}
+        except Exception as e:
+            return 0, {"error": str(e)}
+
+    async def _discard_stale_client(self) -> None:
+        """Close a client left over from a previous event loop.
+
+        Its pooled connections belong to the old loop (e.g. an earlier
+        ``asyncio.run``), so ``_get_client`` builds a fresh one.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop in (None, loop):
+            return
+        stale, self._client, self._client_loop = self._client, None, None
+        try:
+            await stale.aclose()
+        except Exception as e:
+            logger.debug("Failed to close ChromaDB client from a previous event loop: %s", e)
+        else:
+            logger.debug("Closed ChromaDB client from a previous event loop")
+
+    def _get_client(self) -> Any:
+        """Return the shared client, rebuilding it if the event loop changed.
+
+        Raises:
+            ImportError: If httpx is not installed.
+        """
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(timeout=30.0)
+            self._client_loop = loop
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
 
     async def initialize(self) -> None:
         """Ensure collection exists, creating it if needed."""
@@ -122,6 +178,12 @@ class ChromaDBStore(VectorStore):
         metadata: dict[str, Any],
     ) -> bool:
         """Upsert a document, falling back to add on failure."""
+        return await self.upsert_many([VectorDocument(doc_id, document, embedding, metadata)])
+
+    async def upsert_many(self, documents: list[VectorDocument]) -> bool:
+        """Upsert documents in batches of ``CHROMA_BATCH_SIZE`` per request."""
+        if not documents:
+            return True
         coll_id = await self.get_collection_id()
         if not coll_id:
             await self.initialize()
@@ -130,13 +192,19 @@ class ChromaDBStore(VectorStore):
             logger.error("Could not get or create ChromaDB collection")
             return False
 
-        payload = {
-            "ids": [doc_id],
-            "documents": [document],
-            "metadatas": [metadata],
-            "embeddings": [embedding],
-        }
-
+        ok = True
+        for start in range(0, len(documents), _BATCH_SIZE):
+            batch = documents[start : start + _BATCH_SIZE]
+            payload = {
+                "ids": [d.id for d in batch],
+                "documents": [d.document for d in batch],
+                "metadatas": [d.metadata for d in batch],
+                "embeddings": [d.embedding for d in batch],
+            }
+            ok = await self._upsert_payload(coll_id, payload) and ok
+        return ok
+
+    async def _upsert_payload(self, coll_id: str, payload: dict[str, Any]) -> bool:
         # Try upsert first
         status, data = await self._request(
             "POST", f"{self._base}/collections/{coll_id}/upsert", payload
@@ -161,6 +229,8 @@ class ChromaDBStore(VectorStore):
         embedding: list[float],
         n_results: int = 10,
         where: dict[str, Any] | None = None,
+        *,
+        exact: bool | None = None,
     ) -> list[VectorResult]:
         """Query by embedding similarity with optional metadata filters."""
         coll_id = await self.get_collection_id()
@@ -216,6 +286,13 @@ class ChromaDBStore(VectorStore):
         )
         return status in (200, 204)
 
+    async def delete_many(self, ids: list[str]) -> bool:
+        """Delete documents in batches of ``CHROMA_BATCH_SIZE`` per request."""
+        ok = True
+        for start in range(0, len(ids), _BATCH_SIZE):
+            ok = await self.delete(ids[start : start + _BATCH_SIZE]) and ok
+        return ok
+
     async def count(self) -> int:
         """Return document count by fetching all IDs."""
         coll_id = await self.get_collection_id()
@@ -290,4 +367,4 @@ class ChromaDBStore(VectorStore):
             return True
 
         logger.info("Clearing %d documents from collection", len(ids))
-        return await self.delete(ids)
+        return await self.delete_many(ids)
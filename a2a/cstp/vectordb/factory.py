@@ -4,6 +4,7 @@ Provides singleton management and test injection for VectorStore instances.
 """
 
 import os
+from typing import Any
 
 from . import VectorStore
 
@@ -16,6 +17,7 @@ def create_vector_store() -> VectorStore:
     Supported values:
         - "chromadb" (default): ChromaDB via HTTP API v2.
         - "memory": In-memory store for testing.
+        - "numpy": In-process NumPy matrix store (no external services).
     """
     backend = os.getenv("VECTOR_BACKEND", "chromadb")
     match backend:
@@ -27,6 +29,10 @@ def create_vector_store() -> VectorStore:
             from .memory import MemoryStore
 
             return MemoryStore()
+        case "numpy":
+            from .numpy_store import NumpyStore
+
+            return NumpyStore()
         case _:
             msg = f"Unknown vector backend: {backend}"
             raise ValueError(msg)
@@ -44,3 +50,17 @@ def set_vector_store(store: VectorStore | None) -> None:
     """Set the VectorStore instance (for testing)."""
     global _store
     _store = store
+
+
+async def close_vector_store() -> None:
+    """Close and drop the singleton VectorStore, if one was created."""
+    global _store
+    if _store is not None:
+        store, _store = _store, None
+        await store.close()
+
+
+def vector_index_stats() -> dict[str, Any] | None:
+    """ANN index state of the active store (NumpyStore), or None if it has none."""
+    index_stats = getattr(_store, "index_stats", None)
+    return index_stats() if callable(index_stats) else None
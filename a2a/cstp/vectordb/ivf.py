@@ -0,0 +1,155 @@
+"""Inverted-file (IVF-flat) approximate nearest-neighbour index.
+
+Partitions unit-length vectors into ``nlist`` clusters with spherical
+k-means. A query scores only the rows in the ``nprobe`` clusters whose
+centroids are closest to it, so search cost grows with ``nprobe / nlist``
+of the corpus instead of all of it. Vectors themselves stay in the owning
+store's matrix; this index only tracks which rows belong to which list.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+# k-means runs on at most this many sampled rows per centroid.
+_TRAIN_SAMPLES_PER_LIST = 64
+_TRAIN_ITERATIONS = 10
+
+
+def default_nlist(n_rows: int) -> int:
+    """Pick a list count for a corpus of ``n_rows`` (≈ sqrt(n), at least 1)."""
+    return max(1, int(math.sqrt(n_rows)))
+
+
+def train_centroids(
+    vectors: np.ndarray,
+    nlist: int,
+    seed: int = 0,
+) -> np.ndarray:
+    """Run spherical k-means over ``vectors`` and return unit centroids.
+
+    Pure NumPy and free of shared state, so callers can run it in a worker
+    thread on a snapshot of the matrix.
+
+    Args:
+        vectors: (n, dim) float32 matrix of unit-length rows.
+        nlist: Number of clusters to fit.
+        seed: RNG seed, for reproducible partitions.
+
+    Returns:
+        (nlist, dim) float32 matrix of unit-length centroids.
+    """
+    rng = np.random.default_rng(seed)
+    n = vectors.shape[0]
+    nlist = max(1, min(nlist, n))
+
+    sample_size = min(n, nlist * _TRAIN_SAMPLES_PER_LIST)
+    sample = vectors[rng.choice(n, size=sample_size, replace=False)]
+    centroids: np.ndarray = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+
+    for _ in range(_TRAIN_ITERATIONS):
+        assign = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        empty = norms[:, 0] == 0.0
+        # Re-seed empty clusters from random samples instead of letting them die.
+        if empty.any():
+            sums[empty] = sample[rng.choice(sample_size, size=int(empty.sum()))]
+            norms[empty] = 1.0
+        centroids = (sums / norms).astype(np.float32)
+
+    return centroids
+
+
+def assign_lists(vectors: np.ndarray, centroids: np.ndarray, chunk: int = 8192) -> np.ndarray:
+    """Return the nearest-centroid list id for every row, chunked to bound memory."""
+    out = np.empty(vectors.shape[0], dtype=np.int32)
+    for start in range(0, vectors.shape[0], chunk):
+        block = vectors[start : start + chunk]
+        out[start : start + chunk] = np.argmax(block @ centroids.T, axis=1)
+    return out
+
+
+class IVFIndex:
+    """Row membership of an IVF-flat partition.
+
+    Keeps, for every store row, the list it belongs to and its position in
+    that list, so inserts, removals, and the store's row moves are all O(1).
+
+    Attributes:
+        centroids: (nlist, dim) unit-length cluster centroids.
+        nprobe: Default number of lists scanned per query.
+        trained_size: Corpus size at the time the centroids were fitted.
+    """
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        row_lists: np.ndarray,
+        nprobe: int,
+    ) -> None:
+        self.centroids = centroids
+        self.nprobe = nprobe
+        self.trained_size = int(row_lists.shape[0])
+        self._lists: list[list[int]] = [[] for _ in range(centroids.shape[0])]
+        self._list_of: dict[int, int] = {}
+        self._pos: dict[int, int] = {}
+        for row, list_id in enumerate(row_lists.tolist()):
+            self._link(row, list_id)
+
+    @property
+    def nlist(self) -> int:
+        return int(self.centroids.shape[0])
+
+    def __len__(self) -> int:
+        return len(self._list_of)
+
+    def add(self, row: int, vector: np.ndarray) -> None:
+        """Insert (or re-place) ``row`` into the list nearest to ``vector``."""
+        if row in self._list_of:
+            self.remove(row)
+        self._link(row, int(np.argmax(self.centroids @ vector)))
+
+    def remove(self, row: int) -> None:
+        """Drop ``row`` from its list by swapping in the list's last entry."""
+        list_id = self._list_of.pop(row, None)
+        if list_id is None:
+            return
+        members = self._lists[list_id]
+        pos = self._pos.pop(row)
+        last = members.pop()
+        if last != row:
+            members[pos] = last
+            self._pos[last] = pos
+
+    def move(self, src: int, dst: int) -> None:
+        """Record that the store moved row ``src`` into slot ``dst``."""
+        list_id = self._list_of.pop(src, None)
+        if list_id is None:
+            return
+        pos = self._pos.pop(src)
+        self._lists[list_id][pos] = dst
+        self._list_of[dst] = list_id
+        self._pos[dst] = pos
+
+    def candidates(self, query: np.ndarray, nprobe: int | None = None) -> np.ndarray:
+        """Return the rows in the ``nprobe`` lists nearest to ``query``."""
+        probe = max(1, min(nprobe or self.nprobe, self.nlist))
+        centroid_scores = self.centroids @ query
+        if probe < self.nlist:
+            nearest = np.argpartition(-centroid_scores, probe - 1)[:probe]
+        else:
+            nearest = np.arange(self.nlist)
+        rows: list[int] = []
+        for list_id in nearest.tolist():
+            rows.extend(self._lists[list_id])
+        return np.asarray(rows, dtype=np.intp)
+
+    def _link(self, row: int, list_id: int) -> None:
+        members = self._lists[list_id]
+        self._list_of[row] = list_id
+        self._pos[row] = len(members)
+        members.append(row)
@@ -9,6 +9,7 @@ import math
 from typing import Any
 
 from . import VectorResult, VectorStore
+from .metadata_index import MetadataIndex
 
 
 class MemoryStore(VectorStore):
@@ -19,6 +20,10 @@ class MemoryStore(VectorStore):
 
     def __init__(self) -> None:
         self._docs: dict[str, dict[str, Any]] = {}
+        self._meta_index: MetadataIndex[str] = MetadataIndex()
+        # Insertion sequence per doc, so candidate subsets keep dict order.
+        self._seq: dict[str, int] = {}
+        self._next_seq = 0
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -31,6 +36,13 @@ class MemoryStore(VectorStore):
         embedding: list[float],
         metadata: dict[str, Any],
     ) -> bool:
+        previous = self._docs.get(doc_id)
+        if previous is not None:
+            self._meta_index.remove(doc_id, previous["metadata"])
+        else:
+            self._seq[doc_id] = self._next_seq
+            self._next_seq += 1
+        self._meta_index.add(doc_id, metadata)
         self._docs[doc_id] = {
             "document": document,
             "embedding": embedding,
@@ -43,10 +55,16 @@ class MemoryStore(VectorStore):
         embedding: list[float],
         n_results: int = 10,
         where: dict[str, Any] | None = None,
+        *,
+        exact: bool | None = None,
     ) -> list[VectorResult]:
+        candidates, exact_match = self._meta_index.compile(where) if where else (None, True)
+        ids = self._docs if candidates is None else sorted(candidates, key=self._seq.__getitem__)
+
         results: list[VectorResult] = []
-        for doc_id, doc in self._docs.items():
-            if where and not _matches_where(doc["metadata"], where):
+        for doc_id in ids:
+            doc = self._docs[doc_id]
+            if where and not exact_match and not _matches_where(doc["metadata"], where):
                 continue
             dist = _cosine_distance(embedding, doc["embedding"])
             results.append(
@@ -62,7 +80,10 @@ class MemoryStore(VectorStore):
 
     async def delete(self, ids: list[str]) -> bool:
         for doc_id in ids:
-            self._docs.pop(doc_id, None)
+            doc = self._docs.pop(doc_id, None)
+            if doc is not None:
+                self._meta_index.remove(doc_id, doc["metadata"])
+                del self._seq[doc_id]
         return True
 
     async def count(self) -> int:
@@ -70,6 +91,8 @@ class MemoryStore(VectorStore):
 
     async def reset(self) -> bool:
         self._docs.clear()
+        self._meta_index.clear()
+        self._seq.clear()
         self._initialized = True
         return True
 
@@ -0,0 +1,174 @@
+"""Inverted index over vector-store metadata for where-clause pre-filtering.
+
+Maps each filterable field value (category, stakes, status, project,
+feature, pr, and every individual tag) to the set of rows carrying it. A
+ChromaDB-style where clause is compiled into set algebra over those row
+sets, so a filtered query scores only its candidate rows instead of
+evaluating ``_matches_where`` against every document.
+
+Rows are opaque hashable keys: NumpyStore uses matrix row numbers,
+MemoryStore uses document IDs.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from typing import Any, Generic, TypeVar
+
+# Metadata fields written by decision_service.reindex_decision that
+# query_service.query_decisions filters on by equality / $in.
+INDEXED_FIELDS: tuple[str, ...] = ("category", "stakes", "status", "project", "feature", "pr")
+
+_SCALAR_TYPES = (str, int, float, bool)
+
+Row = TypeVar("Row", bound=Hashable)
+
+
+class MetadataIndex(Generic[Row]):
+    """Field-value → row-set postings for the indexed metadata fields.
+
+    ``compile`` returns ``(candidates, exact)``: ``candidates`` is the set
+    of rows that can possibly match (None when the clause cannot be narrowed
+    by the index) and ``exact`` says whether every candidate is known to
+    match, in which case callers can skip the per-row ``_matches_where``
+    check entirely.
+    """
+
+    def __init__(self) -> None:
+        self._postings: dict[str, dict[Any, set[Row]]] = {f: {} for f in INDEXED_FIELDS}
+        self._tags: dict[str, set[Row]] = {}
+        # Rows whose value for a field could not be indexed (non-scalar);
+        # they are always candidates for that field and force a residual check.
+        self._opaque: dict[str, set[Row]] = {f: set() for f in (*INDEXED_FIELDS, "tags")}
+
+    def add(self, row: Row, metadata: dict[str, Any]) -> None:
+        """Index ``row`` under each of its metadata values."""
+        for field in INDEXED_FIELDS:
+            value = metadata.get(field)
+            if value is None:
+                continue
+            if isinstance(value, _SCALAR_TYPES):
+                self._postings[field].setdefault(value, set()).add(row)
+            else:
+                self._opaque[field].add(row)
+        tags = metadata.get("tags")
+        if tags is not None and not isinstance(tags, str):
+            self._opaque["tags"].add(row)
+        for tag in _split_tags(tags):
+            self._tags.setdefault(tag, set()).add(row)
+
+    def remove(self, row: Row, metadata: dict[str, Any]) -> None:
+        """Drop ``row`` from the postings it was added to with ``metadata``."""
+        for field in INDEXED_FIELDS:
+            value = metadata.get(field)
+            if value is None:
+                continue
+            if isinstance(value, _SCALAR_TYPES):
+                _discard(self._postings[field], value, row)
+            else:
+                self._opaque[field].discard(row)
+        self._opaque["tags"].discard(row)
+        for tag in _split_tags(metadata.get("tags")):
+            _discard(self._tags, tag, row)
+
+    def clear(self) -> None:
+        for postings in self._postings.values():
+            postings.clear()
+        for opaque in self._opaque.values():
+            opaque.clear()
+        self._tags.clear()
+
+    def compile(self, where: dict[str, Any]) -> tuple[set[Row] | None, bool]:
+        """Translate a where clause into a candidate row set.
+
+        Top-level keys are ANDed, ``$and`` intersects and ``$or`` unions.
+        Equality and ``$in`` on indexed fields and ``$contains`` on tags are
+        answered from the postings; anything else (ranges, negations,
+        unindexed fields) leaves the set unrestricted and clears ``exact``.
+        """
+        parts: list[set[Row]] = []
+        exact = True
+        for key, condition in where.items():
+            rows, part_exact = self._compile_term(key, condition)
+            exact = exact and part_exact
+            if rows is not None:
+                parts.append(rows)
+        if not parts:
+            return None, False
+        parts.sort(key=len)
+        return set.intersection(*parts), exact
+
+    def _compile_term(self, key: str, condition: Any) -> tuple[set[Row] | None, bool]:
+        if key in ("$and", "$or"):
+            if not isinstance(condition, list) or not condition:
+                return set(), True  # _matches_where rejects malformed groups
+            compiled = [self.compile(sub) for sub in condition]
+            if key == "$and":
+                restricted = [sub_rows for sub_rows, _ in compiled if sub_rows is not None]
+                exact = all(sub_exact for _, sub_exact in compiled)
+                if not restricted:
+                    return None, False
+                restricted.sort(key=len)
+                return set.intersection(*restricted), exact
+            union: set[Row] = set()
+            for sub_rows, _ in compiled:
+                if sub_rows is None:
+                    return None, False
+                union |= sub_rows
+            return union, all(sub_exact for _, sub_exact in compiled)
+
+        if key == "tags" and isinstance(condition, dict) and set(condition) == {"$contains"}:
+            return self._tags_containing(condition["$contains"])
+
+        if key not in self._postings:
+            return None, False
+
+        postings = self._postings[key]
+        opaque = self._opaque[key]
+        if isinstance(condition, dict):
+            if set(condition) != {"$in"} or not isinstance(condition["$in"], list):
+                return None, False
+            values = condition["$in"]
+        elif isinstance(condition, _SCALAR_TYPES):
+            values = [condition]
+        else:
+            return None, False
+
+        rows: set[Row] = set()
+        for value in values:
+            if isinstance(value, _SCALAR_TYPES):
+                rows |= postings.get(value, set())
+        if opaque:
+            return rows | opaque, False
+        return rows, True
+
+    def _tags_containing(self, needle: Any) -> tuple[set[Row] | None, bool]:
+        """Rows whose comma-joined tags string contains ``needle``.
+
+        A needle without commas can only match inside a single tag, so the
+        union over matching tags is exact.
+        """
+        if not isinstance(needle, str) or "," in needle or not needle:
+            return None, False
+        rows: set[Row] = set()
+        for tag, tag_rows in self._tags.items():
+            if needle in tag:
+                rows |= tag_rows
+        if self._opaque["tags"]:
+            return rows | self._opaque["tags"], False
+        return rows, True
+
+
+def _split_tags(tags: Any) -> list[str]:
+    if not isinstance(tags, str) or not tags:
+        return []
+    return [t for t in tags.split(",") if t]
+
+
+def _discard(postings: dict[Any, set[Row]], value: Any, row: Row) -> None:
+    rows = postings.get(value)
+    if rows is None:
+        return
+    rows.discard(row)
+    if not rows:
+        del postings[value]
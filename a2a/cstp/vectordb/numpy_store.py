@@ -0,0 +1,474 @@
+"""NumPy-backed in-process vector store.
+
+Keeps every embedding in one contiguous, pre-normalized float32 matrix so a
+query is a single matrix-vector product followed by an ``argpartition``
+top-k, instead of a pure-Python cosine loop and a full sort over every
+document. Intended for nodes that run without ChromaDB but still need to
+serve a large decision corpus.
+
+Optionally maintains an IVF-flat approximate index (``VECTOR_ANN=ivf``) so
+query cost stops growing linearly with the corpus. Callers can still force
+an exact scan per request with ``query(..., exact=True)``.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any
+
+import numpy as np
+
+from . import VectorResult, VectorStore
+from .ivf import IVFIndex, assign_lists, default_nlist, train_centroids
+from .memory import _matches_where
+from .metadata_index import MetadataIndex
+
+logger = logging.getLogger(__name__)
+
+# Initial matrix capacity; grows by doubling so upserts stay amortized O(dim).
+_INITIAL_CAPACITY = 256
+
+# Rebuild the ANN partition once the corpus has grown this much past the
+# size the centroids were trained on; inserts in between go to existing lists.
+_RETRAIN_GROWTH = 2.0
+
+# Number of stored vectors sampled as queries when measuring recall@k.
+_RECALL_SAMPLE_SIZE = 50
+
+
+class NumpyStore(VectorStore):
+    """In-process vector store backed by a single NumPy matrix.
+
+    Rows of ``_matrix`` are unit-length embeddings; ``_ids[row]`` and
+    ``_row_of[id]`` map between document IDs and rows. Deletes move the
+    last row into the freed slot so the live rows stay contiguous and a
+    query never has to skip holes.
+
+    Configuration via environment variables (constructor args win):
+        - VECTOR_ANN: "ivf" to serve queries from an approximate index by
+          default, or "none" (default) for exact search.
+        - VECTOR_ANN_NPROBE: Lists scanned per approximate query (default 8).
+        - VECTOR_ANN_NLIST: Number of IVF lists (default: sqrt of corpus size).
+        - VECTOR_ANN_MIN_SIZE: Corpus size below which exact search is always
+          used, since it is already cheap (default 1024).
+    """
+
+    def __init__(
+        self,
+        ann: str | None = None,
+        nprobe: int | None = None,
+        nlist: int | None = None,
+        min_index_size: int | None = None,
+    ) -> None:
+        self._matrix: np.ndarray = np.zeros((0, 0), dtype=np.float32)
+        self._size = 0
+        self._dim: int | None = None
+        self._ids: list[str] = []
+        self._documents: list[str] = []
+        self._metadatas: list[dict[str, Any]] = []
+        self._row_of: dict[str, int] = {}
+        self._meta_index: MetadataIndex[int] = MetadataIndex()
+        self._initialized = False
+
+        ann_mode = (ann or os.getenv("VECTOR_ANN") or "none").lower()
+        if ann_mode not in ("ivf", "none"):
+            msg = f"Unknown ANN index mode: {ann_mode}"
+            raise ValueError(msg)
+        self._ann_default = ann_mode == "ivf"
+        self._nprobe = nprobe or int(os.getenv("VECTOR_ANN_NPROBE", "8"))
+        self._nlist = nlist or int(os.getenv("VECTOR_ANN_NLIST", "0"))
+        self._min_index_size = (
+            min_index_size
+            if min_index_size is not None
+            else int(os.getenv("VECTOR_ANN_MIN_SIZE", "1024"))
+        )
+        self._index: IVFIndex | None = None
+        self._build_task: asyncio.Task[None] | None = None
+        # IDs touched while a background build works on a snapshot; they are
+        # re-assigned against the new centroids when the build is installed.
+        self._touched_during_build: set[str] | None = None
+        self._generation = 0
+        self.last_recall: float | None = None
+
+    async def initialize(self) -> None:
+        self._initialized = True
+
+    async def upsert(
+        self,
+        doc_id: str,
+        document: str,
+        embedding: list[float],
+        metadata: dict[str, Any],
+    ) -> bool:
+        vector = _normalize(embedding)
+        if vector is None:
+            logger.warning("Rejected embedding for %s: not a 1-D vector", doc_id)
+            return False
+
+        if self._dim is None or self._size == 0:
+            if self._index is not None:
+                self._drop_index()  # centroids are tied to the old dimension
+            self._dim = vector.shape[0]
+        elif vector.shape[0] != self._dim:
+            logger.warning(
+                "Rejected embedding for %s: dimension %d does not match store dimension %d",
+                doc_id, vector.shape[0], self._dim,
+            )
+            return False
+
+        row = self._row_of.get(doc_id)
+        if row is None:
+            row = self._append_row()
+            self._row_of[doc_id] = row
+            self._ids.append(doc_id)
+            self._documents.append(document)
+            self._metadatas.append(metadata)
+        else:
+            self._meta_index.remove(row, self._metadatas[row])
+            self._documents[row] = document
+            self._metadatas[row] = metadata
+        self._meta_index.add(row, metadata)
+
+        self._matrix[row] = vector
+        if self._index is not None:
+            self._index.add(row, vector)
+        if self._touched_during_build is not None:
+            self._touched_during_build.add(doc_id)
+        return True
+
+    async def query(
+        self,
+        embedding: list[float],
+        n_results: int = 10,
+        where: dict[str, Any] | None = None,
+        *,
+        exact: bool | None = None,
+    ) -> list[VectorResult]:
+        if self._size == 0 or n_results <= 0:
+            return []
+
+        query_vec = _normalize(embedding)
+        if query_vec is None or query_vec.shape[0] != self._dim:
+            logger.warning("Query embedding does not match store dimension %s", self._dim)
+            return []
+
+        want_ann = self._ann_default if exact is None else not exact
+        if want_ann and self._size >= self._min_index_size:
+            index = self._ready_index()
+            if index is not None:
+                top_rows, top_scores = self._search_rows(
+                    query_vec, n_results, where, index.candidates(query_vec)
+                )
+                # A selective filter can leave the probed lists with too few
+                # matches; an exact pass is the only way to fill the page.
+                if top_rows.size >= min(n_results, self._size):
+                    return self._results(top_rows, top_scores)
+
+        return self._results(*self._search_rows(query_vec, n_results, where, None))
+
+    def _search_rows(
+        self,
+        query_vec: np.ndarray,
+        n_results: int,
+        where: dict[str, Any] | None,
+        rows: np.ndarray | None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Score ``rows`` (all rows when None) and return the top-k rows and scores.
+
+        A where clause is first compiled against the metadata index so only
+        candidate rows are visited; ``_matches_where`` runs just for the
+        parts of the clause the index cannot answer exactly.
+        """
+        if where:
+            candidates, exact_match = self._meta_index.compile(where)
+            if candidates is not None:
+                allowed = np.fromiter(candidates, dtype=np.intp, count=len(candidates))
+                allowed.sort()
+                rows = allowed if rows is None else np.intersect1d(rows, allowed, assume_unique=True)
+            if not exact_match:
+                pool = range(self._size) if rows is None else rows.tolist()
+                rows = np.fromiter(
+                    (r for r in pool if _matches_where(self._metadatas[r], where)),
+                    dtype=np.intp,
+                )
+
+        if rows is None:
+            scores = self._matrix[: self._size] @ query_vec
+            top = _top_k(scores, n_results)
+            return top, scores[top]
+
+        if rows.size == 0:
+            return rows, np.empty(0, dtype=np.float32)
+        scores = self._matrix[rows] @ query_vec
+        top = _top_k(scores, n_results)
+        return rows[top], scores[top]
+
+    def _results(self, top_rows: np.ndarray, top_scores: np.ndarray) -> list[VectorResult]:
+        return [
+            VectorResult(
+                id=self._ids[row],
+                document=self._documents[row],
+                metadata=self._metadatas[row],
+                distance=float(1.0 - score),
+            )
+            for row, score in zip(top_rows.tolist(), top_scores.tolist(), strict=True)
+        ]
+
+    async def delete(self, ids: list[str]) -> bool:
+        for doc_id in ids:
+            row = self._row_of.pop(doc_id, None)
+            if row is None:
+                continue
+            if self._touched_during_build is not None:
+                self._touched_during_build.add(doc_id)
+            if self._index is not None:
+                self._index.remove(row)
+            self._meta_index.remove(row, self._metadatas[row])
+            last = self._size - 1
+            if row != last:
+                self._meta_index.remove(last, self._metadatas[last])
+                self._meta_index.add(row, self._metadatas[last])
+                # Move the last row into the hole so live rows stay contiguous.
+                if self._index is not None:
+                    self._index.move(last, row)
+                self._matrix[row] = self._matrix[last]
+                moved_id = self._ids[last]
+                self._ids[row] = moved_id
+                self._documents[row] = self._documents[last]
+                self._metadatas[row] = self._metadatas[last]
+                self._row_of[moved_id] = row
+            self._ids.pop()
+            self._documents.pop()
+            self._metadatas.pop()
+            self._size = last
+        return True
+
+    async def count(self) -> int:
+        return self._size
+
+    async def reset(self) -> bool:
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._size = 0
+        self._dim = None
+        self._ids.clear()
+        self._documents.clear()
+        self._metadatas.clear()
+        self._row_of.clear()
+        self._meta_index.clear()
+        self._initialized = True
+        self._drop_index()
+        return True
+
+    async def get_collection_id(self) -> str | None:
+        return "numpy-collection" if self._initialized or self._size else None
+
+    async def close(self) -> None:
+        self._drop_index()
+
+    # ------------------------------------------------------------------
+    # Approximate index
+    # ------------------------------------------------------------------
+
+    def _ready_index(self) -> IVFIndex | None:
+        """Return the ANN index, scheduling a background (re)build if needed.
+
+        Queries never wait for a build: until the first partition is
+        installed they are answered exactly, and a stale partition keeps
+        serving while its replacement trains.
+        """
+        index = self._index
+        stale = index is None or self._size > index.trained_size * _RETRAIN_GROWTH
+        if stale and self._build_task is None:
+            self._build_task = asyncio.get_running_loop().create_task(self._background_build())
+        return index
+
+    async def _background_build(self) -> None:
+        try:
+            await self.build_index()
+        except Exception:
+            logger.exception("ANN index build failed; queries stay exact")
+        finally:
+            self._build_task = None
+
+    async def build_index(self) -> None:
+        """Train and install a fresh IVF partition over the current corpus.
+
+        k-means and list assignment run in a worker thread on a snapshot of
+        the matrix, so the event loop keeps serving. Rows upserted or deleted
+        meanwhile are re-placed against the new centroids at install time.
+        Recall@10 against exact search is then measured in a worker thread
+        too, on a snapshot of the installed partition, and logged.
+        """
+        if self._size == 0:
+            return
+
+        generation = self._generation
+        snapshot = self._matrix[: self._size].copy()
+        snapshot_ids = list(self._ids)
+        self._touched_during_build = set()
+        nlist = self._nlist or default_nlist(self._size)
+
+        try:
+            centroids, row_lists = await asyncio.to_thread(_train_and_assign, snapshot, nlist)
+            touched = self._touched_during_build
+        finally:
+            self._touched_during_build = None
+
+        if generation != self._generation:
+            return  # reset() ran while training; the snapshot is meaningless now
+
+        current = np.full(self._size, -1, dtype=np.int32)
+        for snap_row, doc_id in enumerate(snapshot_ids):
+            row = self._row_of.get(doc_id)
+            if row is not None and doc_id not in touched:
+                current[row] = row_lists[snap_row]
+        missing = np.flatnonzero(current < 0)
+        if missing.size:
+            current[missing] = assign_lists(self._matrix[missing], centroids)
+
+        self._index = IVFIndex(centroids, current, self._nprobe)
+        self.last_recall = None
+        recall = await asyncio.to_thread(
+            _recall_of_snapshot, self._matrix[: self._size].copy(), centroids, current, self._nprobe,
+        )
+        if generation != self._generation:
+            return
+        self.last_recall = recall
+        logger.info(
+            "ANN index built: %d rows, nlist=%d, nprobe=%d, recall@10=%s",
+            self._size, self._index.nlist, self._nprobe,
+            f"{self.last_recall:.3f}" if self.last_recall is not None else "n/a",
+        )
+
+    def measure_recall(
+        self,
+        k: int = 10,
+        sample_size: int = _RECALL_SAMPLE_SIZE,
+        nprobe: int | None = None,
+    ) -> float | None:
+        """Measure recall@k of the ANN index against exact search.
+
+        Uses a deterministic sample of stored vectors as queries and reports
+        the fraction of exact top-k rows the approximate search also returns.
+
+        Returns:
+            Recall in [0, 1], or None if no index is built.
+        """
+        if self._index is None or self._size == 0:
+            return None
+        return _measure_recall(self._matrix[: self._size], self._index, k, sample_size, nprobe)
+
+    def index_stats(self) -> dict[str, Any]:
+        """Describe the ANN index state for diagnostics."""
+        index = self._index
+        return {
+            "mode": "ivf" if self._ann_default else "exact",
+            "built": index is not None,
+            "building": self._build_task is not None,
+            "nlist": index.nlist if index is not None else None,
+            "nprobe": self._nprobe,
+            "trainedSize": index.trained_size if index is not None else 0,
+            "size": self._size,
+            "recallAt10": self.last_recall,
+        }
+
+    def _drop_index(self) -> None:
+        self._generation += 1
+        self._index = None
+        self.last_recall = None
+        if self._build_task is not None:
+            self._build_task.cancel()
+            self._build_task = None
+
+    def _append_row(self) -> int:
+        """Reserve the next matrix row, growing the backing array if full."""
+        assert self._dim is not None  # noqa: S101
+        capacity = self._matrix.shape[0]
+        if self._matrix.shape[1] != self._dim:
+            self._matrix = np.zeros((_INITIAL_CAPACITY, self._dim), dtype=np.float32)
+        elif self._size >= capacity:
+            grown = np.zeros((max(_INITIAL_CAPACITY, capacity * 2), self._dim), dtype=np.float32)
+            grown[: self._size] = self._matrix[: self._size]
+            self._matrix = grown
+        row = self._size
+        self._size += 1
+        return row
+
+
+def _train_and_assign(vectors: np.ndarray, nlist: int) -> tuple[np.ndarray, np.ndarray]:
+    """Fit IVF centroids on ``vectors`` and assign every row to a list."""
+    centroids = train_centroids(vectors, nlist)
+    return centroids, assign_lists(vectors, centroids)
+
+
+def _normalize(embedding: list[float]) -> np.ndarray | None:
+    """Convert an embedding to a unit-length float32 vector.
+
+    Zero vectors stay zero, which scores a cosine similarity of 0 (distance
+    1.0) against everything — the same answer ``MemoryStore`` gives.
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    if vector.ndim != 1 or vector.size == 0:
+        return None
+    norm = float(np.linalg.norm(vector))
+    if norm == 0.0:
+        return vector
+    return vector / norm
+
+
+def _measure_recall(
+    matrix: np.ndarray,
+    index: IVFIndex,
+    k: int,
+    sample_size: int,
+    nprobe: int | None,
+) -> float | None:
+    """Recall@k of ``index`` over ``matrix`` for a deterministic query sample."""
+    size = matrix.shape[0]
+    rng = np.random.default_rng(0)
+    sample = rng.choice(size, size=min(sample_size, size), replace=False)
+    queries = matrix[sample]
+    exact_scores = queries @ matrix.T
+
+    hits = 0
+    expected = 0
+    for i, query_vec in enumerate(queries):
+        exact_top = set(_top_k(exact_scores[i], k).tolist())
+        rows = index.candidates(query_vec, nprobe)
+        approx_top: set[int] = set()
+        if rows.size:
+            approx_top = set(rows[_top_k(matrix[rows] @ query_vec, k)].tolist())
+        hits += len(exact_top & approx_top)
+        expected += len(exact_top)
+    return hits / expected if expected else None
+
+
+def _recall_of_snapshot(
+    matrix: np.ndarray,
+    centroids: np.ndarray,
+    row_lists: np.ndarray,
+    nprobe: int,
+) -> float | None:
+    """Rebuild the installed partition over a matrix copy and measure recall@10.
+
+    Runs in a worker thread; the copies keep it independent of upserts the
+    loop applies to the live store meanwhile.
+    """
+    if matrix.shape[0] == 0:
+        return None
+    return _measure_recall(matrix, IVFIndex(centroids, row_lists, nprobe), 10, _RECALL_SAMPLE_SIZE, None)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return indices of the ``k`` highest scores, best first.
+
+    ``argpartition`` selects the top-k in O(n); only those k are sorted.
+    Candidates are pre-sorted by index so that ties keep insertion order.
+    """
+    k = min(k, scores.shape[0])
+    if k < scores.shape[0]:
+        candidates = np.sort(np.argpartition(-scores, k - 1)[:k])
+    else:
+        candidates = np.arange(scores.shape[0])
+    order = np.argsort(-scores[candidates], kind="stable")
+    return candidates[order]
@@ -0,0 +1,81 @@
+"""Blocking YAML file I/O, run off the event loop.
+
+Decision writes and YAML lookups used to call ``yaml.dump`` / ``open()``
+straight from ``async`` handlers, stalling every other JSON-RPC and MCP
+request on the loop for the length of a file write. ``run_io`` runs such
+work on a small, bounded thread pool instead, and ``dump_yaml`` serializes
+with libyaml's ``CDumper`` when PyYAML was built with it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import tempfile
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Any, TypeVar
+
+import yaml
+
+T = TypeVar("T")
+
+Dumper: type = getattr(yaml, "CDumper", yaml.Dumper)
+
+
+def dump_yaml(data: Any, stream: IO[str]) -> None:
+    """Write ``data`` to ``stream`` in the decision-file layout."""
+    yaml.dump(data, stream, Dumper=Dumper, default_flow_style=False, sort_keys=False)
+
+
+def write_yaml_atomic(file_path: Path, data: Any) -> None:
+    """Write a YAML file via a temp file in the same directory + os.replace.
+
+    Readers never see a half-written file.
+    """
+    temp_fd, temp_path = tempfile.mkstemp(suffix=".yaml", dir=file_path.parent)
+    try:
+        with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
+            dump_yaml(data, f)
+        os.replace(temp_path, file_path)
+    except Exception:
+        # Clean up temp file on failure
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """Get or create the shared YAML I/O pool.
+
+    ``YAML_IO_WORKERS`` sizes it (default 4). Keeping it small bounds how
+    many file writes run at once without starving the default executor.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = max(1, int(os.getenv("YAML_IO_WORKERS", "4")))
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yaml-io")
+        return _executor
+
+
+async def run_io(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run blocking ``fn(*args, **kwargs)`` on the YAML I/O pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_io_executor(), functools.partial(fn, *args, **kwargs))
+
+
+def shutdown_io_executor() -> None:
+    """Wait for queued I/O and drop the pool (a later call recreates it)."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
@@ -0,0 +1,242 @@
+"""Write-behind YAML mirror of recorded decisions.
+
+With ``YAML_MIRROR=write_behind``, ``record_decision`` saves the decision
+and a ``yaml_mirror`` outbox entry in one store transaction and returns;
+the YAML audit file is written afterwards by a background worker. The
+outbox is durable, so files queued before a crash or restart are written
+once the worker starts again. A failed write is retried with exponential
+backoff, and ``cstp.mirrorStatus`` reports the backlog and its age.
+
+Code that reads a decision's YAML file (``find_decision``) calls
+``flush(decision_id)`` first, so updates and reviews always see the file.
+
+Backends without an outbox (see ``DecisionStore.save_with_outbox``) keep
+the synchronous write; the mirror then stays inactive.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from .storage import DecisionStore, OutboxEntry
+from .storage.path_index import get_path_index
+from .yaml_io import run_io, write_yaml_atomic
+
+logger = logging.getLogger(__name__)
+
+MIRROR_TOPIC = "yaml_mirror"
+
+MIRROR_MODES: frozenset[str] = frozenset({"sync", "write_behind"})
+
+
+def _write_mirror_file(payload: dict[str, Any]) -> None:
+    """Write one queued decision file and index it (runs on the I/O pool)."""
+    file_path = Path(payload["path"])
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    write_yaml_atomic(file_path, payload["data"])
+    get_path_index(payload["base"]).record(payload["decision_id"], file_path)
+
+
+class YAMLMirror:
+    """Background writer draining the ``yaml_mirror`` outbox.
+
+    Attributes:
+        written: Files written since start.
+        failures: Failed write attempts since start (each is retried).
+    """
+
+    def __init__(
+        self,
+        mode: str | None = None,
+        batch_size: int = 32,
+        poll_s: float = 1.0,
+        lease_s: float = 60.0,
+        max_backoff_s: float = 300.0,
+    ) -> None:
+        self.mode = mode or os.getenv("YAML_MIRROR", "sync")
+        if self.mode not in MIRROR_MODES:
+            msg = f"Unknown YAML_MIRROR mode: {self.mode} (expected one of {sorted(MIRROR_MODES)})"
+            raise ValueError(msg)
+        self._batch_size = batch_size
+        self._poll_s = poll_s
+        self._lease_s = lease_s
+        self._max_backoff_s = max_backoff_s
+        self._store: DecisionStore | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._wake = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self.written = 0
+        self.failures = 0
+        self.last_written_at: str | None = None
+
+    @property
+    def active(self) -> bool:
+        """True while records go through the outbox (between start and stop)."""
+        return self._store is not None
+
+    async def start(self, store: DecisionStore) -> bool:
+        """Start the worker over ``store`` if write-behind mode is configured.
+
+        Returns:
+            True if the mirror is now active.
+        """
+        if self.mode != "write_behind" or self._task is not None:
+            return self.active
+        if await store.outbox_status(MIRROR_TOPIC) is None:
+            logger.warning(
+                "YAML_MIRROR=write_behind needs a store with an outbox; "
+                "%s has none, writing YAML synchronously",
+                type(store).__name__,
+            )
+            return False
+        self._store = store
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info("Write-behind YAML mirror started")
+        return True
+
+    async def stop(self) -> None:
+        """Stop the worker after writing whatever is due."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        try:
+            await self.drain()
+        except Exception:
+            logger.warning("Final YAML mirror drain failed", exc_info=True)
+        self._store = None
+
+    def entry(
+        self,
+        decision_id: str,
+        data: dict[str, Any],
+        file_path: Path,
+        base: Path,
+    ) -> tuple[str, dict[str, Any]]:
+        """Outbox entry to save alongside the decision (see ``queued``)."""
+        payload = {
+            "decision_id": decision_id,
+            "base": str(base),
+            "path": str(file_path),
+            "data": data,
+        }
+        return MIRROR_TOPIC, payload
+
+    def queued(self) -> None:
+        """Wake the worker after an entry was committed."""
+        self._wake.set()
+
+    async def flush(self, decision_id: str) -> None:
+        """Write ``decision_id``'s queued file now, if it has one.
+
+        Always asks the store (one indexed lookup): the entry may have been
+        queued by another process sharing the same database.
+        """
+        if self._store is None:
+            return
+        async with self._lock:
+            entries = await self._store.claim_outbox(
+                MIRROR_TOPIC, lease_s=self._lease_s, decision_id=decision_id,
+            )
+            await self._process(entries)
+
+    async def drain(self) -> int:
+        """Write every due file; returns how many were written.
+
+        Stops early at a batch in which every write failed, so entries that
+        keep failing wait for their backoff instead of spinning here.
+        """
+        if self._store is None:
+            return 0
+        written = 0
+        while True:
+            async with self._lock:
+                entries = await self._store.claim_outbox(
+                    MIRROR_TOPIC, limit=self._batch_size, lease_s=self._lease_s,
+                )
+                batch_written = await self._process(entries) if entries else 0
+            written += batch_written
+            if batch_written == 0:
+                return written
+
+    async def status(self) -> dict[str, Any]:
+        """Backlog, lag, and worker counters."""
+        queue: dict[str, Any] | None = None
+        if self._store is not None:
+            queue = await self._store.outbox_status(MIRROR_TOPIC)
+        queue = queue or {}
+        oldest = queue.get("oldest_created_at")
+        lag = 0.0
+        if oldest:
+            lag = max(0.0, (datetime.now(UTC) - datetime.fromisoformat(oldest)).total_seconds())
+        return {
+            "mode": self.mode,
+            "active": self.active,
+            "pending": queue.get("pending", 0),
+            "retrying": queue.get("retrying", 0),
+            "oldest_pending_at": oldest,
+            "lag_seconds": round(lag, 3),
+            "max_attempts": queue.get("max_attempts", 0),
+            "last_error": queue.get("last_error"),
+            "written": self.written,
+            "failures": self.failures,
+            "last_written_at": self.last_written_at,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if await self.drain() == 0:
+                    self._wake.clear()
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(self._wake.wait(), self._poll_s)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("YAML mirror worker iteration failed")
+                await asyncio.sleep(self._poll_s)
+
+    async def _process(self, entries: list[OutboxEntry]) -> int:
+        assert self._store is not None  # noqa: S101
+        done: list[OutboxEntry] = []
+        for entry in entries:
+            try:
+                await run_io(_write_mirror_file, entry.payload or {})
+                done.append(entry)
+            except Exception as e:
+                self.failures += 1
+                delay = min(self._max_backoff_s, 2.0 ** entry.attempts)
+                logger.warning(
+                    "YAML mirror write for %s failed (attempt %d, retry in %.0fs): %s",
+                    entry.decision_id, entry.attempts, delay, e,
+                )
+                await self._store.retry_outbox(entry.id, f"{type(e).__name__}: {e}", delay)
+        await self._store.complete_outbox([entry.id for entry in done])
+        if done:
+            self.written += len(done)
+            self.last_written_at = datetime.now(UTC).isoformat()
+        return len(done)
+
+
+_mirror: YAMLMirror | None = None
+
+
+def get_yaml_mirror() -> YAMLMirror:
+    """Get or create the singleton YAMLMirror (``YAML_MIRROR`` picks the mode)."""
+    global _mirror
+    if _mirror is None:
+        _mirror = YAMLMirror()
+    return _mirror
+
+
+def set_yaml_mirror(mirror: YAMLMirror | None) -> None:
+    """Set the YAMLMirror instance (for testing)."""
+    global _mirror
+    _mirror = mirror
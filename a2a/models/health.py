@@ -1,7 +1,8 @@
 """Health check response model."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any
 
 
 @dataclass(frozen=True, slots=True)
@@ -13,18 +14,23 @@ class HealthResponse:
         version: Server version string.
         uptime_seconds: Seconds since server start.
         timestamp: Current server time.
+        metrics: Optional runtime counters, keyed by component.
     """
 
     status: str
     version: str
     uptime_seconds: float
     timestamp: datetime
+    metrics: dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self) -> dict[str, str | float]:
+    def to_dict(self) -> dict[str, Any]:
         """Convert to JSON-serializable dictionary."""
-        return {
+        result: dict[str, Any] = {
             "status": self.status,
             "version": self.version,
             "uptime_seconds": self.uptime_seconds,
             "timestamp": self.timestamp.isoformat(),
         }
+        if self.metrics:
+            result["metrics"] = self.metrics
+        return result
@@ -10,6 +10,7 @@ import time
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -18,6 +19,10 @@ from fastapi.responses import JSONResponse
 from .auth import AuthManager, set_auth_manager, verify_bearer_token
 from .config import Config
 from .cstp import CstpDispatcher, get_dispatcher, register_methods
+from .cstp.embeddings.cache import embedding_cache_stats
+from .cstp.loop_lag import get_loop_lag_monitor, loop_lag_stats
+from .cstp.storage.yaml_cache import yaml_cache_stats
+from .cstp.vectordb.factory import vector_index_stats
 from .models import AgentCapabilities, AgentCard, HealthResponse
 from .models.jsonrpc import (
     INVALID_REQUEST,
@@ -39,6 +44,8 @@ async def lifespan(app: FastAPI):
     """
     # Use monotonic time for uptime (not affected by system clock changes)
     app.state.start_time = time.monotonic()
+    # Shows whether synchronous work in a handler is stalling the loop
+    get_loop_lag_monitor().start()
 
     # Load configuration (use provided or load from file)
     if not hasattr(app.state, "config") or app.state.config is None:
@@ -84,6 +91,16 @@ async def lifespan(app: FastAPI):
             migrated = await auto_migrate_if_incomplete(decision_store)
             if migrated > 0:
                 logger.info("Auto-migrated %d decisions from YAML to SQLite", migrated)
+
+        # YAML_MIRROR=write_behind: drain the YAML outbox in the background
+        from .cstp.yaml_mirror import get_yaml_mirror
+
+        await get_yaml_mirror().start(decision_store)
+
+        # RECORD_INDEXING=queued: embed and upsert recorded decisions in the background
+        from .cstp.index_pipeline import get_index_pipeline
+
+        await get_index_pipeline().start(decision_store)
     except Exception:
         logger.warning("Decision store initialization failed", exc_info=True)
         set_decision_store(None)
@@ -147,6 +164,54 @@ async def lifespan(app: FastAPI):
         yield
 
     # Cleanup
+    await get_loop_lag_monitor().stop()
+
+    # Stop the index workers before their embedding client and stores close;
+    # anything still queued is indexed after the next start
+    try:
+        from .cstp.index_pipeline import get_index_pipeline
+
+        await get_index_pipeline().stop()
+    except Exception:
+        logger.warning("Index pipeline stop failed", exc_info=True)
+
+    # Persist keyword-index changes made since the last snapshot
+    try:
+        from .cstp.bm25_index import save_keyword_index
+
+        if await save_keyword_index():
+            logger.info("BM25 index snapshot saved")
+    except Exception:
+        logger.warning("BM25 index snapshot failed", exc_info=True)
+
+    # Close the pooled embedding HTTP client and the embedding cache
+    try:
+        from .cstp.embeddings.cache import set_embedding_cache
+        from .cstp.embeddings.factory import close_embedding_provider
+
+        await close_embedding_provider()
+        set_embedding_cache(None)
+    except Exception:
+        logger.warning("Embedding provider close failed", exc_info=True)
+
+    # Close the vector store's shared HTTP client
+    try:
+        from .cstp.vectordb.factory import close_vector_store
+
+        await close_vector_store()
+    except Exception:
+        logger.warning("Vector store close failed", exc_info=True)
+
+    # Let queued YAML writes finish before the store goes away
+    try:
+        from .cstp.yaml_io import shutdown_io_executor
+        from .cstp.yaml_mirror import get_yaml_mirror
+
+        await get_yaml_mirror().stop()
+        shutdown_io_executor()
+    except Exception:
+        logger.warning("YAML I/O pool shutdown failed", exc_info=True)
+
     # F050: Close decision store
     if getattr(app.state, "decision_store", None):
         try:
@@ -252,11 +317,30 @@ def _register_routes(app: FastAPI) -> None:
         """Health check endpoint."""
         start_time = getattr(request.app.state, "start_time", 0.0)
         uptime = time.monotonic() - start_time if start_time else 0.0
+        metrics: dict[str, Any] = {}
+        cache_stats = embedding_cache_stats()
+        if cache_stats is not None:
+            metrics["embedding_cache"] = cache_stats
+        yaml_stats = yaml_cache_stats()
+        if yaml_stats is not None:
+            metrics["yaml_cache"] = yaml_stats
+        lag_stats = loop_lag_stats()
+        if lag_stats is not None:
+            metrics["event_loop_lag"] = lag_stats
+        index_stats = vector_index_stats()
+        if index_stats is not None:
+            metrics["vector_index"] = index_stats
+        decision_store = getattr(request.app.state, "decision_store", None)
+        if decision_store is not None:
+            store_metrics = decision_store.metrics()
+            if store_metrics:
+                metrics["decision_store"] = store_metrics
         response = HealthResponse(
             status="healthy",
             version="0.7.0",
             uptime_seconds=uptime,
             timestamp=datetime.now(UTC),
+            metrics=metrics,
         )
         return JSONResponse(content=response.to_dict())
 
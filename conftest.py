@@ -23,6 +23,12 @@ os.environ.setdefault("DASHBOARD_USER", "admin")
 os.environ.setdefault("DASHBOARD_PASS", "test-pass")
 os.environ.setdefault("SECRET_KEY", "test-secret")
 os.environ.setdefault("CSTP_TOKEN", "test-token")
+# Keep the BM25 keyword index memory-only unless a test points it at tmp_path.
+os.environ.setdefault("BM25_INDEX_PATH", "")
+# Likewise keep the embedding cache off disk.
+os.environ.setdefault("EMBEDDING_CACHE_PATH", "")
+# And the decision id -> path index, so no sidecar lands in test trees.
+os.environ.setdefault("DECISION_INDEX_PATH", "")
 
 
 @pytest.fixture(autouse=True)
@@ -38,11 +44,47 @@ def _isolated_decision_store():
     per-test isolation for free.
 
     Tests that need a specific backend still call `set_decision_store()`
-    themselves — the later call wins for the rest of that test.
+    themselves — the later call wins for the rest of that test. The shared
+    BM25 keyword index is dropped too, so it is rebuilt from this store, and
+    so is the embedding cache, so mocked providers see every embed call,
+    and the decision path indexes and parsed-YAML cache, so each test's tree
+    is scanned and parsed afresh, and the YAML mirror and index pipeline, so
+    records default to synchronous YAML writes and inline indexing.
     """
+    from a2a.cstp.bm25_index import set_keyword_index
+    from a2a.cstp.embeddings.cache import set_embedding_cache
+    from a2a.cstp.index_pipeline import set_index_pipeline
     from a2a.cstp.storage.factory import set_decision_store
     from a2a.cstp.storage.memory import MemoryDecisionStore
+    from a2a.cstp.storage.path_index import reset_path_indexes
+    from a2a.cstp.storage.yaml_cache import set_yaml_cache
+    from a2a.cstp.yaml_mirror import set_yaml_mirror
 
     set_decision_store(MemoryDecisionStore())
+    set_keyword_index(None)
+    set_embedding_cache(None)
+    reset_path_indexes()
+    set_yaml_cache(None)
+    set_yaml_mirror(None)
+    set_index_pipeline(None)
     yield
     set_decision_store(None)
+    set_keyword_index(None)
+    set_embedding_cache(None)
+    reset_path_indexes()
+    set_yaml_cache(None)
+    set_yaml_mirror(None)
+    set_index_pipeline(None)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_graph_edges(tmp_path, monkeypatch):
+    """Persist graph edges under `tmp_path` instead of `data/graph_edges.jsonl`.
+
+    `GRAPH_DATA_PATH` is read once at import, so an env default here would be
+    shared by the whole session; patching the module constant gives every
+    NetworkX graph store created during a test its own file.
+    """
+    from a2a.cstp.graphdb import networkx_store
+
+    monkeypatch.setattr(networkx_store, "GRAPH_DATA_PATH", str(tmp_path / "graph_edges.jsonl"))
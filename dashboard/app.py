@@ -119,6 +119,7 @@ def index() -> str:
     try:
         decisions_list, _ = cstp.list_decisions(
             limit=50, date_from=date_from_str, date_to=date_to_str,
+            include_total=False,
         )
     except CSTPError:
         decisions_list = []
@@ -1,4 +1,5 @@
 """Sync client for CSTP JSON-RPC API."""
+from collections.abc import Iterator
 from typing import Any
 
 import httpx
@@ -96,7 +97,8 @@ class CSTPClient:
         order: str = "desc",
         date_from: str | None = None,
         date_to: str | None = None,
-    ) -> tuple[list[Decision], int]:
+        include_total: bool = True,
+    ) -> tuple[list[Decision], int | None]:
         """List decisions with server-side filtering, sorting, and pagination.
 
         Uses cstp.listDecisions (SQL-backed) for structured queries.
@@ -112,9 +114,10 @@ class CSTPClient:
             order: Sort direction (asc, desc)
             date_from: ISO date string for start of range
             date_to: ISO date string for end of range
+            include_total: Set False to skip the server-side count
 
         Returns:
-            Tuple of (list of Decision objects, total count)
+            Tuple of (list of Decision objects, total count or None)
         """
         params: dict[str, Any] = {"limit": limit, "offset": offset}
         if category:
@@ -133,6 +136,8 @@ class CSTPClient:
             params["dateFrom"] = date_from
         if date_to:
             params["dateTo"] = date_to
+        if not include_total:
+            params["includeTotal"] = False
 
         result = self._call("cstp.listDecisions", params)
 
@@ -141,6 +146,61 @@ class CSTPClient:
 
         return decisions, total
 
+    def iter_decisions(
+        self,
+        page_size: int = 500,
+        category: str | None = None,
+        stakes: str | None = None,
+        status: str | None = None,
+        sort: str = "created_at",
+        order: str = "desc",
+        date_from: str | None = None,
+        date_to: str | None = None,
+    ) -> Iterator[Decision]:
+        """Iterate over every matching decision, one page at a time.
+
+        Follows the cstp.listDecisions ``nextCursor`` token and skips the
+        total count, so each page costs the same however deep it is.
+
+        Args:
+            page_size: Decisions fetched per request (1-500)
+            category: Filter by category
+            stakes: Filter by stakes level
+            status: Filter by review status (pending, reviewed)
+            sort: Sort column (created_at, confidence, category, stakes, status)
+            order: Sort direction (asc, desc)
+            date_from: ISO date string for start of range
+            date_to: ISO date string for end of range
+
+        Yields:
+            Decision objects in sort order
+        """
+        params: dict[str, Any] = {
+            "limit": page_size,
+            "sort": sort,
+            "order": order,
+            "includeTotal": False,
+        }
+        if category:
+            params["category"] = category
+        if stakes:
+            params["stakes"] = stakes
+        if status:
+            params["status"] = status
+        if date_from:
+            params["dateFrom"] = date_from
+        if date_to:
+            params["dateTo"] = date_to
+
+        while True:
+            result = self._call("cstp.listDecisions", params)
+            for d in result.get("decisions", []):
+                yield Decision.from_dict(d)
+            cursor = result.get("nextCursor")
+            if not cursor:
+                return
+            params = {**params, "cursor": cursor}
+
     def search_decisions(
         self,
         query: str,
@@ -434,6 +434,41 @@ def test_list_decisions_omits_falsy_optional_params() -> None:
     assert set(params.keys()) == {"limit", "offset"}
 
 
+def test_list_decisions_include_total_false() -> None:
+    """Test list_decisions can skip the server-side count."""
+    from dashboard.cstp_client import CSTPClient
+
+    client = CSTPClient("http://localhost:9991", "test-token")
+    mock_result = {"decisions": [], "total": None}
+
+    with patch.object(client, "_call", return_value=mock_result) as mock_call:
+        _, total = client.list_decisions(include_total=False)
+
+    assert mock_call.call_args[0][1]["includeTotal"] is False
+    assert total is None
+
+
+def test_iter_decisions_follows_cursor() -> None:
+    """Test iter_decisions pages with nextCursor until it runs out."""
+    from dashboard.cstp_client import CSTPClient
+
+    client = CSTPClient("http://localhost:9991", "test-token")
+    pages = [
+        {"decisions": [{"id": "dec00001"}, {"id": "dec00002"}], "nextCursor": "c1"},
+        {"decisions": [{"id": "dec00003"}], "nextCursor": None},
+    ]
+
+    with patch.object(client, "_call", side_effect=pages) as mock_call:
+        ids = [d.id for d in client.iter_decisions(page_size=2, category="process")]
+
+    assert ids == ["dec00001", "dec00002", "dec00003"]
+    first, second = (c[0][1] for c in mock_call.call_args_list)
+    assert "cursor" not in first
+    assert first["includeTotal"] is False
+    assert first["category"] == "process"
+    assert second["cursor"] == "c1"
+
+
 # --- Issue #177: search_decisions via cstp.queryDecisions ---
 
 
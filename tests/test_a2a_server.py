@@ -77,6 +77,21 @@ class TestHealthEndpoint:
         assert "uptime_seconds" in data
         assert isinstance(data["uptime_seconds"], (int, float))
 
+    def test_health_reports_vector_index(self, client: TestClient) -> None:
+        """Health metrics include the ANN index state of a NumpyStore."""
+        from a2a.cstp.vectordb.factory import set_vector_store
+        from a2a.cstp.vectordb.numpy_store import NumpyStore
+
+        set_vector_store(NumpyStore(ann="ivf"))
+        try:
+            data = client.get("/health").json()
+        finally:
+            set_vector_store(None)
+        index = data["metrics"]["vector_index"]
+        assert index["mode"] == "ivf"
+        assert index["built"] is False
+        assert index["recallAt10"] is None
+
 
 class TestAgentCardEndpoint:
     """Tests for GET /.well-known/agent.json."""
@@ -0,0 +1,123 @@
+"""Tests for ChromaDBStore's shared HTTP client and bulk operations."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from a2a.cstp.vectordb import VectorDocument
+from a2a.cstp.vectordb.chromadb import ChromaDBStore
+
+
+class _FakeChroma:
+    """Minimal ChromaDB v2 API recording each request."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str, dict]] = []
+        self.docs: dict[str, dict] = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content) if request.content else {}
+        path = request.url.path
+        self.requests.append((request.method, path, body))
+        if path.endswith("/collections") and request.method == "GET":
+            return httpx.Response(200, json=[{"name": "decisions", "id": "c1"}])
+        if path.endswith("/upsert"):
+            for i, doc_id in enumerate(body["ids"]):
+                self.docs[doc_id] = {"metadata": body["metadatas"][i]}
+            return httpx.Response(200, json={})
+        if path.endswith("/delete"):
+            for doc_id in body["ids"]:
+                self.docs.pop(doc_id, None)
+            return httpx.Response(200, json={})
+        return httpx.Response(404, json={"error": "NotFoundError"})
+
+    def calls(self, suffix: str) -> list[dict]:
+        return [body for _, path, body in self.requests if path.endswith(suffix)]
+
+
+def _store(api: _FakeChroma) -> ChromaDBStore:
+    store = ChromaDBStore(url="http://chroma.test", collection="decisions")
+    store._get_client = lambda: _client(store, api)  # type: ignore[method-assign]
+    return store
+
+
+def _client(store: ChromaDBStore, api: _FakeChroma) -> httpx.AsyncClient:
+    if store._client is None:
+        store._client = httpx.AsyncClient(transport=httpx.MockTransport(api))
+    return store._client
+
+
+async def _upsert_and_keep_client(store: ChromaDBStore) -> httpx.AsyncClient:
+    await store.upsert_many(_docs(1))
+    store._client_loop = asyncio.get_running_loop()
+    return store._client
+
+
+def _docs(n: int) -> list[VectorDocument]:
+    return [VectorDocument(f"d{i}", f"text {i}", [0.1, 0.2], {"i": i}) for i in range(n)]
+
+
+class TestChromaDBStore:
+    """Bulk writes batch documents and reuse one client."""
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_batches(self, monkeypatch) -> None:
+        monkeypatch.setattr("a2a.cstp.vectordb.chromadb._BATCH_SIZE", 4)
+        api = _FakeChroma()
+        store = _store(api)
+        assert await store.upsert_many(_docs(10)) is True
+        assert [len(b["ids"]) for b in api.calls("/upsert")] == [4, 4, 2]
+        assert len(api.docs) == 10
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_delete_many_batches(self, monkeypatch) -> None:
+        monkeypatch.setattr("a2a.cstp.vectordb.chromadb._BATCH_SIZE", 4)
+        api = _FakeChroma()
+        store = _store(api)
+        await store.upsert_many(_docs(6))
+        assert await store.delete_many([f"d{i}" for i in range(6)]) is True
+        assert [len(b["ids"]) for b in api.calls("/delete")] == [4, 2]
+        assert api.docs == {}
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_single_upsert_goes_through_batch_path(self) -> None:
+        api = _FakeChroma()
+        store = _store(api)
+        assert await store.upsert("d1", "text", [0.1], {"category": "x"}) is True
+        assert api.calls("/upsert")[0]["ids"] == ["d1"]
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_client_shared_and_closed(self) -> None:
+        api = _FakeChroma()
+        store = _store(api)
+        await store.upsert_many(_docs(2))
+        client = store._client
+        await store.delete(["d0"])
+        assert store._client is client
+        await store.close()
+        assert client.is_closed
+        assert store._client is None
+
+    def test_client_from_previous_loop_closed(self) -> None:
+        api = _FakeChroma()
+        store = _store(api)
+        stale = asyncio.run(_upsert_and_keep_client(store))
+        assert asyncio.run(_upsert_and_keep_client(store)) is not stale
+        assert stale.is_closed
+        assert len(api.calls("/upsert")) == 2
+
+    @pytest.mark.asyncio
+    async def test_default_upsert_many_loops_upsert(self) -> None:
+        from a2a.cstp.vectordb.memory import MemoryStore
+
+        store = MemoryStore()
+        await store.initialize()
+        assert await store.upsert_many(_docs(3)) is True
+        assert await store.count() == 3
+        assert await store.delete_many(["d0", "d1"]) is True
+        assert await store.count() == 1
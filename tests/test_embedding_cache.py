@@ -0,0 +1,130 @@
+"""Tests for the content-addressed embedding cache."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from a2a.cstp.embeddings import EmbeddingProvider
+from a2a.cstp.embeddings.cache import EmbeddingCache, cache_key, set_embedding_cache
+from a2a.cstp.embeddings.factory import set_embedding_provider
+
+
+class _CountingProvider(EmbeddingProvider):
+    """Deterministic provider that counts the texts it embeds."""
+
+    def __init__(self, model: str = "test-model", dims: int = 3) -> None:
+        self.embedded: list[str] = []
+        self._model = model
+        self._dims = dims
+
+    async def embed(self, text: str) -> list[float]:
+        self.embedded.append(text)
+        return [float(len(text)), 0.1, 1 / 3][: self._dims]
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        return [await self.embed(t) for t in texts]
+
+    @property
+    def dimensions(self) -> int:
+        return self._dims
+
+    @property
+    def model_name(self) -> str:
+        return self._model
+
+
+class TestEmbeddingCache:
+    """Memory and SQLite tiers."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_text_served_from_memory(self) -> None:
+        provider = _CountingProvider()
+        cache = EmbeddingCache()
+        first = await cache.embed(provider, "hello")
+        assert await cache.embed(provider, "hello") == first
+        assert provider.embedded == ["hello"]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_key_includes_model_and_dimensions(self) -> None:
+        cache = EmbeddingCache()
+        a, b = _CountingProvider("m1"), _CountingProvider("m2")
+        await cache.embed(a, "same")
+        await cache.embed(b, "same")
+        assert a.embedded == ["same"]
+        assert b.embedded == ["same"]
+        assert cache_key(a, "same") != cache_key(_CountingProvider("m1", dims=2), "same")
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self) -> None:
+        provider = _CountingProvider()
+        cache = EmbeddingCache(max_entries=2)
+        for text in ("a", "b", "a", "c", "b"):
+            await cache.embed(provider, text)
+        # "b" was the least recently used when "c" arrived.
+        assert provider.embedded == ["a", "b", "c", "b"]
+
+    @pytest.mark.asyncio
+    async def test_persistent_tier_survives_restart(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "cache.db")
+        provider = _CountingProvider()
+        cache = EmbeddingCache(db_path=path)
+        vector = await cache.embed(provider, "persist me")
+        cache.close()
+
+        reopened = EmbeddingCache(db_path=path)
+        assert await reopened.embed(provider, "persist me") == vector
+        assert provider.embedded == ["persist me"]
+        assert reopened.stats()["disk_hits"] == 1
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_only_sends_misses(self, tmp_path: Path) -> None:
+        provider = _CountingProvider()
+        cache = EmbeddingCache(db_path=str(tmp_path / "cache.db"))
+        await cache.embed(provider, "known")
+        provider.embedded.clear()
+
+        vectors = await cache.embed_batch(provider, ["known", "new", "new"])
+        assert vectors == [[5.0, 0.1, 1 / 3], [3.0, 0.1, 1 / 3], [3.0, 0.1, 1 / 3]]
+        assert provider.embedded == ["new"]
+        cache.close()
+
+
+class TestCacheWiring:
+    """generate_embedding and query_decisions go through the cache."""
+
+    @pytest.mark.asyncio
+    async def test_generate_embedding_cached(self) -> None:
+        from a2a.cstp.decision_service import generate_embedding
+
+        provider = _CountingProvider()
+        set_embedding_provider(provider)
+        set_embedding_cache(EmbeddingCache())
+        try:
+            assert await generate_embedding("text") == await generate_embedding("text")
+            assert provider.embedded == ["text"]
+        finally:
+            set_embedding_provider(None)
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_embeds_once(self) -> None:
+        from a2a.cstp.query_service import query_decisions
+        from a2a.cstp.vectordb.factory import set_vector_store
+
+        provider = _CountingProvider()
+        store = AsyncMock()
+        store.get_collection_id.return_value = "coll"
+        store.query.return_value = []
+        set_embedding_provider(provider)
+        set_vector_store(store)
+        set_embedding_cache(EmbeddingCache())
+        try:
+            await query_decisions("cache me")
+            await query_decisions("cache me")
+            assert provider.embedded == ["cache me"]
+        finally:
+            set_embedding_provider(None)
+            set_vector_store(None)
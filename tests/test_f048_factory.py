@@ -79,6 +79,16 @@ class TestEmbeddingProviderFactory:
         provider = create_embedding_provider()
         assert isinstance(provider, GeminiEmbeddings)
 
+    def test_local_provider(self, monkeypatch) -> None:
+        """EMBEDDING_PROVIDER=local creates the offline hashing provider."""
+        from a2a.cstp.embeddings.local import HashingEmbeddings
+
+        monkeypatch.setenv("EMBEDDING_PROVIDER", "local")
+        monkeypatch.setenv("LOCAL_EMBEDDING_DIM", "64")
+        provider = create_embedding_provider()
+        assert isinstance(provider, HashingEmbeddings)
+        assert provider.dimensions == 64
+
     def test_unknown_provider_raises(self, monkeypatch) -> None:
         """Unknown provider raises ValueError."""
         monkeypatch.setenv("EMBEDDING_PROVIDER", "invalid")
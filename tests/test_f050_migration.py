@@ -438,6 +438,76 @@ class TestMigrationGateUsesIds:
         assert await store.get("ccc33333") is not None
 
 
+class TestBulkMigration:
+    """The startup path checks existence in bulk and imports in batches."""
+
+    @pytest.mark.asyncio
+    async def test_gate_never_hydrates_decisions(self, decisions_dir: Path) -> None:
+        from unittest.mock import AsyncMock
+
+        store = MemoryDecisionStore()
+        await store.initialize()
+        await migrate_yaml_to_store(store, str(decisions_dir))
+
+        store.get = AsyncMock(side_effect=AssertionError("per-ID get"))  # type: ignore[method-assign]
+        store.get_many = AsyncMock(side_effect=AssertionError("hydration"))  # type: ignore[method-assign]
+        assert await auto_migrate_if_empty(store, str(decisions_dir)) == 0
+
+    @pytest.mark.asyncio
+    async def test_imports_in_batches(
+        self, decisions_dir: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from a2a.cstp.storage import migrate
+
+        monkeypatch.setattr(migrate, "_IMPORT_BATCH", 2)
+        store = MemoryDecisionStore()
+        await store.initialize()
+        batches: list[int] = []
+        original = store.save_many
+
+        async def recording(items: list[tuple[str, dict[str, Any]]]) -> int:
+            batches.append(len(items))
+            return await original(items)
+
+        store.save_many = recording  # type: ignore[method-assign]
+        assert await migrate_yaml_to_store(store, str(decisions_dir)) == 3
+        assert batches == [2, 1]
+
+    @pytest.mark.asyncio
+    async def test_process_pool_parse_matches_in_process(
+        self, decisions_dir: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from a2a.cstp.storage import migrate
+
+        bad = decisions_dir / "2026" / "02" / "2026-02-18-decision-bad00002.yaml"
+        bad.write_text("", encoding="utf-8")
+        files = sorted(decisions_dir.rglob("*-decision-*.yaml"))
+
+        monkeypatch.setattr(migrate, "_PARALLEL_PARSE_MIN", 1)
+        monkeypatch.setattr(migrate, "_PARSE_WORKERS", 2)
+        parallel = await migrate._parse_yaml_files(files)
+
+        assert parallel == [_parse_yaml_decision(f) for f in files]
+        assert sum(r is None for r in parallel) == 1
+
+    @pytest.mark.asyncio
+    async def test_sqlite_resume_after_delete(self, decisions_dir: Path) -> None:
+        from a2a.cstp.storage.sqlite import SQLiteDecisionStore
+
+        store = SQLiteDecisionStore(db_path=str(decisions_dir / "m.db"))
+        await store.initialize()
+        try:
+            assert await auto_migrate_if_empty(store, str(decisions_dir)) == 3
+            await store.delete("bbb22222")
+            assert await auto_migrate_if_empty(store, str(decisions_dir)) == 3
+            assert await store.existing_ids(["aaa11111", "bbb22222", "ccc33333"]) == {
+                "aaa11111", "bbb22222", "ccc33333",
+            }
+            assert await auto_migrate_if_empty(store, str(decisions_dir)) == 0
+        finally:
+            await store.close()
+
+
 class TestReviewDecisionStoreIsAuthoritative:
     """Same class of bug as recordDecision: calibration reads the store, so a
     swallowed outcome-write leaves an acknowledged review that never lands.
@@ -710,7 +780,9 @@ class TestFailedStoreWritesAreRetrySafe:
             "status": "pending",
         })
 
-        store.get = AsyncMock(side_effect=OSError("read failed"))  # type: ignore[method-assign]
+        store.existing_ids = AsyncMock(  # type: ignore[method-assign]
+            side_effect=OSError("read failed")
+        )
         assert await update_decision_outcome(path, "success", "PR merged") is False
 
         reloaded = yaml.safe_load(path.read_text(encoding="utf-8"))
@@ -84,6 +84,145 @@ def _sample_full(overrides: dict[str, Any] | None = None) -> dict[str, Any]:
     return data
 
 
+# ---------------------------------------------------------------------------
+# get_many / version
+# ---------------------------------------------------------------------------
+
+
+class TestGetMany:
+    """Batched lookup by ID."""
+
+    async def test_returns_found_ids_only(self, store: DecisionStore) -> None:
+        await store.save("gm01", _sample_full())
+        await store.save("gm02", _sample({"decision": "Second", "tags": ["x"]}))
+
+        found = await store.get_many(["gm01", "missing", "gm02"])
+        assert set(found) == {"gm01", "gm02"}
+        assert found["gm02"]["tags"] == ["x"]
+
+    async def test_matches_get(self, store: DecisionStore) -> None:
+        await store.save("gm01", _sample_full())
+        single = await store.get("gm01")
+        assert (await store.get_many(["gm01"]))["gm01"] == single
+
+    async def test_empty(self, store: DecisionStore) -> None:
+        assert await store.get_many([]) == {}
+
+    async def test_fields_projection(self, store: DecisionStore) -> None:
+        full = _sample_full({"outcome": "success", "actual_result": "Worked"})
+        await store.save("gm01", full)
+
+        found = await store.get_many(["gm01"], fields=("category", "tags", "actual_result"))
+        assert found["gm01"]["id"] == "gm01"
+        assert found["gm01"]["category"] == full["category"]
+        assert found["gm01"]["tags"] == full["tags"]
+        assert found["gm01"]["actual_result"] == "Worked"
+        assert "reasons" not in found["gm01"]
+        assert "context" not in found["gm01"]
+        assert "bridge" not in found["gm01"]
+
+    async def test_fields_children_match_full_get(self, store: DecisionStore) -> None:
+        await store.save("gm01", _sample_full())
+        single = await store.get("gm01")
+        found = await store.get_many(["gm01"], fields=("reasons", "bridge", "unknown"))
+        assert found["gm01"]["reasons"] == single["reasons"]
+        assert found["gm01"]["bridge"] == single["bridge"]
+        assert "unknown" not in found["gm01"]
+
+
+class TestBulkImport:
+    """existing_ids / save_many used by the startup migration."""
+
+    async def test_existing_ids(self, store: DecisionStore) -> None:
+        await store.save("ex01", _sample())
+        await store.save("ex02", _sample())
+        assert await store.existing_ids(["ex01", "nope", "ex02", "ex01"]) == {"ex01", "ex02"}
+        assert await store.existing_ids([]) == set()
+
+    async def test_existing_ids_spans_in_chunks(self, store: DecisionStore) -> None:
+        ids = [f"ch{i:05d}" for i in range(2000)]
+        await store.save_many([(i, _sample()) for i in ids[::3]])
+        assert await store.existing_ids(ids) == set(ids[::3])
+
+    async def test_save_many_round_trips(self, store: DecisionStore) -> None:
+        saved = await store.save_many([
+            ("sm01", _sample_full()),
+            ("sm02", _sample({"decision": "Second", "tags": ["x"]})),
+        ])
+        assert saved == 2
+        assert (await store.get("sm02"))["tags"] == ["x"]
+        assert (await store.get("sm01"))["decision"] == _sample_full()["decision"]
+
+    async def test_sqlite_save_many_skips_bad_record(
+        self, sqlite_store: SQLiteDecisionStore,
+    ) -> None:
+        saved = await sqlite_store.save_many([
+            ("sm01", _sample()),
+            ("sm02", _sample({"confidence": None})),  # violates NOT NULL
+            ("sm03", _sample()),
+        ])
+        assert saved == 2
+        assert await sqlite_store.existing_ids(["sm01", "sm02", "sm03"]) == {"sm01", "sm03"}
+        # One transaction on the writer for the whole batch.
+        assert sqlite_store.metrics()["writer"]["writes"] == 2  # initialize + save_many
+
+
+class TestVersion:
+    """Change counter used for derived-index freshness."""
+
+    async def test_bumps_on_every_write(self, store: DecisionStore) -> None:
+        v0 = await store.version()
+        await store.save("v001", _sample())
+        v1 = await store.version()
+        await store.update_fields("v001", tags=["changed"])
+        v2 = await store.version()
+        await store.update_outcome("v001", "success")
+        v3 = await store.version()
+        await store.delete("v001")
+        v4 = await store.version()
+        assert [v1 - v0, v2 - v1, v3 - v2, v4 - v3] == [1, 1, 1, 1]
+
+    async def test_reads_do_not_bump(self, store: DecisionStore) -> None:
+        await store.save("v001", _sample())
+        before = await store.version()
+        await store.get("v001")
+        await store.list(ListQuery())
+        await store.update_outcome("missing", "success")
+        assert await store.version() == before
+
+    async def test_fingerprint_moves_on_write(self, store: DecisionStore) -> None:
+        await store.save("v001", _sample())
+        before = await store.fingerprint()
+        await store.get("v001")
+        assert await store.fingerprint() == before
+        await store.update_fields("v001", tags=["changed"])
+        assert await store.fingerprint() != before
+
+    async def test_yaml_fingerprint_survives_restart(self, tmp_path: Path) -> None:
+        from a2a.cstp.storage.yaml_fs import YAMLFileSystemStore
+
+        first = YAMLFileSystemStore(str(tmp_path))
+        await first.save("v001", _sample())
+        fingerprint = await first.fingerprint()
+        assert await YAMLFileSystemStore(str(tmp_path)).fingerprint() == fingerprint
+
+        await YAMLFileSystemStore(str(tmp_path)).delete("v001")
+        assert await first.fingerprint() != fingerprint
+
+    async def test_sqlite_version_survives_reopen(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "v.db")
+        first = SQLiteDecisionStore(db_path=path)
+        await first.initialize()
+        await first.save("v001", _sample())
+        version = await first.version()
+        await first.close()
+
+        second = SQLiteDecisionStore(db_path=path)
+        await second.initialize()
+        assert await second.version() == version
+        await second.close()
+
+
 # ---------------------------------------------------------------------------
 # Parameterized fixture: memory + sqlite
 # ---------------------------------------------------------------------------
@@ -419,6 +558,76 @@ class TestListDecisions:
         dates = [d.get("created_at") or "" for d in result.decisions]
         assert dates == sorted(dates, reverse=True)
 
+    async def test_list_fields_projection(self, store: DecisionStore) -> None:
+        """Projected rows keep id plus the requested fields; filters still apply."""
+        await self._seed(store)
+        result = await store.list(ListQuery(
+            category="architecture", fields=["confidence", "tags"], limit=50,
+        ))
+        assert result.total == 2
+        full = await store.list(ListQuery(category="architecture", limit=50))
+        assert [d["id"] for d in result.decisions] == [d["id"] for d in full.decisions]
+        for projected, whole in zip(result.decisions, full.decisions, strict=True):
+            assert projected == {
+                "id": whole["id"], "confidence": whole["confidence"], "tags": whole["tags"],
+            }
+
+    async def test_sqlite_projection_skips_child_tables(
+        self, sqlite_store: SQLiteDecisionStore,
+    ) -> None:
+        await sqlite_store.save("p0000001", _sample_full())
+        [row] = (await sqlite_store.list(ListQuery(fields=["confidence", "date"]))).decisions
+        assert set(row) == {"id", "confidence", "created_at", "date"}
+
+        [row] = (await sqlite_store.list(ListQuery(fields=["deliberation"]))).decisions
+        assert row["deliberation"] == (await sqlite_store.get("p0000001"))["deliberation"]
+
+    @pytest.mark.parametrize(("sort", "order"), [
+        ("created_at", "desc"), ("stakes", "asc"), ("category", "desc"),
+    ])
+    async def test_list_cursor_pages_cover_everything(
+        self, store: DecisionStore, sort: str, order: str,
+    ) -> None:
+        """Following next_cursor yields the full ordering, ties included."""
+        await self._seed(store)
+        full = await store.list(ListQuery(limit=50, sort=sort, order=order))
+        assert full.next_cursor is None
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = await store.list(ListQuery(
+                limit=2, sort=sort, order=order, cursor=cursor, include_total=False,
+            ))
+            assert page.total is None
+            assert page.offset == 0
+            seen += [d["id"] for d in page.decisions]
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert seen == [d["id"] for d in full.decisions]
+
+    async def test_list_cursor_with_filters(self, store: DecisionStore) -> None:
+        await self._seed(store)
+        first = await store.list(ListQuery(limit=1, category="architecture"))
+        assert first.total == 2
+        rest = await store.list(ListQuery(
+            limit=1, category="architecture", cursor=first.next_cursor,
+        ))
+        assert [d["id"] for d in first.decisions + rest.decisions] == [
+            "d0000003", "d0000001",
+        ]
+        assert rest.total == 2
+        assert rest.next_cursor is None
+
+    async def test_list_invalid_cursor(self, store: DecisionStore) -> None:
+        await self._seed(store)
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await store.list(ListQuery(cursor="not-a-cursor!"))
+        token = (await store.list(ListQuery(limit=1))).next_cursor
+        with pytest.raises(ValueError, match="sort order"):
+            await store.list(ListQuery(cursor=token, order="asc"))
+
 
 class TestStats:
     """Tests for stats() operation."""
@@ -597,6 +806,576 @@ class TestSQLiteSpecific:
         assert got["decision"] == "Decision 5"
 
 
+class TestSQLiteConnections:
+    """Reader pool and dedicated writer thread."""
+
+    async def test_writes_run_on_writer_thread(self, sqlite_store: SQLiteDecisionStore) -> None:
+        import threading
+
+        assert sqlite_store._writer is not None
+        name = await sqlite_store._writer.submit(lambda: threading.current_thread().name)
+        assert name.startswith("sqlite-writer")
+
+    async def test_concurrent_reads_use_pool(self, tmp_path: Path) -> None:
+        import asyncio
+
+        store = SQLiteDecisionStore(db_path=str(tmp_path / "pool.db"), readers=3)
+        await store.initialize()
+        try:
+            for i in range(5):
+                await store.save(f"pool{i:04d}", _sample({"decision": f"Decision {i}"}))
+            results = await asyncio.gather(*(store.list(ListQuery(limit=50)) for _ in range(12)))
+            assert all(r.total == 5 for r in results)
+
+            metrics = store.metrics()
+            assert metrics["writer"]["writes"] >= 6  # initialize + 5 saves
+            assert metrics["writer"]["queue_depth"] == 0
+            assert metrics["readers"]["size"] == 3
+            assert 1 <= metrics["readers"]["open"] <= 3
+            assert metrics["readers"]["acquires"] == 12
+            assert metrics["readers"]["in_use"] == 0
+        finally:
+            await store.close()
+
+    async def test_readers_are_query_only(self, sqlite_store: SQLiteDecisionStore) -> None:
+        import sqlite3
+
+        assert sqlite_store._reader_pool is not None
+        with (
+            sqlite_store._reader_pool.connection() as conn,
+            pytest.raises(sqlite3.OperationalError),
+        ):
+            conn.execute("DELETE FROM decisions")
+
+    async def test_reads_see_committed_writes(self, sqlite_store: SQLiteDecisionStore) -> None:
+        await sqlite_store.list(ListQuery())  # warm a pooled reader
+        await sqlite_store.save("fresh001", _sample())
+        assert await sqlite_store.get("fresh001") is not None
+        await sqlite_store.update_fields("fresh001", tags=["later"])
+        assert (await sqlite_store.get("fresh001"))["tags"] == ["later"]
+
+    async def test_close_twice(self, tmp_path: Path) -> None:
+        store = SQLiteDecisionStore(db_path=str(tmp_path / "c.db"))
+        await store.initialize()
+        await store.close()
+        await store.close()
+        metrics = store.metrics()
+        assert metrics["writer"] == {}
+        assert metrics["readers"] == {}
+
+
+class TestSQLiteGroupCommit:
+    """Opt-in group commit batches concurrent mutations into one transaction."""
+
+    @pytest.fixture
+    async def grouped_store(self, tmp_path: Path) -> Any:
+        s = SQLiteDecisionStore(
+            db_path=str(tmp_path / "group.db"), group_commit_ms=20, group_commit_max=8,
+        )
+        await s.initialize()
+        yield s
+        await s.close()
+
+    async def test_concurrent_saves_share_commits(self, grouped_store: SQLiteDecisionStore) -> None:
+        import asyncio
+
+        results = await asyncio.gather(*(
+            grouped_store.save(f"grp{i:05d}", _sample({"decision": f"Decision {i}"}))
+            for i in range(20)
+        ))
+        assert all(results)
+        assert (await grouped_store.list(ListQuery(limit=50))).total == 20
+
+        group = grouped_store.metrics()["writer"]["group_commit"]
+        assert group["batches"] == 3  # 8 + 8 + 4
+        assert group["max_batch"] == 8
+
+    async def test_failed_mutation_rolls_back_alone(
+        self, grouped_store: SQLiteDecisionStore,
+    ) -> None:
+        import asyncio
+
+        await grouped_store.save("grp00001", _sample())
+        bad = _sample({"confidence": None})  # violates NOT NULL
+        ok_a, failed, ok_b = await asyncio.gather(
+            grouped_store.save("grp00002", _sample()),
+            grouped_store.save("grp00003", bad),
+            grouped_store.update_fields("grp00001", tags=["grouped"]),
+        )
+        assert (ok_a, failed, ok_b) == (True, False, True)
+        assert await grouped_store.get("grp00003") is None
+        assert (await grouped_store.get("grp00001"))["tags"] == ["grouped"]
+        assert await grouped_store.get("grp00002") is not None
+
+    async def test_close_commits_pending(self, tmp_path: Path) -> None:
+        import asyncio
+
+        path = str(tmp_path / "drain.db")
+        store = SQLiteDecisionStore(db_path=path, group_commit_ms=10_000)
+        await store.initialize()
+        pending = asyncio.ensure_future(store.save("grp00001", _sample()))
+        await asyncio.sleep(0)
+        await store.close()
+        assert await pending is True
+
+        reopened = SQLiteDecisionStore(db_path=path)
+        await reopened.initialize()
+        assert await reopened.get("grp00001") is not None
+        await reopened.close()
+
+    async def test_off_by_default(self, sqlite_store: SQLiteDecisionStore) -> None:
+        await sqlite_store.save("grp00001", _sample())
+        assert "group_commit" not in sqlite_store.metrics()["writer"]
+
+
+class TestSQLiteProfiles:
+    """Named PRAGMA profiles, background maintenance, and statement reuse."""
+
+    @pytest.fixture
+    async def throughput_store(self, tmp_path: Path) -> Any:
+        s = SQLiteDecisionStore(db_path=str(tmp_path / "fast.db"), profile="throughput")
+        await s.initialize()
+        yield s
+        await s.close()
+
+    async def test_throughput_pragmas_on_writer_and_readers(
+        self, throughput_store: SQLiteDecisionStore,
+    ) -> None:
+        assert throughput_store._conn is not None
+        assert throughput_store._reader_pool is not None
+        with throughput_store._reader_pool.connection() as reader:
+            for conn in (throughput_store._conn, reader):
+                assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+                assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+                assert conn.execute("PRAGMA cache_size").fetchone()[0] == -32768
+                assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 256 * 1024 * 1024
+        assert throughput_store.metrics()["profile"] == "throughput"
+
+    async def test_default_profile_keeps_sqlite_defaults(
+        self, sqlite_store: SQLiteDecisionStore,
+    ) -> None:
+        assert sqlite_store._conn is not None
+        assert sqlite_store._conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+        assert sqlite_store._maintenance_task is None
+
+    async def test_profile_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("CSTP_DB_PROFILE", "throughput")
+        assert SQLiteDecisionStore(db_path=":memory:").metrics()["profile"] == "throughput"
+
+    def test_unknown_profile(self) -> None:
+        with pytest.raises(ValueError, match="Unknown SQLite profile"):
+            SQLiteDecisionStore(db_path=":memory:", profile="turbo")
+
+    async def test_maintain_truncates_wal(
+        self, throughput_store: SQLiteDecisionStore, tmp_path: Path,
+    ) -> None:
+        await throughput_store.save_many(
+            [(f"prof{i:04d}", _sample({"decision": f"Decision {i}"})) for i in range(50)]
+        )
+        assert (tmp_path / "fast.db-wal").stat().st_size > 0
+
+        result = await throughput_store.maintain()
+        assert result["busy"] == 0
+        assert (tmp_path / "fast.db-wal").stat().st_size == 0
+        assert throughput_store.metrics()["maintenance"] == {
+            "runs": 1, "last_checkpoint": result,
+        }
+        assert (await throughput_store.list(ListQuery())).total == 50
+
+    async def test_background_maintenance(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        import asyncio
+
+        from a2a.cstp.storage import sqlite as sqlite_module
+
+        monkeypatch.setitem(
+            sqlite_module.SQLITE_PROFILES,
+            "eager",
+            sqlite_module.SQLiteProfile(maintenance_interval_s=0.01),
+        )
+        store = SQLiteDecisionStore(db_path=str(tmp_path / "bg.db"), profile="eager")
+        await store.initialize()
+        try:
+            for _ in range(100):
+                if store.maintenance_runs:
+                    break
+                await asyncio.sleep(0.01)
+            assert store.maintenance_runs >= 1
+        finally:
+            await store.close()
+        assert store._maintenance_task is None
+
+    async def test_id_lists_bind_as_one_parameter(
+        self, throughput_store: SQLiteDecisionStore,
+    ) -> None:
+        """Beyond the historical 999-variable limit, with no chunking."""
+        ids = [f"many{i:05d}" for i in range(1500)]
+        await throughput_store.save_many([(i, _sample()) for i in ids[::100]])
+        assert await throughput_store.existing_ids(ids) == set(ids[::100])
+        found = await throughput_store.get_many(ids)
+        assert set(found) == set(ids[::100])
+        assert all(d["tags"] == ["python", "web"] for d in found.values())
+
+    async def test_tag_filters_share_statement_text(self) -> None:
+        from a2a.cstp.storage.sqlite import _list_statements
+
+        one = _list_statements(ListQuery(tags=["a"]))
+        three = _list_statements(ListQuery(tags=["a", "b", "c"]))
+        assert one.count_sql == three.count_sql
+        assert one.page_sql == three.page_sql
+
+    async def test_tag_filter_uses_index(self, sqlite_store: SQLiteDecisionStore) -> None:
+        plans = await sqlite_store.explain(ListQuery(tags=["a", "b"]))
+        details = [step["detail"] for steps in plans.values() for step in steps]
+        assert any("idx_decision_tags_tag_decision" in d for d in details)
+        assert not any(step["fullScan"] for steps in plans.values() for step in steps)
+
+
+class TestSQLiteStatsRollup:
+    """stats() reads trigger-maintained rollups plus the partial edge days."""
+
+    _ROLLUP_SQL = (
+        "SELECT substr(created_at, 1, 10), category, stakes, status, "
+        "coalesce(recorded_by, ''), coalesce(project, ''), COUNT(*) "
+        "FROM decisions GROUP BY 1, 2, 3, 4, 5, 6 ORDER BY 1, 2, 3, 4, 5, 6"
+    )
+    _TAG_ROLLUP_SQL = (
+        "SELECT substr(d.created_at, 1, 10), coalesce(d.project, ''), t.tag, COUNT(*) "
+        "FROM decision_tags t JOIN decisions d ON d.id = t.decision_id "
+        "GROUP BY 1, 2, 3 ORDER BY 1, 2, 3"
+    )
+
+    async def _seed(self, store: SQLiteDecisionStore) -> None:
+        for i in range(12):
+            await store.save(f"r00000{i:02d}", _sample({
+                "category": ("architecture", "process", "tooling")[i % 3],
+                "stakes": ("low", "medium", "high")[i % 3],
+                "recorded_by": None if i % 4 == 0 else f"agent-{i % 2}",
+                "project": None if i % 5 == 0 else f"proj/{i % 2}",
+                "created_at": f"2026-02-{10 + i // 3:02d}T{(i * 5) % 24:02d}:30:00",
+                "tags": [f"t{i % 3}", "shared"],
+            }))
+
+    def _assert_rollups_exact(self, store: SQLiteDecisionStore) -> None:
+        conn = store._conn
+        assert conn is not None
+        assert [tuple(r) for r in conn.execute(
+            "SELECT * FROM decision_rollup ORDER BY 1, 2, 3, 4, 5, 6"
+        )] == [tuple(r) for r in conn.execute(self._ROLLUP_SQL)]
+        assert [tuple(r) for r in conn.execute(
+            "SELECT * FROM tag_rollup ORDER BY 1, 2, 3"
+        )] == [tuple(r) for r in conn.execute(self._TAG_ROLLUP_SQL)]
+
+    async def test_rollups_follow_every_write(
+        self, sqlite_store: SQLiteDecisionStore,
+    ) -> None:
+        await self._seed(sqlite_store)
+        self._assert_rollups_exact(sqlite_store)
+
+        await sqlite_store.update_outcome("r0000001", "success")
+        await sqlite_store.update_fields("r0000002", category="process", project="proj/9")
+        await sqlite_store.save("r0000003", _sample({
+            "created_at": "2026-03-01T08:00:00", "tags": ["moved"],
+        }))
+        await sqlite_store.delete("r0000004")
+        await sqlite_store.save_many([
+            ("r0000099", _sample({"created_at": "2026-02-11T01:00:00"})),
+        ])
+        self._assert_rollups_exact(sqlite_store)
+
+    @pytest.mark.parametrize(("date_from", "date_to", "project"), [
+        (None, None, None),
+        ("2026-02-11", None, None),
+        (None, "2026-02-12", "proj/1"),
+        ("2026-02-10T12:00:00", "2026-02-12T07:00:00", None),
+        ("2026-02-11T06:00:00", "2026-02-11T20:00:00", "proj/0"),
+    ])
+    async def test_stats_match_table_scan(
+        self,
+        sqlite_store: SQLiteDecisionStore,
+        date_from: str | None,
+        date_to: str | None,
+        project: str | None,
+    ) -> None:
+        await self._seed(sqlite_store)
+        result = await sqlite_store.stats(StatsQuery(
+            date_from=date_from, date_to=date_to, project=project,
+        ))
+
+        rows = (await sqlite_store.list(ListQuery(
+            limit=500, date_from=date_from, date_to=date_to, project=project,
+        ))).decisions
+        assert result.total == len(rows)
+        for key, attr in (("category", "by_category"), ("status", "by_status")):
+            expected: dict[str, int] = {}
+            for d in rows:
+                expected[d[key]] = expected.get(d[key], 0) + 1
+            assert getattr(result, attr) == expected
+        agents: dict[str, int] = {}
+        tags: dict[str, int] = {}
+        for d in rows:
+            if d["recorded_by"]:
+                agents[d["recorded_by"]] = agents.get(d["recorded_by"], 0) + 1
+            for tag in d["tags"]:
+                tags[tag] = tags.get(tag, 0) + 1
+        assert result.by_agent == agents
+        assert {t["tag"]: t["count"] for t in result.top_tags} == tags
+        assert sum(day["count"] for day in result.by_day) == len(rows)
+
+    async def test_migration_backfills_rollups(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "pre_rollup.db")
+        store = SQLiteDecisionStore(db_path=path)
+        await store.initialize()
+        await self._seed(store)
+        assert store._conn is not None
+        store._conn.executescript("""
+            DROP TABLE decision_rollup;
+            DROP TABLE tag_rollup;
+            PRAGMA user_version = 1;
+        """)
+        await store.close()
+
+        reopened = SQLiteDecisionStore(db_path=path)
+        await reopened.initialize()
+        try:
+            self._assert_rollups_exact(reopened)
+            assert (await reopened.stats(StatsQuery())).total == 12
+        finally:
+            await reopened.close()
+
+
+class TestSQLiteQueryPlans:
+    """Hot list() shapes stay on their composite indexes."""
+
+    @pytest.fixture
+    async def seeded(self, sqlite_store: SQLiteDecisionStore) -> SQLiteDecisionStore:
+        await sqlite_store.save_many([
+            (f"q{i:07d}", _sample({
+                "category": ("architecture", "process", "tooling")[i % 3],
+                "status": ("pending", "reviewed")[i % 2],
+                "project": f"proj/{i % 4}",
+                "created_at": f"2026-02-{1 + i % 28:02d}T{i % 24:02d}:00:00",
+            }))
+            for i in range(300)
+        ])
+        return sqlite_store
+
+    @pytest.mark.parametrize(("query", "index"), [
+        (ListQuery(), "idx_decisions_created_id"),
+        (ListQuery(include_total=False, cursor=None), "idx_decisions_created_id"),
+        (ListQuery(category="process"), "idx_decisions_category_created"),
+        (
+            ListQuery(status="reviewed", category="process",
+                      date_from="2026-02-03", date_to="2026-02-20"),
+            "idx_decisions_status_category_created",
+        ),
+        (ListQuery(project="proj/1", status="pending"), "idx_decisions_project_status_created"),
+        (ListQuery(tags=["python"]), "idx_decision_tags_tag_decision"),
+    ])
+    async def test_hot_shapes_avoid_full_scans(
+        self, seeded: SQLiteDecisionStore, query: ListQuery, index: str,
+    ) -> None:
+        plans = await seeded.explain(query)
+        steps = [step for plan in plans.values() for step in plan]
+        assert not [s["detail"] for s in steps if s["fullScan"]]
+        assert any(index in s["detail"] for s in steps)
+
+    async def test_unindexed_sort_reports_full_scan(self, seeded: SQLiteDecisionStore) -> None:
+        plans = await seeded.explain(ListQuery(sort="confidence", include_total=False))
+        assert set(plans) == {"page"}
+        assert any(step["fullScan"] for step in plans["page"])
+
+    async def test_migration_replaces_single_column_indexes(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "pre_index.db")
+        store = SQLiteDecisionStore(db_path=path)
+        await store.initialize()
+        assert store._conn is not None
+        store._conn.executescript("""
+            CREATE INDEX idx_decisions_category ON decisions(category);
+            CREATE INDEX idx_decisions_status ON decisions(status);
+            PRAGMA user_version = 2;
+        """)
+        await store.close()
+
+        reopened = SQLiteDecisionStore(db_path=path)
+        await reopened.initialize()
+        try:
+            assert reopened._conn is not None
+            indexes = {row[0] for row in reopened._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )}
+            assert "idx_decisions_category" not in indexes
+            assert "idx_decisions_status" not in indexes
+            assert "idx_decisions_status_category_created" in indexes
+        finally:
+            await reopened.close()
+
+    async def test_explain_query_rpc(self, seeded: SQLiteDecisionStore) -> None:
+        from a2a.cstp.dispatcher import _handle_explain_query
+
+        with patch("a2a.cstp.storage.factory.get_decision_store", return_value=seeded):
+            indexed = await _handle_explain_query({"category": "process"}, "agent")
+            scanned = await _handle_explain_query({"sort": "confidence"}, "agent")
+        assert indexed["supported"] is True
+        assert set(indexed["plans"]) == {"count", "page"}
+        assert indexed["fullScan"] is False
+        assert scanned["fullScan"] is True
+
+        memory = MemoryDecisionStore()
+        with patch("a2a.cstp.storage.factory.get_decision_store", return_value=memory):
+            result = await _handle_explain_query({}, "agent")
+        assert result == {"supported": False, "plans": {}, "fullScan": False}
+
+
+class TestSQLiteKeywordSearch:
+    """keyword_search ranks inside SQLite with FTS5 bm25()."""
+
+    async def test_ranks_and_scores(self, sqlite_store: SQLiteDecisionStore) -> None:
+        await sqlite_store.save("kw000001", _sample({
+            "decision": "Use Redis caching for sessions",
+            "context": "Redis keeps session caching fast",
+        }))
+        await sqlite_store.save("kw000002", _sample({"decision": "Cache warmup job uses Redis"}))
+        await sqlite_store.save("kw000003", _sample({"decision": "Use PostgreSQL for persistence"}))
+
+        hits = await sqlite_store.keyword_search("redis caching", top_k=10)
+        assert [doc_id for doc_id, _ in hits] == ["kw000001", "kw000002"]
+        assert hits[0][1] > hits[1][1] > 0
+
+        assert len(await sqlite_store.keyword_search("redis", top_k=1)) == 1
+        assert await sqlite_store.keyword_search("  ...  ") == []
+
+    async def test_matches_tags_reasons_and_bridge(
+        self, sqlite_store: SQLiteDecisionStore,
+    ) -> None:
+        await sqlite_store.save("kw000001", _sample({
+            "decision": "Plain title",
+            "tags": ["observability"],
+            "reasons": [{"type": "analysis", "text": "latency budget"}],
+            "bridge": {"structure": "sidecar", "function": "telemetry export"},
+        }))
+        for term in ("observability", "latency", "sidecar", "telemetry"):
+            assert [h[0] for h in await sqlite_store.keyword_search(term)] == ["kw000001"]
+
+        # Child-table rewrites keep the FTS row in step.
+        await sqlite_store.update_fields("kw000001", tags=["tracing"])
+        assert await sqlite_store.keyword_search("observability") == []
+        assert [h[0] for h in await sqlite_store.keyword_search("tracing")] == ["kw000001"]
+
+        await sqlite_store.delete("kw000001")
+        assert await sqlite_store.keyword_search("tracing") == []
+
+    async def test_category_and_reason_type_match_keyword_index(
+        self, sqlite_store: SQLiteDecisionStore,
+    ) -> None:
+        """SQLite and the in-process KeywordIndex agree on category and reason-type terms."""
+        from a2a.cstp.bm25_index import KeywordIndex
+
+        decisions = {
+            "kw000001": _sample({"decision": "Split the monolith", "category": "architecture",
+                                 "reasons": [{"type": "empirical", "text": "deploys got slower"}]}),
+            "kw000002": _sample({"decision": "Adopt ruff", "category": "tooling",
+                                 "reasons": [{"type": "authority", "text": "team standard"}]}),
+            "kw000003": _sample({"decision": "Weekly retros", "category": "process",
+                                 "reasons": [{"type": "analysis", "text": "feedback loop"}]}),
+        }
+        for doc_id, data in decisions.items():
+            await sqlite_store.save(doc_id, data)
+        index = KeywordIndex.from_decisions([{"id": k, **v} for k, v in decisions.items()])
+
+        for term in ("architecture", "empirical", "tooling", "authority"):
+            hits = [h[0] for h in await sqlite_store.keyword_search(term)]
+            assert hits, term
+            assert hits == [h[0] for h in index.search(term)]
+
+    async def test_migration_indexes_category_and_reason_types(self, tmp_path: Path) -> None:
+        from a2a.cstp.storage.sqlite import _FTS_SCHEMA_SQL
+
+        path = str(tmp_path / "pre_category.db")
+        store = SQLiteDecisionStore(db_path=path)
+        await store.initialize()
+        await store.save("kw000001", _sample({
+            "category": "tooling", "reasons": [{"type": "empirical", "text": "measured"}],
+        }))
+        assert store._conn is not None
+        store._conn.executescript(_FTS_SCHEMA_SQL + "PRAGMA user_version = 4;")
+        assert await store.keyword_search("empirical") == []
+        await store.close()
+
+        reopened = SQLiteDecisionStore(db_path=path)
+        await reopened.initialize()
+        try:
+            for term in ("tooling", "empirical"):
+                assert [h[0] for h in await reopened.keyword_search(term)] == ["kw000001"]
+            await reopened.update_fields("kw000001", category="process")
+            assert await reopened.keyword_search("tooling") == []
+            assert [h[0] for h in await reopened.keyword_search("process")] == ["kw000001"]
+        finally:
+            await reopened.close()
+
+    async def test_filters(self, sqlite_store: SQLiteDecisionStore) -> None:
+        await sqlite_store.save("kw000001", _sample({"decision": "Redis A", "category": "tooling"}))
+        await sqlite_store.save("kw000002", _sample({"decision": "Redis B", "project": "other/repo"}))
+
+        hits = await sqlite_store.keyword_search("redis", {"category": "tooling"})
+        assert [h[0] for h in hits] == ["kw000001"]
+        hits = await sqlite_store.keyword_search("redis", {"project": "other/repo", "category": None})
+        assert [h[0] for h in hits] == ["kw000002"]
+
+    async def test_list_search_scope_unchanged(self, sqlite_store: SQLiteDecisionStore) -> None:
+        """list(search=...) still looks at decision, context, and pattern only."""
+        await sqlite_store.save("kw000001", _sample({"decision": "Plain", "tags": ["observability"]}))
+        assert (await sqlite_store.list(ListQuery(search="observability"))).total == 0
+
+    async def test_memory_store_defers_to_bm25_index(self) -> None:
+        store = MemoryDecisionStore()
+        await store.initialize()
+        assert await store.keyword_search("anything") is None
+
+    async def test_migrates_legacy_fts_schema(self, tmp_path: Path) -> None:
+        """A database created with the old FTS table is rebuilt and backfilled."""
+        path = str(tmp_path / "legacy.db")
+        store = SQLiteDecisionStore(db_path=path)
+        await store.initialize()
+        await store.save("kw000001", _sample({"decision": "Legacy row", "tags": ["vintage"]}))
+        assert store._conn is not None
+        store._conn.executescript("""
+            DROP TABLE decisions_fts;
+            CREATE VIRTUAL TABLE decisions_fts USING fts5(
+                id UNINDEXED, decision, context, pattern,
+                content=decisions, content_rowid=rowid
+            );
+            PRAGMA user_version = 0;
+        """)
+        await store.close()
+
+        reopened = SQLiteDecisionStore(db_path=path)
+        await reopened.initialize()
+        try:
+            assert reopened._conn is not None
+            assert reopened._conn.execute("PRAGMA user_version").fetchone()[0] >= 1
+            assert [h[0] for h in await reopened.keyword_search("vintage")] == ["kw000001"]
+            assert (await reopened.list(ListQuery(search="Legacy"))).total == 1
+        finally:
+            await reopened.close()
+
+    async def test_dispatcher_uses_store_keyword_search(
+        self, sqlite_store: SQLiteDecisionStore,
+    ) -> None:
+        from a2a.cstp.dispatcher import _handle_query_decisions
+        from a2a.cstp.storage.factory import set_decision_store
+
+        await sqlite_store.save("kw000001", _sample({"decision": "Use Redis caching"}))
+        set_decision_store(sqlite_store)
+        with patch("a2a.cstp.dispatcher.get_keyword_index") as get_index:
+            result = await _handle_query_decisions(
+                {"query": "redis", "retrievalMode": "keyword"}, "agent",
+            )
+        get_index.assert_not_called()
+        assert [d["id"] for d in result["decisions"]] == ["kw000001"]
+
+
 # =========================================================================
 # C) Factory tests
 # =========================================================================
@@ -645,6 +1424,16 @@ class TestFactory:
         store = create_decision_store()
         assert isinstance(store, SQLiteDecisionStore)
 
+    def test_factory_partitioned(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """CSTP_STORAGE=partitioned creates PartitionedDecisionStore."""
+        from a2a.cstp.storage.factory import create_decision_store
+        from a2a.cstp.storage.partitioned import PartitionedDecisionStore
+
+        monkeypatch.setenv("CSTP_STORAGE", "partitioned")
+        monkeypatch.setenv("CSTP_DB_PATH", str(tmp_path / "decisions.db"))
+        store = create_decision_store()
+        assert isinstance(store, PartitionedDecisionStore)
+
     def test_factory_memory(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """CSTP_STORAGE=memory creates MemoryDecisionStore."""
         from a2a.cstp.storage.factory import create_decision_store
@@ -725,6 +1514,34 @@ class TestRPCIntegration:
         assert len(result["decisions"]) == 2
         assert result["limit"] == 10
         assert result["offset"] == 0
+        assert result["nextCursor"] is None
+
+    async def test_list_decisions_rpc_cursor(self, tmp_path: Any) -> None:
+        """cstp.listDecisions pages by nextCursor and can skip the total."""
+        store = MemoryDecisionStore()
+        await store.initialize()
+        for i in range(3):
+            await store.save(f"rpc0001{i}", _sample({"decision": f"Decision {i}"}))
+
+        _handle_list_decisions, _ = await self._get_handlers()
+
+        with patch(
+            "a2a.cstp.storage.factory.get_decision_store",
+            return_value=store,
+        ):
+            first = await _handle_list_decisions(
+                {"limit": 2, "includeTotal": False}, "test-agent",
+            )
+            second = await _handle_list_decisions(
+                {"limit": 2, "includeTotal": False, "cursor": first["nextCursor"]},
+                "test-agent",
+            )
+
+        assert first["total"] is None
+        assert len(first["decisions"]) == 2
+        assert first["nextCursor"]
+        assert len(second["decisions"]) == 1
+        assert second["nextCursor"] is None
 
     async def test_get_stats_rpc(self, tmp_path: Any) -> None:
         """cstp.getStats handler returns aggregated statistics."""
@@ -1131,6 +1948,26 @@ class TestStorageConfigPrecedence:
         )
         assert store._db_path == target
 
+    def test_config_sqlite_profile_is_honoured(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from a2a.config import Config
+        from a2a.cstp.storage.factory import create_decision_store
+
+        monkeypatch.delenv("CSTP_STORAGE", raising=False)
+        monkeypatch.delenv("CSTP_DB_PROFILE", raising=False)
+        config = Config._from_dict({"storage": {"sqlite": {"profile": "throughput"}}})
+        assert config.storage.sqlite_profile == "throughput"
+        store = create_decision_store(config.storage)
+        assert store.metrics()["profile"] == "throughput"
+
+    def test_env_profile_overrides_config(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from a2a.config import StorageConfig
+        from a2a.cstp.storage.factory import create_decision_store
+
+        monkeypatch.delenv("CSTP_STORAGE", raising=False)
+        monkeypatch.setenv("CSTP_DB_PROFILE", "default")
+        store = create_decision_store(StorageConfig(sqlite_profile="throughput"))
+        assert store.metrics()["profile"] == "default"
+
     def test_no_config_falls_back_to_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
         from a2a.cstp.storage.factory import DEFAULT_BACKEND, resolve_backend
 
@@ -614,10 +614,12 @@ class TestDispatcherWiring:
         }]
         mock_bm25 = MagicMock()
         mock_bm25.search.return_value = [("kw1", 5.0)]
+        from a2a.cstp.storage.factory import get_decision_store
+
+        await get_decision_store().save("kw1", decs[0])
 
         with (
-            patch("a2a.cstp.dispatcher.load_all_decisions", AsyncMock(return_value=decs)),
-            patch("a2a.cstp.dispatcher.get_cached_index", return_value=mock_bm25),
+            patch("a2a.cstp.dispatcher.get_keyword_index", AsyncMock(return_value=mock_bm25)),
             patch("a2a.cstp.deliberation_tracker.track_query"),
         ):
             from a2a.cstp.dispatcher import _handle_query_decisions
@@ -1,7 +1,8 @@
-"""Tests for issue #172: reindex_decisions() delegates to reindex_decision().
+"""Tests for issue #172: reindex_decisions() shares reindex_decision()'s builder.
 
 Verifies that the bulk reindex path produces the same rich metadata and embedding
-text as the single-decision reindex_decision() path in decision_service.
+text as the single-decision reindex_decision() path in decision_service (both use
+build_reindex_document), while embedding and upserting in batches.
 
 Covers:
 1. Full metadata fields after reindex (bridge_json, tags, pattern, reasons_json,
@@ -12,8 +13,9 @@ Covers:
 5. Empty decisions list handling
 6. Reset failure handling
 7. Decisions without id counted as errors
-8. Delegation verification (reindex_decision called with correct args)
-9. store.reset() called before loop
+8. Delegation verification (build_reindex_document called with correct args,
+   one upsert_many per batch)
+9. store.reset() called before upserts
 10. get_embedding_provider no longer called from reindex_service
 11. Integration: query returns all metadata after reindex
 """
@@ -39,6 +41,7 @@ if not _mcp_available:
 
 import pytest  # noqa: E402
 
+from a2a.cstp.decision_service import build_reindex_document  # noqa: E402
 from a2a.cstp.reindex_service import reindex_decisions  # noqa: E402
 from a2a.cstp.vectordb.memory import MemoryStore  # noqa: E402
 
@@ -92,6 +95,12 @@ def _setup_mocks() -> tuple[MemoryStore, AsyncMock]:
     store._initialized = True
     mock_provider = AsyncMock()
     mock_provider.embed = AsyncMock(return_value=[0.1] * 768)
+
+    async def embed_batch(texts: list[str]) -> list[list[float]]:
+        # Looked up at call time so tests can swap in a custom embed.
+        return [await mock_provider.embed(t) for t in texts]
+
+    mock_provider.embed_batch = embed_batch
     return store, mock_provider
 
 
@@ -646,114 +655,114 @@ class TestReindexMinimalDecision:
 
 
 class TestReindexDelegation:
-    """Verify reindex_decisions() delegates to reindex_decision() with correct args."""
+    """Verify reindex_decisions() builds documents like reindex_decision() and batches them."""
 
     @pytest.mark.asyncio
-    async def test_reindex_decision_called_with_correct_args(self) -> None:
-        """reindex_decision is called with (decision_id, full_dict, file_path)."""
-        store = MemoryStore()
-        store._initialized = True
+    async def test_build_reindex_document_called_with_correct_args(self) -> None:
+        """build_reindex_document is called with (full_dict, file_path)."""
+        store, provider = _setup_mocks()
         decision = _make_rich_decision()
-        mock_reindex = AsyncMock(return_value=True)
 
         with (
             patch("a2a.cstp.reindex_service.get_vector_store", return_value=store),
             patch("a2a.cstp.reindex_service.load_all_decisions", AsyncMock(
                 return_value=[decision],
             )),
-            patch("a2a.cstp.reindex_service.reindex_decision", mock_reindex),
+            patch("a2a.cstp.decision_service.get_embedding_provider", return_value=provider),
+            patch(
+                "a2a.cstp.reindex_service.build_reindex_document",
+                wraps=build_reindex_document,
+            ) as mock_build,
         ):
             result = await reindex_decisions()
 
         assert result.success is True
         assert result.decisions_indexed == 1
-        mock_reindex.assert_called_once_with(
-            "abc12345",
+        mock_build.assert_called_once_with(
             decision,
             "/decisions/2026/02/2026-02-18-decision-abc12345.yaml",
         )
 
     @pytest.mark.asyncio
-    async def test_reindex_decision_called_per_decision(self) -> None:
-        """reindex_decision is called once per decision in the list."""
-        store = MemoryStore()
-        store._initialized = True
-        decisions = [
-            {**_make_rich_decision(), "id": f"id{i:06d}", "_file": f"/path/{i}.yaml"}
-            for i in range(3)
-        ]
-        mock_reindex = AsyncMock(return_value=True)
+    async def test_same_document_as_reindex_decision(self) -> None:
+        """Bulk and single-decision paths write identical text and metadata."""
+        from a2a.cstp.decision_service import reindex_decision
+
+        bulk_store, provider = _setup_mocks()
+        single_store = MemoryStore()
+        single_store._initialized = True
+        decision = _make_rich_decision()
 
         with (
-            patch("a2a.cstp.reindex_service.get_vector_store", return_value=store),
+            patch("a2a.cstp.reindex_service.get_vector_store", return_value=bulk_store),
             patch("a2a.cstp.reindex_service.load_all_decisions", AsyncMock(
-                return_value=decisions,
+                return_value=[decision],
             )),
-            patch("a2a.cstp.reindex_service.reindex_decision", mock_reindex),
+            patch("a2a.cstp.decision_service.get_vector_store", return_value=single_store),
+            patch("a2a.cstp.decision_service.get_embedding_provider", return_value=provider),
         ):
-            result = await reindex_decisions()
+            await reindex_decisions()
+            await reindex_decision("abc12345", decision, decision["_file"])
 
-        assert result.decisions_indexed == 3
-        assert mock_reindex.call_count == 3
-        # Verify each call got the correct id and file path
-        for i, call in enumerate(mock_reindex.call_args_list):
-            assert call.args[0] == f"id{i:06d}"
-            assert call.args[2] == f"/path/{i}.yaml"
+        assert bulk_store._docs["abc12345"] == single_store._docs["abc12345"]
 
     @pytest.mark.asyncio
-    async def test_file_path_from_decision_underscore_file(self) -> None:
-        """File path passed to reindex_decision comes from decision['_file']."""
-        store = MemoryStore()
-        store._initialized = True
-        decision = _make_minimal_decision()
-        decision["_file"] = "/custom/path/to/decision.yaml"
-        mock_reindex = AsyncMock(return_value=True)
+    async def test_one_upsert_many_per_batch(self) -> None:
+        """Decisions are written with one upsert_many call per batch."""
+        store, provider = _setup_mocks()
+        decisions = [
+            {**_make_rich_decision(), "id": f"id{i:06d}", "_file": f"/path/{i}.yaml"}
+            for i in range(5)
+        ]
+        store.upsert_many = AsyncMock(wraps=store.upsert_many)  # type: ignore[method-assign]
 
         with (
             patch("a2a.cstp.reindex_service.get_vector_store", return_value=store),
             patch("a2a.cstp.reindex_service.load_all_decisions", AsyncMock(
-                return_value=[decision],
+                return_value=decisions,
             )),
-            patch("a2a.cstp.reindex_service.reindex_decision", mock_reindex),
+            patch("a2a.cstp.reindex_service._REINDEX_BATCH_SIZE", 2),
+            patch("a2a.cstp.decision_service.get_embedding_provider", return_value=provider),
         ):
-            await reindex_decisions()
+            result = await reindex_decisions()
 
-        assert mock_reindex.call_args.args[2] == "/custom/path/to/decision.yaml"
+        assert result.decisions_indexed == 5
+        assert [len(c.args[0]) for c in store.upsert_many.call_args_list] == [2, 2, 1]
+        assert store._docs["id000003"]["metadata"]["path"] == "/path/3.yaml"
 
     @pytest.mark.asyncio
     async def test_missing_file_path_passes_empty_string(self) -> None:
-        """When _file is absent, empty string is passed as file_path."""
-        store = MemoryStore()
-        store._initialized = True
+        """When _file is absent, empty string is used as the path."""
+        store, provider = _setup_mocks()
         decision = _make_minimal_decision()
         # No _file key
-        mock_reindex = AsyncMock(return_value=True)
 
         with (
             patch("a2a.cstp.reindex_service.get_vector_store", return_value=store),
             patch("a2a.cstp.reindex_service.load_all_decisions", AsyncMock(
                 return_value=[decision],
             )),
-            patch("a2a.cstp.reindex_service.reindex_decision", mock_reindex),
+            patch("a2a.cstp.decision_service.get_embedding_provider", return_value=provider),
         ):
             await reindex_decisions()
 
-        assert mock_reindex.call_args.args[2] == ""
+        assert store._docs["min00001"]["metadata"]["path"] == ""
 
 
 # ---------------------------------------------------------------------------
-# 9. store.reset() called before loop (architect spec #4)
+# 9. store.reset() called before upserts (architect spec #4)
 # ---------------------------------------------------------------------------
 
 
 class TestReindexResetCalledFirst:
-    """Verify store.reset() is called before the delegation loop."""
+    """Verify store.reset() is called before anything is written."""
 
     @pytest.mark.asyncio
-    async def test_reset_called_before_reindex_decision(self) -> None:
-        """store.reset() is called, and load_all_decisions comes after."""
+    async def test_reset_called_before_upsert(self) -> None:
+        """store.reset() is called, then load_all_decisions, then upsert_many."""
         call_order: list[str] = []
         mock_store = AsyncMock()
+        _, provider = _setup_mocks()
 
         async def track_reset() -> bool:
             call_order.append("reset")
@@ -763,18 +772,22 @@ class TestReindexResetCalledFirst:
             call_order.append("load")
             return [_make_rich_decision()]
 
+        async def track_upsert_many(documents: list) -> bool:
+            call_order.append("upsert")
+            return True
+
         mock_store.reset = track_reset
-        mock_reindex = AsyncMock(side_effect=lambda *a: call_order.append("reindex") or True)
+        mock_store.upsert_many = track_upsert_many
 
         with (
             patch("a2a.cstp.reindex_service.get_vector_store", return_value=mock_store),
             patch("a2a.cstp.reindex_service.load_all_decisions", track_load),
-            patch("a2a.cstp.reindex_service.reindex_decision", mock_reindex),
+            patch("a2a.cstp.decision_service.get_embedding_provider", return_value=provider),
         ):
             result = await reindex_decisions()
 
         assert result.success is True
-        assert call_order == ["reset", "load", "reindex"]
+        assert call_order == ["reset", "load", "upsert"]
 
 
 # ---------------------------------------------------------------------------
@@ -791,7 +804,7 @@ class TestReindexNoDirectEmbeddingProvider:
         # The module should not have get_embedding_provider in its namespace
         assert not hasattr(mod, "get_embedding_provider"), (
             "reindex_service should not import get_embedding_provider — "
-            "embedding is handled by the delegated reindex_decision()"
+            "embedding is handled by decision_service.generate_embeddings()"
         )
 
 
@@ -0,0 +1,162 @@
+"""Tests for the pooled, batching Gemini embedding provider."""
+
+import asyncio
+import functools
+import json
+
+import httpx
+import pytest
+
+from a2a.cstp.embeddings.gemini import GeminiEmbeddings
+
+
+def _vector(text: str) -> list[float]:
+    return [float(len(text)), 1.0]
+
+
+class _FakeAPI:
+    """Stand-in for the Gemini endpoints, recording every request."""
+
+    def __init__(self, fail_first: int = 0, status: int = 429) -> None:
+        self.calls: list[tuple[str, dict]] = []
+        self.fail_first = fail_first
+        self.status = status
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.calls.append((request.url.path, body))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        if self.fail_first:
+            self.fail_first -= 1
+            return httpx.Response(self.status, json={"error": "busy"}, headers={"Retry-After": "0"})
+        if request.url.path.endswith(":batchEmbedContents"):
+            texts = [r["content"]["parts"][0]["text"] for r in body["requests"]]
+            return httpx.Response(200, json={"embeddings": [{"values": _vector(t)} for t in texts]})
+        return httpx.Response(200, json={"embedding": {"values": _vector(body["content"]["parts"][0]["text"])}})
+
+
+def _provider(api: _FakeAPI, **kwargs) -> GeminiEmbeddings:
+    provider = GeminiEmbeddings(api_key="test-key", **kwargs)
+    provider._client = httpx.AsyncClient(transport=httpx.MockTransport(api))
+    provider._loop = asyncio.get_running_loop()
+    provider._semaphore = asyncio.Semaphore(provider._max_concurrency)
+    return provider
+
+
+class TestMicroBatching:
+    """Concurrent embed() calls share one batchEmbedContents request."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_embeds_coalesce(self) -> None:
+        api = _FakeAPI()
+        provider = _provider(api, batch_window_ms=20)
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+        vectors = await asyncio.gather(*(provider.embed(t) for t in texts))
+        assert vectors == [_vector(t) for t in texts]
+        assert len(api.calls) == 1
+        assert api.calls[0][0].endswith(":batchEmbedContents")
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_single_embed_uses_embed_content(self) -> None:
+        api = _FakeAPI()
+        provider = _provider(api, batch_window_ms=0)
+        assert await provider.embed("hello") == _vector("hello")
+        assert api.calls[0][0].endswith(":embedContent")
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_long_text_truncated(self) -> None:
+        api = _FakeAPI()
+        provider = _provider(api, batch_window_ms=0)
+        assert await provider.embed("x" * 10_000) == _vector("x" * provider.max_length)
+        await provider.close()
+
+
+class TestBatchAndConcurrency:
+    """embed_batch chunking, concurrency limit, and retries."""
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_chunks_at_api_limit(self) -> None:
+        api = _FakeAPI()
+        provider = _provider(api, max_concurrency=2)
+        texts = [f"t{i}" for i in range(250)]
+        assert await provider.embed_batch(texts) == [_vector(t) for t in texts]
+        assert sorted(len(body["requests"]) for _, body in api.calls) == [50, 100, 100]
+        assert api.max_in_flight <= 2
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_retries_throttled_requests(self) -> None:
+        api = _FakeAPI(fail_first=2)
+        provider = _provider(api, batch_window_ms=0)
+        assert await provider.embed("hi") == _vector("hi")
+        assert len(api.calls) == 3
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self) -> None:
+        api = _FakeAPI(fail_first=10)
+        provider = _provider(api, batch_window_ms=0, max_retries=1)
+        with pytest.raises(RuntimeError, match="Embedding API error"):
+            await provider.embed("hi")
+        assert len(api.calls) == 2
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self) -> None:
+        api = _FakeAPI(fail_first=1, status=400)
+        provider = _provider(api, batch_window_ms=0)
+        with pytest.raises(RuntimeError, match="Embedding API error"):
+            await provider.embed("hi")
+        assert len(api.calls) == 1
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_client_reused_until_close(self) -> None:
+        api = _FakeAPI()
+        provider = _provider(api, batch_window_ms=0)
+        client = provider._client
+        await provider.embed("a")
+        await provider.embed_batch(["b", "c"])
+        assert provider._client is client
+        await provider.close()
+        assert client.is_closed
+        assert provider._client is None
+
+
+class TestEventLoopChange:
+    """A provider reused under a new event loop starts from fresh state."""
+
+    def test_state_from_previous_loop_reset(self, monkeypatch) -> None:
+        api = _FakeAPI()
+        monkeypatch.setattr(
+            httpx, "AsyncClient", functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(api))
+        )
+        provider = GeminiEmbeddings(api_key="test-key", batch_window_ms=50)
+
+        async def strand() -> httpx.AsyncClient:
+            # Queue a request, then let asyncio.run end before its flush timer fires
+            asyncio.get_running_loop().create_task(provider.embed("stranded"))
+            await asyncio.sleep(0)
+            return provider._client
+
+        stale = asyncio.run(strand())
+        assert provider._pending
+        assert provider._flush_handle is not None
+
+        async def embed() -> list[float]:
+            return await asyncio.wait_for(provider.embed("hello"), timeout=5)
+
+        assert asyncio.run(embed()) == _vector("hello")
+        assert stale.is_closed
+        assert provider._client is not stale
+        assert [body["content"]["parts"][0]["text"] for _, body in api.calls] == ["hello"]
+        asyncio.run(provider.close())
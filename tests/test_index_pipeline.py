@@ -0,0 +1,188 @@
+"""Tests for queued vector indexing of recorded decisions."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from a2a.cstp.index_pipeline import INDEX_TOPIC, IndexPipeline, set_index_pipeline
+from a2a.cstp.storage.factory import set_decision_store
+from a2a.cstp.storage.memory import MemoryDecisionStore
+from a2a.cstp.storage.sqlite import SQLiteDecisionStore
+from a2a.cstp.storage.yaml_fs import YAMLFileSystemStore
+from a2a.cstp.vectordb.factory import set_vector_store
+from a2a.cstp.vectordb.memory import MemoryStore
+
+
+@pytest.fixture
+def vectors() -> Any:
+    store = MemoryStore()
+    set_vector_store(store)
+    yield store
+    set_vector_store(None)
+
+
+def _embed_all(texts: list[str]) -> list[list[float] | None]:
+    return [[1.0, float(len(text))] for text in texts]
+
+
+async def _record(tmp_path: Path, summary: str = "Index decisions in the background") -> Any:
+    from a2a.cstp.decision_service import RecordDecisionRequest, record_decision
+
+    request = RecordDecisionRequest.from_dict(
+        {"decision": summary, "confidence": 0.8, "category": "architecture"}
+    )
+    with patch("a2a.cstp.decision_service.index_to_chromadb", new_callable=AsyncMock) as inline:
+        response = await record_decision(request, str(tmp_path))
+    inline.assert_not_called()
+    return response
+
+
+def _queued(store: Any) -> IndexPipeline:
+    """A pipeline queuing into ``store`` with no workers running."""
+    set_decision_store(store)
+    pipeline = IndexPipeline(mode="queued", max_backoff_s=0)
+    pipeline._store = store
+    set_index_pipeline(pipeline)
+    return pipeline
+
+
+class TestIndexPipeline:
+    def test_rejects_unknown_mode(self) -> None:
+        with pytest.raises(ValueError, match="RECORD_INDEXING"):
+            IndexPipeline(mode="eventually")
+
+    async def test_inline_mode_stays_inactive(self) -> None:
+        pipeline = IndexPipeline(mode="inline")
+        assert await pipeline.start(MemoryDecisionStore()) is False
+        assert not pipeline.active
+
+    async def test_store_without_outbox_stays_inactive(self, tmp_path: Path) -> None:
+        pipeline = IndexPipeline(mode="queued")
+        assert await pipeline.start(YAMLFileSystemStore(str(tmp_path))) is False
+        assert not pipeline.active
+
+    async def test_record_returns_queued(self, tmp_path: Path, vectors: MemoryStore) -> None:
+        store = MemoryDecisionStore()
+        pipeline = _queued(store)
+
+        response = await _record(tmp_path)
+        assert response.success
+        assert response.to_dict()["indexed"] == "queued"
+        assert await store.get(response.id) is not None
+        assert await vectors.count() == 0
+
+        decision = (await pipeline.status(response.id))["decision"]
+        assert decision["state"] == "queued"
+        assert decision["queued_at"]
+
+    async def test_drain_embeds_in_one_batch(self, tmp_path: Path, vectors: MemoryStore) -> None:
+        store = MemoryDecisionStore()
+        pipeline = _queued(store)
+        ids = [(await _record(tmp_path, f"Decision number {n}")).id for n in range(3)]
+
+        embed = AsyncMock(side_effect=_embed_all)
+        with patch("a2a.cstp.decision_service.generate_embeddings", embed):
+            assert await pipeline.drain() == 3
+
+        embed.assert_awaited_once()
+        assert len(embed.await_args.args[0]) == 3
+        assert await vectors.count() == 3
+        assert (await pipeline.status(ids[0]))["decision"]["state"] == "not_queued"
+        assert (await store.outbox_status(INDEX_TOPIC))["pending"] == 0
+        assert pipeline.indexed == 3
+
+    async def test_failed_embedding_is_retried(self, tmp_path: Path, vectors: MemoryStore) -> None:
+        store = MemoryDecisionStore()
+        pipeline = _queued(store)
+        response = await _record(tmp_path)
+
+        with patch(
+            "a2a.cstp.decision_service.generate_embeddings",
+            AsyncMock(return_value=[None]),
+        ):
+            assert await pipeline.drain() == 0
+        decision = (await pipeline.status(response.id))["decision"]
+        assert decision["state"] == "retrying"
+        assert decision["last_error"] == "no embedding"
+        assert pipeline.failures == 1
+
+        with patch("a2a.cstp.decision_service.generate_embeddings", AsyncMock(side_effect=_embed_all)):
+            assert await pipeline.drain() == 1
+        assert await vectors.count() == 1
+
+    async def test_reindex_supersedes_queued_entry(self, tmp_path: Path) -> None:
+        from a2a.cstp.decision_service import reindex_decision
+
+        store = MemoryDecisionStore()
+        pipeline = _queued(store)
+        response = await _record(tmp_path)
+
+        with patch("a2a.cstp.decision_service.index_to_chromadb", AsyncMock(return_value=True)):
+            assert await reindex_decision(response.id, {"summary": "Updated"}, response.path)
+        assert (await pipeline.status())["pending"] == 0
+
+    async def test_backlog_indexed_after_restart(self, tmp_path: Path, vectors: MemoryStore) -> None:
+        db = str(tmp_path / "decisions.db")
+        store = SQLiteDecisionStore(db_path=db)
+        await store.initialize()
+        _queued(store)  # queue without running workers, as if it crashed
+        response = await _record(tmp_path / "decisions")
+        await store.close()
+
+        reopened = SQLiteDecisionStore(db_path=db)
+        await reopened.initialize()
+        pipeline = IndexPipeline(mode="queued", workers=1)
+        try:
+            with patch("a2a.cstp.decision_service.generate_embeddings", AsyncMock(side_effect=_embed_all)):
+                assert await pipeline.start(reopened)
+                assert await pipeline.drain() == 1
+                await pipeline.stop()
+            results = await vectors.query([1.0, 1.0], n_results=1)
+            assert [r.id for r in results] == [response.id]
+        finally:
+            await reopened.close()
+
+
+class TestIndexStatusRpc:
+    async def test_unknown_decision(self) -> None:
+        from a2a.cstp.dispatcher import _handle_index_status
+
+        set_index_pipeline(IndexPipeline(mode="inline"))
+        result = await _handle_index_status({"id": "abc12345"}, "agent")
+        assert result["mode"] == "inline"
+        assert result["active"] is False
+        assert result["pending"] == 0
+        assert result["decision"] == {
+            "id": "abc12345", "state": "not_found", "queuedAt": None, "attempts": 0, "lastError": None,
+        }
+
+    async def test_failed_inline_index_is_not_reported_indexed(self, tmp_path: Path) -> None:
+        from a2a.cstp.decision_service import RecordDecisionRequest, record_decision
+        from a2a.cstp.dispatcher import _handle_index_status
+
+        set_index_pipeline(IndexPipeline(mode="inline"))
+        request = RecordDecisionRequest.from_dict(
+            {"decision": "Index inline", "confidence": 0.8, "category": "architecture"}
+        )
+        with patch("a2a.cstp.decision_service.index_to_chromadb", AsyncMock(return_value=False)):
+            response = await record_decision(request, str(tmp_path))
+        assert response.indexed is False
+
+        result = await _handle_index_status({"id": response.id}, "agent")
+        assert result["decision"]["state"] == "not_queued"
+
+    async def test_backlog_of_queued_entries(self) -> None:
+        from a2a.cstp.dispatcher import _handle_index_status
+
+        store = MemoryDecisionStore()
+        _queued(store)
+        await store.save_with_outbox("abc12345", {"decision": "x"}, [(INDEX_TOPIC, {"text": "x"})])
+
+        result = await _handle_index_status({}, "agent")
+        assert result["pending"] == 1
+        assert result["oldestPendingAt"]
+        assert "decision" not in result
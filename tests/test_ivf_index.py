@@ -0,0 +1,170 @@
+"""Tests for the IVF approximate index behind NumpyStore (VECTOR_ANN=ivf)."""
+
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from a2a.cstp.models import QueryDecisionsRequest
+from a2a.cstp.vectordb import numpy_store
+from a2a.cstp.vectordb.ivf import IVFIndex, assign_lists, train_centroids
+from a2a.cstp.vectordb.numpy_store import NumpyStore
+
+
+def _clustered(n: int, dim: int = 32, clusters: int = 20, seed: int = 7) -> np.ndarray:
+    """Unit vectors drawn around a few random centers (IVF-friendly corpus)."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    vecs = centers[rng.integers(0, clusters, size=n)] + 0.3 * rng.normal(size=(n, dim))
+    return (vecs / np.linalg.norm(vecs, axis=1, keepdims=True)).astype(np.float32)
+
+
+async def _filled_store(vecs: np.ndarray, **kwargs) -> NumpyStore:
+    store = NumpyStore(ann="ivf", min_index_size=0, **kwargs)
+    await store.initialize()
+    for i, vec in enumerate(vecs):
+        meta = {"category": "arch" if i % 4 == 0 else "process"}
+        await store.upsert(f"d{i}", f"text {i}", vec.tolist(), meta)
+    return store
+
+
+class TestIVFIndex:
+    """Row bookkeeping of the inverted lists."""
+
+    def _index(self) -> tuple[IVFIndex, np.ndarray]:
+        vecs = _clustered(200)
+        centroids = train_centroids(vecs, 8)
+        return IVFIndex(centroids, assign_lists(vecs, centroids), nprobe=8), vecs
+
+    def test_all_rows_listed(self) -> None:
+        index, vecs = self._index()
+        assert len(index) == 200
+        assert sorted(index.candidates(vecs[0], nprobe=index.nlist).tolist()) == list(range(200))
+
+    def test_remove_and_move(self) -> None:
+        index, vecs = self._index()
+        index.remove(5)
+        index.move(199, 5)
+        rows = sorted(index.candidates(vecs[0], nprobe=index.nlist).tolist())
+        assert rows == list(range(199))
+
+    def test_add_replaces_existing_membership(self) -> None:
+        index, vecs = self._index()
+        index.add(3, vecs[150])
+        assert len(index) == 200
+        assert 3 in index.candidates(vecs[150], nprobe=1).tolist()
+
+
+class TestApproximateSearch:
+    """NumpyStore with the ANN index enabled."""
+
+    @pytest.mark.asyncio
+    async def test_queries_exact_until_index_built(self) -> None:
+        store = await _filled_store(_clustered(300))
+        assert store.index_stats()["built"] is False
+        results = await store.query(_clustered(1, seed=1)[0].tolist(), n_results=5)
+        assert len(results) == 5
+        # The first approximate query schedules a background build.
+        assert store.index_stats()["building"] is True
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_build_reports_recall(self) -> None:
+        store = await _filled_store(_clustered(1000), nprobe=4)
+        await store.build_index()
+        stats = store.index_stats()
+        assert stats["built"] is True
+        assert stats["nlist"] == 31
+        assert store.last_recall is not None
+        assert store.last_recall >= 0.8
+        assert store.measure_recall(nprobe=stats["nlist"]) == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_recall_measured_off_loop(self) -> None:
+        store = await _filled_store(_clustered(300))
+        loop_thread = threading.current_thread()
+        threads: list[threading.Thread] = []
+        real = numpy_store._recall_of_snapshot
+
+        def tracking(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return real(*args, **kwargs)
+
+        with patch.object(numpy_store, "_recall_of_snapshot", tracking):
+            await store.build_index()
+        assert threads and threads[0] is not loop_thread
+        assert store.last_recall is not None
+
+    @pytest.mark.asyncio
+    async def test_full_probe_matches_exact(self) -> None:
+        vecs = _clustered(500)
+        store = await _filled_store(vecs, nprobe=1000)
+        await store.build_index()
+        for query in _clustered(5, seed=3):
+            for where in (None, {"category": "arch"}):
+                approx = await store.query(query.tolist(), n_results=10, where=where)
+                exact = await store.query(query.tolist(), n_results=10, where=where, exact=True)
+                assert [r.id for r in approx] == [r.id for r in exact]
+
+    @pytest.mark.asyncio
+    async def test_incremental_insert_and_delete(self) -> None:
+        vecs = _clustered(400)
+        store = await _filled_store(vecs[:300], nprobe=1000)
+        await store.build_index()
+
+        for i in range(300, 400):
+            await store.upsert(f"d{i}", f"text {i}", vecs[i].tolist(), {})
+        await store.delete([f"d{i}" for i in range(0, 300, 2)])
+
+        results = await store.query(vecs[399].tolist(), n_results=1)
+        assert results[0].id == "d399"
+        results = await store.query(vecs[1].tolist(), n_results=1)
+        assert results[0].id == "d1"
+        approx = await store.query(vecs[0].tolist(), n_results=250)
+        exact = await store.query(vecs[0].tolist(), n_results=250, exact=True)
+        assert [r.id for r in approx] == [r.id for r in exact]
+
+    @pytest.mark.asyncio
+    async def test_selective_filter_falls_back_to_exact(self) -> None:
+        vecs = _clustered(400)
+        store = await _filled_store(vecs, nprobe=1)
+        await store.upsert("rare", "rare", (-vecs[0]).tolist(), {"category": "rare"})
+        await store.build_index()
+
+        results = await store.query(vecs[0].tolist(), n_results=3, where={"category": "rare"})
+        assert [r.id for r in results] == ["rare"]
+
+    @pytest.mark.asyncio
+    async def test_reset_drops_index(self) -> None:
+        store = await _filled_store(_clustered(200))
+        await store.build_index()
+        await store.reset()
+        assert store.index_stats()["built"] is False
+        assert await store.upsert("x", "x", [1.0, 0.0], {}) is True
+        assert (await store.query([1.0, 0.0], n_results=1))[0].id == "x"
+
+    def test_unknown_mode_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Unknown ANN"):
+            NumpyStore(ann="hnsw")
+
+    def test_env_configuration(self, monkeypatch) -> None:
+        monkeypatch.setenv("VECTOR_ANN", "ivf")
+        monkeypatch.setenv("VECTOR_ANN_NPROBE", "3")
+        stats = NumpyStore().index_stats()
+        assert stats["mode"] == "ivf"
+        assert stats["nprobe"] == 3
+
+
+class TestSearchModeParam:
+    """searchMode request parameter."""
+
+    def test_parsed(self) -> None:
+        assert QueryDecisionsRequest.from_params({"query": "q", "searchMode": "exact"}).search_mode == "exact"
+        assert (
+            QueryDecisionsRequest.from_params({"query": "q", "search_mode": "approximate"}).search_mode
+            == "approximate"
+        )
+
+    def test_invalid_ignored(self) -> None:
+        assert QueryDecisionsRequest.from_params({"query": "q", "searchMode": "fuzzy"}).search_mode is None
@@ -0,0 +1,50 @@
+"""Tests for the offline feature-hashing embedding provider."""
+
+import numpy as np
+import pytest
+
+from a2a.cstp.embeddings.local import HashingEmbeddings
+
+
+def _cos(a: list[float], b: list[float]) -> float:
+    return float(np.dot(a, b))
+
+
+class TestHashingEmbeddings:
+    """Determinism, shape, and rough semantic sanity."""
+
+    @pytest.mark.asyncio
+    async def test_deterministic_and_normalized(self) -> None:
+        provider = HashingEmbeddings(dimensions=256)
+        a = await provider.embed("Use Redis for session caching")
+        b = await HashingEmbeddings(dimensions=256).embed("Use Redis for session caching")
+        assert a == b
+        assert len(a) == 256
+        assert np.linalg.norm(a) == pytest.approx(1.0, abs=1e-5)
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_single(self) -> None:
+        provider = HashingEmbeddings(dimensions=128)
+        texts = ["alpha beta", "", "gamma delta gamma"]
+        batch = await provider.embed_batch(texts)
+        singles = [await provider.embed(t) for t in texts]
+        assert np.allclose(batch, singles)
+        assert batch[1] == [0.0] * 128
+        assert await provider.embed_batch([]) == []
+
+    @pytest.mark.asyncio
+    async def test_similar_texts_score_higher(self) -> None:
+        provider = HashingEmbeddings()
+        query, near, far = await provider.embed_batch([
+            "cache database queries with redis",
+            "use redis to cache expensive database queries",
+            "rotate the oncall schedule weekly",
+        ])
+        assert _cos(query, near) > _cos(query, far)
+
+    def test_identity(self) -> None:
+        provider = HashingEmbeddings(dimensions=32)
+        assert provider.dimensions == 32
+        assert provider.model_name == "local-hashing-32"
+        with pytest.raises(ValueError, match="positive"):
+            HashingEmbeddings(dimensions=0)
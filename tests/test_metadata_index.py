@@ -0,0 +1,128 @@
+"""Tests for the metadata inverted index used to pre-filter vector queries."""
+
+import random
+
+import pytest
+
+from a2a.cstp.vectordb.memory import MemoryStore, _matches_where
+from a2a.cstp.vectordb.metadata_index import MetadataIndex
+from a2a.cstp.vectordb.numpy_store import NumpyStore
+
+CATEGORIES = ["architecture", "process", "tooling", "security"]
+STAKES = ["low", "medium", "high", "critical"]
+STATUSES = ["pending", "reviewed"]
+PROJECTS = ["org/a", "org/b", None]
+TAGS = ["caching", "perf", "storage", "api", "auth"]
+
+
+def _metadata(rng: random.Random) -> dict:
+    meta = {
+        "category": rng.choice(CATEGORIES),
+        "stakes": rng.choice(STAKES),
+        "status": rng.choice(STATUSES),
+        "confidence": round(rng.random(), 2),
+        "tags": ",".join(rng.sample(TAGS, rng.randint(0, 3))),
+    }
+    project = rng.choice(PROJECTS)
+    if project:
+        meta["project"] = project
+        meta["pr"] = rng.randint(1, 5)
+    return meta
+
+
+WHERE_CLAUSES = [
+    {"category": "process"},
+    {"category": "process", "stakes": {"$in": ["high", "critical"]}},
+    {"status": {"$in": ["pending"]}, "project": "org/a"},
+    {"project": "org/a", "pr": 3},
+    {"tags": {"$contains": "perf"}},
+    {"tags": {"$contains": "stor"}},
+    {"$or": [{"tags": {"$contains": "api"}}, {"tags": {"$contains": "auth"}}]},
+    {"category": "tooling", "confidence": {"$gte": 0.5}},
+    {"confidence": {"$gte": 0.5}},
+    {"status": "reviewed", "$or": [{"tags": {"$contains": "caching"}}, {"tags": {"$contains": "perf"}}]},
+    {"$and": [{"category": "security"}, {"stakes": {"$ne": "low"}}]},
+    {"category": "nonexistent"},
+]
+
+
+class TestCompile:
+    """compile() agrees with _matches_where."""
+
+    @pytest.mark.parametrize("where", WHERE_CLAUSES)
+    def test_candidates_cover_all_matches(self, where: dict) -> None:
+        rng = random.Random(3)
+        rows = {i: _metadata(rng) for i in range(300)}
+        index = MetadataIndex()
+        for row, meta in rows.items():
+            index.add(row, meta)
+
+        expected = {r for r, meta in rows.items() if _matches_where(meta, where)}
+        candidates, exact = index.compile(where)
+        if candidates is None:
+            assert exact is False
+            return
+        assert expected <= candidates
+        if exact:
+            assert candidates == expected
+
+    def test_equality_and_tags_are_exact(self) -> None:
+        index = MetadataIndex()
+        index.add(1, {"category": "process", "tags": "perf,storage"})
+        index.add(2, {"category": "process", "tags": "api"})
+        assert index.compile({"category": "process", "tags": {"$contains": "perf"}}) == ({1}, True)
+
+    def test_range_filters_are_residual(self) -> None:
+        index = MetadataIndex()
+        index.add(1, {"category": "process", "confidence": 0.9})
+        candidates, exact = index.compile({"category": "process", "confidence": {"$gte": 0.5}})
+        assert candidates == {1}
+        assert exact is False
+        assert index.compile({"confidence": {"$gte": 0.5}}) == (None, False)
+
+    def test_remove(self) -> None:
+        index = MetadataIndex()
+        index.add(1, {"category": "process", "tags": "perf"})
+        index.remove(1, {"category": "process", "tags": "perf"})
+        assert index.compile({"category": "process"}) == (set(), True)
+        assert index.compile({"tags": {"$contains": "perf"}}) == (set(), True)
+
+
+@pytest.mark.parametrize("store_cls", [MemoryStore, NumpyStore])
+class TestStoresUseIndex:
+    """Filtered queries stay correct through upserts, overwrites and deletes."""
+
+    @pytest.mark.asyncio
+    async def test_filtered_results_match_scan(self, store_cls) -> None:
+        rng = random.Random(11)
+        store = store_cls()
+        await store.initialize()
+        docs = {}
+        for i in range(200):
+            vec = [rng.uniform(-1, 1) for _ in range(8)]
+            docs[f"d{i}"] = (vec, _metadata(rng))
+            await store.upsert(f"d{i}", "t", vec, docs[f"d{i}"][1])
+
+        # Overwrite metadata on some docs and delete others.
+        for i in range(0, 200, 7):
+            docs[f"d{i}"] = (docs[f"d{i}"][0], _metadata(rng))
+            await store.upsert(f"d{i}", "t", *docs[f"d{i}"])
+        deleted = [f"d{i}" for i in range(0, 200, 5)]
+        await store.delete(deleted)
+        for doc_id in deleted:
+            docs.pop(doc_id)
+
+        query = [rng.uniform(-1, 1) for _ in range(8)]
+        for where in WHERE_CLAUSES:
+            results = await store.query(query, n_results=500, where=where)
+            expected = {d for d, (_, meta) in docs.items() if _matches_where(meta, where)}
+            assert {r.id for r in results} == expected, where
+
+    @pytest.mark.asyncio
+    async def test_reset_clears_index(self, store_cls) -> None:
+        store = store_cls()
+        await store.initialize()
+        await store.upsert("d1", "t", [1.0, 0.0], {"category": "process"})
+        await store.reset()
+        await store.upsert("d2", "t", [1.0, 0.0], {"category": "tooling"})
+        assert await store.query([1.0, 0.0], where={"category": "process"}) == []
@@ -0,0 +1,204 @@
+"""Tests for the NumPy-backed VectorStore backend.
+
+The contract tests mirror test_f048_memory_store.py and run against both
+MemoryStore and NumpyStore, so the two in-process backends stay
+interchangeable.
+"""
+
+import random
+
+import pytest
+
+from a2a.cstp.vectordb import VectorStore
+from a2a.cstp.vectordb.factory import create_vector_store, set_vector_store
+from a2a.cstp.vectordb.memory import MemoryStore
+from a2a.cstp.vectordb.numpy_store import NumpyStore
+
+
+@pytest.fixture(params=["memory", "numpy"])
+def store(request: pytest.FixtureRequest) -> VectorStore:
+    """Fresh in-process store, parameterized across both backends."""
+    return MemoryStore() if request.param == "memory" else NumpyStore()
+
+
+class TestStoreContract:
+    """Behaviour shared by MemoryStore and NumpyStore."""
+
+    @pytest.mark.asyncio
+    async def test_upsert_and_count(self, store: VectorStore) -> None:
+        await store.initialize()
+        assert await store.upsert("doc1", "text", [0.1, 0.2], {"k": "v"}) is True
+        assert await store.count() == 1
+
+    @pytest.mark.asyncio
+    async def test_upsert_overwrites(self, store: VectorStore) -> None:
+        await store.initialize()
+        await store.upsert("doc1", "old text", [0.1, 0.2], {"version": "1"})
+        await store.upsert("doc1", "new text", [0.3, 0.4], {"version": "2"})
+        assert await store.count() == 1
+        results = await store.query([0.3, 0.4], n_results=1)
+        assert results[0].document == "new text"
+        assert results[0].metadata == {"version": "2"}
+
+    @pytest.mark.asyncio
+    async def test_delete(self, store: VectorStore) -> None:
+        await store.initialize()
+        await store.upsert("doc1", "text1", [0.1, 0.2], {})
+        await store.upsert("doc2", "text2", [0.3, 0.4], {})
+        assert await store.delete(["doc1", "missing"]) is True
+        assert await store.count() == 1
+        results = await store.query([0.3, 0.4], n_results=5)
+        assert [r.id for r in results] == ["doc2"]
+
+    @pytest.mark.asyncio
+    async def test_reset(self, store: VectorStore) -> None:
+        await store.initialize()
+        await store.upsert("doc1", "text", [0.1, 0.2], {})
+        assert await store.reset() is True
+        assert await store.count() == 0
+        assert await store.get_collection_id() is not None
+
+    @pytest.mark.asyncio
+    async def test_collection_id_before_init(self, store: VectorStore) -> None:
+        assert await store.get_collection_id() is None
+
+    @pytest.mark.asyncio
+    async def test_returns_nearest(self, store: VectorStore) -> None:
+        await store.initialize()
+        await store.upsert("near", "near doc", [1.0, 0.0], {})
+        await store.upsert("far", "far doc", [0.0, 1.0], {})
+
+        results = await store.query([1.0, 0.0], n_results=2)
+        assert results[0].id == "near"
+        assert results[0].distance == pytest.approx(0.0, abs=1e-6)
+        assert results[1].distance == pytest.approx(1.0, abs=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_n_results_limit(self, store: VectorStore) -> None:
+        await store.initialize()
+        for i in range(5):
+            await store.upsert(f"doc{i}", f"text{i}", [float(i) / 5] * 2, {})
+
+        results = await store.query([0.5, 0.5], n_results=2)
+        assert len(results) == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_store(self, store: VectorStore) -> None:
+        await store.initialize()
+        assert await store.query([0.1, 0.2], n_results=5) == []
+
+    @pytest.mark.asyncio
+    async def test_where_in_query(self, store: VectorStore) -> None:
+        await store.initialize()
+        await store.upsert("d1", "text", [0.1, 0.2], {"category": "arch", "status": "pending"})
+        await store.upsert("d2", "text", [0.1, 0.2], {"category": "process", "status": "pending"})
+
+        results = await store.query([0.1, 0.2], n_results=10, where={"category": "arch"})
+        assert [r.id for r in results] == ["d1"]
+
+    @pytest.mark.asyncio
+    async def test_where_no_match(self, store: VectorStore) -> None:
+        await store.initialize()
+        await store.upsert("d1", "text", [0.1, 0.2], {"category": "arch"})
+        assert await store.query([0.1, 0.2], where={"category": "nope"}) == []
+
+    @pytest.mark.asyncio
+    async def test_opposite_vector_distance(self, store: VectorStore) -> None:
+        await store.initialize()
+        await store.upsert("opp", "text", [-1.0, 0.0], {})
+        results = await store.query([1.0, 0.0], n_results=1)
+        assert results[0].distance == pytest.approx(2.0, abs=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_zero_vector_distance(self, store: VectorStore) -> None:
+        await store.initialize()
+        await store.upsert("zero", "text", [0.0, 0.0], {})
+        results = await store.query([1.0, 0.0], n_results=1)
+        assert results[0].distance == pytest.approx(1.0, abs=1e-6)
+
+
+class TestNumpyStore:
+    """NumPy-specific behaviour: matrix layout, growth, and parity."""
+
+    @pytest.mark.asyncio
+    async def test_matches_memory_store_ranking(self) -> None:
+        """Same corpus and query produce the same ranking as MemoryStore."""
+        rng = random.Random(42)
+        memory, dense = MemoryStore(), NumpyStore()
+        for store in (memory, dense):
+            await store.initialize()
+
+        for i in range(300):
+            vec = [rng.uniform(-1, 1) for _ in range(16)]
+            meta = {"category": "arch" if i % 3 == 0 else "process"}
+            await memory.upsert(f"d{i}", f"text {i}", vec, meta)
+            await dense.upsert(f"d{i}", f"text {i}", vec, meta)
+
+        for _ in range(5):
+            query = [rng.uniform(-1, 1) for _ in range(16)]
+            for where in (None, {"category": "arch"}):
+                expected = await memory.query(query, n_results=10, where=where)
+                actual = await dense.query(query, n_results=10, where=where)
+                assert [r.id for r in actual] == [r.id for r in expected]
+                for a, e in zip(actual, expected, strict=True):
+                    assert a.distance == pytest.approx(e.distance, abs=1e-5)
+
+    @pytest.mark.asyncio
+    async def test_grows_past_initial_capacity(self) -> None:
+        store = NumpyStore()
+        await store.initialize()
+        dim = 1000
+        for i in range(dim):
+            await store.upsert(f"d{i}", "t", [float(i == j) for j in range(dim)], {})
+        assert await store.count() == dim
+        results = await store.query([float(j == 999) for j in range(dim)], n_results=1)
+        assert results[0].id == "d999"
+
+    @pytest.mark.asyncio
+    async def test_delete_keeps_id_row_map_consistent(self) -> None:
+        """Deleting from the middle moves the last row; lookups still resolve."""
+        store = NumpyStore()
+        await store.initialize()
+        await store.upsert("a", "A", [1.0, 0.0, 0.0], {})
+        await store.upsert("b", "B", [0.0, 1.0, 0.0], {})
+        await store.upsert("c", "C", [0.0, 0.0, 1.0], {})
+
+        await store.delete(["a"])
+        results = await store.query([0.0, 0.0, 1.0], n_results=1)
+        assert results[0].id == "c"
+        assert results[0].document == "C"
+
+        await store.upsert("c", "C2", [0.0, 0.0, 1.0], {})
+        assert await store.count() == 2
+        results = await store.query([0.0, 0.0, 1.0], n_results=1)
+        assert results[0].document == "C2"
+
+    @pytest.mark.asyncio
+    async def test_rejects_dimension_mismatch(self) -> None:
+        store = NumpyStore()
+        await store.initialize()
+        await store.upsert("a", "A", [1.0, 0.0], {})
+        assert await store.upsert("b", "B", [1.0, 0.0, 0.0], {}) is False
+        assert await store.count() == 1
+        assert await store.query([1.0, 0.0, 0.0]) == []
+
+    @pytest.mark.asyncio
+    async def test_dimension_resets_when_empty(self) -> None:
+        store = NumpyStore()
+        await store.initialize()
+        await store.upsert("a", "A", [1.0, 0.0], {})
+        await store.reset()
+        assert await store.upsert("b", "B", [1.0, 0.0, 0.0], {}) is True
+        results = await store.query([1.0, 0.0, 0.0], n_results=1)
+        assert results[0].id == "b"
+
+
+class TestFactory:
+    """VECTOR_BACKEND=numpy wiring."""
+
+    def test_numpy_backend(self, monkeypatch) -> None:
+        monkeypatch.setenv("VECTOR_BACKEND", "numpy")
+        try:
+            assert isinstance(create_vector_store(), NumpyStore)
+        finally:
+            set_vector_store(None)
@@ -0,0 +1,264 @@
+"""Tests for PartitionedDecisionStore.
+
+The partitioned store must answer every read exactly as one SQLite store
+holding the same decisions would; the tests seed both and compare.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from a2a.cstp.storage import ListQuery, StatsQuery
+from a2a.cstp.storage.partitioned import PartitionedDecisionStore
+from a2a.cstp.storage.sqlite import SQLiteDecisionStore
+
+
+def _decision(i: int) -> dict[str, Any]:
+    return {
+        "decision": f"Decision {i} about caching" if i % 4 == 0 else f"Decision {i}",
+        "confidence": round(0.5 + (i % 5) / 10, 2),
+        "category": ("architecture", "process", "tooling")[i % 3],
+        "stakes": ("low", "medium", "high")[i % 3],
+        "status": ("pending", "reviewed")[i % 2],
+        "recorded_by": f"agent-{i % 3}",
+        "project": None if i % 7 == 0 else f"org/repo-{i % 3}",
+        # Several decisions share each timestamp, so ties break on id
+        "created_at": f"2026-{1 + i % 4:02d}-{1 + i % 9:02d}T10:00:00",
+        "tags": [f"tag-{i % 4}", "shared"],
+    }
+
+
+ITEMS = [(f"p{i:07d}", _decision(i)) for i in range(60)]
+
+
+@pytest.fixture(params=["month", "project"])
+async def stores(
+    request: pytest.FixtureRequest, tmp_path: Path,
+) -> Any:
+    """A partitioned store and a single-file reference with the same data."""
+    partitioned = PartitionedDecisionStore(
+        str(tmp_path / "parts" / "decisions.db"), partition_by=request.param, archives=[],
+    )
+    reference = SQLiteDecisionStore(str(tmp_path / "reference.db"))
+    await partitioned.initialize()
+    await reference.initialize()
+    await partitioned.save_many(ITEMS)
+    await reference.save_many(ITEMS)
+    yield partitioned, reference
+    await partitioned.close()
+    await reference.close()
+
+
+def _ids(decisions: list[dict[str, Any]]) -> list[str]:
+    return [d["id"] for d in decisions]
+
+
+def _stable(decisions: Any) -> Any:
+    """Drop updated_at (the save time, which differs between the stores)."""
+    if isinstance(decisions, dict):
+        return {k: v for k, v in decisions.items() if k != "updated_at"}
+    return [_stable(d) for d in decisions]
+
+
+class TestRouting:
+    async def test_files_per_partition(self, tmp_path: Path) -> None:
+        store = PartitionedDecisionStore(str(tmp_path / "decisions.db"), archives=[])
+        await store.initialize()
+        try:
+            await store.save_many(ITEMS[:8])
+            names = sorted(p.name for p in tmp_path.glob("decisions-*.db"))
+            assert names == [f"decisions-2026-0{m}.db" for m in range(1, 5)]
+        finally:
+            await store.close()
+
+        reopened = PartitionedDecisionStore(str(tmp_path / "decisions.db"), archives=[])
+        await reopened.initialize()
+        try:
+            assert await reopened.count() == 8
+        finally:
+            await reopened.close()
+
+    def test_partition_names(self, tmp_path: Path) -> None:
+        by_month = PartitionedDecisionStore(str(tmp_path / "d.db"), partition_by="month")
+        assert by_month.partition_for({"created_at": "2026-03-04T05:06:07"}) == "2026-03"
+        assert by_month.partition_for({"date": "2025-12-01"}) == "2025-12"
+        assert by_month.partition_for({"created_at": "soon"}) == "undated"
+        by_project = PartitionedDecisionStore(str(tmp_path / "d.db"), partition_by="project")
+        assert by_project.partition_for({"project": "org/repo"}) == "org_repo"
+        assert by_project.partition_for({"project": {"name": "a/b"}}) == "a_b"
+        assert by_project.partition_for({}) == "unassigned"
+
+    def test_unknown_scheme(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="partition scheme"):
+            PartitionedDecisionStore(str(tmp_path / "d.db"), partition_by="weekday")
+
+    async def test_resave_moves_between_partitions(self, tmp_path: Path) -> None:
+        store = PartitionedDecisionStore(str(tmp_path / "decisions.db"), archives=[])
+        await store.initialize()
+        try:
+            await store.save("moved001", _decision(0))
+            assert await store.save("moved001", {**_decision(0), "created_at": "2026-06-01"})
+            assert await store.count() == 1
+            assert (await store.get("moved001"))["created_at"] == "2026-06-01"
+        finally:
+            await store.close()
+
+    async def test_update_fields_moves_project(self, tmp_path: Path) -> None:
+        store = PartitionedDecisionStore(
+            str(tmp_path / "decisions.db"), partition_by="project", archives=[],
+        )
+        await store.initialize()
+        try:
+            await store.save("moved002", _decision(1))
+            assert await store.update_fields("moved002", project="other/repo")
+            assert (await store.list(ListQuery(project="other/repo"))).total == 1
+            assert await store.count() == 1
+            assert (await store.get("moved002"))["tags"] == ["shared", "tag-1"]
+        finally:
+            await store.close()
+
+
+class TestMatchesSingleStore:
+    @pytest.mark.parametrize("query", [
+        ListQuery(limit=100),
+        ListQuery(limit=7, offset=9),
+        ListQuery(limit=10, sort="confidence", order="asc"),
+        ListQuery(limit=10, sort="project", order="desc"),
+        ListQuery(limit=50, category="process", date_from="2026-02-01", date_to="2026-03-05"),
+        ListQuery(limit=50, project="org/repo-1", status="pending"),
+        ListQuery(limit=50, tags=["tag-2"], fields=["confidence"]),
+    ])
+    async def test_list(self, stores: Any, query: ListQuery) -> None:
+        partitioned, reference = stores
+        got = await partitioned.list(query)
+        want = await reference.list(query)
+        assert got.total == want.total
+        assert _stable(got.decisions) == _stable(want.decisions)
+        assert (got.next_cursor is None) == (want.next_cursor is None)
+
+    @pytest.mark.parametrize(("sort", "order"), [("created_at", "desc"), ("stakes", "asc")])
+    async def test_cursor_walk(self, stores: Any, sort: str, order: str) -> None:
+        partitioned, reference = stores
+        want = await reference.list(ListQuery(limit=100, sort=sort, order=order))
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = await partitioned.list(ListQuery(
+                limit=8, sort=sort, order=order, cursor=cursor, include_total=False,
+            ))
+            assert page.total is None
+            seen += _ids(page.decisions)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert seen == _ids(want.decisions)
+
+    @pytest.mark.parametrize("query", [
+        StatsQuery(),
+        StatsQuery(project="org/repo-2"),
+        StatsQuery(date_from="2026-02-03T12:00:00", date_to="2026-03-31"),
+    ])
+    async def test_stats(self, stores: Any, query: StatsQuery) -> None:
+        partitioned, reference = stores
+        assert await partitioned.stats(query) == await reference.stats(query)
+
+    async def test_counts_and_lookups(self, stores: Any) -> None:
+        partitioned, reference = stores
+        assert await partitioned.count() == 60
+        assert await partitioned.count(category="tooling") == await reference.count(
+            category="tooling",
+        )
+        assert _stable(await partitioned.get("p0000005")) == _stable(
+            await reference.get("p0000005"),
+        )
+        ids = ["p0000001", "p0000033", "missing1"]
+        got = await partitioned.get_many(ids, fields=["decision", "tags"])
+        assert got == await reference.get_many(ids, fields=["decision", "tags"])
+        assert await partitioned.existing_ids(ids) == {"p0000001", "p0000033"}
+        hits = await partitioned.keyword_search("caching", top_k=100)
+        assert hits is not None
+        assert sorted(i for i, _ in hits) == sorted(
+            i for i, d in ITEMS if "caching" in d["decision"]
+        )
+
+    async def test_mutations(self, stores: Any) -> None:
+        partitioned, _ = stores
+        before = await partitioned.version()
+        fingerprint = await partitioned.fingerprint()
+        assert await partitioned.update_outcome("p0000002", "success", lessons="ok")
+        assert (await partitioned.get("p0000002"))["status"] == "reviewed"
+        assert await partitioned.update_fields("p0000004", pattern="cache-aside")
+        assert await partitioned.delete("p0000006")
+        assert not await partitioned.delete("p0000006")
+        assert not await partitioned.update_outcome("missing1", "success")
+        assert await partitioned.count() == 59
+        assert await partitioned.version() > before
+        assert await partitioned.fingerprint() != fingerprint
+
+    async def test_explain_per_partition(self, stores: Any) -> None:
+        partitioned, _ = stores
+        plans = await partitioned.explain(ListQuery(category="process"))
+        assert plans
+        assert all(key.endswith(("/count", "/page")) for key in plans)
+
+
+class TestArchives:
+    async def test_archive_is_read_only(self, tmp_path: Path) -> None:
+        old = SQLiteDecisionStore(str(tmp_path / "decisions.db"))
+        await old.initialize()
+        await old.save("legacy01", {**_decision(3), "created_at": "2025-06-01T00:00:00"})
+        await old.close()
+
+        archive = tmp_path / "archive" / "decisions-2025-06.db"
+        archive.parent.mkdir()
+        (tmp_path / "decisions.db").rename(archive)
+
+        store = PartitionedDecisionStore(
+            str(tmp_path / "decisions.db"), archives=[str(archive)],
+        )
+        await store.initialize()
+        try:
+            await store.save("fresh001", _decision(0))
+            assert await store.existing_ids(["legacy01", "fresh001"]) == {
+                "legacy01", "fresh001",
+            }
+            assert (await store.list(ListQuery(limit=10))).total == 2
+            assert (await store.stats(StatsQuery())).total == 2
+            assert not await store.update_outcome("legacy01", "success")
+            with pytest.raises(ValueError, match="archived"):
+                await store.save("legacy02", {**_decision(3), "created_at": "2025-06-09"})
+            assert "2025-06 (archived)" in store.metrics()["partitions"]
+        finally:
+            await store.close()
+
+    async def test_read_only_store_rejects_writes(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "ro.db")
+        writable = SQLiteDecisionStore(path)
+        await writable.initialize()
+        await writable.save("ro000001", _decision(1))
+        await writable.close()
+
+        store = SQLiteDecisionStore(path, read_only=True)
+        await store.initialize()
+        try:
+            assert (await store.get("ro000001")) is not None
+            with pytest.raises(ValueError, match="read-only"):
+                await store.save("ro000002", _decision(2))
+            with pytest.raises(ValueError, match="read-only"):
+                await store.save_many([("ro000002", _decision(2))])
+        finally:
+            await store.close()
+
+    async def test_unmigrated_archive_is_refused(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "old.db")
+        writable = SQLiteDecisionStore(path)
+        await writable.initialize()
+        assert writable._conn is not None
+        writable._conn.execute("PRAGMA user_version = 1")
+        await writable.close()
+
+        with pytest.raises(ValueError, match="schema version 1"):
+            await SQLiteDecisionStore(path, read_only=True).initialize()
@@ -0,0 +1,238 @@
+"""Tests for the decision id -> YAML path index."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from a2a.cstp.storage.path_index import (
+    DecisionPathIndex,
+    decision_id_from_name,
+    get_path_index,
+)
+
+_OLD = 1_600_000_000  # a mtime well outside the racy window
+
+
+def _write(base: Path, decision_id: str, month: str = "2026/01", day: str = "2026-01-05") -> Path:
+    directory = base / month
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{day}-decision-{decision_id}.yaml"
+    path.write_text(yaml.safe_dump({"id": decision_id, "decision": f"Decision {decision_id}"}))
+    return path
+
+
+def _age_dirs(base: Path) -> None:
+    """Backdate every directory so its mtime is trusted by the index."""
+    for directory in [base, *(p for p in base.rglob("*") if p.is_dir())]:
+        os.utime(directory, (_OLD, _OLD))
+
+
+class TestDecisionIdFromName:
+    def test_parses_id(self) -> None:
+        assert decision_id_from_name("2026-01-05-decision-abc12345.yaml") == "abc12345"
+
+    @pytest.mark.parametrize("name", ["notes.yaml", "2026-01-05-decision-abc.yml", "tmpx1.yaml"])
+    def test_ignores_other_files(self, name: str) -> None:
+        assert decision_id_from_name(name) is None
+
+
+class TestLookups:
+    def test_full_scan_then_hits(self, tmp_path: Path) -> None:
+        a = _write(tmp_path, "aaaa0001")
+        b = _write(tmp_path, "bbbb0002", "2026/02", "2026-02-03")
+        index = DecisionPathIndex(tmp_path)
+
+        assert index.get("aaaa0001") == a
+        assert index.get("bbbb0002") == b
+        assert len(index) == 2
+        assert index.stats()["hits"] == 2
+        assert index.stats()["refreshes"] == 0
+
+    def test_missing_base(self, tmp_path: Path) -> None:
+        index = DecisionPathIndex(tmp_path / "absent")
+        assert index.get("aaaa0001") is None
+        _write(tmp_path / "absent", "aaaa0001")
+        assert index.get("aaaa0001") is not None
+
+    def test_record_is_a_hit(self, tmp_path: Path) -> None:
+        index = DecisionPathIndex(tmp_path)
+        assert index.get("aaaa0001") is None
+        path = _write(tmp_path, "aaaa0001")
+        index.record("aaaa0001", path)
+        refreshes = index.refreshes
+        assert index.get("aaaa0001") == path
+        assert index.refreshes == refreshes
+
+    def test_record_outside_base_is_ignored(self, tmp_path: Path) -> None:
+        index = DecisionPathIndex(tmp_path / "tree")
+        index.record("aaaa0001", _write(tmp_path / "elsewhere", "aaaa0001"))
+        assert index.get("aaaa0001") is None
+
+    def test_miss_picks_up_external_write(self, tmp_path: Path) -> None:
+        _write(tmp_path, "aaaa0001")
+        _age_dirs(tmp_path)
+        index = DecisionPathIndex(tmp_path)
+        assert len(index) == 1
+
+        # Written behind the index's back (another process), in a new month
+        path = _write(tmp_path, "cccc0003", "2026/03", "2026-03-01")
+        assert index.get("cccc0003") == path
+
+    def test_refresh_only_lists_changed_dirs(self, tmp_path: Path) -> None:
+        for month in range(1, 7):
+            _write(tmp_path, f"dddd000{month}", f"2026/{month:02d}", f"2026-{month:02d}-01")
+        _age_dirs(tmp_path)
+        index = DecisionPathIndex(tmp_path)
+        assert len(index) == 6
+        scanned = index.dirs_scanned
+
+        _write(tmp_path, "eeee0007", "2026/04", "2026-04-09")
+        assert index.get("eeee0007") is not None
+        assert index.dirs_scanned == scanned + 1
+
+    def test_deleted_file(self, tmp_path: Path) -> None:
+        path = _write(tmp_path, "aaaa0001")
+        index = DecisionPathIndex(tmp_path)
+        assert index.get("aaaa0001") == path
+        path.unlink()
+        assert index.get("aaaa0001") is None
+        assert len(index) == 0
+
+    def test_forget(self, tmp_path: Path) -> None:
+        path = _write(tmp_path, "aaaa0001")
+        index = DecisionPathIndex(tmp_path)
+        assert index.get("aaaa0001") == path
+        index.forget("aaaa0001")
+        assert len(index) == 0
+
+    def test_moved_file(self, tmp_path: Path) -> None:
+        path = _write(tmp_path, "aaaa0001")
+        index = DecisionPathIndex(tmp_path)
+        assert index.get("aaaa0001") == path
+
+        target = tmp_path / "2025" / "12" / path.name
+        target.parent.mkdir(parents=True)
+        path.rename(target)
+        assert index.get("aaaa0001") == target
+
+    def test_removed_directory(self, tmp_path: Path) -> None:
+        path = _write(tmp_path, "aaaa0001", "2026/05", "2026-05-01")
+        index = DecisionPathIndex(tmp_path)
+        assert index.get("aaaa0001") == path
+        path.unlink()
+        path.parent.rmdir()
+        assert index.get("aaaa0001") is None
+        assert index.stats()["entries"] == 0
+
+    def test_prefix(self, tmp_path: Path) -> None:
+        _write(tmp_path, "abcd1234")
+        abce = _write(tmp_path, "abce5678")
+        index = DecisionPathIndex(tmp_path)
+        assert index.get_prefix("abce") == abce
+        assert index.get_prefix("abc") is not None
+        assert index.get_prefix("zz") is None
+
+
+class TestPersistence:
+    def test_reload_skips_unchanged_dirs(self, tmp_path: Path) -> None:
+        tree = tmp_path / "decisions"
+        for month in range(1, 4):
+            _write(tree, f"ffff000{month}", f"2026/{month:02d}", f"2026-{month:02d}-01")
+        _age_dirs(tree)
+        sidecar = tmp_path / "index.db"
+
+        first = DecisionPathIndex(tree, sidecar)
+        assert len(first) == 3
+        first.close()
+
+        second = DecisionPathIndex(tree, sidecar)
+        assert len(second) == 3
+        assert second.dirs_scanned == 0
+        assert second.get("ffff0002") == tree / "2026/02/2026-02-01-decision-ffff0002.yaml"
+        second.close()
+
+    def test_reload_sees_changes_made_while_closed(self, tmp_path: Path) -> None:
+        tree = tmp_path / "decisions"
+        old = _write(tree, "aaaa0001")
+        _write(tree, "bbbb0002", "2026/02", "2026-02-02")
+        _age_dirs(tree)
+        sidecar = tmp_path / "index.db"
+        first = DecisionPathIndex(tree, sidecar)
+        assert len(first) == 2
+        first.close()
+
+        old.unlink()
+        _write(tree, "cccc0003", "2026/02", "2026-02-03")
+        reloaded = DecisionPathIndex(tree, sidecar)
+        assert reloaded.get("aaaa0001") is None
+        assert reloaded.get("cccc0003") is not None
+        assert len(reloaded) == 2
+        reloaded.close()
+
+    def test_records_persist(self, tmp_path: Path) -> None:
+        tree = tmp_path / "decisions"
+        sidecar = tmp_path / "index.db"
+        index = DecisionPathIndex(tree, sidecar)
+        assert len(index) == 0
+        path = _write(tree, "aaaa0001")
+        index.record("aaaa0001", path)
+        index.close()
+
+        reloaded = DecisionPathIndex(tree, sidecar)
+        assert reloaded.get("aaaa0001") == path
+        reloaded.close()
+
+    def test_unwritable_sidecar_falls_back_to_memory(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        path = _write(tmp_path / "tree", "aaaa0001")
+        index = DecisionPathIndex(tmp_path / "tree", blocker / "index.db")
+        assert index.get("aaaa0001") == path
+        assert index.stats()["persistent"] is False
+
+    def test_default_sidecar_lives_in_tree(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.delenv("DECISION_INDEX_PATH", raising=False)
+        _write(tmp_path, "aaaa0001")
+        index = get_path_index(tmp_path)
+        assert index.get("aaaa0001") is not None
+        assert (tmp_path / ".decision-index.db").exists()
+        assert get_path_index(str(tmp_path)) is index
+
+
+class TestDecisionServiceLookups:
+    async def test_write_then_find(self, tmp_path: Path) -> None:
+        from a2a.cstp.decision_service import find_decision, write_decision_file
+
+        path = write_decision_file({"decision": "Use the index"}, "abcd1234", str(tmp_path))
+        index = get_path_index(tmp_path)
+        hits = index.hits
+
+        found = await find_decision("abcd1234", str(tmp_path))
+        assert found is not None
+        assert found[0] == Path(path)
+        assert found[1]["decision"] == "Use the index"
+        assert index.hits == hits + 1
+
+    async def test_find_unknown(self, tmp_path: Path) -> None:
+        from a2a.cstp.decision_service import find_decision
+
+        _write(tmp_path, "abcd1234")
+        assert await find_decision("ffff9999", str(tmp_path)) is None
+
+    async def test_yaml_store_uses_index(self, tmp_path: Path) -> None:
+        from a2a.cstp.storage.yaml_fs import YAMLFileSystemStore
+
+        store = YAMLFileSystemStore(str(tmp_path))
+        await store.initialize()
+        await store.save("abcd1234", {"decision": "Indexed", "date": "2026-02-01"})
+        assert get_path_index(tmp_path).get("abcd1234") is not None
+        assert (await store.get_many(["abcd1234", "missing0"]))["abcd1234"]["decision"] == "Indexed"
+
+        assert await store.delete("abcd1234")
+        assert len(get_path_index(tmp_path)) == 0
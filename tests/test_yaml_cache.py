@@ -0,0 +1,115 @@
+"""Tests for the parsed-YAML document cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import yaml
+
+from a2a.cstp.storage.yaml_cache import (
+    ParsedYAMLCache,
+    get_yaml_cache,
+    iter_decision_files,
+    parse_yaml,
+)
+
+
+def _write(base: Path, decision_id: str, month: str = "2026/01", **fields: object) -> Path:
+    directory = base / month
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"2026-01-05-decision-{decision_id}.yaml"
+    path.write_text(yaml.safe_dump({"decision": f"Decision {decision_id}", **fields}))
+    return path
+
+
+class TestParsedYAMLCache:
+    def test_second_load_is_a_hit(self, tmp_path: Path) -> None:
+        path = _write(tmp_path, "aaaa0001")
+        cache = ParsedYAMLCache()
+        assert cache.load(path)["decision"] == "Decision aaaa0001"
+        assert cache.load(path)["decision"] == "Decision aaaa0001"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_changed_file_is_reparsed(self, tmp_path: Path) -> None:
+        path = _write(tmp_path, "aaaa0001")
+        cache = ParsedYAMLCache()
+        cache.load(path)
+        path.write_text(yaml.safe_dump({"decision": "Changed"}))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert cache.load(path)["decision"] == "Changed"
+        assert cache.misses == 2
+
+    def test_returns_copies(self, tmp_path: Path) -> None:
+        path = _write(tmp_path, "aaaa0001", reasons=[{"type": "analysis"}])
+        cache = ParsedYAMLCache()
+        first = cache.load(path)
+        first["reasons"].append({"type": "pattern"})
+        first["status"] = "reviewed"
+        second = cache.load(path)
+        assert second["reasons"] == [{"type": "analysis"}]
+        assert "status" not in second
+
+    def test_bounded(self, tmp_path: Path) -> None:
+        cache = ParsedYAMLCache(max_entries=2)
+        paths = [_write(tmp_path, f"bbbb000{i}", f"2026/0{i}") for i in range(1, 4)]
+        for path in paths:
+            cache.load(path)
+        assert cache.stats()["entries"] == 2
+        cache.load(paths[0])
+        assert cache.misses == 4
+
+    def test_disabled(self, tmp_path: Path) -> None:
+        path = _write(tmp_path, "aaaa0001")
+        cache = ParsedYAMLCache(max_entries=0)
+        cache.load(path)
+        cache.load(path)
+        assert cache.stats()["entries"] == 0
+        assert cache.misses == 2
+
+    def test_parse_yaml(self) -> None:
+        assert parse_yaml("a: 1\nb: [x, y]\n") == {"a": 1, "b": ["x", "y"]}
+
+
+class TestIterDecisionFiles:
+    def test_yields_ids_and_parses_once(self, tmp_path: Path) -> None:
+        _write(tmp_path, "aaaa0001", category="arch")
+        _write(tmp_path, "bbbb0002", "2026/02")
+        (tmp_path / "2026" / "02" / "2026-02-01-decision-empty000.yaml").write_text("")
+        (tmp_path / "2026" / "02" / "2026-02-01-decision-broken00.yaml").write_text("a: [")
+
+        first = {decision_id: data for decision_id, _, data in iter_decision_files(tmp_path)}
+        assert set(first) == {"aaaa0001", "bbbb0002"}
+        assert first["aaaa0001"]["category"] == "arch"
+
+        misses = get_yaml_cache().misses
+        assert len(list(iter_decision_files(tmp_path))) == 2
+        assert get_yaml_cache().misses == misses
+
+    def test_sees_new_files(self, tmp_path: Path) -> None:
+        _write(tmp_path, "aaaa0001")
+        assert len(list(iter_decision_files(tmp_path))) == 1
+        _write(tmp_path, "cccc0003", "2026/03")
+        assert len(list(iter_decision_files(tmp_path))) == 2
+
+
+class TestFallbacksUseCache:
+    async def test_query_fallback(self, tmp_path: Path, monkeypatch) -> None:
+        from a2a.cstp import query_service
+
+        async def broken_list(*args, **kwargs):
+            raise RuntimeError("store down")
+
+        from a2a.cstp.storage.factory import get_decision_store
+
+        monkeypatch.setattr(get_decision_store(), "list", broken_list)
+        _write(tmp_path, "aaaa0001", category="arch")
+        _write(tmp_path, "bbbb0002", "2026/02", category="process")
+
+        first = await query_service.load_all_decisions(str(tmp_path), category="arch")
+        assert [d["id"] for d in first] == ["aaaa0001"]
+        misses = get_yaml_cache().misses
+        again = await query_service.load_all_decisions(str(tmp_path))
+        assert len(again) == 2
+        assert get_yaml_cache().misses == misses
@@ -0,0 +1,108 @@
+"""Tests for off-loop YAML I/O and the event-loop lag monitor."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+from a2a.cstp.loop_lag import LoopLagMonitor
+from a2a.cstp.yaml_io import dump_yaml, get_io_executor, run_io, shutdown_io_executor
+
+
+class TestDumpYaml:
+    def test_round_trips_in_insertion_order(self) -> None:
+        data = {"summary": "Use SQLite", "confidence": 0.8, "reasons": [{"type": "analysis"}]}
+        buf = io.StringIO()
+        dump_yaml(data, buf)
+        text = buf.getvalue()
+        assert text.index("summary") < text.index("confidence") < text.index("reasons")
+        assert yaml.safe_load(text) == data
+
+
+class TestRunIo:
+    async def test_runs_on_pool_thread(self) -> None:
+        name = await run_io(lambda: threading.current_thread().name)
+        assert name.startswith("yaml-io")
+
+    async def test_passes_arguments_and_errors(self) -> None:
+        assert await run_io(lambda a, b=0: a + b, 1, b=2) == 3
+
+        def boom() -> None:
+            raise OSError("disk full")
+
+        try:
+            await run_io(boom)
+        except OSError as e:
+            assert str(e) == "disk full"
+        else:
+            raise AssertionError("expected OSError")
+
+    async def test_shutdown_recreates(self) -> None:
+        first = get_io_executor()
+        shutdown_io_executor()
+        assert get_io_executor() is not first
+        assert await run_io(lambda: 1) == 1
+
+
+class TestDecisionServiceOffLoop:
+    async def test_record_write_and_find_run_off_loop(self, tmp_path: Path) -> None:
+        from a2a.cstp import decision_service
+        from a2a.cstp.decision_service import RecordDecisionRequest, find_decision
+
+        loop_thread = threading.current_thread()
+        threads: list[threading.Thread] = []
+        real_write = decision_service.write_decision_file
+
+        def tracking_write(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return real_write(*args, **kwargs)
+
+        request = RecordDecisionRequest.from_dict(
+            {"decision": "Move YAML writes off the loop", "confidence": 0.8, "category": "architecture"}
+        )
+        with (
+            patch.object(decision_service, "write_decision_file", tracking_write),
+            patch.object(decision_service, "index_to_chromadb", return_value=False),
+        ):
+            response = await decision_service.record_decision(request, str(tmp_path))
+
+        assert response.success
+        assert threads and threads[0] is not loop_thread
+        found = await find_decision(response.id, str(tmp_path))
+        assert found is not None
+        assert found[1]["summary"] == "Move YAML writes off the loop"
+
+
+class TestLoopLagMonitor:
+    async def test_detects_blocking_call(self) -> None:
+        monitor = LoopLagMonitor(interval=0.01, warn_threshold=10.0)
+        monitor.start()
+        await asyncio.sleep(0.03)
+        time.sleep(0.1)  # deliberately block the loop
+        await asyncio.sleep(0.03)
+        await monitor.stop()
+
+        stats = monitor.stats()
+        assert stats["samples"] >= 2
+        assert stats["max_ms"] >= 50
+
+    def test_stats_without_samples(self) -> None:
+        stats = LoopLagMonitor().stats()
+        assert stats["samples"] == 0
+        assert stats["p99_ms"] == 0.0
+
+    def test_record(self) -> None:
+        monitor = LoopLagMonitor(window=3)
+        for lag in (0.001, 0.002, 0.004, 0.003):
+            monitor.record(lag)
+        stats = monitor.stats()
+        assert stats["samples"] == 4
+        assert stats["max_ms"] == 4.0
+        assert stats["last_ms"] == 3.0
+        assert stats["mean_ms"] == 3.0
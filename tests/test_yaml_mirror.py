@@ -0,0 +1,300 @@
+"""Tests for the decision-store outbox and the write-behind YAML mirror."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from a2a.cstp.storage.factory import set_decision_store
+from a2a.cstp.storage.memory import MemoryDecisionStore
+from a2a.cstp.storage.sqlite import SQLiteDecisionStore
+from a2a.cstp.storage.yaml_fs import YAMLFileSystemStore
+from a2a.cstp.yaml_mirror import MIRROR_TOPIC, YAMLMirror, set_yaml_mirror
+
+SAMPLE: dict[str, Any] = {
+    "decision": "Mirror YAML in the background",
+    "confidence": 0.8,
+    "category": "architecture",
+    "stakes": "medium",
+    "status": "pending",
+    "date": "2026-03-01T10:00:00+00:00",
+}
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+async def store(request: pytest.FixtureRequest, tmp_path: Path) -> Any:
+    """An initialized store with an outbox."""
+    if request.param == "memory":
+        s: Any = MemoryDecisionStore()
+    else:
+        s = SQLiteDecisionStore(db_path=str(tmp_path / "outbox.db"))
+    await s.initialize()
+    yield s
+    await s.close()
+
+
+# ---------------------------------------------------------------------------
+# Outbox contract
+# ---------------------------------------------------------------------------
+
+
+class TestOutbox:
+    async def test_save_with_outbox_queues_entry(self, store: Any) -> None:
+        assert await store.save_with_outbox("abc12345", dict(SAMPLE), [("t", {"k": 1})])
+        assert (await store.get("abc12345"))["decision"] == SAMPLE["decision"]
+
+        status = await store.outbox_status("t")
+        assert status["pending"] == 1
+        assert status["oldest_created_at"]
+        assert (await store.outbox_status("other"))["pending"] == 0
+
+    async def test_claim_leases_entries(self, store: Any) -> None:
+        await store.save_with_outbox("abc12345", dict(SAMPLE), [("t", {"k": 1})])
+        claimed = await store.claim_outbox("t", lease_s=60)
+        assert [(e.decision_id, e.payload, e.attempts) for e in claimed] == [
+            ("abc12345", {"k": 1}, 1),
+        ]
+        assert await store.claim_outbox("t") == []
+
+        await store.complete_outbox([claimed[0].id])
+        assert (await store.outbox_status("t"))["pending"] == 0
+
+    async def test_retry_reschedules(self, store: Any) -> None:
+        await store.save_with_outbox("abc12345", dict(SAMPLE), [("t", None)])
+        entry = (await store.claim_outbox("t", lease_s=60))[0]
+        await store.retry_outbox(entry.id, "OSError: disk full", delay_s=0)
+
+        status = await store.outbox_status("t")
+        assert status["retrying"] == 1
+        assert status["last_error"] == "OSError: disk full"
+        again = await store.claim_outbox("t")
+        assert again[0].attempts == 2
+        assert again[0].payload is None
+
+    async def test_claim_by_decision_ignores_schedule(self, store: Any) -> None:
+        await store.save_with_outbox("aaa11111", dict(SAMPLE), [("t", {"n": 1})])
+        await store.save_with_outbox("bbb22222", dict(SAMPLE), [("t", {"n": 2})])
+        await store.claim_outbox("t", lease_s=60)  # both leased
+
+        forced = await store.claim_outbox("t", decision_id="bbb22222")
+        assert [e.payload for e in forced] == [{"n": 2}]
+        status = await store.outbox_status("t", decision_id="aaa11111")
+        assert status["pending"] == 1
+
+
+class TestSQLiteOutbox:
+    async def test_failed_save_queues_nothing(self, tmp_path: Path) -> None:
+        store = SQLiteDecisionStore(db_path=str(tmp_path / "outbox.db"))
+        await store.initialize()
+        try:
+            bad = dict(SAMPLE, reasons=["not-a-dict"])
+            assert await store.save_with_outbox("abc12345", bad, [("t", {"k": 1})]) is False
+            assert await store.get("abc12345") is None
+            assert (await store.outbox_status("t"))["pending"] == 0
+        finally:
+            await store.close()
+
+    async def test_entries_survive_reopen(self, tmp_path: Path) -> None:
+        db = str(tmp_path / "outbox.db")
+        store = SQLiteDecisionStore(db_path=db)
+        await store.initialize()
+        await store.save_with_outbox("abc12345", dict(SAMPLE), [("t", {"k": 1})])
+        await store.close()
+
+        reopened = SQLiteDecisionStore(db_path=db)
+        await reopened.initialize()
+        try:
+            assert [e.payload for e in await reopened.claim_outbox("t")] == [{"k": 1}]
+        finally:
+            await reopened.close()
+
+    async def test_stores_without_outbox(self, tmp_path: Path) -> None:
+        store = YAMLFileSystemStore(str(tmp_path))
+        assert await store.save_with_outbox("abc12345", dict(SAMPLE), []) is None
+        assert await store.outbox_status("t") is None
+        assert await store.claim_outbox("t") == []
+
+
+# ---------------------------------------------------------------------------
+# Mirror worker
+# ---------------------------------------------------------------------------
+
+
+def _files(base: Path) -> list[Path]:
+    return sorted(base.rglob("*-decision-*.yaml"))
+
+
+async def _record(tmp_path: Path) -> Any:
+    from a2a.cstp.decision_service import RecordDecisionRequest, record_decision
+
+    request = RecordDecisionRequest.from_dict(
+        {"decision": "Mirror YAML in the background", "confidence": 0.8, "category": "architecture"}
+    )
+    with patch("a2a.cstp.decision_service.index_to_chromadb", return_value=False):
+        return await record_decision(request, str(tmp_path))
+
+
+class TestYAMLMirror:
+    def test_rejects_unknown_mode(self) -> None:
+        with pytest.raises(ValueError, match="YAML_MIRROR"):
+            YAMLMirror(mode="eventually")
+
+    async def test_sync_mode_stays_inactive(self) -> None:
+        mirror = YAMLMirror(mode="sync")
+        assert await mirror.start(MemoryDecisionStore()) is False
+        assert not mirror.active
+
+    async def test_store_without_outbox_stays_inactive(self, tmp_path: Path) -> None:
+        mirror = YAMLMirror(mode="write_behind")
+        assert await mirror.start(YAMLFileSystemStore(str(tmp_path))) is False
+        assert not mirror.active
+
+    async def test_record_is_store_only_then_mirrored(self, tmp_path: Path) -> None:
+        store = MemoryDecisionStore()
+        set_decision_store(store)
+        mirror = YAMLMirror(mode="write_behind", poll_s=0.01)
+        set_yaml_mirror(mirror)
+        # Attached but no worker yet: records queue, nothing is written
+        mirror._store = store
+        response = await _record(tmp_path)
+        assert response.success
+        assert await store.get(response.id) is not None
+        assert _files(tmp_path) == []
+        assert (await mirror.status())["pending"] == 1
+
+        assert await mirror.start(store)
+        for _ in range(200):
+            if _files(tmp_path):
+                break
+            await asyncio.sleep(0.01)
+        await mirror.stop()
+
+        [path] = _files(tmp_path)
+        assert str(path) == response.path
+        assert yaml.safe_load(path.read_text())["id"] == response.id
+        assert mirror.written == 1
+        assert (await store.outbox_status(MIRROR_TOPIC))["pending"] == 0
+
+    async def test_find_decision_flushes_queued_file(self, tmp_path: Path) -> None:
+        from a2a.cstp.decision_service import find_decision
+
+        store = MemoryDecisionStore()
+        set_decision_store(store)
+        mirror = YAMLMirror(mode="write_behind", poll_s=60)
+        set_yaml_mirror(mirror)
+        assert await mirror.start(store)
+        try:
+            # Hold the worker off so only flush() can write the file
+            async with mirror._lock:
+                response = await _record(tmp_path)
+            found = await find_decision(response.id, str(tmp_path))
+            assert found is not None
+            assert found[1]["summary"] == "Mirror YAML in the background"
+        finally:
+            await mirror.stop()
+
+    async def test_failed_write_is_retried(self, tmp_path: Path) -> None:
+        store = MemoryDecisionStore()
+        mirror = YAMLMirror(mode="write_behind", max_backoff_s=0)
+        mirror._store = store
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        payload = {"decision_id": "abc12345", "base": str(tmp_path), "data": dict(SAMPLE)}
+
+        await store.save_with_outbox(
+            "abc12345",
+            dict(SAMPLE),
+            [mirror.entry("abc12345", dict(SAMPLE), blocker / "x" / "f-decision-abc12345.yaml", tmp_path)],
+        )
+        mirror.queued()
+        assert await mirror.drain() == 0
+        status = await mirror.status()
+        assert status["retrying"] == 1
+        assert status["last_error"]
+        assert mirror.failures == 1
+
+        # Point the queued entry somewhere writable and let the retry land
+        entry = (await store.claim_outbox(MIRROR_TOPIC))[0]
+        await store.complete_outbox([entry.id])
+        target = tmp_path / "2026" / "03" / "2026-03-01-decision-abc12345.yaml"
+        await store.save_with_outbox(
+            "abc12345", dict(SAMPLE), [(MIRROR_TOPIC, {**payload, "path": str(target)})],
+        )
+        assert await mirror.drain() == 1
+        assert target.exists()
+
+    async def test_backlog_written_after_restart(self, tmp_path: Path) -> None:
+        db = str(tmp_path / "decisions.db")
+        decisions = tmp_path / "decisions"
+        store = SQLiteDecisionStore(db_path=db)
+        await store.initialize()
+        set_decision_store(store)
+        first = YAMLMirror(mode="write_behind")
+        first._store = store  # queue without a running worker, as if it crashed
+        set_yaml_mirror(first)
+        response = await _record(decisions)
+        await store.close()
+        assert _files(decisions) == []
+
+        reopened = SQLiteDecisionStore(db_path=db)
+        await reopened.initialize()
+        second = YAMLMirror(mode="write_behind")
+        try:
+            assert await second.start(reopened)
+            await second.stop()  # stop() drains what is due
+            assert [p.name for p in _files(decisions)] == [Path(response.path).name]
+        finally:
+            await reopened.close()
+
+
+class TestMirrorStatusRpc:
+    async def test_reports_mode_and_backlog(self) -> None:
+        from a2a.cstp.dispatcher import _handle_mirror_status
+
+        set_yaml_mirror(YAMLMirror(mode="sync"))
+        result = await _handle_mirror_status({}, "agent")
+        assert result["mode"] == "sync"
+        assert result["active"] is False
+        assert result["pending"] == 0
+        assert result["lagSeconds"] == 0.0
+
+    async def test_lag_of_queued_entries(self) -> None:
+        from a2a.cstp.dispatcher import _handle_mirror_status
+
+        store = MemoryDecisionStore()
+        mirror = YAMLMirror(mode="write_behind")
+        mirror._store = store
+        set_yaml_mirror(mirror)
+        await store.save_with_outbox("abc12345", dict(SAMPLE), [(MIRROR_TOPIC, {})])
+        await asyncio.sleep(0.01)
+
+        result = await _handle_mirror_status({}, "agent")
+        assert result["pending"] == 1
+        assert result["oldestPendingAt"]
+        assert result["lagSeconds"] > 0
+
+
+class TestFlushAcrossProcesses:
+    async def test_flushes_entry_queued_elsewhere(self, tmp_path: Path) -> None:
+        """An entry committed by another process is written before a read."""
+        store = MemoryDecisionStore()
+        mirror = YAMLMirror(mode="write_behind", poll_s=60)
+        assert await mirror.start(store)
+        try:
+            await mirror.drain()  # caught up with its own backlog
+            target = tmp_path / "2026" / "03" / "2026-03-01-decision-abc12345.yaml"
+            # Committed straight to the shared store, bypassing this mirror
+            await store.save_with_outbox(
+                "abc12345",
+                dict(SAMPLE),
+                [mirror.entry("abc12345", dict(SAMPLE), target, tmp_path)],
+            )
+            await mirror.flush("abc12345")
+            assert target.exists()
+        finally:
+            await mirror.stop()